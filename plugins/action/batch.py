@@ -0,0 +1,86 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Action plugin of the batch module"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common.text.converters import to_text
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.batch \
+    import BATCH_MODULES
+
+MODULE_PREFIX = 'dellemc.powerscale.'
+
+
+class ActionModule(ActionBase):
+
+    '''Action plugin which sends the sources of the modules of the
+    operations with the batch module, so that they run in its process'''
+
+    TRANSFERS_FILES = False
+
+    def run(self, tmp=None, task_vars=None):
+        """
+        Run the batch module with the sources of the operation modules
+        :param tmp: Deprecated temporary directory
+        :param task_vars: The task variables
+        """
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        module_args = dict(self._task.args)
+        operations = module_args.get('operations')
+        if not isinstance(operations, list):
+            raise AnsibleActionFail('operations must be a list of operations')
+
+        sources = {}
+        for index, operation in enumerate(operations):
+            if not isinstance(operation, dict):
+                raise AnsibleActionFail('Operation %d must be a dictionary'
+                                        % (index + 1))
+            module_name = self.get_module_name(operation.get('module'), index)
+            if module_name not in sources:
+                sources[module_name] = self.read_module_source(module_name)
+        module_args['module_sources'] = sources
+
+        result.update(self._execute_module(
+            module_name=MODULE_PREFIX + 'batch', module_args=module_args,
+            task_vars=task_vars))
+        return result
+
+    @staticmethod
+    def get_module_name(module, index):
+        """
+        Get the name of the module of an operation
+        :param module: The module of the operation, such as filesystem or
+                       dellemc.powerscale.filesystem
+        :param index: The position of the operation
+        """
+        module_name = to_text(module or '')
+        if module_name.startswith(MODULE_PREFIX):
+            module_name = module_name[len(MODULE_PREFIX):]
+        if module_name not in BATCH_MODULES:
+            raise AnsibleActionFail(
+                'Module %s of operation %d cannot run in a batch, expected '
+                'one of: %s' % (module, index + 1, ', '.join(BATCH_MODULES)))
+        return module_name
+
+    def read_module_source(self, module_name):
+        """
+        Read the source of a module of the collection
+        :param module_name: The module name
+        """
+        context = self._shared_loader_obj.module_loader \
+            .find_plugin_with_context(MODULE_PREFIX + module_name,
+                                      collection_list=self._task.collections)
+        if not context.resolved or not context.plugin_resolved_path:
+            raise AnsibleActionFail('Module %s%s was not found'
+                                    % (MODULE_PREFIX, module_name))
+        with open(context.plugin_resolved_path, 'rb') as module_file:
+            return to_text(module_file.read(), errors='surrogate_or_strict')
@@ -0,0 +1,272 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Callback plugin for Dell PowerScale"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+author: Dell Technologies
+name: perf
+type: aggregate
+short_description: Aggregate the timings of the PowerScale API requests of a play
+version_added: '3.10.0'
+description:
+- Aggregates the C(perf) dictionary of the results of the modules of the
+  collection, with the timings of their requests to the clusters.
+- Reports the number of requests, the errors, the total and percentile
+  latencies, the payload size and the retries per module, per endpoint
+  and per cluster at the end of each play.
+- Writes the reports of the plays of the playbook to I(output_file) in
+  JSON, so that runs can be compared in CI.
+requirements:
+- Enable the callback in the C(callbacks_enabled) setting of the Ansible
+  configuration.
+options:
+  output_file:
+    description:
+    - The JSON file of the reports of the plays.
+    type: path
+    default: ~/.ansible/powerscale_perf.json
+    env:
+    - name: POWERSCALE_PERF_OUTPUT_FILE
+    ini:
+    - section: callback_powerscale_perf
+      key: output_file
+  top:
+    description:
+    - The number of slowest modules, endpoints and clusters displayed for
+      each play, by total latency.
+    - The JSON file has all of them.
+    type: int
+    default: 10
+    env:
+    - name: POWERSCALE_PERF_TOP
+    ini:
+    - section: callback_powerscale_perf
+      key: top
+notes:
+- The percentiles are computed from a uniform sample of at most 1000
+  latencies per endpoint and module run.
+- The requests of the operations of a C(dellemc.powerscale.batch) task are
+  counted once, in the result of the batch.
+'''
+
+import json
+import os
+import tempfile
+
+from ansible.module_utils.common.text.converters import to_text
+from ansible.plugins.callback import CallbackBase
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.api_perf \
+    import add_latency_sample
+
+# Maximum number of latencies kept per row of a report
+MAX_REPORT_SAMPLES = 10000
+
+# The percentiles of the latencies in the reports
+PERCENTILES = (50, 90, 99)
+
+# The groupings of the reports
+GROUPS = ('modules', 'endpoints', 'clusters')
+
+
+def get_percentile(latencies, percentile):
+    """
+    Get a percentile of sorted latencies with the nearest rank method
+    :param latencies: The sorted latencies
+    :param percentile: The percentile, such as 90
+    """
+    if not latencies:
+        return None
+    rank = max(1, -(-percentile * len(latencies) // 100))
+    return latencies[int(rank) - 1]
+
+
+class PerfReport:
+
+    '''Requests of the modules of a play, aggregated per module, endpoint and
+    cluster'''
+
+    def __init__(self, name):
+        """
+        Initialize the report
+        :param name: The name of the play
+        """
+        self.name = name
+        self.tasks = 0
+        self.rows = dict((group, {}) for group in GROUPS)
+
+    def add(self, module, perf):
+        """
+        Add the perf of a module result
+        :param module: The module name
+        :param perf: The perf dictionary of the result
+        """
+        self.tasks += 1
+        for call in perf.get('calls') or []:
+            keys = dict(modules=module,
+                        endpoints='%s %s' % (call.get('method'),
+                                             call.get('endpoint')),
+                        clusters=call.get('cluster'))
+            for group in GROUPS:
+                self.add_call(group, keys[group], call)
+
+    def add_call(self, group, key, call):
+        """
+        Add the requests of an endpoint to a row of the report
+        :param group: The group of the row
+        :param key: The key of the row, such as the module name
+        :param call: The requests of the endpoint
+        """
+        row = self.rows[group].get(key)
+        if row is None:
+            row = self.rows[group][key] = dict(
+                name=to_text(key), requests=0, errors=0, latency_ms=0.0,
+                latencies_ms=[], payload_bytes=0, retries=0)
+        for latency_ms in call.get('latencies_ms') or []:
+            row['requests'] += 1
+            add_latency_sample(row['latencies_ms'], row['requests'],
+                               latency_ms, MAX_REPORT_SAMPLES)
+        # The requests beyond the sampled latencies of the module run
+        row['requests'] += max(0, (call.get('count') or 0)
+                               - len(call.get('latencies_ms') or []))
+        row['errors'] += call.get('errors') or 0
+        row['latency_ms'] += call.get('latency_ms') or 0
+        row['payload_bytes'] += call.get('payload_bytes') or 0
+        row['retries'] += call.get('retries') or 0
+
+    def get_rows(self, group):
+        """
+        Get the rows of a group by decreasing total latency, with their
+        percentiles
+        :param group: The group, such as endpoints
+        """
+        rows = []
+        for row in self.rows[group].values():
+            latencies = sorted(row['latencies_ms'])
+            entry = dict((key, value) for key, value in row.items()
+                         if key != 'latencies_ms')
+            entry['latency_ms'] = round(row['latency_ms'], 1)
+            for percentile in PERCENTILES:
+                entry['p%d_ms' % percentile] = get_percentile(latencies,
+                                                              percentile)
+            entry['max_ms'] = latencies[-1] if latencies else None
+            rows.append(entry)
+        return sorted(rows, key=lambda entry: (-entry['latency_ms'],
+                                               entry['name']))
+
+    def to_dict(self):
+        """
+        Get the report as a dictionary
+        """
+        report = dict(play=self.name, tasks=self.tasks)
+        for group in GROUPS:
+            report[group] = self.get_rows(group)
+        return report
+
+
+class CallbackModule(CallbackBase):
+
+    '''Aggregates the timings of the PowerScale API requests of a play'''
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'dellemc.powerscale.perf'
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, display=None):
+        super(CallbackModule, self).__init__(display=display)
+        self.report = None
+        self.reports = []
+
+    def v2_playbook_on_play_start(self, play):
+        self.end_play()
+        self.report = PerfReport(to_text(play.get_name()).strip())
+
+    def v2_runner_on_ok(self, result):
+        self.add_result(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self.add_result(result)
+
+    def v2_playbook_on_stats(self, stats):
+        self.end_play()
+        self.write_reports()
+
+    def add_result(self, result):
+        """
+        Add the perf of a task result and of the results of its loop items
+        :param result: The task result
+        """
+        if self.report is None:
+            self.report = PerfReport('')
+        task = result._task
+        module = getattr(task, 'resolved_action', None) or task.action
+        module_results = [result._result]
+        if isinstance(result._result.get('results'), list):
+            module_results.extend(result._result['results'])
+        for module_result in module_results:
+            perf = module_result.get('perf') \
+                if isinstance(module_result, dict) else None
+            if isinstance(perf, dict):
+                self.report.add(module, perf)
+
+    def end_play(self):
+        """
+        Display the report of the play and keep it for the JSON file
+        """
+        report, self.report = self.report, None
+        if report is None or not report.tasks:
+            return
+        report = report.to_dict()
+        self.reports.append(report)
+        self.display_report(report)
+
+    def display_report(self, report):
+        """
+        Display the slowest rows of each group of a report
+        :param report: The report dictionary
+        """
+        self._display.banner('POWERSCALE API PERF: %s' % report['play'])
+        top = self.get_option('top')
+        columns = ('requests', 'errors', 'latency_ms', 'p50_ms', 'p90_ms',
+                   'p99_ms', 'payload_bytes', 'retries')
+        for group in GROUPS:
+            rows = report[group][:top]
+            if not rows:
+                continue
+            width = max(len(group), max(len(row['name']) for row in rows))
+            self._display.display('%-*s %s' % (
+                width, group, ' '.join('%13s' % column
+                                       for column in columns)))
+            for row in rows:
+                self._display.display('%-*s %s' % (
+                    width, row['name'],
+                    ' '.join('%13s' % ('-' if row[column] is None
+                                       else row[column])
+                             for column in columns)))
+            self._display.display('')
+
+    def write_reports(self):
+        """
+        Write the reports of the plays to the output file
+        """
+        output_file = self.get_option('output_file')
+        if not output_file or not self.reports:
+            return
+        output_file = os.path.expanduser(output_file)
+        directory = os.path.dirname(os.path.abspath(output_file))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(dict(plays=self.reports), tmp_file, indent=2)
+            os.replace(tmp_path, output_file)
+        except (IOError, OSError) as e:
+            self._display.warning('Failed to write the PowerScale API perf '
+                                  'to %s: %s' % (output_file, to_text(e)))
@@ -42,6 +42,35 @@ class ModuleDocFragment(object):
             description:
             - the password of the PowerScale cluster.
             required: true
+        log_level:
+            description:
+            - Level of the messages written to the C(ansible_powerscale.log)
+              file on the managed node.
+            - C('off') disables logging, quoted so that YAML keeps it a string.
+            - The environment variable C(POWERSCALE_LOG_LEVEL) is used when
+              not specified, else the messages are logged from C(info).
+            type: str
+            choices: [debug, info, warning, error, critical, 'off']
+            version_added: '3.10.0'
+        log_format:
+            description:
+            - Format of the log file on the managed node.
+            - C(text) writes free-text lines to C(ansible_powerscale.log).
+            - C(json) writes one JSON object per line to numbered segments
+              of C(ansible_powerscale.jsonl), such as
+              C(ansible_powerscale.1.jsonl). Each record carries the
+              correlation ID of the task, the module, the cluster host and
+              for the requests to the cluster, the endpoint, HTTP status,
+              latency and payload size.
+            - A segment is never renamed, the next segment is started when
+              it reaches 5 MB.
+            - The correlation ID is taken from the environment variable
+              C(POWERSCALE_CORRELATION_ID), else generated for each task.
+            - The environment variable C(POWERSCALE_LOG_FORMAT) is used when
+              not specified, else C(text) is used.
+            type: str
+            choices: [text, json]
+            version_added: '3.10.0'
     requirements:
       - A Dell PowerScale Storage system.
       - Ansible-core 2.17 or later.
@@ -49,4 +78,36 @@ class ModuleDocFragment(object):
     notes:
       - The modules present in this collection named as 'dellemc.powerscale'
         are built to support the Dell PowerScale storage platform.
+      - The result of a module which sent requests to the cluster includes
+        a C(perf) dictionary with their count, latency, payload size and
+        retries per endpoint, which the C(dellemc.powerscale.perf) callback
+        plugin aggregates across a play.
+    '''
+
+    # Documentation fragment for the zone topology cache (zone_cache)
+    ZONE_CACHE = r'''
+    options:
+        zone_cache_file:
+            description:
+            - Path of a file on the controller persisting the access zones of
+              the cluster with their base paths, IDs and auth providers.
+            - The access zones are fetched in a single request and reused by
+              the tasks of any module reading them until I(zone_cache_ttl)
+              expires.
+            - If not specified, the access zones are fetched once per task.
+            - The environment variable C(POWERSCALE_ZONE_CACHE_FILE) is used
+              when not specified.
+            type: path
+            version_added: '3.10.0'
+        zone_cache_ttl:
+            description:
+            - The number of seconds the access zones persisted in
+              I(zone_cache_file) are reused.
+            - An access zone missing from the persisted access zones is
+              always fetched again.
+            - The environment variable C(POWERSCALE_ZONE_CACHE_TTL) is used
+              when not specified.
+            type: int
+            default: 300
+            version_added: '3.10.0'
     '''
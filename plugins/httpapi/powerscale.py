@@ -0,0 +1,289 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""HttpApi plugin for Dell PowerScale"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+author: Dell Technologies
+name: powerscale
+short_description: HttpApi plugin for Dell PowerScale
+version_added: '3.10.0'
+description:
+- Persistent connection to the Platform API (PAPI) of a Dell PowerScale
+  cluster, shared by the tasks of a play running on the cluster host.
+- The plugin logs in once per cluster with a PAPI session cookie instead of
+  sending the credentials with every request, and keeps the HTTPS connections
+  to the cluster alive between requests and tasks.
+- The modules of the collection send their PAPI requests through the
+  connection when C(ansible_connection) is C(ansible.netcommon.httpapi) and
+  C(ansible_network_os) is C(dellemc.powerscale.powerscale).
+- The cluster is reached with C(ansible_host), C(ansible_httpapi_port),
+  C(ansible_httpapi_use_ssl) and C(ansible_httpapi_validate_certs), and the
+  session is opened with C(ansible_user) and C(ansible_httpapi_password).
+- The I(onefs_host), I(api_user) and I(api_password) options of the modules
+  are still required, the requests are authenticated with the session of
+  the connection.
+- Requires the C(ansible.netcommon) collection.
+'''
+
+import http.client
+import json
+import ssl
+import threading
+from urllib.parse import urlencode
+
+from ansible.module_utils.common.text.converters import to_text
+from ansible.module_utils.connection import ConnectionError
+from ansible.plugins.httpapi import HttpApiBase
+
+SESSION_PATH = '/session/1/session'
+CLUSTER_CONFIG_PATH = '/platform/1/cluster/config'
+SESSION_SERVICES = ['platform', 'namespace']
+
+# Number of idle connections to the cluster kept alive
+MAX_IDLE_CONNECTIONS = 4
+
+
+class HttpApi(HttpApiBase):
+
+    '''Class which owns the PAPI session and the keep-alive connections of a
+    PowerScale cluster'''
+
+    def __init__(self, connection):
+        """
+        Initialize the HttpApi plugin
+        :param connection: The httpapi connection plugin
+        """
+        super(HttpApi, self).__init__(connection)
+        self.session_id = None
+        self.csrf_token = None
+        self.credentials = None
+        self.onefs_version = None
+        self.idle_connections = []
+        self.pool_lock = threading.Lock()
+
+    def get_connection_option(self, name, default=None):
+        """
+        Get an option of the httpapi connection
+        :param name: The option name
+        :param default: The value when the option is not set
+        """
+        try:
+            value = self.connection.get_option(name)
+        except KeyError:
+            value = None
+        return default if value is None else value
+
+    def get_base_url(self):
+        """
+        Get the URL of the cluster, sent as referer of the session requests
+        """
+        protocol = 'https' if self.get_connection_option('use_ssl') \
+            else 'http'
+        return '%s://%s:%s' % (protocol, self.get_connection_option('host'),
+                               self.get_port())
+
+    def get_port(self):
+        """
+        Get the port of the Platform API
+        """
+        return self.get_connection_option('port', 8080)
+
+    def new_http_connection(self):
+        """
+        Open a connection to the cluster
+        """
+        host = self.get_connection_option('host')
+        timeout = self.get_connection_option('persistent_command_timeout',
+                                             30)
+        if not self.get_connection_option('use_ssl'):
+            return http.client.HTTPConnection(host, self.get_port(),
+                                              timeout=timeout)
+        context = ssl.create_default_context()
+        if not self.get_connection_option('validate_certs', True):
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        return http.client.HTTPSConnection(host, self.get_port(),
+                                           timeout=timeout, context=context)
+
+    def acquire_http_connection(self):
+        """
+        Get an idle connection to the cluster, or open a new one
+        :return: The connection and whether it was idle
+        """
+        with self.pool_lock:
+            if self.idle_connections:
+                return self.idle_connections.pop(), True
+        return self.new_http_connection(), False
+
+    def release_http_connection(self, http_connection, response):
+        """
+        Keep a connection alive for the next requests
+        :param http_connection: The connection
+        :param response: The last response read on the connection
+        """
+        with self.pool_lock:
+            if not response.will_close and \
+                    len(self.idle_connections) < MAX_IDLE_CONNECTIONS:
+                self.idle_connections.append(http_connection)
+                return
+        http_connection.close()
+
+    def close_http_connections(self):
+        """
+        Close the idle connections to the cluster
+        """
+        with self.pool_lock:
+            idle_connections, self.idle_connections = \
+                self.idle_connections, []
+        for http_connection in idle_connections:
+            http_connection.close()
+
+    def send(self, method, path, body=None, headers=None):
+        """
+        Send a request on a keep-alive connection. A request failing on a
+        connection closed by the cluster while idle is sent again on a new
+        connection.
+        :param method: The HTTP method
+        :param path: The path of the request with its query
+        :param body: The request body
+        :param headers: The request headers
+        :return: The response and its body
+        """
+        while True:
+            http_connection, was_idle = self.acquire_http_connection()
+            try:
+                http_connection.request(method, path, body=body,
+                                        headers=headers or {})
+                response = http_connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                http_connection.close()
+                if was_idle:
+                    continue
+                raise ConnectionError('%s %s failed with error: %s'
+                                      % (method, path, to_text(e)))
+            self.release_http_connection(http_connection, response)
+            return response, data
+
+    def get_session_headers(self):
+        """
+        Get the headers authenticating a request with the session
+        """
+        headers = {'Referer': self.get_base_url()}
+        if self.session_id:
+            headers['Cookie'] = 'isisessid=%s' % self.session_id
+        if self.csrf_token:
+            headers['X-CSRF-Token'] = self.csrf_token
+        return headers
+
+    def login(self, username, password):
+        """
+        Open a PAPI session with the credentials of the connection
+        :param username: The user of the cluster
+        :param password: The password of the user
+        """
+        self.credentials = (username, password)
+        self.open_session()
+
+    def open_session(self):
+        """
+        Open a PAPI session and keep its cookie
+        """
+        if not self.credentials or not self.credentials[0]:
+            raise ConnectionError('The user and password of the PowerScale '
+                                  'cluster are required to open a session')
+        username, password = self.credentials
+        body = json.dumps(dict(username=username, password=password,
+                               services=SESSION_SERVICES))
+        headers = {'Content-Type': 'application/json',
+                   'Referer': self.get_base_url()}
+        response, data = self.send('POST', SESSION_PATH, body, headers)
+        if response.status not in (200, 201):
+            raise ConnectionError('Login to the PowerScale cluster failed '
+                                  'with status %s: %s'
+                                  % (response.status, to_text(data)))
+        cookies = self.get_cookies(response)
+        self.session_id = cookies.get('isisessid')
+        self.csrf_token = cookies.get('isicsrf')
+
+    @staticmethod
+    def get_cookies(response):
+        """
+        Get the cookies set by a response
+        :param response: The HTTP response
+        :return: Dictionary of cookie name to value
+        """
+        cookies = {}
+        for header in response.msg.get_all('Set-Cookie') or []:
+            name, _sep, value = header.split(';', 1)[0].partition('=')
+            cookies[name.strip()] = value.strip()
+        return cookies
+
+    def logout(self):
+        """
+        Close the PAPI session and the connections to the cluster
+        """
+        if self.session_id:
+            try:
+                self.send('DELETE', SESSION_PATH + '?isisessid',
+                          headers=self.get_session_headers())
+            except ConnectionError:
+                pass
+            self.session_id = None
+            self.csrf_token = None
+        self.close_http_connections()
+
+    def send_request(self, method, path, query=None, body=None,
+                     headers=None):
+        """
+        Send a PAPI request with the session of the connection, opening a
+        new session when it expired
+        :param method: The HTTP method
+        :param path: The path of the request
+        :param query: List of query parameter name and value pairs
+        :param body: The request body, serialized as JSON unless a string
+        :param headers: The request headers
+        :return: Dictionary with the status, reason, headers and body of the
+                 response
+        """
+        if query:
+            path += ('&' if '?' in path else '?') + urlencode(
+                [tuple(pair) for pair in query])
+        if body is not None and not isinstance(body, str):
+            body = json.dumps(body)
+        request_headers = dict(headers or {})
+        if body is not None:
+            request_headers.setdefault('Content-Type', 'application/json')
+
+        if not self.session_id:
+            self.open_session()
+        request_headers.update(self.get_session_headers())
+        response, data = self.send(method, path, body, request_headers)
+        if response.status == 401 and self.credentials:
+            self.open_session()
+            request_headers.update(self.get_session_headers())
+            response, data = self.send(method, path, body, request_headers)
+        return dict(status=response.status, reason=response.reason,
+                    headers=dict(response.getheaders()),
+                    data=to_text(data, errors='surrogate_or_strict'))
+
+    def get_onefs_version(self):
+        """
+        Get the OneFS version of the cluster, fetched once per connection
+        :return: Dictionary of the OneFS version details
+        """
+        if self.onefs_version is None:
+            response = self.send_request('GET', CLUSTER_CONFIG_PATH)
+            if response['status'] != 200:
+                raise ConnectionError('Getting the OneFS version failed with '
+                                      'status %s: %s' % (response['status'],
+                                                         response['data']))
+            self.onefs_version = json.loads(response['data'])['onefs_version']
+        return self.onefs_version
@@ -0,0 +1,345 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Inventory plugin for Dell PowerScale"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+author: Dell Technologies
+name: powerscale
+short_description: Inventory of Dell PowerScale clusters
+version_added: '3.10.0'
+description:
+- Creates hosts and groups from the nodes, access zones, network groupnets,
+  subnets and pools, and node pools of Dell PowerScale clusters.
+- Each node is added as the host C(<cluster>-node-<lnn>) and each access
+  zone as the host C(<cluster>-zone-<name>). Each network pool is added as
+  the host of its SmartConnect zone, or C(<cluster>-pool-<pool ID>) when it
+  has no SmartConnect zone.
+- The hosts of a cluster are in the groups C(<cluster>_nodes),
+  C(<cluster>_access_zones) and C(<cluster>_network_pools), children of the
+  C(<cluster>) group. The nodes of a node pool are in the group
+  C(<cluster>_nodepool_<name>). The network pools are in the groups
+  C(<cluster>_groupnet_<groupnet>) and C(<cluster>_subnet_<groupnet>_<subnet>),
+  and with the access zone they serve in the group
+  C(<cluster>_zone_<access zone>).
+- The details of each object are in the C(powerscale_*) host variables.
+- The topology of the clusters is fetched concurrently and kept in the
+  inventory cache when it is enabled. It is not cached when a request
+  failed.
+- The configuration file name must end with C(powerscale.yml) or
+  C(powerscale.yaml).
+extends_documentation_fragment:
+- constructed
+- inventory_cache
+options:
+  plugin:
+    description:
+    - The name of this plugin.
+    type: str
+    required: true
+    choices: [dellemc.powerscale.powerscale]
+  clusters:
+    description:
+    - The PowerScale clusters.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description:
+        - The name of the cluster in the host and group names.
+        - Defaults to I(onefs_host).
+        type: str
+      onefs_host:
+        description:
+        - IP address or FQDN of the PowerScale cluster.
+        type: str
+        required: true
+      port_no:
+        description:
+        - Port number of the PowerScale cluster.
+        type: str
+        default: '8080'
+      verify_ssl:
+        description:
+        - Whether to validate the SSL certificate of the cluster.
+        type: bool
+        default: false
+      api_user:
+        description:
+        - The user of the PowerScale cluster.
+        type: str
+        required: true
+      api_password:
+        description:
+        - The password of the user.
+        type: str
+        required: true
+  max_workers:
+    description:
+    - The maximum number of requests sent concurrently to the clusters.
+    type: int
+    default: 8
+requirements:
+- isilon-sdk
+'''
+
+EXAMPLES = r'''
+# powerscale.yml
+plugin: dellemc.powerscale.powerscale
+clusters:
+  - name: cluster1
+    onefs_host: 10.230.24.1
+    api_user: admin
+    api_password: "{{ lookup('ansible.builtin.env', 'POWERSCALE_PASSWORD') }}"
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/powerscale_inventory
+cache_timeout: 3600
+compose:
+  ansible_connection: "'local'"
+keyed_groups:
+  - key: powerscale_node.status
+    prefix: node_status
+    default_value: unknown
+'''
+
+from ansible.errors import AnsibleParserError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, \
+    Constructable
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.controller \
+    import get_controller_connection
+
+# Topology query name to the SDK API, method and key of the list in the
+# response, the same requests as the info module
+TOPOLOGY_QUERIES = dict(
+    nodes=('ClusterApi', 'get_cluster_nodes', 'nodes'),
+    access_zones=('ZonesApi', 'list_zones', 'zones'),
+    groupnets=('NetworkApi', 'list_network_groupnets', 'groupnets'),
+    subnets=('NetworkApi', 'get_network_subnets', 'subnets'),
+    network_pools=('NetworkApi', 'get_network_pools', 'pools'),
+    node_pools=('StoragepoolApi', 'list_storagepool_nodepools', 'nodepools'),
+)
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'dellemc.powerscale.powerscale'
+
+    def __init__(self):
+        super(InventoryModule, self).__init__()
+        self.fetch_failed = False
+
+    def verify_file(self, path):
+        """
+        Check whether a file is a configuration file of this plugin
+        :param path: The path of the file
+        """
+        return super(InventoryModule, self).verify_file(path) and \
+            path.endswith(('powerscale.yml', 'powerscale.yaml'))
+
+    def parse(self, inventory, loader, path, cache=True):
+        """
+        Populate the inventory from the clusters of a configuration file
+        :param inventory: The inventory
+        :param loader: The data loader
+        :param path: The path of the configuration file
+        :param cache: Whether the cached topology can be used
+        """
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+        clusters = self.get_clusters()
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option('cache') and cache
+        update_cache = self.get_option('cache') and not cache
+        topology = None
+        if use_cache:
+            try:
+                topology = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if topology is None:
+            topology = self.fetch_topology(clusters)
+        if update_cache and not self.fetch_failed:
+            self._cache[cache_key] = topology
+
+        for cluster in clusters:
+            self.populate(cluster, topology.get(cluster['name']) or {})
+
+    def get_clusters(self):
+        """
+        Get the clusters of the configuration file with their names
+        """
+        clusters = []
+        for cluster in self.get_option('clusters') or []:
+            cluster = dict((key, self.templar.template(value)
+                            if self.templar.is_template(value) else value)
+                           for key, value in cluster.items())
+            if not cluster.get('onefs_host'):
+                raise AnsibleParserError('onefs_host is required for each '
+                                         'cluster of the PowerScale inventory')
+            cluster['name'] = cluster.get('name') or cluster['onefs_host']
+            clusters.append(cluster)
+        return clusters
+
+    def fetch_topology(self, clusters):
+        """
+        Fetch the topology of the clusters, sending the requests of all the
+        clusters concurrently
+        :param clusters: The clusters
+        :return: Dictionary of cluster name to query name to list of objects
+        """
+        self.fetch_failed = False
+        connections = {}
+        topology = {}
+        for cluster in clusters:
+            params = dict((key, value) for key, value in cluster.items()
+                          if key != 'name')
+            try:
+                connections[cluster['name']] = \
+                    get_controller_connection(params)
+            except Exception as e:
+                self.fetch_failed = True
+                self.display.warning(
+                    'Skipping PowerScale cluster %s: %s'
+                    % (cluster['name'], to_native(e)))
+            topology[cluster['name']] = {}
+
+        items = [(name, query) for name in connections
+                 for query in TOPOLOGY_QUERIES]
+        outcome = utils.run_concurrently(
+            lambda item: self.fetch_query(connections[item[0]], item[1]),
+            items, self.get_option('max_workers'))
+        for entry in outcome:
+            name, query = entry['item']
+            if entry['error']:
+                self.fetch_failed = True
+                self.display.warning(
+                    'Getting %s of PowerScale cluster %s failed with error: '
+                    '%s' % (query.replace('_', ' '), name, entry['error']))
+                continue
+            topology[name][query] = entry['result']
+        return topology
+
+    @staticmethod
+    def fetch_query(connection, query):
+        """
+        Fetch the objects of a topology query
+        :param connection: The SDK and API client of the cluster
+        :param query: The topology query name
+        :return: List of objects
+        """
+        isi_sdk, api_client = connection
+        api_name, method, key = TOPOLOGY_QUERIES[query]
+        api = getattr(isi_sdk, api_name)(api_client)
+        return getattr(api, method)().to_dict().get(key) or []
+
+    def add_group(self, name, parent=None):
+        """
+        Add a group to the inventory
+        :param name: The group name, sanitized
+        :param parent: The parent group
+        :return: The group name in the inventory
+        """
+        group = self.inventory.add_group(self._sanitize_group_name(name))
+        if parent:
+            self.inventory.add_child(parent, group)
+        return group
+
+    def add_host(self, name, groups, cluster, variables):
+        """
+        Add a host to the inventory with the variables of its cluster
+        :param name: The host name
+        :param groups: The groups of the host
+        :param cluster: The cluster of the host
+        :param variables: The host variables
+        """
+        host = self.inventory.add_host(name)
+        for group in groups:
+            self.inventory.add_child(group, host)
+        variables = dict(variables, powerscale_cluster=cluster['name'],
+                         powerscale_onefs_host=cluster['onefs_host'],
+                         powerscale_port_no=str(cluster.get('port_no') or
+                                                '8080'))
+        for key, value in variables.items():
+            self.inventory.set_variable(host, key, value)
+
+        strict = self.get_option('strict')
+        self._set_composite_vars(self.get_option('compose'), variables, host,
+                                 strict=strict)
+        self._add_host_to_composed_groups(self.get_option('groups'),
+                                          variables, host, strict=strict)
+        self._add_host_to_keyed_groups(self.get_option('keyed_groups'),
+                                       variables, host, strict=strict)
+        return host
+
+    def populate(self, cluster, topology):
+        """
+        Add the hosts and groups of a cluster
+        :param cluster: The cluster
+        :param topology: Dictionary of query name to list of objects
+        """
+        name = cluster['name']
+        cluster_group = self.add_group(name)
+        nodes_group = self.add_group('%s_nodes' % name, cluster_group)
+        zones_group = self.add_group('%s_access_zones' % name, cluster_group)
+        pools_group = self.add_group('%s_network_pools' % name,
+                                     cluster_group)
+
+        node_hosts = {}
+        for node in topology.get('nodes') or []:
+            node_hosts[node.get('lnn')] = self.add_host(
+                '%s-node-%s' % (name, node.get('lnn')), [nodes_group],
+                cluster, dict(powerscale_node=node,
+                              powerscale_lnn=node.get('lnn')))
+
+        for node_pool in topology.get('node_pools') or []:
+            group = self.add_group('%s_nodepool_%s' % (name,
+                                                       node_pool['name']),
+                                   cluster_group)
+            for lnn in node_pool.get('lnns') or []:
+                if lnn in node_hosts:
+                    self.inventory.add_child(group, node_hosts[lnn])
+
+        zone_groups = {}
+        for zone in topology.get('access_zones') or []:
+            zone_groups[zone['name']] = self.add_group(
+                '%s_zone_%s' % (name, zone['name']), cluster_group)
+            self.add_host('%s-zone-%s' % (name, zone['name']),
+                          [zones_group, zone_groups[zone['name']]], cluster,
+                          dict(powerscale_access_zone=zone))
+
+        subnet_groups = {}
+        for groupnet in topology.get('groupnets') or []:
+            self.add_group('%s_groupnet_%s' % (name, groupnet['name']),
+                           cluster_group)
+        for subnet in topology.get('subnets') or []:
+            groupnet_group = self.add_group(
+                '%s_groupnet_%s' % (name, subnet['groupnet']), cluster_group)
+            subnet_groups[(subnet['groupnet'], subnet['name'])] = \
+                self.add_group('%s_subnet_%s_%s' % (name, subnet['groupnet'],
+                                                    subnet['name']),
+                               groupnet_group)
+
+        for pool in topology.get('network_pools') or []:
+            groups = [pools_group]
+            subnet_group = subnet_groups.get((pool.get('groupnet'),
+                                              pool.get('subnet')))
+            if subnet_group:
+                groups.append(subnet_group)
+            if pool.get('access_zone') in zone_groups:
+                groups.append(zone_groups[pool['access_zone']])
+            self.add_host(pool.get('sc_dns_zone') or
+                          '%s-pool-%s' % (name, pool['id']), groups, cluster,
+                          dict(powerscale_network_pool=pool))
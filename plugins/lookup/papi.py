@@ -0,0 +1,260 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Lookup plugin for Dell PowerScale"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+author: Dell Technologies
+name: papi
+short_description: Get single values from Dell PowerScale clusters
+version_added: '3.10.0'
+description:
+- Returns the result of a query on a Dell PowerScale cluster for each term,
+  such as the base path of an access zone or the ID of the NFS export of
+  a path.
+- The results are kept in a process-wide LRU cache for I(cache_ttl) seconds,
+  keyed by cluster and query.
+- Identical lookups running at the same time send a single request. The
+  forks of a playbook run share their results through I(cache_dir).
+options:
+  _terms:
+    description:
+    - The queries.
+    - C(zone_base_path) returns the base path of I(access_zone).
+    - C(nfs_export_id) returns the ID of the NFS export of I(path) in
+      I(access_zone), null when there is no export.
+    - C(smb_share_path) returns the path of the SMB share I(share_name) in
+      I(access_zone), null when the share does not exist.
+    - C(quota_usage) returns the usage of the directory quota of I(path),
+      null when there is no quota.
+    - C(filesystem) returns the metadata of the directory I(path), null
+      when the directory does not exist.
+    type: list
+    elements: str
+    required: true
+    choices: [zone_base_path, nfs_export_id, smb_share_path, quota_usage,
+              filesystem]
+  onefs_host:
+    description:
+    - IP address or FQDN of the PowerScale cluster.
+    type: str
+    required: true
+  port_no:
+    description:
+    - Port number of the PowerScale cluster.
+    type: str
+    default: '8080'
+  verify_ssl:
+    description:
+    - Whether to validate the SSL certificate of the cluster.
+    type: bool
+    default: false
+  api_user:
+    description:
+    - The user of the PowerScale cluster.
+    type: str
+    required: true
+  api_password:
+    description:
+    - The password of the user.
+    type: str
+    required: true
+  access_zone:
+    description:
+    - The access zone of the query.
+    type: str
+    default: System
+  path:
+    description:
+    - The absolute path of the directory of the C(nfs_export_id),
+      C(quota_usage) and C(filesystem) queries, such as C(/ifs/data).
+    type: str
+  share_name:
+    description:
+    - The name of the SMB share of the C(smb_share_path) query.
+    type: str
+  cache_ttl:
+    description:
+    - The number of seconds the result of a query is used.
+    - C(0) sends a request for every lookup.
+    type: int
+    default: 60
+  cache_size:
+    description:
+    - The maximum number of results kept in memory by a process.
+    type: int
+    default: 256
+  cache_dir:
+    description:
+    - The directory sharing the results with the other processes.
+    - Defaults to a directory in the local temporary directory of the
+      playbook run, removed at its end.
+    type: path
+    env:
+    - name: POWERSCALE_LOOKUP_CACHE_DIR
+requirements:
+- isilon-sdk
+'''
+
+EXAMPLES = r'''
+- name: Get the base path of an access zone
+  ansible.builtin.debug:
+    msg: "{{ lookup('dellemc.powerscale.papi', 'zone_base_path',
+              access_zone='sample-zone', onefs_host=onefs_host,
+              api_user=api_user, api_password=api_password) }}"
+
+- name: Get the NFS export ID and the quota usage of a path
+  ansible.builtin.set_fact:
+    export_id: "{{ details[0] }}"
+    quota_usage: "{{ details[1] }}"
+  vars:
+    details: "{{ query('dellemc.powerscale.papi', 'nfs_export_id',
+                       'quota_usage', path='/ifs/data/sample',
+                       onefs_host=onefs_host, api_user=api_user,
+                       api_password=api_password) }}"
+'''
+
+RETURN = r'''
+_raw:
+  description:
+  - The result of each query.
+  type: list
+  elements: raw
+'''
+
+import os
+import threading
+
+from ansible import constants as C
+from ansible.errors import AnsibleLookupError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.lookup import LookupBase
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.controller \
+    import ControllerModule, get_controller_connection
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.cursor \
+    import get_cluster_key
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.namespace \
+    import Namespace
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.protocol \
+    import Protocol
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.query_cache \
+    import QueryCache
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.quota \
+    import Quota
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zones_summary \
+    import ZonesSummary
+
+CLUSTER_OPTIONS = ('onefs_host', 'port_no', 'verify_ssl', 'api_user',
+                   'api_password')
+QUERY_OPTIONS = ('access_zone', 'path', 'share_name')
+
+# The cache and the connections are shared by the lookups of a process
+CACHE = QueryCache()
+CONNECTIONS = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def get_zone_base_path(isi_sdk, api_client, args):
+    return ZonesSummary(isi_sdk.ZonesSummaryApi(api_client),
+                        ControllerModule()).get_zone_base_path(
+        args['access_zone'])
+
+
+def get_nfs_export_id(isi_sdk, api_client, args):
+    export = Protocol(isi_sdk.ProtocolsApi(api_client),
+                      ControllerModule()).get_nfs_export(
+        args['path'], args['access_zone'])
+    return export['id'] if export else None
+
+
+def get_smb_share_path(isi_sdk, api_client, args):
+    share = Protocol(isi_sdk.ProtocolsApi(api_client),
+                     ControllerModule()).get_smb_share(
+        args['share_name'], args['access_zone'])
+    return share['path'] if share else None
+
+
+def get_quota_usage(isi_sdk, api_client, args):
+    quota = Quota(isi_sdk.QuotaApi(api_client),
+                  ControllerModule()).get_directory_quota(
+        '/' + args['path'].lstrip('/'))
+    return quota.get('usage') if quota else None
+
+
+def get_filesystem(isi_sdk, api_client, args):
+    return Namespace(isi_sdk.NamespaceApi(api_client),
+                     ControllerModule()).get_filesystem(
+        args['path'].lstrip('/'))
+
+
+# Query name to the options it requires and the function fetching it
+QUERIES = dict(
+    zone_base_path=((), get_zone_base_path),
+    nfs_export_id=(('path',), get_nfs_export_id),
+    smb_share_path=(('share_name',), get_smb_share_path),
+    quota_usage=(('path',), get_quota_usage),
+    filesystem=(('path',), get_filesystem),
+)
+
+
+class LookupModule(LookupBase):
+
+    def run(self, terms, variables=None, **kwargs):
+        """
+        Get the result of each query
+        :param terms: The query names
+        :param variables: The task variables
+        :return: List of query results
+        """
+        self.set_options(var_options=variables, direct=kwargs)
+        cluster = dict((key, self.get_option(key)) for key in CLUSTER_OPTIONS)
+        args = dict((key, self.get_option(key)) for key in QUERY_OPTIONS)
+        ttl = self.get_option('cache_ttl')
+        cache_dir = self.get_option('cache_dir') or \
+            os.path.join(C.DEFAULT_LOCAL_TMP, 'powerscale_papi')
+        CACHE.max_size = self.get_option('cache_size')
+
+        results = []
+        for term in terms:
+            if term not in QUERIES:
+                raise AnsibleLookupError(
+                    'Unknown PowerScale query %s, expected one of: %s'
+                    % (term, ', '.join(sorted(QUERIES))))
+            required, fetch = QUERIES[term]
+            missing = [key for key in required if not args.get(key)]
+            if missing:
+                raise AnsibleLookupError('%s is required for the %s query'
+                                         % (', '.join(missing), term))
+            key = [get_cluster_key(cluster), cluster['api_user'], term,
+                   dict((name, args[name]) for name in required +
+                        ('access_zone',))]
+            try:
+                results.append(CACHE.get(
+                    key, lambda: fetch(*(self.get_connection(cluster) +
+                                         (args,))),
+                    ttl, cache_dir))
+            except Exception as e:
+                raise AnsibleLookupError('PowerScale query %s failed with '
+                                         'error: %s' % (term, to_native(e)))
+        return results
+
+    @staticmethod
+    def get_connection(cluster):
+        """
+        Get the SDK and the API client of a cluster, created once per
+        process
+        :param cluster: The connection options of the cluster
+        :return: The SDK and the API client
+        """
+        key = (get_cluster_key(cluster), cluster['api_user'])
+        with _CONNECTIONS_LOCK:
+            if key not in CONNECTIONS:
+                CONNECTIONS[key] = get_controller_connection(cluster)
+            return CONNECTIONS[key]
@@ -0,0 +1,111 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Timings of the PAPI requests of a PowerScale module"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import random
+import threading
+
+# Version of the perf structure in the module results
+PERF_VERSION = 1
+
+# Maximum number of latencies kept per endpoint for the percentiles
+MAX_LATENCY_SAMPLES = 1000
+
+
+def add_latency_sample(samples, count, latency_ms,
+                       max_samples=MAX_LATENCY_SAMPLES):
+    """
+    Add a latency to the samples of an endpoint, keeping a uniform random
+    sample of at most max_samples latencies
+    :param samples: The list of sampled latencies
+    :param count: The number of latencies seen, including this one
+    :param latency_ms: The latency in milliseconds
+    :param max_samples: The maximum number of samples
+    """
+    if len(samples) < max_samples:
+        samples.append(latency_ms)
+        return
+    index = random.randrange(count)
+    if index < max_samples:
+        samples[index] = latency_ms
+
+
+class ApiPerf:
+    """
+    Counters of the PAPI requests sent by the process, per cluster, method
+    and endpoint.
+    """
+
+    def __init__(self):
+        """
+        Initialize the counters.
+        """
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    def record(self, cluster, method, endpoint, http_status, latency_ms,
+               payload_bytes=None, retries=0):
+        """
+        Record a request.
+        :param cluster: The host of the cluster.
+        :param method: The HTTP method.
+        :param endpoint: The endpoint, such as
+                         /platform/3/protocols/nfs/exports/{NfsExportId}.
+        :param http_status: The HTTP status, None when there is no response.
+        :param latency_ms: The latency in milliseconds.
+        :param payload_bytes: The size of the response payload, when known.
+        :param retries: The number of retries of the request.
+        """
+        key = (cluster, method, endpoint)
+        failed = http_status is None or http_status >= 400
+        with self.lock:
+            call = self.calls.get(key)
+            if call is None:
+                call = self.calls[key] = dict(
+                    cluster=cluster, method=method, endpoint=endpoint,
+                    count=0, errors=0, latency_ms=0.0, latencies_ms=[],
+                    payload_bytes=0, retries=0)
+            call['count'] += 1
+            call['errors'] += int(failed)
+            call['latency_ms'] += latency_ms
+            call['payload_bytes'] += payload_bytes or 0
+            call['retries'] += retries
+            add_latency_sample(call['latencies_ms'], call['count'],
+                               latency_ms)
+
+    def get_perf(self):
+        """
+        Get the perf structure of the recorded requests.
+        :return: Dictionary with the totals and the calls per endpoint,
+                 None when no request was sent.
+        """
+        with self.lock:
+            calls = [dict(call, latency_ms=round(call['latency_ms'], 1),
+                          latencies_ms=list(call['latencies_ms']))
+                     for call in self.calls.values()]
+        if not calls:
+            return None
+        return dict(
+            version=PERF_VERSION,
+            requests=sum(call['count'] for call in calls),
+            errors=sum(call['errors'] for call in calls),
+            latency_ms=round(sum(call['latency_ms'] for call in calls), 1),
+            payload_bytes=sum(call['payload_bytes'] for call in calls),
+            retries=sum(call['retries'] for call in calls),
+            calls=calls)
+
+    def reset(self):
+        """
+        Forget the recorded requests.
+        """
+        with self.lock:
+            self.calls.clear()
+
+
+# The requests of the module process
+API_PERF = ApiPerf()
@@ -1,4 +1,4 @@
-# Copyright: (c) 2022-2024, Dell Technologies
+# Copyright: (c) 2022-2026, Dell Technologies
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
@@ -7,8 +7,26 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+import atexit
+import glob
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+CORRELATION_ID_ENV = 'POWERSCALE_CORRELATION_ID'
+
+# Attributes added to the log records of a structured log
+RECORD_FIELDS = ('correlation_id', 'cluster', 'method', 'endpoint',
+                 'http_status', 'latency_ms', 'payload_bytes')
+
+# Context of the task added to every log record
+_LOG_CONTEXT = dict(pid=None, correlation_id=None, cluster=None)
 
 
 class CustomRotatingFileHandler(RotatingFileHandler):
@@ -17,9 +35,316 @@ class CustomRotatingFileHandler(RotatingFileHandler):
         Modify the filename of a log file when rotating.
         :param default_name: The default name of the log file.
         """
-        src_file_name = default_name.split('.')
-        dest_file_name = "{0}_{1}.{2}.{3}".format(
-            src_file_name[0], '{0:%Y%m%d}'.format(datetime.now()),
-            src_file_name[1], src_file_name[2]
-        )
-        return dest_file_name
+        root, ext = os.path.splitext(self.baseFilename)
+        suffix = default_name[len(self.baseFilename):] \
+            if default_name.startswith(self.baseFilename) else ''
+        return "{0}_{1}{2}{3}".format(
+            root, '{0:%Y%m%d}'.format(datetime.now()), ext, suffix)
+
+
+class SegmentedFileHandler(logging.Handler):
+    """
+    Append the log records to numbered segments of a log file. A new
+    segment is started when the current one reaches the maximum size, so
+    that no file is renamed while other processes are writing to it.
+    """
+
+    def __init__(self, file_name, max_bytes, backup_count):
+        """
+        Initialize the handler.
+        :param file_name: The name of the log file, the segment number is
+                          inserted before its extension.
+        :param max_bytes: The size of a segment.
+        :param backup_count: The number of full segments kept.
+        """
+        super(SegmentedFileHandler, self).__init__()
+        self.root, self.ext = os.path.splitext(os.path.abspath(file_name))
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.fd = None
+        self.index = None
+
+    def get_segment_name(self, index):
+        """
+        Get the file name of a segment.
+        :param index: The segment number.
+        """
+        return "{0}.{1}{2}".format(self.root, index, self.ext)
+
+    def get_segment_indexes(self):
+        """
+        Get the numbers of the existing segments in ascending order.
+        """
+        pattern = re.compile(r'\.(\d+)' + re.escape(self.ext) + '$')
+        indexes = []
+        for name in glob.glob(glob.escape(self.root) + '.*' + self.ext):
+            match = pattern.search(name[len(self.root):])
+            if match:
+                indexes.append(int(match.group(1)))
+        return sorted(indexes)
+
+    def open_segment(self, minimum_index=1):
+        """
+        Open the latest segment for appending, or the next one when it is
+        full, and remove the segments beyond the backup count.
+        :param minimum_index: The lowest segment number to open.
+        """
+        self.close_segment()
+        indexes = self.get_segment_indexes()
+        index = max(indexes[-1] if indexes else 1, minimum_index)
+        name = self.get_segment_name(index)
+        if self.max_bytes and os.path.exists(name) and \
+                os.path.getsize(name) >= self.max_bytes:
+            index += 1
+        self.fd = os.open(self.get_segment_name(index),
+                          os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self.index = index
+        for old_index in indexes:
+            if old_index < index - self.backup_count:
+                try:
+                    os.remove(self.get_segment_name(old_index))
+                except OSError:
+                    pass
+
+    def close_segment(self):
+        """
+        Close the segment being written.
+        """
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def emit(self, record):
+        """
+        Append a log record with a single write, so that the records of
+        concurrent processes are not interleaved.
+        :param record: The log record.
+        """
+        try:
+            data = (self.format(record) + '\n').encode('utf-8')
+            if self.fd is None:
+                self.open_segment()
+            elif self.max_bytes:
+                size = os.fstat(self.fd).st_size
+                if size and size + len(data) > self.max_bytes:
+                    self.open_segment(self.index + 1)
+            os.write(self.fd, data)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        """
+        Close the handler.
+        """
+        with self.lock:
+            self.close_segment()
+        super(SegmentedFileHandler, self).close()
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format a log record as a single line JSON object.
+    """
+
+    def format(self, record):
+        """
+        Format a log record.
+        :param record: The log record.
+        """
+        entry = dict(
+            time=datetime.fromtimestamp(record.created,
+                                        timezone.utc).isoformat(),
+            level=record.levelname, module=record.name,
+            file=record.filename, line=record.lineno,
+            message=record.getMessage())
+        for field in RECORD_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def get_correlation_id():
+    """
+    Get the ID correlating the log records of a task, taken from the
+    environment or generated once per process.
+    """
+    if _LOG_CONTEXT['pid'] != os.getpid():
+        _LOG_CONTEXT['pid'] = os.getpid()
+        _LOG_CONTEXT['correlation_id'] = os.environ.get(CORRELATION_ID_ENV) \
+            or uuid.uuid4().hex
+    return _LOG_CONTEXT['correlation_id']
+
+
+def set_log_context(cluster=None):
+    """
+    Set the context added to the log records of the task.
+    :param cluster: The host of the PowerScale cluster.
+    """
+    _LOG_CONTEXT['cluster'] = cluster
+
+
+class LogContextFilter(logging.Filter):
+    """
+    Add the correlation ID and the cluster of the task to the log records.
+    """
+
+    def filter(self, record):
+        """
+        Add the context to a log record.
+        :param record: The log record.
+        """
+        record.correlation_id = get_correlation_id()
+        if getattr(record, 'cluster', None) is None:
+            record.cluster = _LOG_CONTEXT['cluster']
+        return True
+
+
+def create_file_handler(log_file_name, formatter, max_bytes, backup_count,
+                        structured):
+    """
+    Create the handler writing a log file.
+    :param log_file_name: The name of the log file.
+    :param formatter: The formatter of the text log records.
+    :param max_bytes: The size of the log file when rotating.
+    :param backup_count: The number of rotated log files kept.
+    :param structured: Whether the records are written as JSON lines, to
+                       segments of a .jsonl file next to the log file.
+    """
+    if structured:
+        handler = SegmentedFileHandler(
+            os.path.splitext(log_file_name)[0] + '.jsonl', max_bytes,
+            backup_count)
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler = CustomRotatingFileHandler(log_file_name,
+                                            maxBytes=max_bytes,
+                                            backupCount=backup_count,
+                                            delay=True)
+        handler.setFormatter(formatter)
+    return handler
+
+
+class AsyncQueueHandler(QueueHandler):
+    """
+    Queue the log records of the calling thread so that a listener thread
+    writes them to the log file off the request path. The listener is
+    started with the first record and restarted in a forked process.
+    """
+
+    def __init__(self, log_file_name, formatter, max_bytes, backup_count,
+                 structured=False):
+        """
+        Initialize the handler.
+        :param log_file_name: The name of the log file.
+        :param formatter: The formatter of the text log records.
+        :param max_bytes: The size of the log file when rotating.
+        :param backup_count: The number of rotated log files kept.
+        :param structured: Whether the records are written as JSON lines.
+        """
+        super(AsyncQueueHandler, self).__init__(queue.SimpleQueue())
+        self.file_settings = (log_file_name, formatter, max_bytes,
+                              backup_count)
+        self.structured = structured
+        self.target = create_file_handler(*self.file_settings,
+                                          structured=structured)
+        self.listener = None
+        self.pid = None
+        self.start_lock = threading.Lock()
+        self.addFilter(LogContextFilter())
+
+    def start(self):
+        """
+        Start the listener thread of the current process.
+        """
+        with self.start_lock:
+            if self.pid == os.getpid():
+                return
+            self.queue = queue.SimpleQueue()
+            self.listener = QueueListener(self.queue, self.target,
+                                          respect_handler_level=True)
+            self.listener.start()
+            self.pid = os.getpid()
+            atexit.register(self.stop)
+
+    def enqueue(self, record):
+        """
+        Queue a log record, starting the listener thread when needed.
+        :param record: The log record.
+        """
+        if self.pid != os.getpid():
+            self.start()
+        self.queue.put_nowait(record)
+
+    def stop_listener(self):
+        """
+        Write the queued log records and stop the listener thread, the
+        start lock being held.
+        """
+        if self.listener is None or self.pid != os.getpid():
+            return
+        self.listener.stop()
+        self.listener = None
+        self.pid = None
+        self.target.flush()
+
+    def stop(self):
+        """
+        Write the queued log records and stop the listener thread.
+        """
+        with self.start_lock:
+            self.stop_listener()
+
+    def set_structured(self, structured):
+        """
+        Switch between the text and the structured JSON log file.
+        :param structured: Whether the records are written as JSON lines.
+        """
+        with self.start_lock:
+            if structured == self.structured:
+                return
+            self.stop_listener()
+            self.target.close()
+            self.target = create_file_handler(*self.file_settings,
+                                              structured=structured)
+            self.structured = structured
+
+
+_HANDLERS = {}
+_HANDLERS_LOCK = threading.Lock()
+
+
+def get_queue_handler(log_file_name, formatter, max_bytes, backup_count,
+                      structured=False):
+    """
+    Get the handler of a log file, created once per file and process.
+    :param log_file_name: The name of the log file.
+    :param formatter: The formatter of the text log records.
+    :param max_bytes: The size of the log file when rotating.
+    :param backup_count: The number of rotated log files kept.
+    :param structured: Whether the records are written as JSON lines.
+    :return: The queue handler writing to the log file.
+    """
+    path = os.path.abspath(log_file_name)
+    with _HANDLERS_LOCK:
+        handler = _HANDLERS.get(path)
+        if handler is None:
+            handler = AsyncQueueHandler(log_file_name, formatter, max_bytes,
+                                        backup_count, structured)
+            _HANDLERS[path] = handler
+        else:
+            handler.set_structured(structured)
+    return handler
+
+
+def set_structured_logging(structured):
+    """
+    Switch every log file between the text and the structured JSON format.
+    :param structured: Whether the records are written as JSON lines.
+    """
+    with _HANDLERS_LOCK:
+        handlers = list(_HANDLERS.values())
+    for handler in handlers:
+        handler.set_structured(structured)
@@ -0,0 +1,132 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Persistent connection of the PowerScale httpapi plugin for the SDK"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from urllib.parse import urlsplit
+
+from ansible.module_utils.connection import Connection
+
+
+def get_request_path(url):
+    """
+    Get the path and query of an SDK request URL.
+    :param url: The URL of the request, including the cluster host.
+    """
+    parts = urlsplit(url)
+    return parts.path + ('?' + parts.query if parts.query else '')
+
+
+def get_onefs_release(socket_path):
+    """
+    Get the OneFS release of the cluster of a persistent connection, which
+    fetches it once per connection.
+    :param socket_path: The socket path of the persistent connection.
+    """
+    return Connection(socket_path).get_onefs_version()['release']
+
+
+class PersistentResponse:
+    """
+    Response of a request sent through the persistent connection, with the
+    attributes of a response of the SDK REST client.
+    """
+
+    def __init__(self, response):
+        """
+        Initialize the response.
+        :param response: Dictionary with the status, reason, headers and body
+                         of the response.
+        """
+        self.status = response['status']
+        self.reason = response['reason']
+        self.data = response['data']
+        self.headers = response.get('headers') or {}
+        self.urllib3_response = None
+
+    def getheaders(self):
+        """
+        Get the response headers.
+        """
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """
+        Get a response header.
+        :param name: The header name, case insensitive.
+        :param default: The value when the header is not set.
+        """
+        for key, value in self.headers.items():
+            if key.lower() == name.lower():
+                return value
+        return default
+
+
+class PersistentRestClient:
+    """
+    REST client of the SDK API client which sends the requests through the
+    persistent connection of the dellemc.powerscale httpapi plugin, so that
+    the session and the keep-alive connections of the plugin are used
+    instead of a new connection with basic authentication.
+    """
+
+    def __init__(self, socket_path, api_exception):
+        """
+        Initialize the REST client.
+        :param socket_path: The socket path of the persistent connection.
+        :param api_exception: The exception class of the SDK raised for
+                              unsuccessful responses.
+        """
+        self.connection = Connection(socket_path)
+        self.api_exception = api_exception
+
+    def request(self, method, url, query_params=None, headers=None,
+                post_params=None, body=None, _preload_content=True,
+                _request_timeout=None):
+        """
+        Send a request through the persistent connection.
+        :param method: The HTTP method.
+        :param url: The URL of the request.
+        :param query_params: List of query parameter name and value pairs.
+        :param headers: The request headers, the session of the connection
+                        replaces the basic authentication.
+        :param post_params: The form parameters, sent as the body when there
+                            is no body.
+        :param body: The request body.
+        :return: The response.
+        """
+        headers = dict((key, value) for key, value in (headers or {}).items()
+                       if key.lower() != 'authorization')
+        if body is None and post_params:
+            body = dict(post_params)
+        response = PersistentResponse(self.connection.send_request(
+            method, get_request_path(url),
+            [list(pair) for pair in query_params or []], body, headers))
+        if not 200 <= response.status <= 299:
+            raise self.api_exception(http_resp=response)
+        return response
+
+    def GET(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def HEAD(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    def OPTIONS(self, url, **kwargs):
+        return self.request('OPTIONS', url, **kwargs)
+
+    def DELETE(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def POST(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def PUT(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def PATCH(self, url, **kwargs):
+        return self.request('PATCH', url, **kwargs)
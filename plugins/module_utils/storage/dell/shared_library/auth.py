@@ -149,8 +149,7 @@ class Auth:
                 user_list_details = (self.auth_api.list_auth_users(resume=resume, **filter_params)).to_dict()
                 user_list.extend(user_list_details['users'])
                 resume = user_list_details['resume']
-            msg = f"Got user list from PowerScale cluster {self.module.params['onefs_host']}"
-            LOG.info(msg)
+            LOG.info("Got user list from PowerScale cluster %s", self.module.params['onefs_host'])
             return user_list
         except Exception as e:
             error_msg = (
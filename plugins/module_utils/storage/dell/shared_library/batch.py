@@ -0,0 +1,256 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import copy
+import threading
+import types
+
+from ansible.module_utils.common.parameters import PASS_VARS, remove_values
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library \
+    import auth, powerscale_base, quota, snapshot, zone_topology, \
+    zones_summary
+
+LOG = utils.get_logger('batch')
+
+# Modules of the collection which can run as batch operations
+BATCH_MODULES = ('filesystem', 'group', 'nfs', 'nfs_alias', 'smartquota', 'smb',
+                 'snapshot', 'snapshotschedule', 'user', 'writable_snapshots')
+
+# The module_utils of the operation modules, imported so that they are in
+# the payload of the batch module
+OPERATION_MODULE_UTILS = (auth, powerscale_base, quota, snapshot,
+                          zone_topology, zones_summary)
+
+# Methods of the auth API whose results are kept in the identity cache
+IDENTITY_METHODS = ('get_auth_user', 'get_auth_group', 'get_mapping_identity',
+                    'get_auth_wellknowns', 'get_auth_wellknown')
+
+# Prefixes of the auth API methods changing identities, which clear the
+# identity cache
+IDENTITY_UPDATE_PREFIXES = ('create_', 'update_', 'delete_')
+
+# The parameters of the operation running in the current thread
+_OPERATION = threading.local()
+
+
+class OperationExit(SystemExit):
+
+    '''Exit of a batch operation, carrying the result of its module'''
+
+    def __init__(self, result):
+        super(OperationExit, self).__init__(1 if result.get('failed') else 0)
+        self.result = result
+
+
+class OperationModule:
+
+    '''Mixin of the Ansible module class of a batch operation, which reads
+    the parameters of the operation and returns its result instead of
+    exiting the process'''
+
+    def _load_params(self):
+        self.params = copy.deepcopy(_OPERATION.params)
+
+    def exit_json(self, **kwargs):
+        self.do_cleanup_files()
+        raise OperationExit(self.get_result(kwargs))
+
+    def fail_json(self, msg, **kwargs):
+        kwargs.update(failed=True, msg=str(msg))
+        kwargs.pop('exception', None)
+        self.do_cleanup_files()
+        raise OperationExit(self.get_result(kwargs))
+
+    def get_result(self, kwargs):
+        """
+        Get the result of the operation without its no_log values
+        :param kwargs: The result given to exit_json or fail_json
+        """
+        preserved = dict((key, value) for key, value in kwargs.items()
+                         if value is None or isinstance(value, bool))
+        result = remove_values(kwargs, self.no_log_values)
+        result.update(preserved)
+        return result
+
+
+class IdentityCache:
+
+    '''Auth API whose identity lookups are shared by the operations of a
+    batch'''
+
+    def __init__(self, auth_api):
+        """
+        Initialize the identity cache
+        :param auth_api: The auth sdk instance
+        """
+        self.auth_api = auth_api
+        self.identities = {}
+        self.lock = threading.Lock()
+
+    def __getattr__(self, name):
+        method = getattr(self.auth_api, name)
+        if name in IDENTITY_METHODS:
+            return lambda *args, **kwargs: self.get_identity(
+                name, method, args, kwargs)
+        if name.startswith(IDENTITY_UPDATE_PREFIXES):
+            self.clear()
+        return method
+
+    def get_identity(self, name, method, args, kwargs):
+        """
+        Get the result of an identity lookup, sent once per batch
+        :param name: The method name
+        :param method: The auth API method
+        :param args: The positional arguments of the lookup
+        :param kwargs: The keyword arguments of the lookup
+        """
+        key = (name, repr(args), repr(sorted(kwargs.items())))
+        with self.lock:
+            if key in self.identities:
+                LOG.info("Using the cached result of %s", name)
+                return self.identities[key]
+        result = method(*args, **kwargs)
+        with self.lock:
+            self.identities[key] = result
+        return result
+
+    def clear(self):
+        """
+        Clear the cached identities
+        """
+        with self.lock:
+            self.identities.clear()
+
+
+class BatchSdk:
+
+    '''SDK of the operations of a batch, sharing one auth API with its
+    identity cache'''
+
+    def __init__(self, isi_sdk, api_client):
+        """
+        Initialize the batch SDK
+        :param isi_sdk: The PowerScale SDK
+        :param api_client: The API client of the batch
+        """
+        self.isi_sdk = isi_sdk
+        self.api_client = api_client
+        self.identity_cache = None
+        self.lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self.isi_sdk, name)
+
+    def AuthApi(self, api_client=None):
+        """
+        Get the auth API with the identity cache of the batch
+        """
+        with self.lock:
+            if self.identity_cache is None:
+                self.identity_cache = IdentityCache(
+                    self.isi_sdk.AuthApi(self.api_client))
+            return self.identity_cache
+
+
+class BatchSession:
+
+    '''Context in which the operations of a batch share the API client,
+    the SDK version probe, the identity cache and the zone topology of the
+    batch module'''
+
+    def __init__(self, module, isi_sdk, api_client):
+        """
+        Initialize the batch session
+        :param module: The Ansible module object of the batch
+        :param isi_sdk: The PowerScale SDK
+        :param api_client: The API client of the batch
+        """
+        self.module = module
+        self.isi_sdk = BatchSdk(isi_sdk, api_client)
+        self.api_client = api_client
+        self.saved = None
+
+    def __enter__(self):
+        self.saved = (utils.validate_module_pre_reqs,
+                      utils.get_powerscale_connection, utils.isi_sdk)
+        utils.validate_module_pre_reqs = \
+            lambda module_params, socket_path=None: None
+        utils.get_powerscale_connection = \
+            lambda module_params, socket_path=None: self.api_client
+        utils.isi_sdk = self.isi_sdk
+        zone_topology.share_zone_topologies()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        utils.validate_module_pre_reqs, utils.get_powerscale_connection, \
+            utils.isi_sdk = self.saved
+        zone_topology.share_zone_topologies(False)
+
+    def get_internal_params(self, module_name):
+        """
+        Get the internal parameters of an operation module, such as the
+        check mode and diff mode of the batch
+        :param module_name: The name of the operation module
+        """
+        params = {}
+        for name, (attribute, _default) in PASS_VARS.items():
+            if hasattr(self.module, attribute):
+                params['_ansible_%s' % name] = getattr(self.module,
+                                                       attribute)
+        params['_ansible_module_name'] = module_name
+        return params
+
+    def run_operation(self, operation_module, params):
+        """
+        Run the main function of an operation module
+        :param operation_module: The operation module
+        :param params: The parameters of the operation
+        :return: The result of the operation
+        """
+        _OPERATION.params = dict(
+            params, **self.get_internal_params(operation_module.MODULE_NAME))
+        try:
+            operation_module.main()
+        except OperationExit as e:
+            return e.result
+        except SystemExit as e:
+            return dict(failed=True, changed=False,
+                        msg='%s exited with status %s'
+                            % (operation_module.MODULE_NAME, e.code))
+        except Exception as e:
+            return dict(failed=True, changed=False,
+                        msg='%s failed with error: %s'
+                            % (operation_module.MODULE_NAME,
+                               utils.determine_error(error_obj=e)))
+        finally:
+            _OPERATION.params = None
+        return dict(failed=True, changed=False,
+                    msg='%s did not return a result'
+                        % operation_module.MODULE_NAME)
+
+
+def load_operation_module(name, source):
+    """
+    Load a module of the collection from its source, with its Ansible module
+    class returning the result of the operation
+    :param name: The module name, such as filesystem
+    :param source: The source of the module
+    :return: The loaded module
+    """
+    operation_module = types.ModuleType(
+        'ansible_collections.dellemc.powerscale.plugins.modules.%s' % name)
+    operation_module.__file__ = '<batch operation %s>' % name
+    exec(compile(source, operation_module.__file__, 'exec'),
+         operation_module.__dict__)
+    operation_module.AnsibleModule = type(
+        'OperationModule', (OperationModule, operation_module.AnsibleModule),
+        {})
+    operation_module.MODULE_NAME = 'dellemc.powerscale.%s' % name
+    return operation_module
@@ -39,8 +39,7 @@ class Certificate:
                         each_cert['certificate_pre_expiration_threshold'] = \
                             default_certificate['settings']['certificate_pre_expiration_threshold']
                         break
-                msg = f"Server certificate details are: {certificate}"
-                LOG.info(msg)
+                LOG.info("Server certificate details are: %s", certificate)
                 return certificate['certificates']
         except Exception as e:
             error_msg = f"Got error {utils.determine_error(e)} while getting Server certificate details."
@@ -0,0 +1,78 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import threading
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+
+LOG = utils.get_logger('controller')
+
+# Connection parameters of a cluster used when not given
+DEFAULT_CLUSTER_PARAMS = dict(port_no='8080', verify_ssl=False)
+
+# The SDK import depends on the OneFS version of each cluster and sets the
+# SDK of the utils module, so connections are created one at a time
+_CONNECTION_LOCK = threading.Lock()
+
+
+def get_cluster_params(cluster):
+    """
+    Get the connection parameters of a cluster
+    :param cluster: Dictionary with onefs_host, api_user, api_password and
+                    optionally port_no and verify_ssl
+    :return: The parameters in the format of the module parameters
+    """
+    params = dict(DEFAULT_CLUSTER_PARAMS)
+    params.update((key, value) for key, value in cluster.items()
+                  if value is not None)
+    for key in ('onefs_host', 'api_user', 'api_password'):
+        if not params.get(key):
+            raise ValueError('%s is required to connect to a PowerScale '
+                             'cluster' % key)
+    params['port_no'] = str(params['port_no'])
+    return params
+
+
+def get_controller_connection(cluster):
+    """
+    Get the SDK and the API client of a cluster for a plugin running on
+    the controller
+    :param cluster: The connection parameters of the cluster
+    :return: The SDK and the API client
+    """
+    params = get_cluster_params(cluster)
+    with _CONNECTION_LOCK:
+        prereqs = utils.validate_module_pre_reqs(params)
+        if prereqs and not prereqs['all_packages_found']:
+            raise ValueError(prereqs['error_message'])
+        isi_sdk = utils.get_powerscale_sdk()
+        api_client = utils.get_powerscale_connection(params)
+    LOG.info("Connected to PowerScale cluster %s", params['onefs_host'])
+    return isi_sdk, api_client
+
+
+class ControllerModule:
+
+    '''Stand-in for the Ansible module object of the shared library classes
+    used by plugins on the controller, raising ValueError on failures'''
+
+    def __init__(self, params=None):
+        """
+        Initialize the controller module
+        :param params: The parameters read by the shared library classes
+        """
+        self.params = params or {}
+        self.check_mode = False
+
+    def fail_json(self, msg, **kwargs):
+        """
+        Raise the failure of a shared library operation
+        :param msg: The error message
+        """
+        raise ValueError(msg)
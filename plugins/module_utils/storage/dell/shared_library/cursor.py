@@ -0,0 +1,143 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import fcntl
+import json
+import os
+import tempfile
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+
+LOG = utils.get_logger('cursor')
+
+
+def get_cluster_key(module_params):
+    """
+    Get the key identifying a cluster in a cursor file
+    :param module_params: Ansible module parameters
+    """
+    return '%s:%s' % (module_params['onefs_host'], module_params['port_no'])
+
+
+class Cursor:
+
+    '''Class which persists the position of incremental reads per cluster'''
+
+    def __init__(self, cursor_file, cluster, name, time_key='time',
+                 id_key='id'):
+        """
+        Initialize the cursor class
+        :param cursor_file: The path of the state file
+        :param cluster: The key of the cluster in the state file
+        :param name: The name of the record stream, such as events
+        :param time_key: The key of the record time
+        :param id_key: The key of the record ID
+        """
+        self.cursor_file = cursor_file
+        self.cluster = cluster
+        self.name = name
+        self.time_key = time_key
+        self.id_key = id_key
+        self.position = None
+
+    def read_state(self):
+        """
+        Read the state file
+        :return: Dictionary of cluster to stream name to position
+        """
+        if not os.path.exists(self.cursor_file):
+            return {}
+        with open(self.cursor_file) as state_file:
+            content = state_file.read()
+        state = json.loads(content) if content.strip() else {}
+        if not isinstance(state, dict):
+            raise ValueError('%s does not contain a JSON object'
+                             % self.cursor_file)
+        return state
+
+    def load(self):
+        """
+        Load the position of the stream for the cluster
+        :return: The position, None when nothing was read before
+        """
+        position = self.read_state().get(self.cluster, {}).get(self.name)
+        if position:
+            self.position = dict(time=position['time'],
+                                 ids=list(position.get('ids') or []))
+        LOG.info("Loaded %s cursor for %s: %s", self.name, self.cluster,
+                 self.position)
+        return self.position
+
+    def get_begin(self, begin):
+        """
+        Get the start of the window to read so that records already read
+        are not fetched again
+        :param begin: The requested start, None when not bounded
+        :return: The later of the requested start and the cursor time
+        """
+        if self.position is None:
+            return begin
+        if begin is None:
+            return self.position['time']
+        return max(begin, self.position['time'])
+
+    def is_new(self, record):
+        """
+        Check whether a record is newer than the cursor
+        :param record: The record details
+        """
+        if self.position is None:
+            return True
+        record_time = record.get(self.time_key) or 0
+        if record_time != self.position['time']:
+            return record_time > self.position['time']
+        return record.get(self.id_key) not in self.position['ids']
+
+    def track(self, records):
+        """
+        Advance the cursor over the records as they are consumed. Only the
+        IDs of the records at the cursor time are kept, a record without a
+        time does not move the cursor.
+        :param records: Iterable of records in time order
+        :return: Generator of the records
+        """
+        for record in records:
+            record_time = record.get(self.time_key)
+            if record_time is not None:
+                if self.position is None or \
+                        record_time > self.position['time']:
+                    self.position = dict(time=record_time, ids=[])
+                record_id = record.get(self.id_key)
+                if record_time == self.position['time'] and \
+                        record_id not in self.position['ids']:
+                    self.position['ids'].append(record_id)
+            yield record
+
+    def save(self):
+        """
+        Save the position of the stream for the cluster. The state file is
+        locked while it is updated so that the streams of other clusters
+        sharing the file are kept.
+        """
+        directory = os.path.dirname(os.path.abspath(self.cursor_file))
+        with open(self.cursor_file + '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            state = self.read_state()
+            state.setdefault(self.cluster, {})[self.name] = self.position
+            handle, temp_path = tempfile.mkstemp(dir=directory,
+                                                 prefix='.cursor')
+            try:
+                with os.fdopen(handle, 'w') as temp_file:
+                    json.dump(state, temp_file, indent=2, sort_keys=True)
+                os.replace(temp_path, self.cursor_file)
+            except Exception:
+                os.remove(temp_path)
+                raise
+        LOG.info("Saved %s cursor for %s: %s", self.name, self.cluster,
+                 self.position)
@@ -6,11 +6,17 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import itertools
+
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.cursor \
+    import Cursor, get_cluster_key
 
 LOG = utils.get_logger('Events')
 
+OCCURRENCE_PAGE_SIZE = 100
+
 
 class Events:
 
@@ -78,6 +84,89 @@ class Events:
             LOG.error(error_message)
             self.module.fail_json(msg=error_message)
 
+    def get_occurrence_params(self):
+        """
+        Get the query parameters of event group occurrences
+        :return: Tuple of the filter parameters, the cursor file and the
+                 maximum number of occurrences
+        """
+        query_params = self.module.params.get('query_parameters') or {}
+        filter_params = {}
+        cursor_file = None
+        max_items = None
+        for parm in query_params.get('event_group_occurrences') or []:
+            for key, value in parm.items():
+                if key in ['begin', 'end', 'resolved', 'ignore', 'cause',
+                           'limit']:
+                    filter_params[key] = value
+                elif key == 'cursor_file':
+                    cursor_file = value
+                elif key == 'max_items':
+                    max_items = int(value)
+        filter_params.setdefault('limit', OCCURRENCE_PAGE_SIZE)
+        return filter_params, cursor_file, max_items
+
+    def iter_event_group_occurrences(self, filter_params, cursor=None):
+        """
+        Iterate over event group occurrences oldest first, following the
+        resume token across pages
+        :param filter_params: Filter parameters of the first page
+        :param cursor: Cursor skipping the occurrences already read
+        :return: Generator of occurrence dicts
+        """
+        response = self.event_api.get_event_eventgroup_occurrences(
+            sort='time_noticed', dir='ASC', **filter_params).to_dict()
+        while True:
+            for occurrence in response.get('eventgroups') or []:
+                if cursor is None or cursor.is_new(occurrence):
+                    yield occurrence
+            resume = response.get('resume')
+            if not resume:
+                break
+            response = self.event_api.get_event_eventgroup_occurrences(
+                resume=resume).to_dict()
+
+    def get_event_group_occurrences(self):
+        """
+        Get event group occurrences. With a cursor file only the
+        occurrences noticed after the previous call are returned, and the
+        cursor is advanced unless in check mode.
+        :param cursor_file: State file of the last occurrence read per
+                            cluster.
+        :param max_items: Maximum number of occurrences to return.
+        :return: event group occurrences, oldest first
+        :rtype: list
+        """
+        try:
+            filter_params, cursor_file, max_items = self.get_occurrence_params()
+            cursor = None
+            if cursor_file:
+                cursor = Cursor(cursor_file, get_cluster_key(self.module.params),
+                                'event_group_occurrences',
+                                time_key='time_noticed')
+                cursor.load()
+                begin = cursor.get_begin(filter_params.get('begin'))
+                if begin is not None:
+                    filter_params['begin'] = begin
+
+            occurrences = self.iter_event_group_occurrences(filter_params, cursor)
+            if cursor:
+                occurrences = cursor.track(occurrences)
+            # islice stops before pulling an occurrence past max_items, so
+            # the cursor only moves over the occurrences returned.
+            all_occurrences = list(itertools.islice(occurrences, max_items))
+
+            if cursor and cursor.position and not self.module.check_mode:
+                cursor.save()
+            LOG.info("Fetched %d event group occurrences", len(all_occurrences))
+            return all_occurrences
+
+        except Exception as e:
+            error_msg = utils.determine_error(error_obj=e)
+            error_message = f'Fetching event group occurrences failed with error: {error_msg}'
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
     def get_alert_categories(self):
         """
         Get alert categories
@@ -200,8 +289,7 @@ class Events:
                 return alert_channel
         except Exception as e:
             if str(e.status) == "404":
-                msg = f'Alert channel {alert_channel_id} not found.'
-                LOG.info(msg)
+                LOG.info('Alert channel %s not found.', alert_channel_id)
                 return None
             else:
                 error_msg = utils.determine_error(error_obj=e)
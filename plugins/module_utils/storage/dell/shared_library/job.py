@@ -0,0 +1,427 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import heapq
+import json
+import random
+import re
+import threading
+import time
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+
+LOG = utils.get_logger('job_waiter')
+
+# Terminal states - job is complete
+TERMINAL_STATES = ('succeeded', 'failed', 'cancelled_user', 'cancelled_system')
+
+# Active states - job is running or paused
+ACTIVE_STATES = ('running', 'paused_user', 'paused_system', 'paused_policy',
+                 'paused_priority')
+
+PERCENT_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+
+
+def iter_jobs(job_api, **query):
+    """
+    Iterate over the jobs, following the resume token across pages
+    :param job_api: The job sdk instance
+    :param query: Additional query arguments for list_job_jobs
+    :return: Generator of job dicts
+    """
+    response = job_api.list_job_jobs(**query).to_dict()
+    while True:
+        for job in response.get('jobs') or []:
+            yield job
+        resume = response.get('resume')
+        if not resume:
+            break
+        response = job_api.list_job_jobs(resume=resume).to_dict()
+
+
+class JobWaiter:
+
+    '''Class which waits for Job Engine jobs to reach a terminal state'''
+
+    def __init__(self, job_api, module, initial_interval=2, max_interval=60,
+                 max_errors=3, backoff_factor=2):
+        """
+        Initialize the job waiter class
+        :param job_api: The job sdk instance
+        :param module: Ansible module object
+        :param initial_interval: The first polling interval in seconds
+        :param max_interval: The upper bound of the polling interval in seconds
+        :param max_errors: The number of consecutive transient errors
+                           tolerated for a job
+        :param backoff_factor: The factor the interval grows by after each poll
+        """
+        self.job_api = job_api
+        self.module = module
+        self.initial_interval = initial_interval
+        self.max_interval = max(initial_interval, max_interval)
+        self.max_errors = max_errors
+        self.backoff_factor = backoff_factor
+
+    def get_job(self, job_id):
+        """
+        Get the details of a job by ID without failing the module
+        :param job_id: The job ID
+        :return: The job details, None if the job does not exist
+        """
+        response = self.job_api.get_job_job(job_id).to_dict()
+        jobs = response.get('jobs') or []
+        return jobs[0] if jobs else None
+
+    def iter_jobs(self, **query):
+        """
+        Iterate over the jobs, following the resume token across pages
+        :param query: Additional query arguments for list_job_jobs
+        :return: Generator of job dicts
+        """
+        return iter_jobs(self.job_api, **query)
+
+    def list_jobs_by_id(self):
+        """
+        List all the jobs once
+        :return: Dictionary of job ID to job details
+        """
+        return dict((job.get('id'), job) for job in self.iter_jobs())
+
+    def fetch_jobs_by_listing(self, job_ids, listed):
+        """
+        Get the details of the jobs from one listing of all the jobs. The
+        jobs missing from the listing are fetched individually.
+        :param job_ids: The job IDs
+        :param listed: The jobs keyed by ID from list_jobs_by_id
+        :return: Dictionary of job ID to dict(result, error)
+        """
+        fetched = dict((job_id, dict(item=job_id, result=listed[job_id],
+                                     error=None))
+                       for job_id in job_ids if job_id in listed)
+        missing = [job_id for job_id in job_ids if job_id not in listed]
+        if missing:
+            fetched.update(self.fetch_jobs(missing))
+        return fetched
+
+    def fetch_jobs(self, job_ids):
+        """
+        Get the details of the jobs concurrently
+        :param job_ids: The job IDs
+        :return: Dictionary of job ID to dict(result, error)
+        """
+        outcome = utils.run_concurrently(self.get_job, job_ids)
+        return dict((item['item'], item) for item in outcome)
+
+    @staticmethod
+    def get_progress_sample(job, elapsed):
+        """
+        Get a progress sample of a job
+        :param job: The job details
+        :param elapsed: The seconds elapsed since the wait started
+        :return: Dictionary with the state, phase and percent of the job
+        """
+        progress = job.get('progress')
+        percent = None
+        if isinstance(progress, (int, float)) and not isinstance(progress, bool):
+            percent = float(progress)
+        elif progress:
+            match = PERCENT_PATTERN.search(str(progress))
+            if match:
+                percent = float(match.group(1))
+        if percent is None and job.get('total_phases'):
+            percent = round(100.0 * max((job.get('current_phase') or 1) - 1, 0) /
+                            job['total_phases'], 2)
+        return dict(elapsed=int(elapsed), state=job.get('state'),
+                    phase=job.get('current_phase'),
+                    total_phases=job.get('total_phases'), percent=percent)
+
+    def get_sleep_time(self, interval):
+        """
+        Get the time to sleep for an interval with jitter
+        :param interval: The current polling interval
+        """
+        return random.uniform(interval / 2.0, interval)
+
+    def wait(self, job_ids, timeout, fetch_jobs=None):
+        """
+        Wait for the jobs to reach a terminal state. The polling interval
+        starts at the initial interval and grows exponentially with jitter up
+        to the maximum interval. The timeout is measured on the wall clock.
+        :param job_ids: The job IDs to wait for
+        :param timeout: The maximum time to wait in seconds
+        :param fetch_jobs: Callable returning dict(result, error) per job ID
+                           for a list of job IDs, fetch_jobs by default
+        :return: Dictionary of job ID to dict(job, samples, error, not_found,
+                 timed_out)
+        """
+        fetch_jobs = fetch_jobs or self.fetch_jobs
+        start = time.monotonic()
+        deadline = start + timeout
+        status = dict((job_id, self.new_status()) for job_id in job_ids)
+        pending = list(job_ids)
+        interval = self.initial_interval
+        while pending:
+            if time.monotonic() >= deadline:
+                for job_id in pending:
+                    status[job_id]['timed_out'] = True
+                break
+            fetched = fetch_jobs(pending)
+            elapsed = time.monotonic() - start
+            pending = [job_id for job_id in pending
+                       if not self.update_status(status[job_id], job_id,
+                                                 fetched[job_id], elapsed)]
+            if not pending:
+                break
+            sleep_time = min(self.get_sleep_time(interval),
+                             deadline - time.monotonic())
+            if sleep_time > 0:
+                LOG.info("Waiting %.1f seconds for %d jobs", sleep_time,
+                         len(pending))
+                time.sleep(sleep_time)
+            interval = self.next_interval(interval)
+
+        for entry in status.values():
+            entry.pop('errors')
+        return status
+
+    @staticmethod
+    def new_status():
+        """
+        Get the initial wait status of a job
+        """
+        return dict(job=None, samples=[], error=None, not_found=False,
+                    timed_out=False, errors=0)
+
+    def next_interval(self, interval):
+        """
+        Get the polling interval following an interval
+        :param interval: The current polling interval
+        """
+        return min(self.max_interval, interval * self.backoff_factor)
+
+    def update_status(self, entry, job_id, fetched, elapsed):
+        """
+        Update the wait status of a job with the result of a poll
+        :param entry: The wait status of the job
+        :param job_id: The job ID
+        :param fetched: dict(result, error) of the poll
+        :param elapsed: The seconds elapsed since the wait started
+        :return: True if the wait for the job is over
+        """
+        if fetched['error']:
+            entry['errors'] += 1
+            LOG.warning("Transient error %d of %d while polling job %s: %s",
+                        entry['errors'], self.max_errors, job_id,
+                        fetched['error'])
+            if entry['errors'] > self.max_errors:
+                entry['error'] = fetched['error']
+                return True
+            return False
+
+        entry['errors'] = 0
+        job = fetched['result']
+        if job is None:
+            LOG.warning("Job %s not found during wait", job_id)
+            entry['not_found'] = True
+            return True
+
+        entry['job'] = job
+        sample = self.get_progress_sample(job, elapsed)
+        last = entry['samples'][-1] if entry['samples'] else None
+        if last is None or \
+                dict(last, elapsed=None) != dict(sample, elapsed=None):
+            entry['samples'].append(sample)
+        if job.get('state') in TERMINAL_STATES:
+            LOG.info("Job %s reached terminal state: %s", job_id,
+                     job.get('state'))
+            return True
+        return False
+
+
+def record_sort_key(record):
+    """
+    Get the key ordering job events and reports by time
+    :param record: The event or report details
+    """
+    return (record.get('time') or 0, str(record.get('id')))
+
+
+class JobHistory:
+
+    '''Class which fetches time ordered job events and reports'''
+
+    def __init__(self, list_func, records_key,
+                 max_workers=utils.DEFAULT_MAX_WORKERS):
+        """
+        Initialize the job history class
+        :param list_func: The sdk call listing the records, such as
+                          get_job_events or get_job_reports
+        :param records_key: The key of the records in the response
+        :param max_workers: The maximum number of concurrent requests
+        """
+        self.list_func = list_func
+        self.records_key = records_key
+        self.max_workers = max_workers
+
+    def iter_records(self, query, follow=True):
+        """
+        Iterate over the records, following the resume token across pages
+        :param query: Query arguments for the list call
+        :param follow: Whether to follow the resume token
+        :return: Generator of record dicts
+        """
+        response = self.list_func(**query).to_dict() or {}
+        while True:
+            for record in response.get(self.records_key) or []:
+                yield record
+            resume = response.get('resume')
+            if not follow or not resume:
+                break
+            response = self.list_func(**dict(query, resume=resume)).to_dict() or {}
+
+    @staticmethod
+    def split_window(begin, end, windows):
+        """
+        Split a time window into contiguous sub-windows which do not
+        overlap. As for the list calls the start is inclusive and the end
+        exclusive, so each sub-window ends where the next one starts.
+        :param begin: The window start in epoch seconds, inclusive
+        :param end: The window end in epoch seconds, exclusive
+        :param windows: The number of sub-windows
+        :return: List of (begin, end) tuples in time order
+        """
+        windows = max(1, min(windows, end - begin))
+        step = (end - begin) / float(windows)
+        bounds = [begin + int(round(step * index))
+                  for index in range(windows + 1)]
+        return [(bounds[index], bounds[index + 1])
+                for index in range(windows)]
+
+    @staticmethod
+    def get_window_query(query, begin, end):
+        """
+        Get the query arguments of a time window
+        :param query: Query arguments for the list call without begin and end
+        :param begin: The window start in epoch seconds
+        :param end: The window end in epoch seconds
+        """
+        window_query = dict(query)
+        if begin is not None:
+            window_query['begin'] = begin
+        if end is not None:
+            window_query['end'] = end
+        return window_query
+
+    def fetch(self, query, begin=None, end=None, windows=1, max_items=None,
+              follow=True, record_filter=None):
+        """
+        Fetch the records of a time window. A single window is streamed
+        lazily, API errors are then raised while the records are consumed.
+        With more than one sub-window each sub-window follows its own resume
+        chain concurrently and the results are merged in time order.
+        :param query: Query arguments for the list call without begin and end
+        :param begin: The window start in epoch seconds
+        :param end: The window end in epoch seconds
+        :param windows: The number of sub-windows fetched concurrently
+        :param max_items: The maximum number of records to return
+        :param follow: Whether to follow the resume token
+        :param record_filter: Callable returning whether to keep a record,
+                              applied before max_items
+        :return: Tuple of the record iterator in time order and the errors
+        """
+        if windows > 1 and begin is not None and end is not None \
+                and end > begin:
+            sub_windows = self.split_window(begin, end, windows)
+        else:
+            records = self.iter_records(
+                self.get_window_query(query, begin, end), follow)
+            if record_filter:
+                records = (record for record in records
+                           if record_filter(record))
+            return self.merge([records], max_items), []
+
+        counts = [0] * len(sub_windows)
+        lock = threading.Lock()
+
+        def is_done(index):
+            # Records of a sub-window arrive in time order, so once the
+            # sub-windows up to this one hold max_items records nothing
+            # later can make it into the result.
+            with lock:
+                return max_items is not None and \
+                    sum(counts[:index + 1]) >= max_items
+
+        def fetch_window(index):
+            records = []
+            if is_done(index):
+                return records
+            window_query = self.get_window_query(query, *sub_windows[index])
+            for record in self.iter_records(window_query, follow):
+                if record_filter and not record_filter(record):
+                    continue
+                records.append(record)
+                with lock:
+                    counts[index] += 1
+                if is_done(index):
+                    break
+            records.sort(key=record_sort_key)
+            return records
+
+        outcome = utils.run_concurrently(fetch_window,
+                                         range(len(sub_windows)),
+                                         self.max_workers)
+        errors = [item['error'] for item in outcome if item['error']]
+        streams = [item['result'] or [] for item in outcome]
+        LOG.info("Fetched %d %s over %d windows", sum(counts),
+                 self.records_key, len(sub_windows))
+        return self.merge(streams, max_items), errors
+
+    @staticmethod
+    def merge(streams, max_items=None):
+        """
+        Merge time ordered record streams, dropping duplicate IDs. Only the
+        IDs of the current time are remembered since duplicates share their
+        time.
+        :param streams: Iterables of records each sorted by time
+        :param max_items: The maximum number of records to yield
+        :return: Generator of record dicts in time order
+        """
+        current_time = None
+        seen_ids = set()
+        count = 0
+        for record in heapq.merge(*streams, key=record_sort_key):
+            if max_items is not None and count >= max_items:
+                break
+            record_time = record_sort_key(record)[0]
+            if record_time != current_time:
+                current_time = record_time
+                seen_ids = set()
+            record_id = record.get('id')
+            if record_id is not None:
+                if record_id in seen_ids:
+                    continue
+                seen_ids.add(record_id)
+            count += 1
+            yield record
+
+    @staticmethod
+    def write_records(records, output_file):
+        """
+        Stream records to a file as JSON lines
+        :param records: Iterable of record dicts
+        :param output_file: The path of the file
+        :return: The number of records written
+        """
+        count = 0
+        with open(output_file, 'w') as output:
+            for record in records:
+                output.write(json.dumps(record, sort_keys=True, default=str))
+                output.write('\n')
+                count += 1
+        return count
@@ -0,0 +1,358 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import math
+import re
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+
+LOG = utils.get_logger('job_statistics')
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Words of a report key naming the processed LINs or bytes
+MEASURE_WORDS = (('lins', ('lin', 'lins')), ('bytes', ('byte', 'bytes')))
+
+
+def get_report_value(report):
+    """
+    Get the numeric value of a job report. Reports hold their value as a
+    string under their key, only the values which are numbers are summarized.
+    :param report: The job report details
+    :return: The value as float, None when it is not a number
+    """
+    try:
+        value = float(report.get('value'))
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def get_report_measure(report):
+    """
+    Get the measure a job report key names, such as LINs processed
+    :param report: The job report details
+    :return: lins, bytes or None
+    """
+    words = re.split('[^a-z]+', str(report.get('key') or '').lower())
+    for measure, names in MEASURE_WORDS:
+        if any(word in names for word in words):
+            return measure
+    return None
+
+
+def is_failed_report(report):
+    """
+    Check whether a job report was written by a failed job
+    :param report: The job report details
+    """
+    return 'fail' in str(report.get('status') or '').lower()
+
+
+class StreamingQuantile:
+
+    '''Class which estimates a quantile of a stream in constant memory
+    with the P-square algorithm'''
+
+    def __init__(self, quantile):
+        """
+        Initialize the streaming quantile class
+        :param quantile: The quantile to estimate, between 0 and 1
+        """
+        self.quantile = quantile
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * quantile, 1 + 4 * quantile,
+                        3 + 2 * quantile, 5]
+        self.increments = [0, quantile / 2.0, quantile, (1 + quantile) / 2.0,
+                           1]
+
+    def add(self, value):
+        """
+        Add a value of the stream
+        :param value: The value
+        """
+        heights = self.heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = max(index for index in range(4) if heights[index] <= value)
+        for index in range(cell + 1, 5):
+            self.positions[index] += 1
+        for index in range(5):
+            self.desired[index] += self.increments[index]
+        for index in (1, 2, 3):
+            self.adjust(index)
+
+    def adjust(self, index):
+        """
+        Move a middle marker towards its desired position
+        :param index: The index of the marker
+        """
+        heights = self.heights
+        positions = self.positions
+        offset = self.desired[index] - positions[index]
+        if (offset >= 1 and positions[index + 1] - positions[index] > 1) or \
+                (offset <= -1 and positions[index - 1] - positions[index] < -1):
+            step = 1 if offset > 0 else -1
+            height = self.parabolic(index, step)
+            if not heights[index - 1] < height < heights[index + 1]:
+                height = heights[index] + step * \
+                    (heights[index + step] - heights[index]) / \
+                    (positions[index + step] - positions[index])
+            heights[index] = height
+            positions[index] += step
+
+    def parabolic(self, index, step):
+        """
+        Get the piecewise parabolic prediction of a marker height
+        :param index: The index of the marker
+        :param step: The direction the marker moves in
+        """
+        heights = self.heights
+        positions = self.positions
+        return heights[index] + step / float(
+            positions[index + 1] - positions[index - 1]) * (
+            (positions[index] - positions[index - 1] + step) *
+            (heights[index + 1] - heights[index]) /
+            (positions[index + 1] - positions[index]) +
+            (positions[index + 1] - positions[index] - step) *
+            (heights[index] - heights[index - 1]) /
+            (positions[index] - positions[index - 1]))
+
+    def value(self):
+        """
+        Get the estimated quantile, exact for up to five values
+        :return: The quantile, None when no value was added
+        """
+        if not self.heights:
+            return None
+        if len(self.heights) < 5 or self.positions[4] == 5:
+            return self.heights[
+                int(round(self.quantile * (len(self.heights) - 1)))]
+        return self.heights[2]
+
+
+class RunningStats:
+
+    '''Class which summarizes a stream of values in constant memory'''
+
+    def __init__(self, quantiles=QUANTILES):
+        """
+        Initialize the running statistics class
+        :param quantiles: The quantiles to estimate
+        """
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.quantiles = [StreamingQuantile(quantile)
+                          for quantile in quantiles]
+
+    def add(self, value):
+        """
+        Add a value of the stream
+        :param value: The value
+        """
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None \
+            else min(self.minimum, value)
+        self.maximum = value if self.maximum is None \
+            else max(self.maximum, value)
+        for quantile in self.quantiles:
+            quantile.add(value)
+
+    def summary(self):
+        """
+        Get the summary of the values
+        :return: Dictionary with count, min, max, mean and the quantiles
+        """
+        summary = dict(count=self.count, min=self.minimum, max=self.maximum,
+                       mean=round(self.total / self.count, 3)
+                       if self.count else None)
+        for quantile in self.quantiles:
+            estimate = quantile.value()
+            summary['p%g' % (quantile.quantile * 100)] = \
+                round(estimate, 3) if estimate is not None else None
+        return summary
+
+
+class JobReportAggregator:
+
+    '''Class which aggregates job reports into per job type statistics.
+    The runtime of a job phase spans its first to its last report, only the
+    phase being reported of each job is kept in memory.'''
+
+    def __init__(self, quantiles=QUANTILES):
+        """
+        Initialize the job report aggregator class
+        :param quantiles: The quantiles of the runtime, the throughput and
+                          the numeric report values
+        """
+        self.quantiles = quantiles
+        self.job_types = {}
+        self.open_phases = {}
+        self.report_count = 0
+
+    def new_entry(self):
+        """
+        Get the initial statistics of a job type
+        """
+        return dict(report_count=0, failed_reports=0, first_report_time=None,
+                    last_report_time=None, lins_processed=0.0,
+                    bytes_processed=0.0,
+                    runtime=RunningStats(self.quantiles),
+                    lins_per_second=RunningStats(self.quantiles),
+                    bytes_per_second=RunningStats(self.quantiles),
+                    phases={}, values={})
+
+    def add(self, report):
+        """
+        Add a job report
+        :param report: The job report details
+        """
+        self.report_count += 1
+        entry = self.job_types.setdefault(report.get('job_type') or 'unknown',
+                                          self.new_entry())
+        failed = is_failed_report(report)
+        entry['report_count'] += 1
+        entry['failed_reports'] += int(failed)
+        phase = entry['phases'].setdefault(str(report.get('phase')),
+                                           dict(report_count=0,
+                                                failed_reports=0))
+        phase['report_count'] += 1
+        phase['failed_reports'] += int(failed)
+
+        report_time = report.get('time')
+        if report_time is not None:
+            if entry['first_report_time'] is None or \
+                    report_time < entry['first_report_time']:
+                entry['first_report_time'] = report_time
+            if entry['last_report_time'] is None or \
+                    report_time > entry['last_report_time']:
+                entry['last_report_time'] = report_time
+
+        value = get_report_value(report)
+        if value is not None:
+            key = report.get('key')
+            if key not in entry['values']:
+                entry['values'][key] = RunningStats(self.quantiles)
+            entry['values'][key].add(value)
+        if report_time is not None and report.get('job_id') is not None:
+            self.track_phase(report, report_time, value)
+
+    def track_phase(self, report, report_time, value):
+        """
+        Extend the job phase of a report, closing the previous phase of the
+        job when a new phase starts
+        :param report: The job report details
+        :param report_time: The time of the report
+        :param value: The numeric value of the report, None if not a number
+        """
+        job_type = report.get('job_type') or 'unknown'
+        job_key = (job_type, report.get('job_id'))
+        phase = self.open_phases.get(job_key)
+        if phase is not None and phase['phase'] != report.get('phase'):
+            self.close_phase(job_type, phase)
+            phase = None
+        if phase is None:
+            phase = self.open_phases[job_key] = dict(
+                phase=report.get('phase'), start=report_time,
+                end=report_time, lins=None, bytes=None)
+        phase['start'] = min(phase['start'], report_time)
+        phase['end'] = max(phase['end'], report_time)
+        measure = get_report_measure(report)
+        if measure is not None and value is not None:
+            phase[measure] = max(phase[measure] or 0.0, value)
+
+    def close_phase(self, job_type, phase):
+        """
+        Add the runtime and throughput of a job phase to its job type. A
+        phase whose reports share one time has no runtime.
+        :param job_type: The job type
+        :param phase: The tracked phase
+        """
+        entry = self.job_types[job_type]
+        runtime = phase['end'] - phase['start']
+        for measure in ('lins', 'bytes'):
+            if phase[measure] is None:
+                continue
+            entry[measure + '_processed'] += phase[measure]
+            if runtime > 0:
+                entry[measure + '_per_second'].add(phase[measure] / runtime)
+        if runtime > 0:
+            entry['runtime'].add(runtime)
+
+    def flush(self):
+        """
+        Close the phases still being reported
+        """
+        for (job_type, dummy), phase in self.open_phases.items():
+            self.close_phase(job_type, phase)
+        self.open_phases = {}
+
+    def consume(self, reports):
+        """
+        Add a stream of job reports
+        :param reports: Iterable of job report details
+        :return: The number of reports added
+        """
+        for report in reports:
+            self.add(report)
+        self.flush()
+        LOG.info("Aggregated %d job reports of %d job types",
+                 self.report_count, len(self.job_types))
+        return self.report_count
+
+    @staticmethod
+    def get_rate(failed, count):
+        """
+        Get the share of failed reports
+        :param failed: The number of failed reports
+        :param count: The number of reports
+        """
+        return round(float(failed) / count, 4) if count else 0.0
+
+    def summary(self):
+        """
+        Get the statistics of every job type
+        :return: Dictionary of job type to statistics
+        """
+        self.flush()
+        summary = {}
+        for job_type, entry in self.job_types.items():
+            summary[job_type] = dict(
+                report_count=entry['report_count'],
+                failed_reports=entry['failed_reports'],
+                failure_rate=self.get_rate(entry['failed_reports'],
+                                           entry['report_count']),
+                first_report_time=entry['first_report_time'],
+                last_report_time=entry['last_report_time'],
+                lins_processed=int(entry['lins_processed']),
+                bytes_processed=int(entry['bytes_processed']),
+                runtime=entry['runtime'].summary(),
+                lins_per_second=entry['lins_per_second'].summary(),
+                bytes_per_second=entry['bytes_per_second'].summary(),
+                phases=dict(
+                    (name, dict(phase, failure_rate=self.get_rate(
+                        phase['failed_reports'], phase['report_count'])))
+                    for name, phase in entry['phases'].items()),
+                values=dict((str(key), stats.summary())
+                            for key, stats in entry['values'].items()))
+        return summary
@@ -9,6 +9,8 @@ __metaclass__ = type
 
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zone_topology \
+    import ZoneTopology
 
 LOG = utils.get_logger('powerscale_base')
 
@@ -35,13 +37,16 @@ class PowerScaleBase:
 
         self.result = {"changed": False}
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info('Got python SDK instance for provisioning on PowerScale')
         LOG.info('Check Mode Flag: %s', self.module.check_mode)
@@ -50,9 +55,12 @@ class PowerScaleBase:
         self._protocol_api = None
         self._auth_api = None
         self._synciq_api = None
+        self._synciq_reports_api = None
         self._cluster_api = None
         self._certificate_api = None
         self._zones_summary_api = None
+        self._zones_api = None
+        self._zone_topology = None
         self._support_assist_api = None
         self._event_api = None
         self._snapshot_api = None
@@ -94,6 +102,17 @@ class PowerScaleBase:
             self._synciq_api = self.isi_sdk.SyncApi(self.api_client)
         return self._synciq_api
 
+    @property
+    def synciq_reports_api(self):
+        """Returns the SyncIQ reports API object.
+        :return: The SyncIQ reports API object.
+        :rtype: isi_sdk.SyncReportsApi
+        """
+        if self._synciq_reports_api is None:
+            self._synciq_reports_api = self.isi_sdk.SyncReportsApi(
+                self.api_client)
+        return self._synciq_reports_api
+
     @property
     def cluster_api(self):
         """
@@ -128,6 +147,26 @@ class PowerScaleBase:
                 self.api_client)
         return self._zones_summary_api
 
+    @property
+    def zones_api(self):
+        """Returns the zones API object.
+        :return: The zones API object.
+        :rtype: isi_sdk.ZonesApi
+        """
+        if self._zones_api is None:
+            self._zones_api = self.isi_sdk.ZonesApi(self.api_client)
+        return self._zones_api
+
+    @property
+    def zone_topology(self):
+        """Returns the access zone topology, loaded once per module run.
+        :return: The zone topology object.
+        :rtype: ZoneTopology
+        """
+        if self._zone_topology is None:
+            self._zone_topology = ZoneTopology(self.zones_api, self.module)
+        return self._zone_topology
+
     @property
     def support_assist_api(self):
         """
@@ -33,14 +33,12 @@ class Protocol:
         :return: NFS default settings
         :rtype: dict
         """
-        msg = f"Getting NFS default settings for {access_zone} access zone"
-        LOG.info(msg)
+        LOG.info("Getting NFS default settings for %s access zone", access_zone)
         try:
             nfs_settings_export = self.protocol_api.get_nfs_settings_export(zone=access_zone).to_dict()
             if nfs_settings_export:
                 nfs_default_settings = nfs_settings_export['settings']
-                msg = f"NFS default settings are: {nfs_default_settings}"
-                LOG.info(msg)
+                LOG.info("NFS default settings are: %s", nfs_default_settings)
                 return nfs_default_settings
         except Exception as e:
             error_msg = utils.determine_error(error_obj=e)
@@ -73,8 +71,7 @@ class Protocol:
         try:
             smb_global_obj = self.protocol_api.get_smb_settings_global().to_dict()
             if smb_global_obj:
-                msg = f"SMB global settings details are: {smb_global_obj}"
-                LOG.info(msg)
+                LOG.info("SMB global settings details are: %s", smb_global_obj)
                 return smb_global_obj['settings']
 
         except Exception as e:
@@ -107,8 +104,7 @@ class Protocol:
             snmp_settings = self.protocol_api.get_snmp_settings().to_dict()
             if snmp_settings:
                 snmp_setting = snmp_settings['settings']
-                msg = f"SNMP settings are: {snmp_setting}"
-                LOG.info(msg)
+                LOG.info("SNMP settings are: %s", snmp_setting)
                 return snmp_setting
         except Exception as e:
             error_msg = utils.determine_error(error_obj=e)
@@ -116,3 +112,59 @@ class Protocol:
                             f'error: {error_msg}'
             LOG.error(error_message)
             self.module.fail_json(msg=error_message)
+
+    def get_nfs_export(self, path, access_zone):
+        """
+        Get details of the NFS export of a path in an access zone
+        :param path: The path of the export
+        :param access_zone: Access zone
+        :return: NFS export details, None when there is no export
+        :rtype: dict
+        """
+        LOG.info("Getting NFS export of %s in %s access zone", path,
+                 access_zone)
+        try:
+            if len(path) > 1 and path.endswith('/'):
+                path = path[:-1]
+            nfs_exports = self.protocol_api.list_nfs_exports(
+                path=path, zone=access_zone).to_dict()
+            exports = nfs_exports.get('exports') or []
+            if len(exports) > 1:
+                self.module.fail_json(msg=f'Multiple NFS exports found for '
+                                          f'path {path}')
+            return exports[0] if exports else None
+        except Exception as e:
+            error_msg = utils.determine_error(error_obj=e)
+            error_message = f'Fetching NFS export of path {path} failed ' \
+                            f'with error: {error_msg}'
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
+    def get_smb_share(self, share_name, access_zone):
+        """
+        Get details of an SMB share
+        :param share_name: The name of the share
+        :param access_zone: Access zone
+        :return: SMB share details, None when the share does not exist
+        :rtype: dict
+        """
+        LOG.info("Getting SMB share %s in %s access zone", share_name,
+                 access_zone)
+        try:
+            smb_shares = self.protocol_api.get_smb_share(
+                smb_share_id=share_name, zone=access_zone).to_dict()
+            shares = smb_shares.get('shares') or []
+            return shares[0] if shares else None
+        except utils.ApiException as e:
+            if str(e.status) == "404":
+                LOG.info("SMB share %s does not exist", share_name)
+                return None
+            error_message = f'Fetching SMB share {share_name} failed with ' \
+                            f'error: {utils.determine_error(error_obj=e)}'
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+        except Exception as e:
+            error_message = f'Fetching SMB share {share_name} failed with ' \
+                            f'error: {utils.determine_error(error_obj=e)}'
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
@@ -0,0 +1,177 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+
+LOG = utils.get_logger('query_cache')
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL = 60
+
+
+class QueryCache:
+
+    '''Process-wide LRU cache of query results with a time to live. Identical
+    concurrent queries send a single request: threads wait for the query in
+    flight, and processes sharing a cache directory wait for the lock of the
+    query file and read its result.'''
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        """
+        Initialize the query cache
+        :param max_size: The maximum number of results kept in memory
+        """
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_digest(key):
+        """
+        Get the file name digest of a query key
+        :param key: The query key, serializable as JSON
+        """
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode())\
+            .hexdigest()
+
+    def get_entry(self, digest):
+        """
+        Get the result of a query from memory, counting the hits
+        :param digest: The digest of the query key
+        :return: Tuple of whether the result is cached and the result
+        """
+        entry = self.entries.get(digest)
+        if entry is not None and entry[0] > time.time():
+            self.entries.move_to_end(digest)
+            self.hits += 1
+            return True, entry[1]
+        self.entries.pop(digest, None)
+        return False, None
+
+    def put_entry(self, digest, expiry, value):
+        """
+        Keep the result of a query in memory, evicting the least recently
+        used results
+        :param digest: The digest of the query key
+        :param expiry: The time the result expires
+        :param value: The result
+        """
+        self.entries[digest] = (expiry, value)
+        self.entries.move_to_end(digest)
+        while len(self.entries) > max(self.max_size, 0):
+            self.entries.popitem(last=False)
+
+    def get(self, key, fetch, ttl=DEFAULT_CACHE_TTL, cache_dir=None):
+        """
+        Get the result of a query, fetched once per time to live
+        :param key: The query key, serializable as JSON
+        :param fetch: Function fetching the result
+        :param ttl: The number of seconds a result is used
+        :param cache_dir: The directory sharing the results with other
+                          processes, None to only cache them in memory
+        :return: The result
+        """
+        digest = self.get_digest(key)
+        while True:
+            with self.lock:
+                cached, value = self.get_entry(digest)
+                if cached:
+                    return value
+                event = self.in_flight.get(digest)
+                owner = event is None
+                if owner:
+                    event = threading.Event()
+                    self.in_flight[digest] = event
+            if owner:
+                break
+            # Another thread fetches the same query, use its result or
+            # fetch it when it failed
+            event.wait()
+
+        try:
+            fetched_at, value = self.fetch_shared(digest, fetch, ttl,
+                                                  cache_dir)
+            with self.lock:
+                self.misses += 1
+                self.put_entry(digest, fetched_at + ttl, value)
+            return value
+        finally:
+            with self.lock:
+                self.in_flight.pop(digest, None)
+            event.set()
+
+    def fetch_shared(self, digest, fetch, ttl, cache_dir):
+        """
+        Fetch the result of a query, shared through the cache directory
+        :param digest: The digest of the query key
+        :param fetch: Function fetching the result
+        :param ttl: The number of seconds a result is used
+        :param cache_dir: The directory of the shared results
+        :return: Tuple of the time the result was fetched and the result
+        """
+        if not cache_dir:
+            return time.time(), fetch()
+
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        path = os.path.join(cache_dir, digest + '.json')
+        with open(path + '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            entry = self.read_entry(path)
+            if entry is not None and time.time() - entry['time'] < ttl:
+                LOG.info("Using the shared query result %s", path)
+                return entry['time'], entry['value']
+            fetched_at = time.time()
+            value = fetch()
+            self.write_entry(path, dict(time=fetched_at, value=value))
+        return fetched_at, value
+
+    @staticmethod
+    def read_entry(path):
+        """
+        Read a shared result
+        :param path: The path of the result file
+        :return: Dictionary of the time and the result, None when not shared
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as entry_file:
+                return json.load(entry_file)
+        except ValueError as e:
+            LOG.warning("Ignoring query cache file %s: %s", path, str(e))
+            return None
+
+    @staticmethod
+    def write_entry(path, entry):
+        """
+        Share a result, replacing its file atomically
+        :param path: The path of the result file
+        :param entry: Dictionary of the time and the result
+        """
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path),
+                                             prefix='.query')
+        try:
+            with os.fdopen(handle, 'w') as temp_file:
+                json.dump(entry, temp_file, default=str)
+            os.replace(temp_path, path)
+        except Exception:
+            os.remove(temp_path)
+            raise
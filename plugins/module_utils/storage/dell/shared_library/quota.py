@@ -41,3 +41,23 @@ class Quota:
                             'path {0}'.format(effective_path)
             LOG.info(error_message)
             return None
+
+    def get_directory_quota(self, path):
+        """
+        Get the directory quota of a path, failing when it can not be
+        listed
+        :param path: The absolute path of the directory
+        :return: Quota details, None when there is no directory quota
+        :rtype: dict
+        """
+        LOG.info("Getting directory quota of %s", path)
+        try:
+            quotas = self.quota_api.list_quota_quotas(
+                path=path, type='directory').to_dict().get('quotas') or []
+            return quotas[0] if quotas else None
+        except Exception as e:
+            error_message = f'Fetching directory quota of path {path} ' \
+                            f'failed with error: ' \
+                            f'{utils.determine_error(error_obj=e)}'
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
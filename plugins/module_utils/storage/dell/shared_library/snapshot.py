@@ -25,25 +25,77 @@ class Snapshot:
         self.snapshot_api = snapshot_api
         self.module = module
 
+    def iter_snapshots(self, **query_params):
+        """
+        Stream the snapshots page by page, following the resume token.
+        :param query_params: Server side filters such as schedule, state,
+                             type, sort and dir for the first page.
+        :return: Generator of snapshot dicts.
+        """
+        snapshot_list = self.snapshot_api.list_snapshot_snapshots(
+            **query_params).to_dict()
+        while True:
+            for snap in snapshot_list.get('snapshots') or []:
+                yield snap
+            resume = snapshot_list.get('resume')
+            if not resume:
+                break
+            snapshot_list = self.snapshot_api.list_snapshot_snapshots(
+                resume=resume).to_dict()
+
+    def get_snapshots_page(self, limit, **query_params):
+        """
+        Get the snapshots following the resume token up to a limit.
+        :param limit: The maximum number of snapshots to return.
+        :param query_params: Server side filters for the first page.
+        :return: dict with snapshots, total and the resume token of the
+                 next page if the list ends on a page boundary.
+        """
+        snapshot_list = self.snapshot_api.list_snapshot_snapshots(
+            limit=limit, **query_params).to_dict()
+        snapshots = list(snapshot_list.get('snapshots') or [])
+        total = snapshot_list.get('total')
+        resume = snapshot_list.get('resume')
+        while resume and len(snapshots) < limit:
+            snapshot_list = self.snapshot_api.list_snapshot_snapshots(
+                resume=resume).to_dict()
+            snapshots.extend(snapshot_list.get('snapshots') or [])
+            resume = snapshot_list.get('resume')
+        if len(snapshots) > limit:
+            # The remainder of an over-sized page cannot be resumed, hence
+            # following the token of the next page would skip snapshots.
+            snapshots = snapshots[:limit]
+            resume = None
+        return dict(snapshots=snapshots, total=total, resume=resume)
+
+    def get_snapshots_summary(self, **query_params):
+        """
+        Summarize the snapshots without returning the individual records.
+        :param query_params: Server side filters such as schedule.
+        :return: dict with count, oldest, newest and total_size.
+        """
+        summary = dict(count=0, oldest=None, newest=None, total_size=0)
+        for snap in self.iter_snapshots(**query_params):
+            summary['count'] += 1
+            summary['total_size'] += snap.get('size') or 0
+            created = snap.get('created')
+            if created is None:
+                continue
+            brief = dict(id=snap.get('id'), name=snap.get('name'),
+                         created=created)
+            if summary['oldest'] is None or \
+                    created < summary['oldest']['created']:
+                summary['oldest'] = brief
+            if summary['newest'] is None or \
+                    created > summary['newest']['created']:
+                summary['newest'] = brief
+        return summary
+
     def get_filesystem_snapshots(self, effective_path):
         """Get snapshots for a given filesystem"""
         try:
-            snapshots = []
-            filtered_snapshots = []
-            snapshot_list = \
-                self.snapshot_api.list_snapshot_snapshots().to_dict()
-            snapshots.extend(snapshot_list['snapshots'])
-            resume = snapshot_list['resume']
-            while resume:
-                snapshot_list = \
-                    self.snapshot_api.list_snapshot_snapshots(
-                        resume=resume).to_dict()
-                snapshots.extend(snapshot_list['snapshots'])
-                resume = snapshot_list['resume']
-            for snap in snapshot_list['snapshots']:
-                if snap['path'] == '/' + effective_path:
-                    filtered_snapshots.append(snap)
-            return filtered_snapshots
+            return [snap for snap in self.iter_snapshots()
+                    if snap['path'] == '/' + effective_path]
         except Exception as e:
             error_msg = utils.determine_error(error_obj=e)
             error_message = 'Failed to get filesystem snapshots ' \
@@ -34,8 +34,7 @@ class SupportAssist:
         try:
             support_assist_obj = self.support_assist_api.get_supportassist_settings().to_dict()
             if support_assist_obj:
-                msg = f"support assist settings details are: {support_assist_obj}"
-                LOG.info(msg)
+                LOG.info("support assist settings details are: %s", support_assist_obj)
                 return support_assist_obj
 
         except Exception as e:
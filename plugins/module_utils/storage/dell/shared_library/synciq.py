@@ -11,6 +11,8 @@ from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
 
 LOG = utils.get_logger('synciq')
 
+REPORT_LOOKUP_LIMIT = 10
+
 
 class SyncIQ:
 
@@ -32,8 +34,7 @@ class SyncIQ:
         try:
             synciq_global_obj = self.synciq_api.get_sync_settings()
             if synciq_global_obj:
-                msg = f"SyncIQ global settings details are: {synciq_global_obj.settings.to_dict()}"
-                LOG.info(msg)
+                LOG.info("SyncIQ global settings details are: %s", synciq_global_obj.settings.to_dict())
                 return synciq_global_obj.settings.to_dict()
 
         except Exception as e:
@@ -41,3 +42,104 @@ class SyncIQ:
                         f" SyncIQ global setings details "
             LOG.error(error_msg)
             self.module.fail_json(msg=error_msg)
+
+    def iter_sync_jobs(self, **query):
+        """
+        Iterate over the SyncIQ jobs, following the resume token across pages
+        :param query: Additional query arguments for list_sync_jobs
+        :return: Generator of SyncIQ job objects
+        """
+        response = self.synciq_api.list_sync_jobs(**query)
+        while True:
+            for job in response.jobs or []:
+                yield job
+            if not response.resume:
+                break
+            response = self.synciq_api.list_sync_jobs(resume=response.resume)
+
+    def get_sync_jobs_by_id(self, job_id):
+        """
+        Get the SyncIQ jobs with the given id through the per-job endpoint.
+        A job id is the id or name of the policy that runs it. Falls back to
+        listing and filtering the jobs when the per-job endpoint is rejected.
+        :param job_id: Specifies the id or name of the SyncIQ job
+        :return: List of SyncIQ job objects, empty if the job does not exist
+        """
+        try:
+            return list(self.synciq_api.get_sync_job(job_id).jobs or [])
+        except utils.ApiException as e:
+            if str(e.status) == '404':
+                LOG.info("SyncIQ job %s is not found", job_id)
+                return []
+            LOG.info("Per-job lookup of SyncIQ job %s failed with error: %s,"
+                     " listing SyncIQ jobs instead", job_id,
+                     utils.determine_error(error_obj=e))
+        return [job for job in self.iter_sync_jobs() if job.id == job_id]
+
+    def iter_reports(self, target=False, **query):
+        """
+        Iterate over the SyncIQ reports, following the resume token across pages
+        :param target: Iterate over the target reports instead of the source reports
+        :param query: Additional query arguments for the report listing
+        :return: Generator of SyncIQ report objects
+        """
+        list_reports = self.synciq_api.get_target_reports if target \
+            else self.synciq_api.get_sync_reports
+        response = list_reports(**query)
+        while True:
+            for report in response.reports or []:
+                yield report
+            if not response.resume:
+                break
+            response = list_reports(resume=response.resume)
+
+    def get_latest_report(self, policy_name, target=False):
+        """
+        Get the newest SyncIQ report of a policy. The reports are requested
+        newest first and filtered to the policy by the server, so only the
+        first small page is normally read.
+        :param policy_name: Specifies the name of the SyncIQ policy
+        :param target: Look up the target report instead of the source report
+        :return: The newest report object of the policy, None if there is none
+        """
+        reports = self.iter_reports(target, policy_name=policy_name,
+                                    sort='start_time', dir='DESC',
+                                    limit=REPORT_LOOKUP_LIMIT)
+        for report in reports:
+            if report.policy_name == policy_name:
+                return report
+        return None
+
+    def get_latest_reports_index(self, policy_names=None, target=False):
+        """
+        Resolve the newest SyncIQ report of many policies in one streamed pass
+        :param policy_names: Names of the SyncIQ policies, all policies if None
+        :param target: Index the target reports instead of the source reports
+        :return: Dictionary of policy name to the newest report details
+        """
+        wanted = set(policy_names) if policy_names is not None else None
+        index = {}
+        reports = self.iter_reports(target, reports_per_policy=1,
+                                    sort='start_time', dir='DESC')
+        for report in reports:
+            name = report.policy_name
+            if name in index or (wanted is not None and name not in wanted):
+                continue
+            index[name] = report.to_dict()
+            if wanted is not None and len(index) == len(wanted):
+                break
+        return index
+
+    def iter_policies(self, **query):
+        """
+        Iterate over the SyncIQ policies, following the resume token across pages
+        :param query: Additional query arguments for list_sync_policies
+        :return: Generator of SyncIQ policy objects
+        """
+        response = self.synciq_api.list_sync_policies(**query)
+        while True:
+            for policy in response.policies or []:
+                yield policy
+            if not response.resume:
+                break
+            response = self.synciq_api.list_sync_policies(resume=response.resume)
@@ -0,0 +1,224 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import fcntl
+import json
+import os
+import tempfile
+import time
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.cursor \
+    import get_cluster_key
+
+LOG = utils.get_logger('zone_topology')
+
+DEFAULT_CACHE_TTL = 300
+
+# Keys of an access zone kept in the topology
+ZONE_KEYS = ('name', 'id', 'zone_id', 'path', 'auth_providers')
+
+# Access zones shared by the zone topologies of the process by cluster,
+# None when each zone topology memoizes its own
+_SHARED_ZONES = None
+
+
+def share_zone_topologies(enabled=True):
+    """
+    Share the access zones fetched by a zone topology with the other zone
+    topologies of the process, such as the operations of a batch
+    :param enabled: Whether the access zones are shared
+    """
+    global _SHARED_ZONES
+    _SHARED_ZONES = {} if enabled else None
+
+
+class ZoneTopology:
+
+    '''Class which loads every access zone with its base path, ID and auth
+    providers in a single request and memoizes them for the module run'''
+
+    def __init__(self, zones_api, module):
+        """
+        Initialize the zone topology class. The topology is persisted on the
+        controller when zone_cache_file is given in the module parameters.
+        :param zones_api: The zones sdk instance
+        :param module: Ansible module object
+        """
+        self.zones_api = zones_api
+        self.module = module
+        self.zones = None
+        self.from_cache = False
+
+    @property
+    def cache_file(self):
+        """
+        The path of the file persisting the topology, None to only memoize it
+        """
+        cache_file = self.module.params.get('zone_cache_file')
+        return cache_file if isinstance(cache_file, str) else None
+
+    @property
+    def cache_ttl(self):
+        """
+        The number of seconds a persisted topology is used
+        """
+        ttl = self.module.params.get('zone_cache_ttl')
+        return DEFAULT_CACHE_TTL if ttl is None else ttl
+
+    def fetch_zones(self):
+        """
+        Fetch every access zone from the cluster
+        :return: List of access zones
+        """
+        LOG.info("Fetching the access zone topology")
+        response = self.zones_api.list_zones().to_dict()
+        zones = [dict((key, zone.get(key)) for key in ZONE_KEYS)
+                 for zone in response.get('zones') or []]
+        LOG.info("Fetched %d access zones", len(zones))
+        return zones
+
+    def get_zones(self):
+        """
+        Get every access zone, fetched at most once per module run unless
+        a fresh topology is persisted in the cache file
+        :return: List of access zones
+        """
+        if self.zones is None:
+            if _SHARED_ZONES is not None:
+                self.zones = _SHARED_ZONES.get(self.get_cache_key())
+            if self.zones is None:
+                self.zones = self.read_cache()
+            self.from_cache = self.zones is not None
+            if self.zones is None:
+                self.refresh()
+        return self.zones
+
+    def refresh(self):
+        """
+        Fetch the access zones again and persist them in the cache file
+        :return: List of access zones
+        """
+        self.zones = self.fetch_zones()
+        self.from_cache = False
+        if _SHARED_ZONES is not None:
+            _SHARED_ZONES[self.get_cache_key()] = self.zones
+        if self.cache_file:
+            self.write_cache()
+        return self.zones
+
+    def find_zone(self, name):
+        """
+        Find an access zone by name, case insensitive when there is no
+        exact match
+        :param name: The access zone name
+        :return: The access zone, None when it does not exist
+        """
+        zone = self.match_zone(self.get_zones(), name)
+        if zone is None and self.from_cache:
+            LOG.info("Access zone %s is not in the cached topology", name)
+            zone = self.match_zone(self.refresh(), name)
+        return zone
+
+    @staticmethod
+    def match_zone(zones, name):
+        """
+        Match an access zone by name
+        :param zones: List of access zones
+        :param name: The access zone name
+        """
+        lower_match = None
+        for zone in zones:
+            if zone['name'] == name:
+                return zone
+            if lower_match is None and \
+                    str(zone['name']).lower() == str(name).lower():
+                lower_match = zone
+        return lower_match
+
+    def get_zone_base_path(self, access_zone):
+        """
+        Get the base path of an access zone
+        :param access_zone: The access zone name
+        :return: The zone base path
+        """
+        zone = self.find_zone(access_zone)
+        if zone is None:
+            raise ValueError('Access zone %s does not exist' % access_zone)
+        LOG.info("Zone base path of %s is %s", access_zone, zone['path'])
+        return zone['path']
+
+    def get_linked_zones(self, provider_ids):
+        """
+        Get the access zones linked to all of the auth providers
+        :param provider_ids: List of auth provider IDs
+        :return: List of access zone IDs
+        """
+        zones = self.get_zones()
+        if not provider_ids:
+            return []
+        return [zone['id'] for zone in zones
+                if set(provider_ids).issubset(zone['auth_providers'] or [])]
+
+    def get_cache_key(self):
+        """
+        Get the key of the cluster in the cache file
+        """
+        return get_cluster_key(self.module.params)
+
+    def read_cache(self):
+        """
+        Read the persisted topology of the cluster
+        :return: List of access zones, None when not persisted or expired
+        """
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return None
+        try:
+            with open(self.cache_file) as cache:
+                entry = json.load(cache).get(self.get_cache_key())
+        except (ValueError, AttributeError) as e:
+            LOG.warning("Ignoring zone cache file %s: %s", self.cache_file,
+                        str(e))
+            return None
+        if not entry or time.time() - entry['time'] > self.cache_ttl:
+            return None
+        LOG.info("Loaded %d access zones from %s", len(entry['zones']),
+                 self.cache_file)
+        return entry['zones']
+
+    def write_cache(self):
+        """
+        Persist the topology of the cluster. The cache file is locked while
+        it is updated so that the topology of other clusters is kept.
+        """
+        directory = os.path.dirname(os.path.abspath(self.cache_file))
+        with open(self.cache_file + '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            state = {}
+            if os.path.exists(self.cache_file):
+                try:
+                    with open(self.cache_file) as cache:
+                        state = json.load(cache)
+                except ValueError:
+                    state = {}
+            if not isinstance(state, dict):
+                state = {}
+            state[self.get_cache_key()] = dict(time=time.time(),
+                                               zones=self.zones)
+            handle, temp_path = tempfile.mkstemp(dir=directory,
+                                                 prefix='.zone_cache')
+            try:
+                with os.fdopen(handle, 'w') as temp_file:
+                    json.dump(state, temp_file, indent=2, sort_keys=True)
+                os.replace(temp_path, self.cache_file)
+            except Exception:
+                os.remove(temp_path)
+                raise
+        LOG.info("Saved %d access zones to %s", len(self.zones),
+                 self.cache_file)
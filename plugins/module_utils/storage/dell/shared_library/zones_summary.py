@@ -15,14 +15,17 @@ LOG = utils.get_logger('zones_summary')
 class ZonesSummary:
     '''Class with methods to get zones summary details'''
 
-    def __init__(self, zones_summary_api, module):
+    def __init__(self, zones_summary_api, module, zone_topology=None):
         """
         Initialize the zones_summary class
         :param zones_summary_api: The zones_summary sdk instance
         :param module: Ansible module object
+        :param zone_topology: The zone topology resolving the base paths,
+                              None to fetch the summary of each zone
         """
         self.zones_summary_api = zones_summary_api
         self.module = module
+        self.zone_topology = zone_topology
 
     def get_zone_base_path(self, access_zone):
         """
@@ -32,13 +35,13 @@ class ZonesSummary:
         :rtype: dict
         """
         try:
-            msg = f"Getting zone base path for {access_zone} access zone"
-            LOG.info(msg)
+            LOG.info("Getting zone base path for %s access zone", access_zone)
+            if self.zone_topology is not None:
+                return self.zone_topology.get_zone_base_path(access_zone)
             zone_path = (self.zones_summary_api.get_zones_summary_zone(access_zone)).to_dict()
             # returning access zone base path
             if zone_path:
-                path_msg = f"Zone base path is: {zone_path['summary']['path']}"
-                LOG.info(path_msg)
+                LOG.info("Zone base path is: %s", zone_path['summary']['path'])
                 return zone_path['summary']['path']
         except Exception as e:
             error_msg = utils.determine_error(error_obj=e)
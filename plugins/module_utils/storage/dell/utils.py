@@ -23,15 +23,34 @@ except ImportError:
     IMPORT_PKGS_FAIL.append("importlib")
 
 import logging
+from ansible.module_utils.basic import AnsibleModule, env_fallback
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.api_perf \
+    import API_PERF
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.logging_handler \
-    import CustomRotatingFileHandler
+    import get_queue_handler, set_log_context, set_structured_logging
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.nwpool_utils \
     import NetworkPoolAPI
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.persistent_connection \
+    import PersistentRestClient, get_onefs_release
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from decimal import Decimal
 import datetime
 import re
 import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+LOG_LEVEL_ENV = 'POWERSCALE_LOG_LEVEL'
+LOG_LEVEL_OFF = logging.CRITICAL + 10
+LOG_LEVELS = dict(debug=logging.DEBUG, info=logging.INFO,
+                  warning=logging.WARNING, error=logging.ERROR,
+                  critical=logging.CRITICAL, off=LOG_LEVEL_OFF)
+LOG_FORMAT = '%(asctime)-15s %(filename)s %(levelname)s : %(message)s'
+LOG_FORMAT_ENV = 'POWERSCALE_LOG_FORMAT'
+LOG_FORMATS = ('text', 'json')
 
 
 ''' Check and Get required libraries '''
@@ -82,6 +101,12 @@ options:
   api_password:
     description:
     - password to access OneFS
+  log_level:
+    description:
+    - Level of the messages written to the log file, off disables logging
+  log_format:
+    description:
+    - Format of the log file, json writes one JSON object per line
 '''
 
 
@@ -91,7 +116,28 @@ def get_powerscale_management_host_parameters():
         verify_ssl=dict(choices=[True, False], type='bool', required=True),
         port_no=dict(type='str', default='8080', no_log=True),
         api_user=dict(type='str', required=True),
-        api_password=dict(type='str', required=True, no_log=True)
+        api_password=dict(type='str', required=True, no_log=True),
+        log_level=dict(type='str', choices=list(LOG_LEVELS),
+                       fallback=(env_fallback, [LOG_LEVEL_ENV])),
+        log_format=dict(type='str', choices=list(LOG_FORMATS),
+                        fallback=(env_fallback, [LOG_FORMAT_ENV]))
+    )
+
+
+'''
+This method provides the parameters of the zone topology cache shared by
+the modules which resolve access zone base paths
+'''
+
+
+def get_zone_cache_parameters():
+    return dict(
+        zone_cache_file=dict(type='path',
+                             fallback=(env_fallback,
+                                       ['POWERSCALE_ZONE_CACHE_FILE'])),
+        zone_cache_ttl=dict(type='int', default=300,
+                            fallback=(env_fallback,
+                                      ['POWERSCALE_ZONE_CACHE_TTL']))
     )
 
 
@@ -106,11 +152,20 @@ parameters:
      - port_no: The port no of the OneFS host.
      - username:  Username to access OneFS
      - password: Password to access OneFS
+  socket_path - The socket path of the persistent connection of the
+                dellemc.powerscale httpapi plugin, which then sends the
+                requests with its session
 returns configuration object
+The log level and format of the module parameters are applied to the
+loggers, and every request of the API client is logged with its timing.
 '''
 
 
-def get_powerscale_connection(module_params):
+def get_powerscale_connection(module_params, socket_path=None):
+    set_log_level(module_params.get('log_level'))
+    set_log_format(module_params.get('log_format'))
+    if isinstance(module_params.get('onefs_host'), str):
+        set_log_context(cluster=module_params['onefs_host'])
     if HAS_POWERSCALE_SDK:
         if isi_sdk.__name__ == "isilon_sdk":
             conn = isi_sdk.v9_10_0.Configuration()
@@ -128,7 +183,193 @@ def get_powerscale_connection(module_params):
             api_client = isi_sdk.v9_10_0.ApiClient(conn)
         else:
             api_client = isi_sdk.ApiClient(conn)
-        return api_client
+        if isinstance(socket_path, str):
+            api_client.rest_client = PersistentRestClient(socket_path,
+                                                          ApiException)
+        return log_api_requests(api_client)
+
+
+# Loggers configured by get_logger and the log settings of the module
+# parameters
+_LOGGERS = {}
+_LOG_SETTINGS = dict(level=None, format=None)
+
+# The templated endpoint of the SDK call sending a request of the thread
+_API_REQUEST = threading.local()
+
+
+def get_log_level(level):
+    """
+    Get the numeric log level of a level name
+    :param level: The level name, such as debug or off
+    :return: The log level, None when not a known level name
+    """
+    if isinstance(level, str):
+        return LOG_LEVELS.get(level.strip().lower())
+    return None
+
+
+def apply_log_level(logger, log_level):
+    """
+    Apply a log level to a logger and to its handlers
+    :param logger: The logger
+    :param log_level: The numeric log level
+    """
+    logger.setLevel(log_level)
+    for handler in logger.handlers:
+        handler.setLevel(LOG_LEVEL_OFF if log_level == LOG_LEVEL_OFF
+                         else logging.NOTSET)
+
+
+def set_log_level(level):
+    """
+    Set the level of every logger of the collection, off disables logging
+    :param level: The level name, ignored when None
+    """
+    log_level = get_log_level(level)
+    if log_level is None:
+        return
+    _LOG_SETTINGS['level'] = log_level
+    for logger in _LOGGERS.values():
+        apply_log_level(logger, log_level)
+
+
+def get_log_format():
+    """
+    Get the format of the log files, set by the module parameters or else
+    by the POWERSCALE_LOG_FORMAT environment variable
+    :return: text or json
+    """
+    log_format = _LOG_SETTINGS['format'] or os.environ.get(LOG_FORMAT_ENV)
+    if isinstance(log_format, str) and log_format.strip().lower() == 'json':
+        return 'json'
+    return 'text'
+
+
+def set_log_format(log_format):
+    """
+    Set the format of the log files
+    :param log_format: text or json, ignored when None
+    """
+    if log_format not in LOG_FORMATS:
+        return
+    _LOG_SETTINGS['format'] = log_format
+    set_structured_logging(log_format == 'json')
+
+
+def log_api_requests(api_client):
+    """
+    Log the method, endpoint, HTTP status, latency and payload size of the
+    requests of an SDK API client, at info level with the json log format
+    and at debug level otherwise, and record their timings in the perf
+    structure of the module result
+    :param api_client: The SDK API client
+    :return: The API client
+    """
+    request = api_client.request
+    call_api = getattr(api_client, 'call_api', None)
+    log = get_logger('api_requests')
+
+    def templated_call_api(resource_path, *args, **kwargs):
+        # Record the endpoints with the templates of their path parameters
+        _API_REQUEST.endpoint = resource_path
+        try:
+            return call_api(resource_path, *args, **kwargs)
+        finally:
+            _API_REQUEST.endpoint = None
+
+    def logged_request(method, url, *args, **kwargs):
+        level = logging.INFO if get_log_format() == 'json' else logging.DEBUG
+        start = time.monotonic()
+        http_status = payload_bytes = None
+        retries = 0
+        try:
+            response = request(method, url, *args, **kwargs)
+            http_status = getattr(response, 'status', None)
+            payload_bytes = get_payload_size(response)
+            retries = get_retry_count(response)
+            return response
+        except Exception as e:
+            http_status = getattr(e, 'status', None)
+            raise
+        finally:
+            latency_ms = round((time.monotonic() - start) * 1000, 1)
+            parts = urlsplit(url)
+            endpoint = getattr(_API_REQUEST, 'endpoint', None) or parts.path
+            API_PERF.record(parts.hostname, method, endpoint, http_status,
+                            latency_ms, payload_bytes, retries)
+            if log.isEnabledFor(level):
+                log.log(level, "%s %s returned %s in %s ms", method,
+                        parts.path, http_status, latency_ms,
+                        extra=dict(method=method, endpoint=parts.path,
+                                   http_status=http_status,
+                                   latency_ms=latency_ms,
+                                   payload_bytes=payload_bytes))
+
+    api_client.request = logged_request
+    if callable(call_api):
+        api_client.call_api = templated_call_api
+    return api_client
+
+
+def get_retry_count(response):
+    """
+    Get the number of retries of the urllib3 request of an SDK response
+    :param response: The SDK response
+    :return: The number of retries
+    """
+    retries = getattr(getattr(response, 'urllib3_response', None),
+                      'retries', None)
+    history = getattr(retries, 'history', None)
+    return len(history) if isinstance(history, tuple) else 0
+
+
+def report_api_perf(module):
+    """
+    Add the perf structure with the timings of the API requests of the
+    module process to the result of an Ansible module
+    :param module: The Ansible module object
+    """
+    if not isinstance(module, AnsibleModule):
+        return
+    exit_json, fail_json = module.exit_json, module.fail_json
+
+    def perf_exit_json(**kwargs):
+        add_api_perf(kwargs)
+        exit_json(**kwargs)
+
+    def perf_fail_json(msg, **kwargs):
+        add_api_perf(kwargs)
+        fail_json(msg, **kwargs)
+
+    module.exit_json = perf_exit_json
+    module.fail_json = perf_fail_json
+
+
+def add_api_perf(result):
+    """
+    Add the perf structure of the API requests to a module result
+    :param result: The module result
+    """
+    perf = API_PERF.get_perf()
+    if perf is not None and 'perf' not in result:
+        result['perf'] = perf
+
+
+def get_payload_size(response):
+    """
+    Get the size of the payload of an SDK response without reading a
+    streamed payload
+    :param response: The SDK response
+    :return: The size in bytes, None when not known
+    """
+    if hasattr(response, 'urllib3_response'):
+        data = getattr(response, 'data', None)
+        if isinstance(data, (bytes, str)):
+            return len(data)
+    getheader = getattr(response, 'getheader', None)
+    length = getheader('Content-Length') if callable(getheader) else None
+    return int(length) if length and str(length).isdigit() else None
 
 
 '''
@@ -136,25 +377,37 @@ This method is to initialize logger and return the logger object
 parameters:
      - module_name: Name of module to be part of log message.
      - log_file_name: name of the file in which the log meessages get appended.
-     - log_devel: log level.
+     - log_devel: log level, overridden by the POWERSCALE_LOG_LEVEL
+       environment variable and the log_level module parameter.
 returns logger object
+All the loggers of a log file share one handler, which queues the records
+to a listener thread and opens the file when the first record is written.
+The json log format writes the records with the correlation ID of the task
+and the cluster to segments of a .jsonl file next to the log file.
 '''
 
 
 def get_logger(module_name, log_file_name='ansible_powerscale.log',
                log_devel=logging.INFO):
-    FORMAT = '%(asctime)-15s %(filename)s %(levelname)s : %(message)s'
-    max_bytes = 5 * 1024 * 1024
-    logging.basicConfig(filename=log_file_name, format=FORMAT)
     LOG = logging.getLogger(module_name)
-    LOG.setLevel(log_devel)
-    handler = CustomRotatingFileHandler(log_file_name,
-                                        maxBytes=max_bytes,
-                                        backupCount=5)
-    formatter = logging.Formatter(FORMAT)
-    handler.setFormatter(formatter)
-    LOG.addHandler(handler)
-    LOG.propagate = False
+    if module_name not in _LOGGERS:
+        max_bytes = 5 * 1024 * 1024
+        handler = get_queue_handler(log_file_name,
+                                    logging.Formatter(LOG_FORMAT),
+                                    max_bytes, 5,
+                                    get_log_format() == 'json')
+        if handler not in LOG.handlers:
+            LOG.addHandler(handler)
+        root = logging.getLogger()
+        if not root.handlers:
+            # Keep writing the records of other libraries to the log file
+            root.addHandler(handler)
+        LOG.propagate = False
+        _LOGGERS[module_name] = LOG
+    log_level = _LOG_SETTINGS['level']
+    if log_level is None:
+        log_level = get_log_level(os.environ.get(LOG_LEVEL_ENV))
+    apply_log_level(LOG, log_devel if log_level is None else log_level)
     return LOG
 
 
@@ -218,7 +471,7 @@ Validates the package pre-requisites of invoking module
 '''
 
 
-def validate_module_pre_reqs(module_params):
+def validate_module_pre_reqs(module_params, socket_path=None):
     error_message = ""
     cur_py_ver = "{0}.{1}.{2}".format(str(sys.version_info[0]),
                                       str(sys.version_info[1]),
@@ -239,7 +492,8 @@ def validate_module_pre_reqs(module_params):
         )
         return prereqs_check
 
-    POWERSCALE_SDK_IMPORT = find_compatible_powerscale_sdk(module_params)
+    POWERSCALE_SDK_IMPORT = find_compatible_powerscale_sdk(module_params,
+                                                           socket_path)
     if POWERSCALE_SDK_IMPORT and \
             not POWERSCALE_SDK_IMPORT["powerscale_package_imported"]:
         if POWERSCALE_SDK_IMPORT['error_message']:
@@ -284,7 +538,7 @@ def import_powerscale_sdk(sdk, major, minor):
 ''' Find compatible powerscale sdk based on onefs version '''
 
 
-def find_compatible_powerscale_sdk(module_params):
+def find_compatible_powerscale_sdk(module_params, socket_path=None):
     global HAS_POWERSCALE_SDK
     error_message = ""
 
@@ -303,10 +557,15 @@ def find_compatible_powerscale_sdk(module_params):
         import_powerscale_sdk(powerscale_sdk + ".v9_10_0", 9, 10)
         try:
             HAS_POWERSCALE_SDK = True
-            api_client = get_powerscale_connection(module_params)
-            cluster_api = isi_sdk.ClusterApi(api_client)
-            major = str(parse_version(cluster_api.get_cluster_config().to_dict()['onefs_version']['release'].split('.')[0]))
-            minor = str(parse_version(cluster_api.get_cluster_config().to_dict()['onefs_version']['release'].split('.')[1]))
+            if isinstance(socket_path, str):
+                # The persistent connection fetches the version once
+                release = get_onefs_release(socket_path)
+            else:
+                api_client = get_powerscale_connection(module_params)
+                cluster_api = isi_sdk.ClusterApi(api_client)
+                release = cluster_api.get_cluster_config().to_dict()['onefs_version']['release']
+            major = str(parse_version(release.split('.')[0]))
+            minor = str(parse_version(release.split('.')[1]))
             array_version = major + "_" + minor + "_0"
 
             compatible_powerscale_sdk = "isilon_sdk.v" + array_version
@@ -375,7 +634,7 @@ def validate_threshold_overhead_parameter(quota):
 
 
 def determine_error(error_obj):
-    if isinstance(error_obj, ApiException):
+    if ApiException is not None and isinstance(error_obj, ApiException):
         error = re.sub("[\n \"]+", ' ', str(error_obj.body))
     else:
         error = str(error_obj)
@@ -390,6 +649,41 @@ def get_missing_pkgs():
         ". Please install the required package(s)."
 
 
+'''
+Run a function over a list of items using a bounded pool of worker threads.
+parameters:
+     - func: callable invoked once per item.
+     - items: list of items to process.
+     - max_workers: maximum number of requests in flight at once.
+returns a list of dict(item, result, error) in the same order as items,
+where error is the non-empty error message of a failed call, else None.
+'''
+DEFAULT_MAX_WORKERS = 10
+
+
+def run_concurrently(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    items = list(items)
+    outcome = [None] * len(items)
+    if not items:
+        return outcome
+    workers = max(1, min(int(max_workers or 1), len(items)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        future_to_index = {
+            executor.submit(func, item): index
+            for index, item in enumerate(items)
+        }
+        for future in as_completed(future_to_index):
+            index = future_to_index[future]
+            try:
+                outcome[index] = dict(item=items[index],
+                                      result=future.result(), error=None)
+            except Exception as e:
+                outcome[index] = dict(item=items[index], result=None,
+                                      error=determine_error(error_obj=e) or
+                                      type(e).__name__)
+    return outcome
+
+
 '''
 Convert to seconds from nanoseconds, microseconds, milliseconds
 '''
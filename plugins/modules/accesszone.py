@@ -33,8 +33,34 @@ options:
   az_name:
     description:
     - The name of the access zone.
+    - Mutually exclusive with I(az_names).
     type: str
-    required: true
+  az_names:
+    description:
+    - The names of the access zones to get the details of.
+    - The details of the access zones are fetched concurrently and returned
+      in I(access_zones_details).
+    - Only supported with I(state=present), the access zones are not
+      modified.
+    - Mutually exclusive with I(az_name).
+    type: list
+    elements: str
+    version_added: '3.10.0'
+  include_protocol_settings:
+    description:
+    - Whether to get the default SMB and NFS settings of the access zone.
+    - If C(false), the SMB settings are fetched only when I(smb) is given and
+      the NFS settings only when I(nfs) is given.
+    type: bool
+    default: true
+    version_added: '3.10.0'
+  max_workers:
+    description:
+    - The maximum number of API calls made concurrently to get the details
+      of the access zones.
+    type: int
+    default: 10
+    version_added: '3.10.0'
   path:
     description:
     - Specifies the access zone base directory path.
@@ -175,6 +201,7 @@ options:
 
 notes:
 - The I(check_mode) is not supported.
+- The access zone and its SMB and NFS settings are fetched concurrently.
 - Built-in System zone cannot be deleted.
 - When access zone is deleted, all associated authentication providers remain available to other zones,
   the IP addresses are not reassigned to other zones.
@@ -192,6 +219,28 @@ EXAMPLES = r'''
     az_name: "{{access zone}}"
     state: "present"
 
+- name: Get details of access zone without smb and nfs settings
+  dellemc.powerscale.accesszone:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    az_name: "{{access zone}}"
+    include_protocol_settings: false
+    state: "present"
+
+- name: Get details of multiple access zones
+  dellemc.powerscale.accesszone:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    az_names:
+      - "System"
+      - "sample_zone"
+    max_workers: 5
+    state: "present"
+
 - name: Modify smb settings of access zone
   dellemc.powerscale.accesszone:
     onefs_host: "{{onefs_host}}"
@@ -335,6 +384,18 @@ access_zone_modify_flag:
     type: bool
     sample: "false"
 
+access_zones_details:
+    description:
+    - The details of each access zone given in I(az_names), keyed by the
+      access zone name.
+    - The details are null for an access zone which does not exist.
+    - The details have the same structure as I(access_zone_details).
+    returned: When I(az_names) is given
+    type: dict
+    sample: {"System": {"zones": [{"name": "System", "path": "/ifs"}]},
+             "sample_zone": null}
+    version_added: '3.10.0'
+
 access_zone_details:
     description: The access zone details.
     returned: When access zone exists
@@ -588,21 +649,28 @@ class AccessZone(object):
         self.module_params.update(get_accesszone_parameters())
 
         required_together = [['auth_providers', 'provider_state']]
+        mutually_exclusive = [['az_name', 'az_names']]
+        required_one_of = [['az_name', 'az_names']]
 
         # initialize the Ansible module
         self.module = AnsibleModule(
             argument_spec=self.module_params,
             supports_check_mode=False,
-            required_together=required_together
+            required_together=required_together,
+            mutually_exclusive=mutually_exclusive,
+            required_one_of=required_one_of
         )
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.api_instance = utils.isi_sdk.ZonesApi(self.api_client)
         self.api_protocol = utils.isi_sdk.ProtocolsApi(self.api_client)
         self.api_auth = utils.isi_sdk.AuthApi(self.api_client)
@@ -610,41 +678,112 @@ class AccessZone(object):
 
     def get_details(self, name):
         """ Get access zone details"""
+        return self.get_details_for_zones([name])[name]
+
+    def get_protocol_setting_kinds(self):
+        """
+        Get the protocol settings to fetch along with the access zone
+        :return: List of the protocol settings, nfs and smb
+        """
+        params = self.module.params
+        include = params['include_protocol_settings'] is not False
+        kinds = []
+        if include or params['nfs'] is not None:
+            kinds.append('nfs')
+        if include or params['smb'] is not None:
+            kinds.append('smb')
+        return kinds
+
+    def fetch_zone_setting(self, request):
+        """
+        Fetch one setting of an access zone
+        :param request: Tuple of the zone name and the setting to fetch
+        :return: Dictionary with the response or the exception raised
+        """
+        name, kind = request
+        calls = {
+            'zone': lambda: self.api_instance.get_zone(name),
+            'nfs_export': lambda: self.api_protocol.get_nfs_settings_export(
+                zone=name),
+            'nfs_zone': lambda: self.api_protocol.get_nfs_settings_zone(
+                zone=name),
+            'smb': lambda: self.api_protocol.get_smb_settings_share(
+                zone=name)
+        }
         try:
+            return dict(response=calls[kind]().to_dict(), exception=None)
+        except Exception as e:
+            return dict(response=None, exception=e)
+
+    def build_details(self, name, responses):
+        """
+        Assemble the details of an access zone from its settings. The
+        responses are copied, not modified.
+        :param name: The access zone name
+        :param responses: Dictionary of setting to response
+        :return: The access zone details
+        """
+        api_response = copy.deepcopy(responses['zone'])
+        if 'nfs_export' in responses:
             nfs_settings = {}
-            api_response = self.api_instance.get_zone(name).to_dict()
-            nfs_export_settings = self.api_protocol.get_nfs_settings_export(
-                zone=name).to_dict()
-            nfs_export_settings['export_settings'] = nfs_export_settings[
-                'settings']
-            del nfs_export_settings['settings']
-            nfs_zone_settings = self.api_protocol.get_nfs_settings_zone(
-                zone=name).to_dict()
-            nfs_zone_settings['zone_settings'] = nfs_zone_settings['settings']
-            del nfs_zone_settings['settings']
-
-            nfs_settings['nfs_settings'] = nfs_export_settings
-            nfs_settings['nfs_settings'].update(nfs_zone_settings)
-
-            api_response.update(nfs_settings)
-            smb_settings = self.api_protocol.get_smb_settings_share(
-                zone=name).to_dict()
-            smb_settings['settings']['directory_create_mask_octal'] = \
-                OCTAL_FORMAT.format(smb_settings['settings']
-                                    ['directory_create_mask'])
-            smb_settings['settings']['directory_create_mode_octal'] = \
-                OCTAL_FORMAT.format(smb_settings['settings']
-                                    ['directory_create_mode'])
-            smb_settings['settings']['file_create_mask_octal'] = \
-                OCTAL_FORMAT.format(smb_settings['settings']
-                                    ['file_create_mask'])
-            smb_settings['settings']['file_create_mode_octal'] = \
-                OCTAL_FORMAT.format(smb_settings['settings']
-                                    ['file_create_mode'])
-            smb_settings['smb_settings'] = smb_settings['settings']
-            del smb_settings['settings']
-            api_response.update(smb_settings)
-            return api_response
+            for kind, key in (('nfs_export', 'export_settings'),
+                              ('nfs_zone', 'zone_settings')):
+                settings = copy.deepcopy(responses[kind])
+                settings[key] = settings.pop('settings')
+                nfs_settings.update(settings)
+            api_response['nfs_settings'] = nfs_settings
+
+        if 'smb' in responses:
+            smb_settings = copy.deepcopy(responses['smb']['settings'])
+            for key in ('directory_create_mask', 'directory_create_mode',
+                        'file_create_mask', 'file_create_mode'):
+                smb_settings[key + '_octal'] = \
+                    OCTAL_FORMAT.format(smb_settings[key])
+            api_response['smb_settings'] = smb_settings
+        LOG.info("Assembled details of access zone %s", name)
+        return api_response
+
+    def get_details_for_zones(self, names):
+        """
+        Get the details of access zones. The zone and its protocol settings
+        are fetched concurrently, with at most max_workers calls in flight.
+        :param names: List of access zone names
+        :return: Dictionary of access zone name to details, None when the
+                 access zone does not exist
+        """
+        kinds = ['zone']
+        for kind in self.get_protocol_setting_kinds():
+            kinds.extend(['nfs_export', 'nfs_zone'] if kind == 'nfs'
+                         else [kind])
+        requests = [(name, kind) for name in names for kind in kinds]
+        outcome = utils.run_concurrently(self.fetch_zone_setting, requests,
+                                         self.module.params['max_workers'])
+
+        fetched = {}
+        for entry in outcome:
+            name, kind = entry['item']
+            fetched.setdefault(name, {})[kind] = entry['result']
+
+        details = {}
+        for name in names:
+            details[name] = self.get_zone_details(name, fetched[name], kinds)
+        return details
+
+    def get_zone_details(self, name, fetched, kinds):
+        """
+        Get the details of an access zone from its fetched settings
+        :param name: The access zone name
+        :param fetched: Dictionary of setting to fetch result
+        :param kinds: The settings in the order they are checked
+        :return: The access zone details, None when it does not exist
+        """
+        try:
+            for kind in kinds:
+                if fetched[kind]['exception'] is not None:
+                    raise fetched[kind]['exception']
+            return self.build_details(
+                name, dict((kind, fetched[kind]['response'])
+                           for kind in kinds))
         except utils.ApiException as e:
             if str(e.status) == '404':
                 error_message = "Access zone {0} details are not found".\
@@ -787,7 +926,6 @@ class AccessZone(object):
                     key <= len(self.unique_auth_providers(existing_items=updated_auth_providers_list,
                                                           new_items=new_auth_providers)) + len(no_priority_list):
                 updated_auth_providers_list.remove(new_auth_providers[key])
-        sorted_providers_by_priority = sorted(new_auth_providers.items(), key=lambda x: x[0])
         index = 0
         index1 = 0
 
@@ -948,11 +1086,38 @@ class AccessZone(object):
             if nfs_export_flag or nfs_zone_flag:
                 result['nfs_modify_flag'] = self.nfs_modify(name, nfs, nfs_export_flag, nfs_zone_flag)
 
+    def get_multiple_zone_details(self):
+        """
+        Get the details of multiple access zones for inventory. The access
+        zones are only read, so the options modifying an access zone are not
+        allowed.
+        :return: Dictionary of access zone name to details
+        """
+        params = self.module.params
+        modify_params = [key for key in ('path', 'create_path', 'smb', 'nfs',
+                                         'provider_state', 'auth_providers')
+                         if params[key] is not None]
+        if params['state'] != 'present' or modify_params:
+            error_message = 'az_names can only be used to get the details ' \
+                            'of access zones with state present'
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
+        names = list(dict.fromkeys(params['az_names']))
+        access_zones_details = self.get_details_for_zones(names)
+        LOG.info("Got details of %d access zones", len(names))
+        return access_zones_details
+
     def perform_module_operation(self):
         """
         Perform different actions on access zone module based on parameters
         chosen in playbook
         """
+        if self.module.params['az_names'] is not None:
+            self.module.exit_json(
+                changed=False,
+                access_zones_details=self.get_multiple_zone_details())
+            return
         name = self.module.params['az_name']
         state = self.module.params['state']
         smb = self.module.params['smb']
@@ -980,7 +1145,8 @@ class AccessZone(object):
         if state == 'present' and provider_state in ('add', 'remove') and access_zone_details:
             result['access_zone_modify_flag'] = self._handle_provider_state(
                 name, provider_state, auth_providers, access_zone_details)
-            access_zone_details = self.get_details(name)
+            if result['access_zone_modify_flag']:
+                access_zone_details = self.get_details(name)
 
         if state == 'absent' and access_zone_details:
             result['changed'] = self.delete_access_zone(name)
@@ -1001,7 +1167,8 @@ def get_accesszone_parameters():
     """This method provide parameter required for the ansible access zone
     modules on PowerScale"""
     return dict(
-        az_name=dict(required=True, type='str'),
+        az_name=dict(type='str'),
+        az_names=dict(type='list', elements='str'),
         path=dict(required=False, type='str'),
         groupnet=dict(required=False, type='str', default='groupnet0'),
         create_path=dict(required=False, type='bool'),
@@ -1013,6 +1180,8 @@ def get_accesszone_parameters():
             provider_type=dict(type='str', required=True, choices=['local', 'file', 'ldap', 'ads', 'nis']),
             priority=dict(type='int')
         )),
+        include_protocol_settings=dict(type='bool', default=True),
+        max_workers=dict(type='int', default=10),
         state=dict(required=True, type='str', choices=['present', 'absent'])
     )
 
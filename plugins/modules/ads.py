@@ -24,6 +24,7 @@ description:
 
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 
 author:
 - Jennifer John (@johnj9) <ansible.team@dell.com>
@@ -746,6 +747,8 @@ import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zone_topology \
+    import ZoneTopology
 
 LOG = utils.get_logger('ads')
 
@@ -759,6 +762,7 @@ class Ads(object):
         self.result = {"changed": False}
         self.module_params = utils.get_powerscale_management_host_parameters()
         self.module_params.update(self.get_ads_parameters())
+        self.module_params.update(utils.get_zone_cache_parameters())
         required_one_of = [['domain_name', 'instance_name']]
         # initialize the Ansible module
         self.module = AnsibleModule(
@@ -767,15 +771,19 @@ class Ads(object):
             required_one_of=required_one_of
         )
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.auth_api_instance = utils.isi_sdk.AuthApi(self.api_client)
         self.zones_api_instance = utils.isi_sdk.ZonesApi(self.api_client)
+        self.zone_topology = None
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
 
         # result is a dictionary that contains changed status
@@ -1056,21 +1064,19 @@ class Ads(object):
     def update_ads_access_zone_info(self, ads_name, ads_details):
         """Update ADS with access zone details"""
         try:
-            zone_api_response = self.zones_api_instance.list_zones()
-            if zone_api_response:
-                providers_summary = self.get_auth_providers_summary()
-                for name in ads_name:
-                    provider_ids = [provider.id for provider in
-                                    providers_summary if provider.type == "ads" and
-                                    provider.name.lower() == name.lower()]
-                    zone_ids = []
-                    if provider_ids:
-                        zone_ids = [zone.id for zone in zone_api_response.zones
-                                    if set(provider_ids).issubset(
-                                        zone.auth_providers)]
-                    [ads_detail.update(linked_access_zones=zone_ids)
-                        for ads_detail in ads_details
-                        if ads_detail['id'].lower() == name.lower()]
+            if self.zone_topology is None:
+                self.zone_topology = ZoneTopology(self.zones_api_instance,
+                                                  self.module)
+            self.zone_topology.get_zones()
+            providers_summary = self.get_auth_providers_summary()
+            for name in ads_name:
+                provider_ids = [provider.id for provider in
+                                providers_summary if provider.type == "ads" and
+                                provider.name.lower() == name.lower()]
+                zone_ids = self.zone_topology.get_linked_zones(provider_ids)
+                [ads_detail.update(linked_access_zones=zone_ids)
+                    for ads_detail in ads_details
+                    if ads_detail['id'].lower() == name.lower()]
 
         except utils.ApiException as e:
             error_message = "Update ADS with access zone details " \
@@ -0,0 +1,433 @@
+#!/usr/bin/python
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Ansible module for running many PowerScale operations in one module execution"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: batch
+version_added: '3.10.0'
+short_description: Run many PowerScale operations in one module execution
+description:
+- You can perform the following operations.
+- Run a list of operations of the filesystem, group, nfs, nfs_alias,
+  smartquota, smb, snapshot, snapshotschedule, user and writable_snapshots
+  modules on a PowerScale cluster.
+- The operations run in a single module process which connects to the
+  cluster and probes its OneFS version once. They share the API client,
+  the user and group lookups, and the access zones.
+
+extends_documentation_fragment:
+  - dellemc.powerscale.powerscale
+
+author:
+- Ansible Team (@dell) <ansible.team@dell.com>
+
+options:
+  operations:
+    description:
+    - The operations to run.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      module:
+        description:
+        - The module of the operation, one of C(filesystem), C(group),
+          C(nfs), C(nfs_alias), C(smartquota), C(smb), C(snapshot),
+          C(snapshotschedule), C(user) or C(writable_snapshots).
+        - The fully qualified name such as C(dellemc.powerscale.filesystem)
+          is also accepted.
+        type: str
+        required: true
+      params:
+        description:
+        - The parameters of the module, without the options connecting to
+          the cluster which are set on the batch.
+        type: dict
+        default: {}
+      name:
+        description:
+        - The name of the operation in the results.
+        - Defaults to the module name and the position of the operation.
+        type: str
+  max_workers:
+    description:
+    - The maximum number of operations running concurrently.
+    - With C(1), the operations run one after the other in the given order.
+    type: int
+    default: 4
+  stop_on_error:
+    description:
+    - Whether the operations which have not started are skipped once an
+      operation fails.
+    type: bool
+    default: true
+  module_sources:
+    description:
+    - The sources of the modules of the operations.
+    - Set by the C(dellemc.powerscale.batch) action plugin, do not set it.
+    type: dict
+attributes:
+    check_mode:
+        description: Runs task to validate without performing action on the target machine.
+        support: full
+    diff_mode:
+        description: Runs the task to report the changes made or to be made.
+        support: full
+notes:
+- The task must use the C(dellemc.powerscale.batch) action plugin, which
+  sends the modules of the operations with the task.
+- Operations which depend on each other, such as an NFS export of a
+  filesystem created in the same batch, must run with I(max_workers=1).
+- The check mode and the diff mode of the task apply to all the operations.
+'''
+
+EXAMPLES = r'''
+- name: Create filesystems with their NFS exports and quotas
+  dellemc.powerscale.batch:
+    onefs_host: "{{ onefs_host }}"
+    verify_ssl: "{{ verify_ssl }}"
+    api_user: "{{ api_user }}"
+    api_password: "{{ api_password }}"
+    max_workers: 1
+    operations:
+      - module: filesystem
+        name: project1
+        params:
+          path: "/ifs/project1"
+          access_zone: "System"
+          owner:
+            name: "ansible_user"
+            provider_type: "local"
+          state: "present"
+      - module: nfs
+        params:
+          path: "/ifs/project1"
+          access_zone: "System"
+          clients: ["10.0.0.10"]
+          state: "present"
+      - module: smartquota
+        params:
+          path: "/ifs/project1"
+          quota_type: "directory"
+          quota:
+            hard_limit_size: 10
+            cap_unit: "GB"
+          state: "present"
+
+- name: Take snapshots of many paths
+  dellemc.powerscale.batch:
+    onefs_host: "{{ onefs_host }}"
+    verify_ssl: "{{ verify_ssl }}"
+    api_user: "{{ api_user }}"
+    api_password: "{{ api_password }}"
+    max_workers: 8
+    stop_on_error: false
+    operations:
+      - module: snapshot
+        params:
+          path: "/ifs/project1"
+          snapshot_name: "project1_nightly"
+          state: "present"
+      - module: snapshot
+        params:
+          path: "/ifs/project2"
+          snapshot_name: "project2_nightly"
+          state: "present"
+'''
+
+RETURN = r'''
+changed:
+    description: Whether or not any operation has changed a resource.
+    returned: always
+    type: bool
+    sample: true
+
+results:
+    description: The results of the operations, in the order of
+                 I(operations).
+    type: list
+    returned: always
+    elements: dict
+    contains:
+        name:
+            description: The name of the operation.
+            type: str
+            sample: "project1"
+        module:
+            description: The module of the operation.
+            type: str
+            sample: "filesystem"
+        changed:
+            description: Whether the operation has changed the resource.
+            type: bool
+            sample: true
+        failed:
+            description: Whether the operation failed.
+            type: bool
+            sample: false
+        skipped:
+            description: Whether the operation was skipped after a failed
+                         operation.
+            type: bool
+            sample: false
+        msg:
+            description: The error message of a failed operation.
+            type: str
+            sample: "Failed to create filesystem"
+        diff:
+            description: The diff of the operation in diff mode.
+            type: dict
+        result:
+            description: The result of the module of the operation.
+            type: dict
+            sample: {
+                "filesystem_details": {
+                    "name": "project1"
+                }
+            }
+    sample: [
+        {
+            "name": "project1",
+            "module": "filesystem",
+            "changed": true,
+            "failed": false,
+            "skipped": false,
+            "result": {
+                "filesystem_details": {
+                    "name": "project1"
+                }
+            }
+        }
+    ]
+
+diff:
+    description: The diffs of the operations in diff mode.
+    type: list
+    returned: When diff mode is enabled.
+    elements: dict
+'''
+
+import threading
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.batch \
+    import BATCH_MODULES, BatchSession, load_operation_module
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.powerscale_base \
+    import PowerScaleBase
+
+LOG = utils.get_logger('batch')
+
+MODULE_PREFIX = 'dellemc.powerscale.'
+
+# Keys of the module result of an operation reported next to it
+RESULT_KEYS = ('msg', 'diff')
+
+
+class Batch(PowerScaleBase):
+    '''Class with batch operations'''
+
+    def __init__(self):
+        """
+        Initializes the class instance.
+        """
+        ansible_module_params = {
+            'argument_spec': self.get_batch_parameters(),
+            'supports_check_mode': True
+        }
+        super().__init__(AnsibleModule, ansible_module_params)
+
+        self.result.update({
+            "results": []
+        })
+        self.operation_failed = threading.Event()
+
+    def get_batch_parameters(self):
+        """
+        Returns a dictionary with the parameters of the batch.
+        """
+        return dict(
+            operations=dict(
+                type='list', elements='dict', required=True,
+                options=dict(
+                    module=dict(type='str', required=True),
+                    params=dict(type='dict', default={}),
+                    name=dict(type='str'))),
+            max_workers=dict(type='int', default=4),
+            stop_on_error=dict(type='bool', default=True),
+            module_sources=dict(type='dict')
+        )
+
+    def get_operations(self):
+        """
+        Validates the operations and returns them with their module names.
+        :return: List of operations with their name, module and parameters.
+        """
+        connection_keys = set(self.module_params)
+        operations = []
+        for index, operation in enumerate(self.module.params['operations']):
+            module_name = operation['module']
+            if module_name.startswith(MODULE_PREFIX):
+                module_name = module_name[len(MODULE_PREFIX):]
+            if module_name not in BATCH_MODULES:
+                self.module.fail_json(
+                    msg='Module %s of operation %d cannot run in a batch, '
+                        'expected one of: %s'
+                        % (operation['module'], index + 1,
+                           ', '.join(BATCH_MODULES)))
+            params = operation['params'] or {}
+            connection_params = sorted(connection_keys.intersection(params))
+            if connection_params:
+                self.module.fail_json(
+                    msg='Operation %d sets %s, the options connecting to the '
+                        'cluster are set on the batch'
+                        % (index + 1, ', '.join(connection_params)))
+            operations.append(dict(
+                name=operation['name'] or '%s_%d' % (module_name, index + 1),
+                module=module_name, params=params))
+        return operations
+
+    def load_operation_modules(self, operations):
+        """
+        Loads the modules of the operations from their sources.
+        :param operations: List of operations.
+        :return: Dictionary of module name to the loaded module.
+        """
+        sources = self.module.params.pop('module_sources', None) or {}
+        modules = {}
+        for operation in operations:
+            module_name = operation['module']
+            if module_name in modules:
+                continue
+            if not sources.get(module_name):
+                self.module.fail_json(
+                    msg='The source of module %s is missing, the task must '
+                        'use the dellemc.powerscale.batch action plugin'
+                        % module_name)
+            modules[module_name] = load_operation_module(
+                module_name, sources[module_name])
+        return modules
+
+    def get_operation_params(self, params):
+        """
+        Returns the parameters of an operation with the options connecting
+        to the cluster of the batch.
+        :param params: The parameters of the operation.
+        """
+        operation_params = dict((key, self.module.params[key])
+                                for key in self.module_params
+                                if self.module.params.get(key) is not None)
+        operation_params.update(params)
+        return operation_params
+
+    def run_operation(self, session, modules, operation):
+        """
+        Runs an operation unless an operation failed with stop_on_error.
+        :param session: The batch session.
+        :param modules: Dictionary of module name to the loaded module.
+        :param operation: The operation.
+        :return: The result of the operation.
+        """
+        if self.operation_failed.is_set() and \
+                self.module.params['stop_on_error']:
+            return dict(changed=False, failed=False, skipped=True,
+                        msg='Skipped after a failed operation')
+        LOG.info("Running operation %s of module %s", operation['name'],
+                 operation['module'])
+        result = session.run_operation(
+            modules[operation['module']],
+            self.get_operation_params(operation['params']))
+        if result.get('failed'):
+            LOG.error("Operation %s failed: %s", operation['name'],
+                      result.get('msg'))
+            self.operation_failed.set()
+        return result
+
+    def get_operation_result(self, operation, module_result):
+        """
+        Returns the result of an operation in the results of the batch.
+        :param operation: The operation.
+        :param module_result: The result of the module of the operation.
+        """
+        module_result = dict(module_result)
+        # The perf of the batch covers the requests of all the operations
+        module_result.pop('perf', None)
+        result = dict(name=operation['name'], module=operation['module'],
+                      changed=bool(module_result.pop('changed', False)),
+                      failed=bool(module_result.pop('failed', False)),
+                      skipped=bool(module_result.pop('skipped', False)))
+        for key in RESULT_KEYS:
+            if key in module_result:
+                result[key] = module_result.pop(key)
+        result['result'] = module_result
+        return result
+
+    def run_operations(self, operations):
+        """
+        Runs the operations with bounded parallelism.
+        :param operations: List of operations.
+        :return: List of operation results in the order of the operations.
+        """
+        modules = self.load_operation_modules(operations)
+        with BatchSession(self.module, self.isi_sdk,
+                          self.api_client) as session:
+            outcome = utils.run_concurrently(
+                lambda operation: self.run_operation(session, modules,
+                                                     operation),
+                operations, self.module.params['max_workers'])
+        results = []
+        for entry in outcome:
+            module_result = entry['result']
+            if entry['error']:
+                module_result = dict(changed=False, failed=True,
+                                     msg=entry['error'])
+            results.append(self.get_operation_result(entry['item'],
+                                                     module_result))
+        return results
+
+
+class BatchHandler:
+    def handle(self, batch_obj, module_params):
+        """
+        Runs the operations and reports their results.
+        :param batch_obj: The Batch object.
+        :param module_params: The module parameters.
+        """
+        operations = batch_obj.get_operations()
+        results = batch_obj.run_operations(operations)
+        batch_obj.result['results'] = results
+        batch_obj.result['changed'] = any(result['changed']
+                                          for result in results)
+        if batch_obj.module._diff:
+            batch_obj.result['diff'] = [
+                dict(result['diff'], before_header=result['name'],
+                     after_header=result['name'])
+                for result in results if isinstance(result.get('diff'), dict)]
+
+        failed = [result['name'] for result in results if result['failed']]
+        if failed:
+            error_message = '%d of %d operations failed: %s' \
+                % (len(failed), len(results), ', '.join(failed))
+            LOG.error(error_message)
+            batch_obj.module.fail_json(msg=error_message, **batch_obj.result)
+        batch_obj.module.exit_json(**batch_obj.result)
+
+
+def main():
+    """Create PowerScale Batch object and run the operations
+        based on user input from playbook"""
+    obj = Batch()
+    BatchHandler().handle(obj, obj.module.params)
+
+
+if __name__ == '__main__':
+    main()
@@ -191,17 +191,19 @@ class ClusterServices:
             "cluster_services_details": {}
         }
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info('Got python SDK instance for provisioning on PowerScale ')
-        check_mode_msg = f'Check mode flag is {self.module.check_mode}'
-        LOG.info(check_mode_msg)
+        LOG.info('Check mode flag is %s', self.module.check_mode)
 
         self.protocol_api = self.isi_sdk.ProtocolsApi(self.api_client)
         self.antivirus_api = self.isi_sdk.AntivirusApi(self.api_client)
@@ -216,8 +218,7 @@ class ClusterServices:
         api_obj = getattr(self, svc['api_attr'])
         get_method = getattr(api_obj, svc['get'])
         label = svc['label']
-        msg = f"Getting {label} service details"
-        LOG.info(msg)
+        LOG.info("Getting %s service details", label)
         try:
             response = get_method()
             if response:
@@ -248,8 +249,7 @@ class ClusterServices:
         update_method = getattr(api_obj, svc['update'])
         label = svc['label']
         try:
-            msg = f"Modify {label} service with service={enabled}"
-            LOG.info(msg)
+            LOG.info("Modify %s service with service=%s", label, enabled)
             if not self.module.check_mode:
                 kwargs = {svc['update_kwarg']: {'service': enabled}}
                 update_method(**kwargs)
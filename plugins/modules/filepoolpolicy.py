@@ -458,18 +458,20 @@ class FilePoolPolicy(object):
                                     mutually_exclusive=mutually_exclusive,
                                     required_one_of=required_one_of)
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.filepool_api = utils.isi_sdk.FilepoolApi(self.api_client)
         self.storagepool_api = utils.isi_sdk.StoragepoolApi(self.api_client)
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
-        check_mode_msg = f'Check mode flag is {self.module.check_mode}'
-        LOG.info(check_mode_msg)
+        LOG.info('Check mode flag is %s', self.module.check_mode)
 
     def validate_node_pools(self, storage_nodepool):
         """
@@ -894,8 +896,7 @@ class FilePoolPolicy(object):
                 "actions": actions,
                 'file_matching_pattern': file_matching_criteria
             }
-            create_msg = f'Creating file pool policy {policy_name}'
-            LOG.info(create_msg)
+            LOG.info('Creating file pool policy %s', policy_name)
             if not self.module.check_mode:
                 file_pool_policy_object = utils.isi_sdk.FilepoolPolicyCreateParams(**file_pool_policy_data)
                 create_filepool_policy_response = self.filepool_api.create_filepool_policy(file_pool_policy_object)
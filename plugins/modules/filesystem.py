@@ -26,6 +26,7 @@ description:
 
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 
 author:
 - Prashant Rakheja (@prashant-dell) <ansible.team@dell.com>
@@ -566,6 +567,8 @@ import copy
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zone_topology \
+    import ZoneTopology
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.quota \
     import Quota
 
@@ -581,6 +584,7 @@ class FileSystem(object):
         self.module_params = utils \
             .get_powerscale_management_host_parameters()
         self.module_params.update(get_filesystem_parameters())
+        self.module_params.update(utils.get_zone_cache_parameters())
 
         mutually_exclusive = [['access_control', 'access_control_rights']]
         required_together = [['access_control_rights', 'access_control_rights_state']]
@@ -604,20 +608,24 @@ class FileSystem(object):
             filesystem_snapshots='',
             filesystem_details=''
         )
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info('Got python SDK instance for provisioning on PowerScale ')
 
         self.namespace_api = self.isi_sdk.NamespaceApi(self.api_client)
         self.quota_api = self.isi_sdk.QuotaApi(self.api_client)
         self.protocol_api = self.isi_sdk.ProtocolsApi(self.api_client)
-        self.zone_summary_api = self.isi_sdk.ZonesSummaryApi(self.api_client)
+        self.zones_api = self.isi_sdk.ZonesApi(self.api_client)
+        self.zone_topology = None
         self.snapshot_api = self.isi_sdk.SnapshotApi(self.api_client)
         self.auth_api = self.isi_sdk.AuthApi(self.api_client)
 
@@ -698,9 +706,9 @@ class FileSystem(object):
     def get_zone_base_path(self, access_zone):
         """Returns the base path of the Access Zone."""
         try:
-            zone_path = (self.zone_summary_api.
-                         get_zones_summary_zone(access_zone)).to_dict()
-            return zone_path['summary']['path']
+            if self.zone_topology is None:
+                self.zone_topology = ZoneTopology(self.zones_api, self.module)
+            return self.zone_topology.get_zone_base_path(access_zone)
         except Exception as e:
             error_msg = self.determine_error(error_obj=e)
             error_message = 'Unable to fetch base path of Access Zone {0} ' \
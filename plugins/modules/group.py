@@ -281,12 +281,15 @@ class Group(object):
         # result is a dictionary that contains changed status and
         # group details
         self.result = {"changed": False}
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.api_instance = utils.isi_sdk.AuthApi(self.api_client)
         self.group_api_instance = utils.isi_sdk.AuthGroupsApi(
             self.api_client)
@@ -153,6 +153,7 @@ options:
     - Alert channels - C(alert_channels).
     - Alert categories - C(alert_categories).
     - Event groups - C(event_group).
+    - Event group occurrences - C(event_group_occurrences).
     - Writable snapshots - C(writable_snapshots).
     - IPMI configuration - C(ipmi_config).
     required: true
@@ -164,7 +165,8 @@ options:
               nfs_zone_settings, nfs_default_settings, nfs_global_settings, synciq_global_settings, s3_buckets,
               smb_global_settings, ntp_servers, email_settings, cluster_identity, cluster_owner, snmp_settings,
               server_certificate, roles, support_assist_settings, smartquota, filesystem, alert_settings,
-              alert_rules, alert_channels, alert_categories, event_group, writable_snapshots, ipmi_config]
+              alert_rules, alert_channels, alert_categories, event_group, event_group_occurrences,
+              writable_snapshots, ipmi_config]
     type: list
     elements: str
   include_all_access_zones:
@@ -186,8 +188,17 @@ options:
   query_parameters:
     description:
     - Contains dictionary of query parameters for specific I(gather_subset).
-    - Applicable to C(alert_rules), C(event_group), C(event_channels), C(filesystem)
-      and C(writable_snapshots).
+    - Applicable to C(alert_rules), C(event_group), C(event_group_occurrences),
+      C(event_channels), C(filesystem) and C(writable_snapshots).
+    - C(event_group_occurrences) accepts C(begin), C(end), C(resolved), C(ignore),
+      C(cause) and C(limit), the page size which defaults to C(100).
+    - C(event_group_occurrences) also accepts C(cursor_file), the path of a state
+      file holding the time and IDs of the newest occurrence returned per cluster.
+      With C(cursor_file) only occurrences noticed since the previous call are
+      returned and the file is updated unless in check mode.
+    - C(event_group_occurrences) also accepts C(max_items), the maximum number of
+      occurrences returned per call. The remaining ones are returned by the next
+      call when C(cursor_file) is set.
     - If C(writable_snapshots) is passed as I(gather_subset), if I(wspath) is given,
       all other query parameters inside I(writable_snapshots) will be ignored.
     - To view the list of supported query parameters for C(writable_snapshots).
@@ -659,6 +670,20 @@ EXAMPLES = r'''
         - alert_info: true
         - category: '100000000'
 
+- name: Get the event group occurrences noticed since the previous poll
+  dellemc.powerscale.info:
+    onefs_host: "{{ onefs_host }}"
+    verify_ssl: "{{ verify_ssl }}"
+    api_user: "{{ api_user }}"
+    api_password: "{{ api_password }}"
+    gather_subset:
+      - event_group_occurrences
+    query_parameters:
+      event_group_occurrences:
+        - cursor_file: "/var/lib/powerscale/event_cursor.json"
+        - resolved: false
+        - max_items: 500
+
 - name: Get sorted list of alert channel based on name key from PowerScale cluster
   dellemc.powerscale.info:
     onefs_host: "{{ onefs_host }}"
@@ -3216,6 +3241,39 @@ event_groups:
         "resume": null,
         "total": 1
     }
+event_group_occurrences:
+    description: The event group occurrences, oldest first.
+    type: list
+    returned: When C(event_group_occurrences) is in a given I(gather_subset).
+    contains:
+        id:
+            description: Unique identifier of the event group occurrence.
+            type: str
+        time_noticed:
+            description: Time the event group was first noticed.
+            type: int
+        last_event:
+            description: Time of the last event of the event group.
+            type: int
+        severity:
+            description: Severity of the event group.
+            type: str
+        resolved:
+            description: True if the event group is resolved.
+            type: bool
+        causes:
+            description: Specific causes of the event group.
+            type: list
+    sample: [
+        {
+            "id": "3.1542",
+            "time_noticed": 1700000000,
+            "last_event": 1700000300,
+            "severity": "critical",
+            "resolved": false,
+            "causes": [["ONGOING"]]
+        }
+    ]
 '''
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -3266,13 +3324,16 @@ class Info(object):
                                     mutually_exclusive=mutually_exclusive_args
                                     )
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         self.major = self.isi_sdk.major
         self.minor = self.isi_sdk.minor
@@ -3482,10 +3543,14 @@ class Info(object):
         try:
             synciq_reports_list = []
             synciq_reports_details = (self.synciq_api.get_sync_reports()).to_dict()
-            for i in range(synciq_reports_details['total']):
-                synciq_reports_dict = {"id": synciq_reports_details['reports'][i]['id'],
-                                       "name": synciq_reports_details['reports'][i]['policy_name']}
-                synciq_reports_list.append(synciq_reports_dict)
+            while True:
+                for report in synciq_reports_details['reports'] or []:
+                    synciq_reports_list.append({"id": report['id'],
+                                                "name": report['policy_name']})
+                resume = synciq_reports_details.get('resume')
+                if not resume:
+                    break
+                synciq_reports_details = (self.synciq_api.get_sync_reports(resume=resume)).to_dict()
             return synciq_reports_list
         except Exception as e:
             error_msg = (
@@ -3501,9 +3566,8 @@ class Info(object):
         try:
             policies_list = []
             policies_details = (self.synciq_api.list_sync_policies()).to_dict()
-            policies = policies_details['policies']
-            if policies:
-                for policy in policies:
+            while True:
+                for policy in policies_details['policies'] or []:
                     policies_list.append({"name": policy['name'],
                                           "id": policy['id'],
                                           "source_root_path": policy['source_root_path'],
@@ -3511,6 +3575,10 @@ class Info(object):
                                           "action": policy['action'],
                                           "schedule": policy['schedule'],
                                           "enabled": policy['enabled']})
+                resume = policies_details.get('resume')
+                if not resume:
+                    break
+                policies_details = (self.synciq_api.list_sync_policies(resume=resume)).to_dict()
             return policies_list
         except Exception as e:
             error_msg = (
@@ -3851,8 +3919,7 @@ class Info(object):
         """Get the NFS global setings of a given PowerScale Storage"""
         try:
             nfs_global_settings_details = self.protocol_api.get_nfs_settings_global().to_dict()
-            msg = f"Got NFS global settings from PowerScale cluster {self.module.params['onefs_host']}"
-            LOG.info(msg)
+            LOG.info("Got NFS global settings from PowerScale cluster %s", self.module.params['onefs_host'])
             return nfs_global_settings_details['settings']
         except Exception as e:
             error_msg = (
@@ -3872,8 +3939,7 @@ class Info(object):
                 smartquota_details = self.smartquota_api.list_quota_quotas(resume=resume).to_dict()
                 smartquota.extend(smartquota_details['quotas'])
                 resume = smartquota_details['resume']
-            msg = f"Got smartquota list from PowerScale cluster {self.module.params['onefs_host']}"
-            LOG.info(msg)
+            LOG.info("Got smartquota list from PowerScale cluster %s", self.module.params['onefs_host'])
             filters = self.module.params.get('filters')
             filters_dict = self.get_filters(filters)
             if filters_dict:
@@ -4075,6 +4141,7 @@ class Info(object):
             'alert_categories': [],
             'alert_channels': [],
             'event_groups': [],
+            'event_group_occurrences': [],
             'smart_quota' : [],
             'file_system' : []
         }
@@ -4125,6 +4192,7 @@ class Info(object):
             'alert_categories': lambda: Events(self.event_api, self.module).get_alert_categories(),
             'alert_channels': lambda: Events(self.event_api, self.module).get_event_channels(),
             'event_group': lambda: Events(self.event_api, self.module).get_event_groups(),
+            'event_group_occurrences': lambda: Events(self.event_api, self.module).get_event_group_occurrences(),
             'smartquota': self.get_smartquota_list,
             'filesystem': lambda: self.get_filesystem_list(path, query_params),
             'writable_snapshots': self.get_writable_snapshots,
@@ -4170,6 +4238,7 @@ class Info(object):
             's3_buckets': 's3Buckets',
             'synciq_target_cluster_certificates': 'SynciqTargetClusterCertificate',
             'event_group': 'event_groups',
+            'event_group_occurrences': 'event_group_occurrences',
             'smartquota': 'smart_quota',
             'filesystem': 'file_system',
             'writable_snapshots': 'writable_snapshots',
@@ -4237,6 +4306,7 @@ def get_info_parameters():
                      'snmp_settings', 'server_certificate', 'roles',
                      'support_assist_settings', 'alert_settings', 'alert_rules',
                      'alert_channels', 'alert_categories', 'event_group',
+                     'event_group_occurrences',
                      'filesystem', 'smartquota', 'writable_snapshots',
                      'ipmi_config']),
         filters=dict(type='list',
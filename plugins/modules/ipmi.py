@@ -326,14 +326,14 @@ class Ipmi(object):
 
         self.result = {"changed": False, "ipmi_details": {}}
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(msg=PREREQS_VALIDATE["error_message"])
 
         self.ipmi_api = IpmiApi(self.module)
         LOG.info("Got IPMI API instance for PowerScale")
-        check_mode_msg = f"Check mode flag is {self.module.check_mode}"
-        LOG.info(check_mode_msg)
+        LOG.info("Check mode flag is %s", self.module.check_mode)
 
     def get_ipmi_config(self):
         """Get full IPMI configuration."""
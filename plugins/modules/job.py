@@ -37,14 +37,14 @@ options:
   job_id:
     description:
     - The ID of an existing job to control.
-    - Mutually exclusive with I(job_type).
+    - Mutually exclusive with I(job_type) and I(jobs).
     - Required if I(job_type) is not specified.
     type: int
 
   job_type:
     description:
     - The type of job to start (e.g. C(SmartPools), C(TreeDelete)).
-    - Mutually exclusive with I(job_id).
+    - Mutually exclusive with I(job_id) and I(jobs).
     - Required if I(job_id) is not specified.
     type: str
 
@@ -88,6 +88,57 @@ options:
     - Additional parameters to pass when starting the job.
     type: dict
 
+  jobs:
+    description:
+    - List of job specs to start as a batch.
+    - All the jobs are listed once to detect duplicates. A spec is a no-op
+      when a job of the same type is active, or is started earlier in the
+      batch, unless I(allow_dup) of the spec is C(true).
+    - The jobs are started concurrently within I(max_running_per_type).
+    - If I(wait=true), the module waits for all the jobs with one listing
+      of all the jobs per poll.
+    - Mutually exclusive with I(job_id) and I(job_type).
+    type: list
+    elements: dict
+    suboptions:
+      job_type:
+        description:
+        - The type of job to start.
+        type: str
+        required: true
+      paths:
+        description:
+        - List of filesystem paths for the job.
+        type: list
+        elements: str
+        required: true
+      priority:
+        description:
+        - The priority of the job. Must be between 1 and 10.
+        type: int
+      policy:
+        description:
+        - The impact policy name to associate with the job.
+        type: str
+      allow_dup:
+        description:
+        - Whether to allow starting a duplicate job of the same type.
+        type: bool
+        default: false
+      job_params:
+        description:
+        - Additional parameters to pass when starting the job.
+        type: dict
+
+  max_running_per_type:
+    description:
+    - Maximum number of active jobs of the same type, including the jobs
+      already active on the cluster, while starting the I(jobs).
+    - The job specs over the limit are started as the active jobs of their
+      type complete, within I(wait_timeout).
+    - If not specified, all the job specs are started at once.
+    type: int
+
   wait:
     description:
     - Whether to wait for the job to complete after starting it.
@@ -97,15 +148,31 @@ options:
   wait_timeout:
     description:
     - Maximum time in seconds to wait for job completion.
+    - The timeout is measured on the wall clock, including the time taken
+      by the polling requests.
     type: int
     default: 300
 
   wait_interval:
     description:
-    - Interval in seconds between polling for job status during wait.
+    - Initial interval in seconds between polling for job status during wait.
+    - The interval grows exponentially with jitter up to I(wait_max_interval).
     type: int
     default: 10
 
+  wait_max_interval:
+    description:
+    - Maximum interval in seconds between polling for job status during wait.
+    type: int
+    default: 60
+
+  wait_max_errors:
+    description:
+    - Number of consecutive errors tolerated while polling for job status
+      during wait before the task fails.
+    type: int
+    default: 3
+
   state:
     description:
     - The state of the job resource.
@@ -140,6 +207,34 @@ EXAMPLES = r'''
     wait: true
     wait_timeout: 600
     wait_interval: 15
+    wait_max_interval: 120
+    state: "present"
+
+- name: Start a batch of jobs with at most two TreeDelete jobs at a time
+  dellemc.powerscale.job:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    jobs:
+      - job_type: "TreeDelete"
+        paths:
+          - "/ifs/data/old_dir1"
+        allow_dup: true
+      - job_type: "TreeDelete"
+        paths:
+          - "/ifs/data/old_dir2"
+        allow_dup: true
+      - job_type: "TreeDelete"
+        paths:
+          - "/ifs/data/old_dir3"
+        allow_dup: true
+      - job_type: "FSAnalyze"
+        paths:
+          - "/ifs"
+    max_running_per_type: 2
+    wait: true
+    wait_timeout: 3600
     state: "present"
 
 - name: Pause a running job
@@ -230,6 +325,84 @@ job_details:
         "end_time": null
     }
 
+batch_jobs:
+    description: The outcome of each job spec of I(jobs).
+    returned: When I(jobs) is given
+    type: list
+    elements: dict
+    contains:
+        job_type:
+            description: The type of the job.
+            type: str
+        paths:
+            description: The filesystem paths of the job.
+            type: list
+        outcome:
+            description: C(started), C(noop) for a duplicate, C(failed) if the
+                         job could not be started, or C(deferred) if the
+                         limit of active jobs did not allow starting it in time.
+            type: str
+        job_id:
+            description: The ID of the started job, or for a duplicate of
+                         the active job or of the job started for the earlier
+                         job spec of the batch.
+            type: int
+        job_details:
+            description: The latest job details.
+            type: dict
+        job_progress:
+            description: The progress samples of the job, when I(wait=true).
+            type: list
+        error:
+            description: The error of the job spec, if any.
+            type: str
+    sample: [
+        {
+            "job_type": "TreeDelete",
+            "paths": ["/ifs/data/old_dir1"],
+            "outcome": "started",
+            "job_id": 46,
+            "job_details": {"id": 46, "type": "TreeDelete", "state": "succeeded"},
+            "error": null
+        },
+        {
+            "job_type": "FSAnalyze",
+            "paths": ["/ifs"],
+            "outcome": "noop",
+            "job_id": 40,
+            "job_details": {"id": 40, "type": "FSAnalyze", "state": "running"},
+            "error": null
+        }
+    ]
+
+job_progress:
+    description: The progress samples of the job recorded while waiting. A
+                 sample is recorded when the state, phase or percent changes.
+    returned: When I(wait=true) and a job is started
+    type: list
+    elements: dict
+    contains:
+        elapsed:
+            description: The seconds elapsed since the wait started.
+            type: int
+        state:
+            description: The state of the job.
+            type: str
+        phase:
+            description: The current phase of the job.
+            type: int
+        total_phases:
+            description: The total number of phases of the job.
+            type: int
+        percent:
+            description: The completion percentage of the job, if known.
+            type: float
+    sample: [
+        {"elapsed": 0, "state": "running", "phase": 1, "total_phases": 2, "percent": 0.0},
+        {"elapsed": 62, "state": "running", "phase": 2, "total_phases": 2, "percent": 50.0},
+        {"elapsed": 190, "state": "succeeded", "phase": 2, "total_phases": 2, "percent": 50.0}
+    ]
+
 outcome:
     description: The outcome of the operation.
     returned: always
@@ -249,16 +422,15 @@ diff:
             type: dict
 '''
 
-import time
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.job \
+    import JobWaiter, ACTIVE_STATES, TERMINAL_STATES
+import time
 
 LOG = utils.get_logger('job')
 
-# Terminal states - job is complete
-TERMINAL_STATES = ('succeeded', 'failed', 'cancelled_user', 'cancelled_system')
-
 # Paused states
 PAUSED_STATES = ('paused_user',
                  'paused_system',
@@ -281,20 +453,24 @@ class Job(object):
         self.module = AnsibleModule(
             argument_spec=self.module_params,
             supports_check_mode=True,
-            mutually_exclusive=[['job_id', 'job_type']],
-            required_one_of=[['job_id', 'job_type']]
+            mutually_exclusive=[['job_id', 'job_type', 'jobs']],
+            required_one_of=[['job_id', 'job_type', 'jobs']]
         )
 
         # result is a dictionary that contains changed status
         self.result = {"changed": False}
+        self.job_progress = None
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         self.job_api = self.isi_sdk.JobApi(self.api_client)
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
@@ -327,14 +503,10 @@ class Job(object):
         :return: First matching running job or None.
         """
         try:
-            api_response = self.job_api.list_job_jobs()
-            if api_response:
-                response_dict = api_response.to_dict()
-                if response_dict and 'jobs' in response_dict:
-                    for job in response_dict['jobs']:
-                        if job.get('type') == job_type and job.get(
-                                'state') in RUNNING_STATES + PAUSED_STATES:
-                            return job
+            for job in JobWaiter(self.job_api, self.module).iter_jobs():
+                if job.get('type') == job_type and job.get(
+                        'state') in RUNNING_STATES + PAUSED_STATES:
+                    return job
             return None
         except utils.ApiException as e:
             error_message = 'Failed to list jobs with error: %s' \
@@ -342,6 +514,40 @@ class Job(object):
             LOG.error(error_message)
             self.module.fail_json(msg=error_message)
 
+    def get_create_params(self, params):
+        """
+        Get the parameters for creating a job.
+        :param params: Dictionary containing job parameters.
+        :return: Dictionary of JobJobCreateParams arguments.
+        """
+        create_params = {
+            'type': params['job_type']
+        }
+        if params.get('paths'):
+            create_params['paths'] = params['paths']
+        if params.get('priority') is not None:
+            create_params['priority'] = params['priority']
+        if params.get('policy'):
+            create_params['policy'] = params['policy']
+        if params.get('allow_dup'):
+            create_params['allow_dup'] = params['allow_dup']
+        if params.get('job_params'):
+            params_key = params['job_type'].lower() + '_params'
+            create_params[params_key] = params['job_params']
+        return create_params
+
+    def create_job(self, params):
+        """
+        Create a job without failing the module.
+        :param params: Dictionary containing job parameters.
+        :return: The created job response.
+        """
+        body = self.isi_sdk.JobJobCreateParams(**self.get_create_params(params))
+        api_response = self.job_api.create_job_job(body)
+        if api_response:
+            return api_response.to_dict()
+        return None
+
     def start_job(self, params):
         """
         Start a new job.
@@ -349,26 +555,7 @@ class Job(object):
         :return: The created job response.
         """
         try:
-            create_params = {
-                'type': params['job_type']
-            }
-            if params.get('paths'):
-                create_params['paths'] = params['paths']
-            if params.get('priority') is not None:
-                create_params['priority'] = params['priority']
-            if params.get('policy'):
-                create_params['policy'] = params['policy']
-            if params.get('allow_dup'):
-                create_params['allow_dup'] = params['allow_dup']
-            if params.get('job_params'):
-                params_key = params['job_type'].lower() + '_params'
-                create_params[params_key] = params['job_params']
-
-            body = self.isi_sdk.JobJobCreateParams(**create_params)
-            api_response = self.job_api.create_job_job(body)
-            if api_response:
-                return api_response.to_dict()
-            return None
+            return self.create_job(params)
         except utils.ApiException as e:
             error_message = 'Failed to start job of type %s with ' \
                             'error: %s' % (params['job_type'],
@@ -408,29 +595,26 @@ class Job(object):
         Wait for a job to reach a terminal state.
         :param job_id: The job ID to monitor.
         :param timeout: Maximum wait time in seconds.
-        :param interval: Polling interval in seconds.
+        :param interval: Initial polling interval in seconds.
         :return: The final job details.
         """
-        elapsed = 0
-        while elapsed < timeout:
-            job_details = self.get_job_details(job_id)
-            if job_details is None:
-                LOG.warning("Job %s not found during wait", job_id)
-                return None
-            current_state = job_details.get('state', '')
-            if current_state in TERMINAL_STATES:
-                LOG.info("Job %s reached terminal state: %s",
-                         job_id, current_state)
-                return job_details
-            LOG.info("Job %s in state %s, waiting... (%d/%d seconds)",
-                     job_id, current_state, elapsed, timeout)
-            time.sleep(interval)
-            elapsed += interval
-
-        error_message = 'Job %s timed out waiting for completion ' \
-                        'after %d seconds' % (job_id, timeout)
-        LOG.error(error_message)
-        self.module.fail_json(msg=error_message)
+        waiter = JobWaiter(self.job_api, self.module,
+                           initial_interval=interval,
+                           max_interval=self.module.params.get('wait_max_interval') or interval,
+                           max_errors=self.module.params.get('wait_max_errors') or 0)
+        status = waiter.wait([job_id], timeout)[job_id]
+        self.job_progress = status['samples']
+        if status['error']:
+            error_message = 'Failed to get job details for job %s ' \
+                            'with error: %s' % (job_id, status['error'])
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+        if status['timed_out']:
+            error_message = 'Job %s timed out waiting for completion ' \
+                            'after %d seconds' % (job_id, timeout)
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+        return status['job']
 
     def validate_start_params(self):
         """Validate parameters required for starting a job."""
@@ -454,6 +638,227 @@ class Job(object):
             self.module.fail_json(
                 msg="wait_interval must be at least 1 second.")
 
+        wait_max_interval = self.module.params.get('wait_max_interval')
+        if wait_max_interval is not None and wait_max_interval < 1:
+            self.module.fail_json(
+                msg="wait_max_interval must be at least 1 second.")
+
+        wait_max_errors = self.module.params.get('wait_max_errors')
+        if wait_max_errors is not None and wait_max_errors < 0:
+            self.module.fail_json(
+                msg="wait_max_errors must be a non-negative integer.")
+
+    def validate_batch_params(self):
+        """Validate the job specs of the batch mode."""
+        for spec in self.module.params['jobs']:
+            if not spec.get('paths'):
+                self.module.fail_json(
+                    msg="The paths of the %s job spec must contain at least "
+                        "one path." % spec['job_type'])
+            priority = spec.get('priority')
+            if priority is not None and (priority < 1 or priority > 10):
+                self.module.fail_json(
+                    msg="Invalid priority %d in the %s job spec. Priority "
+                        "must be between 1 and 10." % (priority, spec['job_type']))
+        max_running_per_type = self.module.params.get('max_running_per_type')
+        if max_running_per_type is not None and max_running_per_type < 1:
+            self.module.fail_json(
+                msg="max_running_per_type must be at least 1.")
+
+    @staticmethod
+    def count_active_jobs(listed):
+        """Count the active jobs per type from a listing of all the jobs."""
+        counts = {}
+        for job in listed.values():
+            if job.get('state') in ACTIVE_STATES:
+                counts[job.get('type')] = counts.get(job.get('type'), 0) + 1
+        return counts
+
+    def plan_batch(self, specs, listed):
+        """
+        Detect the duplicate job specs against the active jobs and the
+        earlier specs of the batch.
+        :return: Tuple of the batch entries, the queue of (entry, spec) to be
+            started and the (entry, queued entry) pairs of the specs which
+            duplicate an earlier spec of the batch.
+        """
+        active = {}
+        for job in listed.values():
+            if job.get('state') in ACTIVE_STATES:
+                active.setdefault(job.get('type'), job)
+        planned = {}
+        entries = []
+        queue = []
+        duplicates = []
+        for spec in specs:
+            entry = dict(job_type=spec['job_type'], paths=spec['paths'],
+                         outcome=None, job_id=None, job_details=None,
+                         error=None)
+            entries.append(entry)
+            existing = active.get(spec['job_type'])
+            if existing is not None and not spec.get('allow_dup'):
+                LOG.info("Job of type %s already active (ID: %s), "
+                         "allow_dup is false. No-op.",
+                         spec['job_type'], existing.get('id'))
+                entry.update(outcome='noop', job_id=existing.get('id'),
+                             job_details=existing)
+                continue
+            queued = planned.get(spec['job_type'])
+            if queued is not None and not spec.get('allow_dup'):
+                LOG.info("Job of type %s already in the batch, allow_dup is "
+                         "false. No-op.", spec['job_type'])
+                entry['outcome'] = 'noop'
+                duplicates.append((entry, queued))
+                continue
+            planned.setdefault(spec['job_type'], entry)
+            queue.append((entry, spec))
+        return entries, queue, duplicates
+
+    @staticmethod
+    def resolve_duplicates(duplicates):
+        """
+        Point the specs which duplicate an earlier spec of the batch to the
+        job started for that spec.
+        :param duplicates: The (entry, queued entry) pairs from plan_batch.
+        """
+        for entry, queued in duplicates:
+            entry.update(job_id=queued['job_id'],
+                         job_details=queued['job_details'])
+
+    @staticmethod
+    def take_ready(queue, counts, max_running_per_type):
+        """
+        Take the queued job specs which can start without exceeding the cap
+        of active jobs per type.
+        :return: Tuple of the ready and the remaining queue items.
+        """
+        ready = []
+        remaining = []
+        for item in queue:
+            job_type = item[1]['job_type']
+            if max_running_per_type is not None and \
+                    counts.get(job_type, 0) >= max_running_per_type:
+                remaining.append(item)
+                continue
+            counts[job_type] = counts.get(job_type, 0) + 1
+            ready.append(item)
+        return ready, remaining
+
+    def submit_batch(self, ready):
+        """
+        Start the ready job specs concurrently.
+        :return: The IDs of the started jobs.
+        """
+        outcome = utils.run_concurrently(lambda item: self.create_job(item[1]),
+                                         ready)
+        started = []
+        for result in outcome:
+            entry = result['item'][0]
+            job_id = (result['result'] or {}).get('id')
+            if result['error'] or job_id is None:
+                entry.update(outcome='failed',
+                             error=result['error'] or 'No job ID returned')
+                LOG.error("Failed to start job of type %s with error: %s",
+                          entry['job_type'], entry['error'])
+                continue
+            entry.update(outcome='started', job_id=job_id)
+            started.append(job_id)
+        return started
+
+    def run_batch(self, queue, counts, waiter, wait, timeout):
+        """
+        Start the queued job specs within the cap of active jobs per type and
+        optionally wait for them, with one listing of all the jobs per poll.
+        :return: Dictionary of job ID to wait status.
+        """
+        max_running_per_type = self.module.params.get('max_running_per_type')
+        status = {}
+        start = time.monotonic()
+        deadline = start + timeout
+        interval = waiter.initial_interval
+        while True:
+            ready, queue = self.take_ready(queue, counts, max_running_per_type)
+            if ready:
+                for job_id in self.submit_batch(ready):
+                    status[job_id] = waiter.new_status()
+            pending = [job_id for job_id, entry in status.items()
+                       if entry.get('done') is None] if wait else []
+            if not queue and not pending:
+                break
+            if time.monotonic() >= deadline:
+                for job_id in pending:
+                    status[job_id]['timed_out'] = True
+                for entry, spec in queue:
+                    entry.update(outcome='deferred',
+                                 error='Timed out waiting for a free slot')
+                break
+            sleep_time = min(waiter.get_sleep_time(interval),
+                             deadline - time.monotonic())
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+            interval = waiter.next_interval(interval)
+
+            try:
+                listed = waiter.list_jobs_by_id()
+            except Exception as e:
+                error = utils.determine_error(error_obj=e) or type(e).__name__
+                LOG.warning("Failed to list jobs with error: %s", error)
+                fetched = dict((job_id, dict(result=None, error=error))
+                               for job_id in pending)
+            else:
+                counts = self.count_active_jobs(listed)
+                fetched = waiter.fetch_jobs_by_listing(pending, listed)
+            elapsed = time.monotonic() - start
+            for job_id in pending:
+                if waiter.update_status(status[job_id], job_id,
+                                        fetched[job_id], elapsed):
+                    status[job_id]['done'] = True
+        return status
+
+    def _handle_batch(self, params):
+        """Handle starting a batch of jobs. Returns (changed, entries, error_message)."""
+        waiter = JobWaiter(self.job_api, self.module,
+                           initial_interval=params['wait_interval'],
+                           max_interval=params['wait_max_interval'],
+                           max_errors=params['wait_max_errors'])
+        try:
+            listed = waiter.list_jobs_by_id()
+        except Exception as e:
+            error_message = 'Failed to list jobs with error: %s' \
+                            % (utils.determine_error(error_obj=e))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
+        entries, queue, duplicates = self.plan_batch(params['jobs'], listed)
+        if self.module.check_mode:
+            for entry, spec in queue:
+                entry['outcome'] = 'started'
+            return bool(queue), entries, None
+
+        status = self.run_batch(queue, self.count_active_jobs(listed), waiter,
+                                params['wait'], params['wait_timeout'])
+        errors = []
+        for entry in entries:
+            job_status = status.get(entry['job_id']) if entry['outcome'] == 'started' else None
+            if job_status is not None:
+                entry['job_details'] = job_status['job']
+                if params['wait']:
+                    entry['job_progress'] = job_status['samples']
+                if job_status['error']:
+                    entry['error'] = job_status['error']
+                elif job_status['timed_out']:
+                    entry['error'] = 'Timed out waiting for completion'
+            if entry['error']:
+                errors.append('%s job %s: %s' % (entry['job_type'],
+                                                 entry['job_id'] or '', entry['error']))
+        self.resolve_duplicates(duplicates)
+        changed = any(entry['outcome'] == 'started' for entry in entries)
+        error_message = None
+        if errors:
+            error_message = '%d of %d batch jobs failed: %s' % (
+                len(errors), len(entries), '; '.join(errors))
+        return changed, entries, error_message
+
     def _handle_start_job(self, params):
         """Handle starting a new job by type. Returns (changed, outcome, job_details, diff_dict)."""
         job_type = params['job_type']
@@ -629,9 +1034,21 @@ class Job(object):
         job_id = p.get('job_id')
         job_type = p.get('job_type')
 
+        if p.get('jobs') is not None:
+            self.validate_start_params()
+            self.validate_batch_params()
+            changed, entries, error_message = self._handle_batch(p)
+            result = dict(changed=changed, batch_jobs=entries,
+                          outcome='started' if changed else 'noop')
+            if error_message:
+                LOG.error(error_message)
+                self.module.fail_json(msg=error_message, **result)
+            self.module.exit_json(**result)
+            return
+
         if not job_type and job_id is None:
             self.module.fail_json(
-                msg="Either job_id or job_type must be specified.")
+                msg="Either job_id, job_type or jobs must be specified.")
 
         self.validate_start_params()
 
@@ -648,6 +1065,8 @@ class Job(object):
                 'priority': p.get('priority'), 'policy': p.get('policy')})
 
         result = dict(changed=changed, job_details=job_details, outcome=outcome)
+        if self.job_progress is not None:
+            result['job_progress'] = self.job_progress
         if self.module._diff and diff_dict:
             result['diff'] = diff_dict
         self.module.exit_json(**result)
@@ -668,9 +1087,19 @@ def get_job_parameters():
         policy=dict(type='str'),
         allow_dup=dict(type='bool', default=False),
         job_params=dict(type='dict'),
+        jobs=dict(type='list', elements='dict', options=dict(
+            job_type=dict(type='str', required=True),
+            paths=dict(type='list', elements='str', required=True),
+            priority=dict(type='int'),
+            policy=dict(type='str'),
+            allow_dup=dict(type='bool', default=False),
+            job_params=dict(type='dict'))),
+        max_running_per_type=dict(type='int'),
         wait=dict(type='bool', default=False),
         wait_timeout=dict(type='int', default=300),
         wait_interval=dict(type='int', default=10),
+        wait_max_interval=dict(type='int', default=60),
+        wait_max_errors=dict(type='int', default=3),
         state=dict(type='str', choices=['present'], default='present')
     )
 
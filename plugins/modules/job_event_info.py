@@ -93,13 +93,60 @@ options:
   limit:
     description:
     - Maximum number of events to return per API call.
+    - Only the first page is returned unless I(max_items) is set or
+      I(parallel_windows) is greater than C(1), in which case I(limit) is
+      the page size and all pages are followed.
     type: int
 
+  parallel_windows:
+    description:
+    - The number of sub-windows the time window is split into.
+    - Each sub-window follows its own resume chain and the sub-windows are
+      fetched concurrently. The events are merged in time order.
+    - Requires I(begin_time) or I(duration). When I(end_time) is not set the
+      window ends at the current time.
+    type: int
+    default: 1
+
+  max_workers:
+    description:
+    - The maximum number of sub-windows fetched at the same time.
+    type: int
+    default: 10
+
+  max_items:
+    description:
+    - The maximum number of events to return, earliest first.
+    - Every sub-window stops fetching once the earlier sub-windows hold
+      enough events.
+    type: int
+
+  output_file:
+    description:
+    - Path of a file the events are written to as JSON lines in time
+      order.
+    - When set, the events are not returned in I(job_events).
+    type: path
+
+  cursor_file:
+    description:
+    - Path of a state file holding the time and IDs of the last event
+      returned for each cluster. The file is created when it does not exist.
+    - When set, only events newer than the cursor are returned and the cursor
+      is advanced to the newest event returned.
+    - The window starts at the cursor unless I(begin_time) or I(duration) starts later.
+    - The same file can hold the cursors of
+      M(dellemc.powerscale.job_report_info).
+    - The cursor is not saved in check mode.
+    type: path
+
 notes:
 - This is a read-only info module and does not make any changes.
 - The I(check_mode) is supported.
 - When I(duration) is specified, the module calculates a time window
   ending at the current time.
+- Events of a time window are expected to be listed in time order by
+  the API, which allows I(max_items) to stop fetching early.
 '''
 
 EXAMPLES = r'''
@@ -169,6 +216,43 @@ EXAMPLES = r'''
     verify_ssl: "{{verify_ssl}}"
     ended_jobs_only: true
     limit: 100
+
+- name: Get 30 days of job events in 30 concurrent windows into a file
+  dellemc.powerscale.job_event_info:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    duration:
+      value: 30
+      unit: "days"
+    parallel_windows: 30
+    max_workers: 8
+    output_file: "/tmp/job_events.jsonl"
+
+- name: Get the first 1000 failed job events of the last week
+  dellemc.powerscale.job_event_info:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    state: "failed"
+    duration:
+      value: 7
+      unit: "days"
+    parallel_windows: 7
+    max_items: 1000
+
+- name: Poll only the job events created since the previous run
+  dellemc.powerscale.job_event_info:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    duration:
+      value: 1
+      unit: "hours"
+    cursor_file: "/var/lib/powerscale/job_cursor.json"
 '''
 
 RETURN = r'''
@@ -178,47 +262,73 @@ changed:
     type: bool
 
 job_events:
-    description: The list of job event details.
+    description:
+    - The list of job event details in time order.
+    - Empty when I(output_file) is set.
     returned: always
     type: list
     contains:
         id:
             description: The unique identifier for the event.
-            type: str
+            type: int
         job_id:
             description: The ID of the job associated with this event.
             type: int
         job_type:
             description: The type of the job associated with this event.
             type: str
-        state:
-            description: The state of the job at the time of the event.
-            type: str
-        event_key:
+        key:
             description: The event key identifier.
             type: str
-        timestamp:
-            description: The epoch timestamp when the event occurred.
-            type: int
-        message:
-            description: A human-readable message describing the event.
+        value:
+            description: The value of the event.
             type: str
+        phase:
+            description: The phase of the job the event occurred in.
+            type: int
+        time:
+            description: The epoch time when the event occurred.
+            type: int
     sample: [
         {
-            "id": "event_456",
+            "id": 456,
             "job_id": 42,
             "job_type": "SmartPools",
-            "state": "running",
-            "event_key": "job_started",
-            "timestamp": 1700000000,
-            "message": "Job started successfully"
+            "key": "job_state",
+            "value": "running",
+            "phase": 1,
+            "time": 1700000000
         }
     ]
 
 total_events:
-    description: The total number of events returned.
+    description: The total number of events returned or written to
+                 I(output_file).
     returned: always
     type: int
+
+output_file:
+    description: The file the events were written to.
+    returned: When I(output_file) is set
+    type: str
+    sample: "/tmp/job_events.jsonl"
+
+cursor:
+    description: The position of the cursor after this run.
+    returned: When I(cursor_file) is set
+    type: dict
+    contains:
+        time:
+            description: The time of the newest event read.
+            type: int
+        ids:
+            description: The IDs of the events read with that time.
+            type: list
+            elements: int
+    sample: {
+        "time": 1700003000,
+        "ids": [459]
+    }
 '''
 
 import time
@@ -226,6 +336,10 @@ from datetime import datetime, timezone
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.job \
+    import JobHistory
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.cursor \
+    import Cursor, get_cluster_key
 
 LOG = utils.get_logger('job_event_info')
 
@@ -250,13 +364,16 @@ class JobEventInfo(object):
 
         # result is a dictionary that contains changed status
         self.result = {"changed": False}
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         self.job_api = self.isi_sdk.JobApi(self.api_client)
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
@@ -312,19 +429,112 @@ class JobEventInfo(object):
 
         return begin_time, end_time
 
-    def list_job_events(self, **params):
+    def get_job_events(self, api_params, begin, end, record_filter=None):
         """
-        Get a list of job events.
-        :param params: Query parameters for the API call
-        :return: Dict with 'events' and 'resume' keys
+        Get the job events of a time window, split into concurrently fetched
+        sub-windows when parallel_windows is greater than 1.
+        :param api_params: Query parameters for the API call
+        :param begin: The window start in epoch seconds
+        :param end: The window end in epoch seconds
+        :param record_filter: Callable returning whether to keep an event
+        :return: Iterator of job event dicts in time order
+        """
+        params = self.module.params
+        windows = params['parallel_windows']
+        if windows > 1 and end is None:
+            end = int(time.time())
+        follow = params['limit'] is None or params['max_items'] is not None \
+            or windows > 1
+        history = JobHistory(self.job_api.get_job_events, 'events',
+                             params['max_workers'])
+        events, errors = history.fetch(api_params, begin, end, windows,
+                                       params['max_items'], follow,
+                                       record_filter)
+        if errors:
+            error_message = 'Failed to get job events with ' \
+                            'error: %s' % '; '.join(errors)
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+        return events
+
+    def validate_fetch_params(self, begin):
+        """
+        Validate the parameters controlling how events are fetched.
+        :param begin: The parsed window start in epoch seconds
+        """
+        params = self.module.params
+        for name in ('parallel_windows', 'max_workers'):
+            if params[name] < 1:
+                self.module.fail_json(msg='%s must be greater than 0.' % name)
+        if params['max_items'] is not None and params['max_items'] < 0:
+            self.module.fail_json(msg='max_items must be a non-negative '
+                                      'integer.')
+        if params['parallel_windows'] > 1 and begin is None:
+            self.module.fail_json(msg='parallel_windows requires begin_time '
+                                      'or duration.')
+
+    def consume_job_events(self, consumer, events):
+        """
+        Consume the lazily fetched job events, failing the module when
+        fetching a page fails.
+        :param consumer: Callable consuming the job events
+        :param events: Iterator of job event dicts
+        :return: The result of the consumer
         """
         try:
-            api_response = self.job_api.get_job_events(**params)
-            return api_response.to_dict()
+            return consumer(events)
         except utils.ApiException as e:
-            error_message = 'Failed to get job events with ' \
-                            'error: %s' % (utils.determine_error
-                                           (error_obj=e))
+            error_message = 'Failed to get job events with error: %s' \
+                            % (utils.determine_error(error_obj=e))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
+    def write_job_events(self, events, output_file):
+        """
+        Write the job events to a file as JSON lines.
+        :param events: Iterator of job event dicts
+        :param output_file: The path of the file
+        :return: The number of events written
+        """
+        try:
+            return JobHistory.write_records(events, output_file)
+        except (IOError, OSError) as e:
+            error_message = 'Failed to write job events to %s with ' \
+                            'error: %s' % (output_file, str(e))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
+    def load_cursor(self):
+        """
+        Load the job events cursor of the cluster from the cursor file.
+        :return: The cursor, None when cursor_file is not set
+        """
+        cursor_file = self.module.params['cursor_file']
+        if not cursor_file:
+            return None
+        cursor = Cursor(cursor_file, get_cluster_key(self.module.params),
+                        'events')
+        try:
+            cursor.load()
+        except (IOError, OSError, ValueError, KeyError, TypeError) as e:
+            error_message = 'Failed to read the cursor file %s with ' \
+                            'error: %s' % (cursor_file, str(e))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+        return cursor
+
+    def save_cursor(self, cursor):
+        """
+        Save the job events cursor of the cluster unless in check mode.
+        :param cursor: The cursor advanced over the returned events
+        """
+        if self.module.check_mode or cursor.position is None:
+            return
+        try:
+            cursor.save()
+        except (IOError, OSError, ValueError) as e:
+            error_message = 'Failed to update the cursor file %s with ' \
+                            'error: %s' % (cursor.cursor_file, str(e))
             LOG.error(error_message)
             self.module.fail_json(msg=error_message)
 
@@ -342,6 +552,7 @@ class JobEventInfo(object):
         event_key = self.module.params['event_key']
         ended_jobs_only = self.module.params['ended_jobs_only']
         limit = self.module.params['limit']
+        output_file = self.module.params['output_file']
 
         result = dict(
             changed=False,
@@ -369,30 +580,36 @@ class JobEventInfo(object):
             parsed_begin_time = self.parse_time_input(begin_time)
         if end_time is not None:
             parsed_end_time = self.parse_time_input(end_time)
+        cursor = self.load_cursor()
+        if cursor:
+            parsed_begin_time = cursor.get_begin(parsed_begin_time)
+        self.validate_fetch_params(parsed_begin_time)
 
-        # Build API parameters, excluding None values
+        # Build API parameters, excluding None values. The time window is
+        # passed separately so that it can be split.
         param_map = {
-            'state': state, 'begin': parsed_begin_time,
-            'end': parsed_end_time, 'job_id': job_id,
+            'state': state, 'job_id': job_id,
             'job_type': job_type, 'key': event_key,
             'ended_jobs_only': ended_jobs_only, 'limit': limit
         }
         api_params = {k: v for k, v in param_map.items() if v is not None}
 
-        # Fetch events with pagination
-        all_events = []
-        response = self.list_job_events(**api_params)
-        all_events.extend(response.get('events', []))
-
-        # Handle pagination via resume token (skip if limit was set)
-        if limit is None:
-            while response.get('resume') is not None:
-                api_params['resume'] = response['resume']
-                response = self.list_job_events(**api_params)
-                all_events.extend(response.get('events', []))
-
-        result['job_events'] = all_events
-        result['total_events'] = len(all_events)
+        events = self.get_job_events(api_params, parsed_begin_time,
+                                     parsed_end_time,
+                                     cursor.is_new if cursor else None)
+        if cursor:
+            events = cursor.track(events)
+        if output_file:
+            result['total_events'] = self.consume_job_events(
+                lambda items: self.write_job_events(items, output_file),
+                events)
+            result['output_file'] = output_file
+        else:
+            result['job_events'] = self.consume_job_events(list, events)
+            result['total_events'] = len(result['job_events'])
+        if cursor:
+            self.save_cursor(cursor)
+            result['cursor'] = cursor.position
 
         self.module.exit_json(**result)
 
@@ -426,7 +643,12 @@ def get_job_event_info_parameters():
         job_type=dict(type='str'),
         event_key=dict(type='str', no_log=False),
         ended_jobs_only=dict(type='bool'),
-        limit=dict(type='int')
+        limit=dict(type='int'),
+        parallel_windows=dict(type='int', default=1),
+        max_workers=dict(type='int', default=10),
+        max_items=dict(type='int'),
+        output_file=dict(type='path'),
+        cursor_file=dict(type='path')
     )
 
 
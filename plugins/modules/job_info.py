@@ -39,6 +39,8 @@ options:
     description:
     - Filter jobs by their current state.
     - Multiple states can be specified to match any of the given states.
+    - Multiple states are listed concurrently and merged, a job listed under
+      more than one state is returned once.
     type: list
     elements: str
     choices: ['running', 'paused_user', 'paused_system', 'paused_policy',
@@ -47,7 +49,8 @@ options:
   job_type:
     description:
     - Filter jobs by their type.
-    - This is a client-side filter applied after retrieving jobs from the API.
+    - This is a client-side filter applied to each page of jobs as it is
+      retrieved from the API.
     - Multiple types can be specified.
     type: list
     elements: str
@@ -67,6 +70,7 @@ options:
   limit:
     description:
     - The maximum number of jobs to return.
+    - Pages are followed until I(limit) jobs matching the filters are found.
     type: int
 
   include_recent:
@@ -194,9 +198,14 @@ job_summary:
     type: dict
 '''
 
+import heapq
+import itertools
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.job \
+    import iter_jobs
 
 LOG = utils.get_logger('job_info')
 
@@ -217,13 +226,16 @@ class JobInfo(object):
 
         # result is a dictionary that contains changed status
         self.result = {"changed": False}
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         self.job_api = self.isi_sdk.JobApi(self.api_client)
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
@@ -244,21 +256,41 @@ class JobInfo(object):
             LOG.error(error_message)
             self.module.fail_json(msg=error_message)
 
-    def list_jobs(self, **params):
+    def list_jobs(self, params, job_type_filter=None):
         """
-        List jobs with optional filters.
+        List jobs with optional filters, following the resume token across
+        pages.
         :param params: Filter parameters (state, sort, dir, limit)
-        :return: Dict with 'jobs' key containing list of job dicts
+        :param job_type_filter: Job types to keep, applied page by page
+        :return: List of job dicts
         """
         try:
-            api_response = self.job_api.list_job_jobs(**params)
-            return api_response.to_dict()
+            return self._list_state_jobs(params, job_type_filter)
         except utils.ApiException as e:
             error_message = 'Failed to list jobs with error: %s' \
                             % (utils.determine_error(error_obj=e))
             LOG.error(error_message)
             self.module.fail_json(msg=error_message)
 
+    def _list_state_jobs(self, params, job_type_filter=None):
+        """
+        Stream the jobs of one listing page by page. Jobs of other types are
+        dropped as each page arrives and the stream stops once the limit is
+        reached.
+        :param params: Query arguments for list_job_jobs
+        :param job_type_filter: Job types to keep
+        :return: List of job dicts
+        """
+        limit = params.get('limit')
+        jobs = []
+        for job in iter_jobs(self.job_api, **params):
+            if job_type_filter and job.get('type') not in job_type_filter:
+                continue
+            jobs.append(job)
+            if limit is not None and len(jobs) >= limit:
+                break
+        return jobs
+
     def get_recent_jobs(self):
         """
         Get recently completed jobs.
@@ -298,29 +330,51 @@ class JobInfo(object):
             params['limit'] = limit
 
         if state_filter and len(state_filter) > 1:
-            job_details = self._list_jobs_multi_state(params, state_filter)
-        else:
-            if state_filter:
-                params['state'] = state_filter[0]
-            jobs_response = self.list_jobs(**params)
-            job_details = jobs_response.get('jobs', []) if jobs_response else []
+            return self._list_jobs_multi_state(params, state_filter,
+                                               job_type_filter)
+        if state_filter:
+            params['state'] = state_filter[0]
+        return self.list_jobs(params, job_type_filter)
+
+    def _list_jobs_multi_state(self, params, state_filter,
+                               job_type_filter=None):
+        """
+        List jobs across multiple state filters concurrently. The per-state
+        streams are merged in the requested sort order and deduplicated by ID.
+        """
+        outcome = utils.run_concurrently(
+            lambda state: self._list_state_jobs(dict(params, state=state),
+                                                job_type_filter),
+            state_filter)
+        errors = ['%s: %s' % (item['item'], item['error'])
+                  for item in outcome if item['error']]
+        if errors:
+            error_message = 'Failed to list jobs with error: %s' \
+                            % '; '.join(errors)
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
 
-        if job_type_filter and job_details:
-            job_details = [j for j in job_details if j.get('type') in job_type_filter]
-        return job_details
+        streams = [item['result'] for item in outcome]
+        sort = params.get('sort')
+        limit = params.get('limit')
+        if sort:
+            merged = heapq.merge(
+                *streams,
+                key=lambda job: (job.get(sort) is not None, job.get(sort)),
+                reverse=params.get('dir') == 'DESC')
+        else:
+            merged = itertools.chain(*streams)
 
-    def _list_jobs_multi_state(self, params, state_filter):
-        """List jobs across multiple state filters, deduplicating by ID."""
         job_details = []
         seen_ids = set()
-        for s in state_filter:
-            state_params = dict(params, state=s)
-            jobs_response = self.list_jobs(**state_params)
-            for job in (jobs_response.get('jobs', []) if jobs_response else []):
-                jid = job.get('id')
-                if jid not in seen_ids:
-                    seen_ids.add(jid)
-                    job_details.append(job)
+        for job in merged:
+            jid = job.get('id')
+            if jid in seen_ids:
+                continue
+            seen_ids.add(jid)
+            job_details.append(job)
+            if limit is not None and len(job_details) >= limit:
+                break
         return job_details
 
     def perform_module_operation(self):
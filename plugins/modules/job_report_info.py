@@ -68,12 +68,79 @@ options:
   limit:
     description:
     - The maximum number of reports to return per API request.
+    - Only the first page is returned unless I(max_items) is set or
+      I(parallel_windows) is greater than C(1), in which case I(limit) is
+      the page size and all pages are followed.
     type: int
 
+  parallel_windows:
+    description:
+    - The number of sub-windows the I(begin) to I(end) time window is split
+      into.
+    - Each sub-window follows its own resume chain and the sub-windows are
+      fetched concurrently. The reports are merged in time order.
+    - Requires I(begin). When I(end) is not set the window ends at the
+      current time.
+    type: int
+    default: 1
+
+  max_workers:
+    description:
+    - The maximum number of sub-windows fetched at the same time.
+    type: int
+    default: 10
+
+  max_items:
+    description:
+    - The maximum number of reports to return, earliest first.
+    - Every sub-window stops fetching once the earlier sub-windows hold
+      enough reports.
+    type: int
+
+  output_file:
+    description:
+    - Path of a file the reports are written to as JSON lines in time
+      order.
+    - When set, the reports are not returned in I(job_reports).
+    type: path
+
+  cursor_file:
+    description:
+    - Path of a state file holding the time and IDs of the last report
+      returned for each cluster. The file is created when it does not exist.
+    - When set, only reports newer than the cursor are returned and the cursor
+      is advanced to the newest report returned.
+    - The window starts at the cursor unless I(begin) starts later.
+    - The same file can hold the cursors of
+      M(dellemc.powerscale.job_event_info).
+    - The cursor is not saved in check mode.
+    type: path
+
+  aggregate:
+    description:
+    - If true, the reports are streamed into per job type statistics returned
+      in I(job_report_summary) instead of being returned.
+    - Memory use does not grow with the number of reports, only the phase
+      being reported of each job is kept. The runtime, throughput and report
+      value percentiles are estimates.
+    - All pages are followed, I(limit) is the page size.
+    - Mutually exclusive with I(output_file).
+    type: bool
+    default: false
+
 notes:
 - This is a read-only info module. It does not modify any resources.
 - The I(check_mode) is supported.
 - Pagination is handled automatically. All matching reports are returned.
+- Reports of a time window are expected to be listed in time order by
+  the API, which allows I(max_items) to stop fetching early.
+- With I(aggregate), the runtime of a job phase spans the times of its first
+  and last reports, a phase reported at a single time has no runtime. The
+  LINs and bytes of a phase are the largest numeric value of its reports
+  whose key names LINs or bytes, such as C(LINs processed), and the
+  throughput divides them by the runtime. The reports whose value is a number
+  are also summarized per report key. A report whose status names a failure
+  counts as failed.
 '''
 
 EXAMPLES = r'''
@@ -126,6 +193,37 @@ EXAMPLES = r'''
     api_password: "{{api_password}}"
     verify_ssl: "{{verify_ssl}}"
     event_key: "phase_complete"
+
+- name: Get 30 days of verbose reports in 10 concurrent windows into a file
+  dellemc.powerscale.job_report_info:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    begin: 1700000000
+    end: 1702592000
+    verbose: true
+    parallel_windows: 10
+    output_file: "/tmp/job_reports.jsonl"
+
+- name: Poll only the job reports created since the previous run
+  dellemc.powerscale.job_report_info:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    last_phase_only: true
+    cursor_file: "/var/lib/powerscale/job_cursor.json"
+
+- name: Get per job type runtime, throughput and failure statistics
+  dellemc.powerscale.job_report_info:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    begin: 1690000000
+    verbose: true
+    aggregate: true
 '''
 
 RETURN = r'''
@@ -135,42 +233,164 @@ changed:
     type: bool
 
 job_reports:
-    description: List of job report dictionaries.
+    description:
+    - List of job report dictionaries in time order.
+    - Empty when I(output_file) is set.
     returned: always
     type: list
     elements: dict
     contains:
         id:
             description: The unique identifier of the report.
-            type: str
+            type: int
         job_id:
             description: The ID of the job this report belongs to.
             type: int
         job_type:
             description: The type of the job.
             type: str
-        event_key:
+        key:
             description: The event key for this report.
             type: str
+        value:
+            description: The value of the report.
+            type: str
+        status:
+            description: The status of the job when the report was written.
+            type: str
         phase:
             description: The phase of the job this report describes.
-            type: str
-        timestamp:
-            description: The timestamp of the report in unix epoch seconds.
             type: int
-        statistics:
-            description: Statistics associated with the report.
-            type: dict
+        time:
+            description: The time of the report in unix epoch seconds.
+            type: int
+    sample: [
+        {
+            "id": 123,
+            "job_id": 42,
+            "job_type": "SmartPools",
+            "key": "phase_complete",
+            "value": "LINs processed: 10000",
+            "status": "running",
+            "phase": 1,
+            "time": 1700000000
+        }
+    ]
 
 total_reports:
-    description: The total number of reports returned.
+    description: The total number of reports returned or written to
+                 I(output_file).
     returned: always
     type: int
+
+output_file:
+    description: The file the reports were written to.
+    returned: When I(output_file) is set
+    type: str
+    sample: "/tmp/job_reports.jsonl"
+
+job_report_summary:
+    description: The statistics of the reports per job type.
+    returned: When I(aggregate) is true
+    type: dict
+    contains:
+        report_count:
+            description: The number of reports of the job type.
+            type: int
+        failed_reports:
+            description: The number of reports recording a failure.
+            type: int
+        failure_rate:
+            description: The share of failed reports.
+            type: float
+        first_report_time:
+            description: The time of the oldest report.
+            type: int
+        last_report_time:
+            description: The time of the newest report.
+            type: int
+        lins_processed:
+            description: The total number of LINs processed by the phases.
+            type: int
+        bytes_processed:
+            description: The total number of bytes processed by the phases.
+            type: int
+        runtime:
+            description: The count, min, max, mean, p50, p90 and p99 of the
+                         job phase runtimes in seconds.
+            type: dict
+        lins_per_second:
+            description: The count, min, max, mean, p50, p90 and p99 of the
+                         LINs processed per second by the job phases.
+            type: dict
+        bytes_per_second:
+            description: The count, min, max, mean, p50, p90 and p99 of the
+                         bytes processed per second by the job phases.
+            type: dict
+        phases:
+            description: The report_count, failed_reports and failure_rate
+                         per phase.
+            type: dict
+        values:
+            description: The count, min, max, mean, p50, p90 and p99 of the
+                         numeric report values per report key.
+            type: dict
+    sample: {
+        "SmartPools": {
+            "report_count": 120,
+            "failed_reports": 3,
+            "failure_rate": 0.025,
+            "first_report_time": 1700000000,
+            "last_report_time": 1702500000,
+            "lins_processed": 1200000,
+            "bytes_processed": 0,
+            "runtime": {"count": 60, "min": 30.0, "max": 900.0,
+                        "mean": 210.5, "p50": 180.0, "p90": 420.0,
+                        "p99": 850.0},
+            "lins_per_second": {"count": 60, "min": 10.0, "max": 90.0,
+                                "mean": 48.2, "p50": 47.0, "p90": 70.0,
+                                "p99": 88.0},
+            "bytes_per_second": {"count": 0, "min": null, "max": null,
+                                 "mean": null, "p50": null, "p90": null,
+                                 "p99": null},
+            "phases": {"1": {"report_count": 60, "failed_reports": 3,
+                             "failure_rate": 0.05}},
+            "values": {"lins_processed": {"count": 60, "min": 100.0,
+                                          "max": 90000.0, "mean": 12000.5,
+                                          "p50": 9000.0, "p90": 42000.0,
+                                          "p99": 85000.0}}
+        }
+    }
+
+cursor:
+    description: The position of the cursor after this run.
+    returned: When I(cursor_file) is set
+    type: dict
+    contains:
+        time:
+            description: The time of the newest report read.
+            type: int
+        ids:
+            description: The IDs of the reports read with that time.
+            type: list
+            elements: int
+    sample: {
+        "time": 1700002000,
+        "ids": [125]
+    }
 '''
 
+import time
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.job \
+    import JobHistory
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.cursor \
+    import Cursor, get_cluster_key
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.job_statistics \
+    import JobReportAggregator
 
 LOG = utils.get_logger('job_report_info')
 
@@ -186,37 +406,135 @@ class JobReportInfo(object):
         # initialize the Ansible module
         self.module = AnsibleModule(
             argument_spec=self.module_params,
-            supports_check_mode=True
+            supports_check_mode=True,
+            mutually_exclusive=[['aggregate', 'output_file']]
         )
 
         # result is a dictionary that contains changed status
         self.result = {"changed": False}
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         self.job_api = self.isi_sdk.JobApi(self.api_client)
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
 
-    def get_reports(self, **params):
+    def get_reports(self, params, begin, end, record_filter=None):
         """
-        Get job reports with optional filters.
+        Get the job reports of a time window, split into concurrently
+        fetched sub-windows when parallel_windows is greater than 1.
         :param params: Filter parameters for the API call
-        :return: Dict with 'reports' and 'resume' keys
+        :param begin: The window start in epoch seconds
+        :param end: The window end in epoch seconds
+        :param record_filter: Callable returning whether to keep a report
+        :return: Iterator of job report dicts in time order
+        """
+        module_params = self.module.params
+        windows = module_params['parallel_windows']
+        if windows > 1 and end is None:
+            end = int(time.time())
+        follow = module_params['limit'] is None or \
+            module_params['max_items'] is not None or windows > 1 or \
+            module_params['aggregate']
+        history = JobHistory(self.job_api.get_job_reports, 'reports',
+                             module_params['max_workers'])
+        reports, errors = history.fetch(params, begin, end, windows,
+                                        module_params['max_items'], follow,
+                                        record_filter)
+        if errors:
+            error_message = 'Failed to get job reports with error: %s' \
+                            % '; '.join(errors)
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+        return reports
+
+    def validate_fetch_params(self, begin):
+        """
+        Validate the parameters controlling how reports are fetched.
+        :param begin: The window start in epoch seconds
+        """
+        params = self.module.params
+        for name in ('parallel_windows', 'max_workers'):
+            if params[name] < 1:
+                self.module.fail_json(msg='%s must be greater than 0.' % name)
+        if params['max_items'] is not None and params['max_items'] < 0:
+            self.module.fail_json(msg='max_items must be a non-negative '
+                                      'integer.')
+        if params['parallel_windows'] > 1 and begin is None:
+            self.module.fail_json(msg='parallel_windows requires begin.')
+
+    def consume_reports(self, consumer, reports):
+        """
+        Consume the lazily fetched job reports, failing the module when
+        fetching a page fails.
+        :param consumer: Callable consuming the job reports
+        :param reports: Iterator of job report dicts
+        :return: The result of the consumer
         """
         try:
-            api_response = self.job_api.get_job_reports(**params)
-            return api_response.to_dict()
+            return consumer(reports)
         except utils.ApiException as e:
             error_message = 'Failed to get job reports with error: %s' \
                             % (utils.determine_error(error_obj=e))
             LOG.error(error_message)
             self.module.fail_json(msg=error_message)
 
+    def write_reports(self, reports, output_file):
+        """
+        Write the job reports to a file as JSON lines.
+        :param reports: Iterator of job report dicts
+        :param output_file: The path of the file
+        :return: The number of reports written
+        """
+        try:
+            return JobHistory.write_records(reports, output_file)
+        except (IOError, OSError) as e:
+            error_message = 'Failed to write job reports to %s with ' \
+                            'error: %s' % (output_file, str(e))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
+    def load_cursor(self):
+        """
+        Load the job reports cursor of the cluster from the cursor file.
+        :return: The cursor, None when cursor_file is not set
+        """
+        cursor_file = self.module.params['cursor_file']
+        if not cursor_file:
+            return None
+        cursor = Cursor(cursor_file, get_cluster_key(self.module.params),
+                        'reports')
+        try:
+            cursor.load()
+        except (IOError, OSError, ValueError, KeyError, TypeError) as e:
+            error_message = 'Failed to read the cursor file %s with ' \
+                            'error: %s' % (cursor_file, str(e))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+        return cursor
+
+    def save_cursor(self, cursor):
+        """
+        Save the job reports cursor of the cluster unless in check mode.
+        :param cursor: The cursor advanced over the returned reports
+        """
+        if self.module.check_mode or cursor.position is None:
+            return
+        try:
+            cursor.save()
+        except (IOError, OSError, ValueError) as e:
+            error_message = 'Failed to update the cursor file %s with ' \
+                            'error: %s' % (cursor.cursor_file, str(e))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
     def perform_module_operation(self):
         """
         Perform different actions on job report info module based on
@@ -230,38 +548,45 @@ class JobReportInfo(object):
         last_phase_only = self.module.params['last_phase_only']
         verbose = self.module.params['verbose']
         limit = self.module.params['limit']
-
-        # Build filter dict, excluding None values
+        output_file = self.module.params['output_file']
+        cursor = self.load_cursor()
+        if cursor:
+            begin = cursor.get_begin(begin)
+        self.validate_fetch_params(begin)
+
+        # Build filter dict, excluding None values. The time window is
+        # passed separately so that it can be split.
         param_map = {
             'job_type': job_type, 'job_id': job_id, 'key': event_key,
-            'begin': begin, 'end': end, 'last_phase_only': last_phase_only,
+            'last_phase_only': last_phase_only,
             'verbose': verbose, 'limit': limit
         }
         params = {k: v for k, v in param_map.items() if v is not None}
 
-        # Fetch reports with pagination
-        all_reports = []
-        response = self.get_reports(**params)
-        reports = response.get('reports', []) if response else []
-        all_reports.extend(reports)
-
-        # Handle pagination: keep fetching while resume token exists
-        # (skip pagination if limit was set by user)
-        if limit is None:
-            resume = response.get('resume') if response else None
-            while resume:
-                paginated_params = dict(params)
-                paginated_params['resume'] = resume
-                response = self.get_reports(**paginated_params)
-                reports = response.get('reports', []) if response else []
-                all_reports.extend(reports)
-                resume = response.get('resume') if response else None
-
+        reports = self.get_reports(params, begin, end,
+                                   cursor.is_new if cursor else None)
+        if cursor:
+            reports = cursor.track(reports)
         result = dict(
             changed=False,
-            job_reports=all_reports,
-            total_reports=len(all_reports)
+            job_reports=[],
+            total_reports=0
         )
+        if self.module.params['aggregate']:
+            aggregator = JobReportAggregator()
+            result['total_reports'] = self.consume_reports(
+                aggregator.consume, reports)
+            result['job_report_summary'] = aggregator.summary()
+        elif output_file:
+            result['total_reports'] = self.consume_reports(
+                lambda items: self.write_reports(items, output_file), reports)
+            result['output_file'] = output_file
+        else:
+            result['job_reports'] = self.consume_reports(list, reports)
+            result['total_reports'] = len(result['job_reports'])
+        if cursor:
+            self.save_cursor(cursor)
+            result['cursor'] = cursor.position
 
         self.module.exit_json(**result)
 
@@ -279,7 +604,13 @@ def get_job_report_info_parameters():
         end=dict(type='int'),
         last_phase_only=dict(type='bool'),
         verbose=dict(type='bool'),
-        limit=dict(type='int')
+        limit=dict(type='int'),
+        parallel_windows=dict(type='int', default=1),
+        max_workers=dict(type='int', default=10),
+        max_items=dict(type='int'),
+        output_file=dict(type='path'),
+        cursor_file=dict(type='path'),
+        aggregate=dict(type='bool', default=False)
     )
 
 
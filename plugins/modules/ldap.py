@@ -23,6 +23,7 @@ description:
 
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 
 author:
 - Jennifer John (@johnj9) <ansible.team@dell.com>
@@ -220,6 +221,8 @@ ldap_provider_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zone_topology \
+    import ZoneTopology
 
 LOG = utils.get_logger('ldap')
 
@@ -231,6 +234,7 @@ class Ldap(object):
         """ Define all parameters required by this module"""
         self.module_params = utils.get_powerscale_management_host_parameters()
         self.module_params.update(get_ldap_parameters())
+        self.module_params.update(utils.get_zone_cache_parameters())
 
         required_together = [['server_uris', 'server_uri_state']]
 
@@ -243,15 +247,19 @@ class Ldap(object):
 
         # result is a dictionary that contains changed status
         self.result = {"changed": False}
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.auth_api_instance = utils.isi_sdk.AuthApi(self.api_client)
         self.zones_api_instance = utils.isi_sdk.ZonesApi(self.api_client)
+        self.zone_topology = None
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
 
     def create(self, ldap_name, server_uris, server_uri_state, base_dn,
@@ -463,18 +471,15 @@ class Ldap(object):
     def update_ldap_access_zone_info(self, ldap_name, ldap_details):
         """Update LDAP with access zone details"""
         try:
-            zone_api_response = self.zones_api_instance.list_zones()
-            if zone_api_response:
-                providers_summary = self.get_auth_providers_summary()
-                provider_ids = [provider.id for provider in
-                                providers_summary if provider.type == "ldap" and
-                                provider.name.lower() == ldap_name.lower()]
-                zone_ids = []
-                if provider_ids:
-                    zone_ids = [zone.id for zone in zone_api_response.zones
-                                if set(provider_ids).issubset(
-                                    zone.auth_providers)]
-                ldap_details.update(linked_access_zones=zone_ids)
+            if self.zone_topology is None:
+                self.zone_topology = ZoneTopology(self.zones_api_instance,
+                                                  self.module)
+            providers_summary = self.get_auth_providers_summary()
+            provider_ids = [provider.id for provider in
+                            providers_summary if provider.type == "ldap" and
+                            provider.name.lower() == ldap_name.lower()]
+            zone_ids = self.zone_topology.get_linked_zones(provider_ids)
+            ldap_details.update(linked_access_zones=zone_ids)
         except utils.ApiException as e:
             error_message = "Update LDAP with access zone details " \
                 "failed with" + utils.determine_error(error_obj=e)
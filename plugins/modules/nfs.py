@@ -21,6 +21,7 @@ description:
 
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 
 author:
 - Manisha Agrawal(@agrawm3) <ansible.team@dell.com>
@@ -967,9 +968,7 @@ class NfsExport(PowerScaleBase):
     def get_zone_base_path(self, access_zone):
         """Returns the base path of the Access Zone."""
         try:
-            zone_path = (self.zones_summary_api.
-                         get_zones_summary_zone(access_zone)).to_dict()
-            return zone_path["summary"]["path"]
+            return self.zone_topology.get_zone_base_path(access_zone)
         except Exception as e:
             error_msg = utils.determine_error(error_obj=e)
             error_message = 'Unable to fetch base path of Access Zone {0} ' \
@@ -1636,7 +1635,8 @@ class NfsExport(PowerScaleBase):
             map_root=self.get_nfs_map_parameters(),
             map_non_root=self.get_nfs_map_parameters(),
             state=dict(required=True, type='str', choices=['present',
-                                                           'absent'])
+                                                           'absent']),
+            **utils.get_zone_cache_parameters()
         )
 
 
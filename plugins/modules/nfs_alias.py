@@ -21,6 +21,7 @@ description:
 
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 
 author:
 - Trisha Datta(@Trisha-Datta) <ansible.team@dell.com>
@@ -193,6 +194,8 @@ nfs_alias_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zone_topology \
+    import ZoneTopology
 
 LOG = utils.get_logger('nfs_alias')
 
@@ -205,6 +208,7 @@ class NfsAlias(object):
         ''' Define all parameters required by this module'''
         self.module_params = utils.get_powerscale_management_host_parameters()
         self.module_params.update(self.get_nfs_alias_parameters())
+        self.module_params.update(utils.get_zone_cache_parameters())
         # Initialize the ansible module
         self.module = AnsibleModule(
             argument_spec=self.module_params,
@@ -216,19 +220,23 @@ class NfsAlias(object):
             "changed": False,
             "nfs_alias_details": {}
         }
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info('Got python SDK instance for provisioning on PowerScale ')
         LOG.info('Check Mode Flag: %s', self.module.check_mode)
 
         self.protocol_api = self.isi_sdk.ProtocolsApi(self.api_client)
-        self.zone_summary_api = self.isi_sdk.ZonesSummaryApi(self.api_client)
+        self.zones_api = self.isi_sdk.ZonesApi(self.api_client)
+        self.zone_topology = None
 
     def get_nfs_alias(self, scope, check, access_zone, nfs_alias_name):
         '''
@@ -363,9 +371,9 @@ class NfsAlias(object):
     def get_zone_base_path(self, access_zone):
         """Returns the base path of the Access Zone."""
         try:
-            zone_path = (self.zone_summary_api.
-                         get_zones_summary_zone(access_zone)).to_dict()
-            return zone_path['summary']['path']
+            if self.zone_topology is None:
+                self.zone_topology = ZoneTopology(self.zones_api, self.module)
+            return self.zone_topology.get_zone_base_path(access_zone)
         except Exception as e:
             error_msg = utils.determine_error(error_obj=e)
             error_message = 'Unable to fetch base path of Access Zone {0} ' \
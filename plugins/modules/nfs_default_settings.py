@@ -857,8 +857,7 @@ class NFSDefaultSettings(PowerScaleBase):
             elif 'enabled' not in map_dict[key] or ('enabled' in map_dict[key] and map_dict[key]['enabled']):
                 map_dict = self.fill_map_dict(map_dict, key, nfs_default_settings)
 
-        msg = f'Forming modification dict for map settings completed: {map_dict}'
-        LOG.info(msg)
+        LOG.info('Forming modification dict for map settings completed: %s', map_dict)
         return map_dict
 
     def form_size_dict(self, nfs_default_settings, module_params):
@@ -887,8 +886,7 @@ class NFSDefaultSettings(PowerScaleBase):
                                 module_params['file_name_max_size']['size_unit']) != nfs_default_settings['name_max_size']:
             size_dict['name_max_size'] = utils.get_size_bytes(module_params['file_name_max_size']['size_value'],
                                                               module_params['file_name_max_size']['size_unit'])
-        msg = f'Forming modification dict for size settings completed: {size_dict}'
-        LOG.info(msg)
+        LOG.info('Forming modification dict for size settings completed: %s', size_dict)
         return size_dict
 
     def form_security_dict(self, nfs_default_settings, module_params):
@@ -914,8 +912,7 @@ class NFSDefaultSettings(PowerScaleBase):
             security_flavors = [security_flavors_mapping[flavor] for flavor in security_flavors]
             if security_flavors != nfs_default_settings['security_flavors']:
                 security_dict['security_flavors'] = security_flavors
-        msg = f'Forming modification dict for security flavors completed: {security_dict}'
-        LOG.info(msg)
+        LOG.info('Forming modification dict for security flavors completed: %s', security_dict)
         return security_dict
 
     def form_sync_bool_dict(self, nfs_default_settings, module_params):
@@ -939,8 +936,7 @@ class NFSDefaultSettings(PowerScaleBase):
             if key in module_params and module_params[key] is not None and\
                nfs_default_settings[key] != module_params[key]:
                 sync_bool_dict[key] = module_params[key]
-        msg = f'Forming modification dict for bool and sync settings completed: {sync_bool_dict}'
-        LOG.info(msg)
+        LOG.info('Forming modification dict for bool and sync settings completed: %s', sync_bool_dict)
         return sync_bool_dict
 
     def form_time_dict(self, nfs_default_settings, module_params):
@@ -958,8 +954,7 @@ class NFSDefaultSettings(PowerScaleBase):
         if 'time_delta' in module_params and module_params['time_delta'] and nfs_default_settings['time_delta'] \
            != utils.convert_to_seconds(module_params['time_delta']['time_value'], module_params['time_delta']['time_unit']):
             time_dict['time_delta'] = utils.convert_to_seconds(module_params['time_delta']['time_value'], module_params['time_delta']['time_unit'])
-        msg = f'Forming modification dict for time delta completed: {time_dict}'
-        LOG.info(msg)
+        LOG.info('Forming modification dict for time delta completed: %s', time_dict)
         return time_dict
 
     def form_modify_dict(self, nfs_default_settings, module_params):
@@ -972,8 +967,7 @@ class NFSDefaultSettings(PowerScaleBase):
         :return: modify_dict
         :rtype: dict
         """
-        msg = f'Form modification dict {module_params}'
-        LOG.info(msg)
+        LOG.info('Form modification dict %s', module_params)
         modify_dict = {}
         try:
             modify_dict.update(self.form_map_dict(nfs_default_settings, module_params))
@@ -985,8 +979,7 @@ class NFSDefaultSettings(PowerScaleBase):
             msg = f'Forming modification dict failed with error: {exp}'
             LOG.info(msg)
             self.module.fail_json(msg=msg)
-        msg = f'Forming modification dict completed: {modify_dict}'
-        LOG.info(msg)
+        LOG.info('Forming modification dict completed: %s', modify_dict)
         return modify_dict
 
     def form_nfs_default_settings_object(self, modify_dict, access_zone):
@@ -1028,8 +1021,7 @@ class NFSDefaultSettings(PowerScaleBase):
         """
         try:
             modify_params_obj = self.form_nfs_default_settings_object(module_params, access_zone)
-            msg = f'Modifying NFS default settings for access zone: {access_zone}'
-            LOG.info(msg)
+            LOG.info('Modifying NFS default settings for access zone: %s', access_zone)
             if not self.module.check_mode:
                 self.protocol_api.update_nfs_settings_export(
                     modify_params_obj, zone=access_zone)
@@ -197,19 +197,21 @@ class NFSGlobalSettings:
             "nfs_global_settings_details": {}
         }
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         self.array_version = f"{self.isi_sdk.major}.{self.isi_sdk.minor}"
 
         LOG.info('Got python SDK instance for provisioning on PowerScale ')
-        check_mode_msg = f'Check mode flag is {self.module.check_mode}'
-        LOG.info(check_mode_msg)
+        LOG.info('Check mode flag is %s', self.module.check_mode)
 
         self.protocol_api = self.isi_sdk.ProtocolsApi(self.api_client)
 
@@ -238,8 +240,7 @@ class NFSGlobalSettings:
         try:
             nfs_global_obj = self.protocol_api.get_nfs_settings_global()
             if nfs_global_obj:
-                msg = f"NFS global settings details are: {nfs_global_obj.settings.to_dict()}"
-                LOG.info(msg)
+                LOG.info("NFS global settings details are: %s", nfs_global_obj.settings.to_dict())
                 return nfs_global_obj.settings.to_dict()
 
         except Exception as e:
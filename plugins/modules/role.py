@@ -287,22 +287,19 @@ class Role(PowerScaleBase):
         """
         Get details of a Role
         """
-        msg = f"Getting Role details {role_name}"
-        LOG.info(msg)
+        LOG.info("Getting Role details %s", role_name)
         try:
             role_obj = self.auth_api.get_auth_role(
                 auth_role_id=role_name, zone=access_zone)
             if role_obj:
                 role_details = role_obj.roles[0]
                 role_details = role_details.to_dict()
-                msg = f"Role details are: {role_details}"
-                LOG.info(msg)
+                LOG.info("Role details are: %s", role_details)
                 return role_details
 
         except utils.ApiException as e:
             if str(e.status) == "404":
-                log_msg = f"Role {role_name} status is {e.status}"
-                LOG.info(log_msg)
+                LOG.info("Role %s status is %s", role_name, e.status)
                 return None
             else:
                 error_msg = utils.determine_error(error_obj=e)
@@ -409,13 +406,11 @@ class Role(PowerScaleBase):
         """Create Role"""
         role = self._create_role_params_object(role_params)
         try:
-            msg = f'Creating Role with parameters: {role})'
-            LOG.info(msg)
+            LOG.info('Creating Role with parameters: %s)', role)
             role_details = {}
             if not self.module.check_mode:
                 response = self.auth_api.create_auth_role(role, zone=role_params['access_zone'])
-                msg = f'reponse from array: {response})'
-                LOG.info(msg)
+                LOG.info('reponse from array: %s)', response)
                 if response:
                     role_details = self.get_role_details(role_params['role_name'], role_params['access_zone'])
                 msg = f"Successfully created auth role with " \
@@ -436,15 +431,13 @@ class Role(PowerScaleBase):
         :param zone: Access zone name
         """
         try:
-            msg = f"Deleting Role with identifier {role_name}."
-            LOG.info(msg)
+            LOG.info("Deleting Role with identifier %s.", role_name)
             if not self.module.check_mode:
                 role_obj = self.auth_api.delete_auth_role(
                     auth_role_id=role_name, zone=access_zone)
                 if role_obj:
                     role_details = role_obj.to_dict()
-                    msg = f"Role details are: {role_details}"
-                    LOG.info(msg)
+                    LOG.info("Role details are: %s", role_details)
                     return role_details
 
                 LOG.info("Successfully Deleted the role.")
@@ -463,8 +456,7 @@ class Role(PowerScaleBase):
         :param role_params: contains params passed through playbook
         """
         try:
-            msg = f'Modify role with parameters: {modify_params})'
-            LOG.info(msg)
+            LOG.info('Modify role with parameters: %s)', modify_params)
             if role_params['copy_role']:
                 name = name_existing
             else:
@@ -657,13 +649,11 @@ class Role(PowerScaleBase):
         """Copy the role"""
         copy_role = self.create_copy_params(new_name, role_params, role_details)
         try:
-            msg = f'Creating Role with parameters in copy: {copy_role})'
-            LOG.info(msg)
+            LOG.info('Creating Role with parameters in copy: %s)', copy_role)
             role_details = {}
             if not self.module.check_mode:
                 response = self.auth_api.create_auth_role(copy_role, zone=role_params['access_zone'])
-                msg = f'reponse from array: {response})'
-                LOG.info(msg)
+                LOG.info('reponse from array: %s)', response)
                 if response:
                     role_details = self.get_role_details(new_name, role_params['access_zone'])
                 msg = f"Successfully created auth role with " \
@@ -20,6 +20,7 @@ description:
 
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 
 author:
 - Bhavneet Sharma(@Bhavneet-Sharma) <ansible.team@dell.com>
@@ -306,6 +307,8 @@ S3_bucket_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zone_topology \
+    import ZoneTopology
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.auth \
     import Auth
 
@@ -319,6 +322,7 @@ class S3Bucket(object):
         """ Define all parameters required by this module"""
         self.module_params = utils.get_powerscale_management_host_parameters()
         self.module_params.update(self.get_s3_bucket_parameters())
+        self.module_params.update(utils.get_zone_cache_parameters())
         # Initialize the ansible module
         self.module = AnsibleModule(
             argument_spec=self.module_params,
@@ -331,28 +335,31 @@ class S3Bucket(object):
             "S3_bucket_details": {}
         }
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info('Got python SDK instance for provisioning on PowerScale ')
-        check_mode_msg = f'Check mode flag is {self.module.check_mode}'
-        LOG.info(check_mode_msg)
+        LOG.info('Check mode flag is %s', self.module.check_mode)
 
         self.protocol_api = self.isi_sdk.ProtocolsApi(self.api_client)
-        self.zone_summary_api = self.isi_sdk.ZonesSummaryApi(self.api_client)
+        self.zones_api = self.isi_sdk.ZonesApi(self.api_client)
+        self.zone_topology = None
         self.auth_api = self.isi_sdk.AuthApi(self.api_client)
 
     def get_zone_base_path(self, access_zone):
         """Returns the base path of the Access Zone."""
         try:
-            zone_path = (self.zone_summary_api.
-                         get_zones_summary_zone(access_zone)).to_dict()
-            return zone_path["summary"]["path"]
+            if self.zone_topology is None:
+                self.zone_topology = ZoneTopology(self.zones_api, self.module)
+            return self.zone_topology.get_zone_base_path(access_zone)
         except Exception as e:
             error_msg = utils.determine_error(error_obj=e)
             error_message = f'Unable to fetch base path of Access' \
@@ -373,8 +380,7 @@ class S3Bucket(object):
                 s3_bucket_id=bucket_id, zone=access_zone)
             if s3_bucket_obj:
                 s3_bucket = s3_bucket_obj.buckets[0]
-                msg = f"s3 details are: {s3_bucket.to_dict()}"
-                LOG.info(msg)
+                LOG.info("s3 details are: %s", s3_bucket.to_dict())
                 # Appending the Access zone
                 bucket_details = s3_bucket.to_dict()
                 bucket_details['access_zone'] = access_zone
@@ -382,8 +388,7 @@ class S3Bucket(object):
 
         except utils.ApiException as e:
             if str(e.status) == "404":
-                log_msg = f"S3 bucket {bucket_id} status is {e.status}"
-                LOG.info(log_msg)
+                LOG.info("S3 bucket %s status is %s", bucket_id, e.status)
                 return None
             else:
                 error_msg = utils.determine_error(error_obj=e)
@@ -511,8 +516,7 @@ class S3Bucket(object):
         """Create S3 Bucket"""
         s3_bucket = self._create_s3_params_object(name, path)
         try:
-            msg = f'Creating S3 Bucket with parameters: {s3_bucket})'
-            LOG.info(msg)
+            LOG.info('Creating S3 Bucket with parameters: %s)', s3_bucket)
             bucket_details = {}
             if not self.module.check_mode:
                 response = self.protocol_api.create_s3_bucket(
@@ -539,8 +543,7 @@ class S3Bucket(object):
         :param zone: Access zone of the S3 bucket
         """
         try:
-            msg = f"Deleting S3 Bucket with identifier {bucket_id}."
-            LOG.info(msg)
+            LOG.info("Deleting S3 Bucket with identifier %s.", bucket_id)
             if not self.module.check_mode:
                 self.protocol_api.delete_s3_bucket(
                     s3_bucket_id=bucket_id, zone=zone)
@@ -589,8 +592,7 @@ class S3Bucket(object):
         s3_bucket = self._prepare_s3_modify_params_object(modify_dict)
         zone = bucket_params['access_zone']
         try:
-            msg = f'Modify S3 Bucket with parameters: {s3_bucket})'
-            LOG.info(msg)
+            LOG.info('Modify S3 Bucket with parameters: %s)', s3_bucket)
             if not self.module.check_mode:
                 self.protocol_api.update_s3_bucket(
                     s3_bucket=s3_bucket, s3_bucket_id=bucket_id, zone=zone)
@@ -645,8 +647,7 @@ class S3Bucket(object):
                 final_acl.append(item2)
 
         if final_acl != buck_acl:
-            msg = f"Final_acls for S3 bucket are : {final_acl}"
-            LOG.info(msg)
+            LOG.info("Final_acls for S3 bucket are : %s", final_acl)
             return True, final_acl
         return False, None
 
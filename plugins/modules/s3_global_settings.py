@@ -123,17 +123,19 @@ class S3GlobalSettings:
             "s3_global_settings_details": {}
         }
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info('Got python SDK instance for provisioning on PowerScale ')
-        check_mode_msg = f'Check mode flag is {self.module.check_mode}'
-        LOG.info(check_mode_msg)
+        LOG.info('Check mode flag is %s', self.module.check_mode)
 
         self.protocol_api = self.isi_sdk.ProtocolsApi(self.api_client)
 
@@ -155,8 +157,7 @@ class S3GlobalSettings:
             if s3_global_obj:
                 raw = s3_global_obj.to_dict() if hasattr(s3_global_obj, 'to_dict') else s3_global_obj.settings.to_dict()
                 settings = raw.get('settings', raw) if isinstance(raw, dict) else raw
-                msg = f"S3 global settings details are: {settings}"
-                LOG.info(msg)
+                LOG.info("S3 global settings details are: %s", settings)
                 return settings
         except Exception as e:
             error_msg = f"Got error {utils.determine_error(e)} while getting" \
@@ -193,15 +193,17 @@ class S3Key(object):
 
         self.result = {"changed": False, "S3_key_details": {}}
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info("Got python SDK instance for provisioning on PowerScale ")
-        check_mode_msg = f"Check mode flag is {self.module.check_mode}"
-        LOG.info(check_mode_msg)
+        LOG.info("Check mode flag is %s", self.module.check_mode)
 
         self.protocol_api = self.isi_sdk.ProtocolsApi(self.api_client)
         self.zone_summary_api = self.isi_sdk.ZonesSummaryApi(self.api_client)
@@ -257,8 +259,7 @@ class S3Key(object):
             "force": True,
         }
         try:
-            msg = f"Creating S3 Key for user {user} in access zone {access_zone}"
-            LOG.info(msg)
+            LOG.info("Creating S3 Key for user %s in access zone %s", user, access_zone)
             key_details = {}
             if not self.module.check_mode:
                 response = self.protocol_api.create_s3_key(
@@ -286,12 +287,10 @@ class S3Key(object):
         user = self.module.params.get("user")
         access_zone = self.module.params.get("access_zone")
         try:
-            msg = f"Deleting S3 Key for user {user} and zone {access_zone}"
-            LOG.info(msg)
+            LOG.info("Deleting S3 Key for user %s and zone %s", user, access_zone)
             if not self.module.check_mode:
                 self.protocol_api.delete_s3_key(s3_key_id=user, zone=access_zone)
-                msg = f"Successfully deleted the S3 key for user {user} and zone {access_zone}"
-                LOG.info(msg)
+                LOG.info("Successfully deleted the S3 key for user %s and zone %s", user, access_zone)
             return self.get_key_details()
 
         except Exception as e:
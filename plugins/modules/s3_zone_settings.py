@@ -156,17 +156,19 @@ class S3ZoneSettings:
         }
 
         # Validate the pre-requisites packages for the module
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
         # Initialize the connection to PowerScale
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info('Got python SDK instance for provisioning on PowerScale ')
-        check_mode_msg = f'Check mode flag is {self.module.check_mode}'
-        LOG.info(check_mode_msg)
+        LOG.info('Check mode flag is %s', self.module.check_mode)
 
         # Initialize the APIs
         self.protocol_api = self.isi_sdk.ProtocolsApi(self.api_client)
@@ -193,8 +195,7 @@ class S3ZoneSettings:
 
                 # Appending the Access zone
                 zone_settings["zone"] = access_zone
-                msg = f"S3 zone settings details are: {zone_settings}"
-                LOG.info(msg)
+                LOG.info("S3 zone settings details are: %s", zone_settings)
                 return zone_settings
 
         except Exception as e:
@@ -22,6 +22,7 @@ description:
 
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 
 author:
 - P Srinivas Rao (@srinivas-rao5) <ansible.team@dell.com>
@@ -481,6 +482,8 @@ quota_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zone_topology \
+    import ZoneTopology
 import re
 import copy
 
@@ -495,6 +498,7 @@ class SmartQuota(object):
 
         self.module_params = utils.get_powerscale_management_host_parameters()
         self.module_params.update(get_smartquota_parameters())
+        self.module_params.update(utils.get_zone_cache_parameters())
         mut_ex_args = [['group_name', 'user_name']]
         req_if_args = [
             ['quota_type', 'user', ['user_name']],
@@ -510,16 +514,19 @@ class SmartQuota(object):
         # result is a dictionary that contains changed status and
         # smart quota details
         self.result = {"changed": False}
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.auth_api_instance = utils.isi_sdk.AuthApi(self.api_client)
-        self.zone_summary_api = utils.isi_sdk.ZonesSummaryApi(
-            self.api_client)
+        self.zones_api = utils.isi_sdk.ZonesApi(self.api_client)
+        self.zone_topology = None
         self.quota_api_instance = utils.isi_sdk.QuotaApi(self.api_client)
 
         LOG.info('Got the isi_sdk instance for Smart Quota Operations')
@@ -531,9 +538,10 @@ class SmartQuota(object):
         :return: Base Path of the Access Zone.
         """
         try:
-            zone_path = (self.zone_summary_api.
-                         get_zones_summary_zone(access_zone)).to_dict()
-            zone_base_path = zone_path['summary']['path']
+            if self.zone_topology is None:
+                self.zone_topology = ZoneTopology(self.zones_api, self.module)
+            zone_base_path = \
+                self.zone_topology.get_zone_base_path(access_zone)
             LOG.debug("Successfully got zone_base_path for %s is %s",
                       access_zone, zone_base_path)
             return zone_base_path
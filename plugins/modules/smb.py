@@ -25,6 +25,7 @@ description:
 
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 
 author:
 - Arindam Datta (@dattaarindam) <ansible.team@dell.com>
@@ -712,8 +713,8 @@ class SMB(PowerScaleBase):
 
     def get_zone_base_path(self, access_zone):
         """Returns the base path of the Access Zone."""
-        return ZonesSummary(self.zones_summary_api,
-                            self.module).get_zone_base_path(access_zone)
+        return ZonesSummary(self.zones_summary_api, self.module,
+                            self.zone_topology).get_zone_base_path(access_zone)
 
     def ca_timeout_value(self):
         if self.module.params.get('ca_timeout'):
@@ -1614,6 +1615,7 @@ def get_smb_parameters():
                 provider_type=dict(type='str', default='local'),
                 state=dict(type='str', choices=['allow', 'deny'],
                            default='allow'))),
+        **utils.get_zone_cache_parameters()
     )
 
 
@@ -1629,8 +1631,7 @@ class SMBDeleteHandler:
     def handle(self, smb_obj, smb_params, smb_details):
         if smb_params['state'] == 'absent':
             if smb_details:
-                info_msg = f"Deleting SMB share {smb_params['share_name']}"
-                LOG.info(info_msg)
+                LOG.info("Deleting SMB share %s", smb_params['share_name'])
                 smb_obj.delete_smb_share()
                 smb_obj.result['changed'] = True
             smb_details = {}
@@ -1670,8 +1671,7 @@ class SMBCreateHandler:
         path = smb_params['path']
         access_zone = smb_params['access_zone']
         if state == 'present' and not smb_details:
-            info_msg = f"Creating a new SMB share {smb_params['share_name']}"
-            LOG.info(info_msg)
+            LOG.info("Creating a new SMB share %s", smb_params['share_name'])
             smb_obj.validate_path(path)
             smb_details = smb_obj.create_smb_share()
             if smb_details:
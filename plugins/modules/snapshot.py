@@ -21,9 +21,11 @@ description:
 - Modify a filesystem snapshot.
 - Get details of a filesystem snapshot.
 - Delete a filesystem snapshot.
+- Create snapshots of multiple paths concurrently.
 
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 
 author:
 - Prashant Rakheja (@prashant-dell) <ansible.team@dell.com>
@@ -32,7 +34,7 @@ options:
   snapshot_name:
     description:
     - The name of the snapshot.
-    required: true
+    - Either I(snapshot_name) or I(snapshots) is required.
     type: str
   path:
     description:
@@ -81,8 +83,52 @@ options:
     required: true
     choices: [absent, present]
     type: str
+  snapshots:
+    description:
+    - List of snapshots to be created concurrently in a single task.
+    - The base path of each distinct access zone is resolved only once.
+    - Snapshots which already exist are not modified.
+    - I(desired_retention), I(retention_unit) and I(expiration_timestamp)
+      apply to all the snapshots.
+    - Mutually exclusive with I(snapshot_name), I(path), I(alias) and
+      I(new_snapshot_name).
+    - Only supported with I(state) C(present).
+    type: list
+    elements: dict
+    version_added: '3.10.0'
+    suboptions:
+      snapshot_name:
+        description:
+        - The name of the snapshot.
+        type: str
+        required: true
+      path:
+        description:
+        - Specifies the filesystem path, with the same semantics as I(path).
+        type: str
+        required: true
+      access_zone:
+        description:
+        - The access zone whose base path is prefixed to I(path).
+        type: str
+        default: 'System'
+      alias:
+        description:
+        - The alias for the snapshot.
+        type: str
+  max_workers:
+    description:
+    - The maximum number of snapshot requests sent concurrently when
+      I(snapshots) is specified.
+    type: int
+    default: 10
+    version_added: '3.10.0'
 notes:
 - The I(check_mode) is not supported.
+- When I(snapshots) is specified, the module reports the time spread between
+  the first and the last snapshot creation timestamps in
+  I(bulk_snapshot_details), which can be used to verify the consistency
+  window of the snapshots.
 '''
 
 EXAMPLES = r'''
@@ -168,6 +214,24 @@ EXAMPLES = r'''
     api_password: "{{api_password}}"
     snapshot_name: "{{new_snapshot_name}}"
     state: "{{absent}}"
+
+- name: Create snapshots of multiple paths concurrently
+  dellemc.powerscale.snapshot:
+    onefs_host: "{{onefs_host}}"
+    verify_ssl: "{{verify_ssl}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    snapshots:
+      - snapshot_name: "project1_checkpoint"
+        path: "/project1"
+        access_zone: "{{access_zone}}"
+      - snapshot_name: "project2_checkpoint"
+        path: "/project2"
+        access_zone: "{{access_zone}}"
+    desired_retention: "{{desired_retention}}"
+    retention_unit: "{{retention_unit_days}}"
+    max_workers: 20
+    state: "{{present}}"
 '''
 
 RETURN = r'''
@@ -255,11 +319,59 @@ snapshot_details:
             }
         ]
     }
+
+bulk_snapshot_details:
+    description: The details of the snapshots created concurrently.
+    type: complex
+    returned: When I(snapshots) is specified.
+    contains:
+        created:
+            description: The names of the snapshots created by this task.
+            type: list
+            elements: str
+            sample: ["project1_checkpoint"]
+        existing:
+            description: The names of the snapshots which already existed.
+            type: list
+            elements: str
+            sample: ["project2_checkpoint"]
+        failed:
+            description: The snapshots which could not be created along
+                         with the error.
+            type: list
+            elements: dict
+            sample: [{"snapshot_name": "project3_checkpoint",
+                      "error": "Path does not exist"}]
+        first_created:
+            description: The earliest creation timestamp of the created
+                         snapshots.
+            type: int
+            sample: 1578514373
+        last_created:
+            description: The latest creation timestamp of the created
+                         snapshots.
+            type: int
+            sample: 1578514375
+        creation_spread_seconds:
+            description: The time between the first and the last snapshot
+                         creation.
+            type: int
+            sample: 2
+    sample: {
+        "created": ["project1_checkpoint"],
+        "existing": ["project2_checkpoint"],
+        "failed": [],
+        "first_created": 1578514373,
+        "last_created": 1578514375,
+        "creation_spread_seconds": 2
+    }
 '''
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zone_topology \
+    import ZoneTopology
 from datetime import datetime, timedelta
 import calendar
 import time
@@ -277,10 +389,15 @@ class Snapshot(object):
         self.module_params = utils \
             .get_powerscale_management_host_parameters()
         self.module_params.update(get_snapshot_parameters())
+        self.module_params.update(utils.get_zone_cache_parameters())
 
         mutually_exclusive = [
             ['desired_retention', 'expiration_timestamp'],
-            ['expiration_timestamp', 'retention_unit']
+            ['expiration_timestamp', 'retention_unit'],
+            ['snapshot_name', 'snapshots'],
+            ['path', 'snapshots'],
+            ['alias', 'snapshots'],
+            ['new_snapshot_name', 'snapshots']
         ]
 
         # initialize the Ansible module
@@ -289,17 +406,21 @@ class Snapshot(object):
                                     mutually_exclusive=mutually_exclusive
                                     )
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info('Got python SDK instance for provisioning on PowerScale ')
         self.snapshot_api = self.isi_sdk.SnapshotApi(self.api_client)
-        self.zone_summary_api = self.isi_sdk.ZonesSummaryApi(self.api_client)
+        self.zones_api = self.isi_sdk.ZonesApi(self.api_client)
+        self.zone_topology = None
 
     def determine_path(self):
         path = None
@@ -357,9 +478,9 @@ class Snapshot(object):
     def get_zone_base_path(self, access_zone):
         """Returns the base path of the Access Zone."""
         try:
-            zone_path = (self.zone_summary_api.
-                         get_zones_summary_zone(access_zone)).to_dict()
-            return zone_path['summary']['path']
+            if self.zone_topology is None:
+                self.zone_topology = ZoneTopology(self.zones_api, self.module)
+            return self.zone_topology.get_zone_base_path(access_zone)
         except Exception as e:
             error_msg = self.determine_error(error_obj=e)
             error_message = 'Unable to fetch base path of Access Zone {0} ' \
@@ -394,6 +515,28 @@ class Snapshot(object):
             self.module.fail_json(msg="Please provide a valid path for "
                                       "snapshot creation")
 
+        epoch_expiry_time = self.get_epoch_expiry_time(
+            desired_retention, retention_unit, epoch_expiry_time)
+
+        try:
+            snapshot_create_param = self.isi_sdk.SnapshotSnapshotCreateParams(
+                alias=alias,
+                expires=epoch_expiry_time,
+                name=snapshot_name,
+                path=path)
+            self.snapshot_api.create_snapshot_snapshot(snapshot_create_param)
+            return True
+        except Exception as e:
+            error_msg = self.determine_error(error_obj=e)
+            error_message = 'Failed to create snapshot: {0} for ' \
+                            'filesystem {1} with error: ' \
+                            '{2}'.format(snapshot_name, path, str(error_msg))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
+    def get_epoch_expiry_time(self, desired_retention, retention_unit,
+                              epoch_expiry_time):
+        """Returns the expiry time in epoch for a new snapshot"""
         if desired_retention and desired_retention.lower() != 'none':
             if retention_unit is None or retention_unit == 'hours':
                 expiration_timestamp = (datetime.utcnow() +
@@ -414,22 +557,111 @@ class Snapshot(object):
         elif desired_retention and \
                 desired_retention.lower() == 'none':
             epoch_expiry_time = None
-
+        return epoch_expiry_time
+
+    def get_bulk_snapshot_paths(self, snapshots):
+        """Returns the effective path of each snapshot, resolving the
+        base path of every distinct access zone only once"""
+        zone_base_paths = {}
+        effective_paths = []
+        for snap in snapshots:
+            path = snap['path'].rstrip("/")
+            access_zone = snap.get('access_zone') or 'System'
+            if access_zone.lower() != 'system':
+                if access_zone not in zone_base_paths:
+                    zone_base_paths[access_zone] = \
+                        self.get_zone_base_path(access_zone)
+                path = zone_base_paths[access_zone] + path
+            effective_paths.append(path)
+        return effective_paths
+
+    def snapshot_exists(self, snapshot_name):
+        """Returns whether the snapshot exists, raises on other errors"""
         try:
-            snapshot_create_param = self.isi_sdk.SnapshotSnapshotCreateParams(
-                alias=alias,
-                expires=epoch_expiry_time,
-                name=snapshot_name,
-                path=path)
-            self.snapshot_api.create_snapshot_snapshot(snapshot_create_param)
+            self.snapshot_api.get_snapshot_snapshot(snapshot_name)
             return True
-        except Exception as e:
-            error_msg = self.determine_error(error_obj=e)
-            error_message = 'Failed to create snapshot: {0} for ' \
-                            'filesystem {1} with error: ' \
-                            '{2}'.format(snapshot_name, path, str(error_msg))
-            LOG.error(error_message)
-            self.module.fail_json(msg=error_message)
+        except utils.ApiException as e:
+            if str(e.status) == "404":
+                return False
+            raise
+
+    def create_bulk_snapshots(self, snapshots, desired_retention,
+                              retention_unit, epoch_expiry_time,
+                              max_workers):
+        """Create snapshots of multiple paths concurrently"""
+        for snap in snapshots:
+            if not snap.get('snapshot_name') or not snap.get('path'):
+                self.module.fail_json(msg="Please provide a valid "
+                                          "snapshot_name and path for each "
+                                          "entry of snapshots.")
+        names = [snap['snapshot_name'] for snap in snapshots]
+        duplicates = sorted(set(name for name in names
+                                if names.count(name) > 1))
+        if duplicates:
+            self.module.fail_json(msg="Duplicate snapshot names {0} in "
+                                      "snapshots.".format(duplicates))
+        if desired_retention is None and epoch_expiry_time is None:
+            self.module.fail_json(msg="Please provide either "
+                                      "desired_retention or expiration_"
+                                      "timestamp for creating snapshots.")
+
+        effective_paths = self.get_bulk_snapshot_paths(snapshots)
+        bulk_details = dict(created=[], existing=[], failed=[],
+                            first_created=None, last_created=None,
+                            creation_spread_seconds=None)
+
+        # Existence checks run before any creation so that the creation
+        # requests are issued as close together as possible.
+        lookups = utils.run_concurrently(self.snapshot_exists, names,
+                                         max_workers)
+        to_create = []
+        for snap, path, lookup in zip(snapshots, effective_paths, lookups):
+            if lookup['error']:
+                bulk_details['failed'].append(dict(
+                    snapshot_name=snap['snapshot_name'],
+                    error=lookup['error']))
+            elif lookup['result']:
+                bulk_details['existing'].append(snap['snapshot_name'])
+            else:
+                to_create.append(self.isi_sdk.SnapshotSnapshotCreateParams(
+                    alias=snap.get('alias'), name=snap['snapshot_name'],
+                    path=path,
+                    expires=self.get_epoch_expiry_time(
+                        desired_retention, retention_unit,
+                        epoch_expiry_time)))
+
+        LOG.info("Creating %s snapshots with %s workers",
+                 len(to_create), max_workers)
+        creations = utils.run_concurrently(
+            self.snapshot_api.create_snapshot_snapshot, to_create,
+            max_workers)
+        created_timestamps = []
+        for creation in creations:
+            if creation['error']:
+                bulk_details['failed'].append(dict(
+                    snapshot_name=creation['item'].name,
+                    error=creation['error']))
+                continue
+            bulk_details['created'].append(creation['item'].name)
+            created = self.get_created_timestamp(creation['result'])
+            if created is not None:
+                created_timestamps.append(created)
+
+        if created_timestamps:
+            bulk_details['first_created'] = min(created_timestamps)
+            bulk_details['last_created'] = max(created_timestamps)
+            bulk_details['creation_spread_seconds'] = \
+                bulk_details['last_created'] - bulk_details['first_created']
+        LOG.info("Bulk snapshot creation details: %s", bulk_details)
+        return bulk_details
+
+    def get_created_timestamp(self, create_response):
+        """Returns the creation timestamp from a create response"""
+        if create_response is None or \
+                not hasattr(create_response, 'to_dict'):
+            return None
+        created = create_response.to_dict().get('created')
+        return created if isinstance(created, (int, float)) else None
 
     def delete_filesystem_snapshot(self, snapshot_name):
         """Deletes a filesystem snapshot"""
@@ -672,6 +904,11 @@ class Snapshot(object):
             changed=False
         )
 
+        if self.module.params['snapshots'] is not None:
+            self.perform_bulk_operation(result)
+            self.module.exit_json(**result)
+            return
+
         if not snapshot_name:
             error_message = 'Please provide a valid snapshot name'
             LOG.error(error_message)
@@ -759,10 +996,43 @@ class Snapshot(object):
         # Finally update the module result!
         self.module.exit_json(**result)
 
+    def perform_bulk_operation(self, result):
+        """Create the snapshots given in snapshots concurrently"""
+        params = self.module.params
+        if params['state'] != 'present':
+            self.module.fail_json(msg="snapshots is only supported with "
+                                      "state present.")
+        desired_retention = params['desired_retention']
+        expiration_timestamp = params['expiration_timestamp']
+        if desired_retention is not None:
+            self.validate_desired_retention(desired_retention)
+        if desired_retention is None and \
+                params['retention_unit'] is not None:
+            self.module.fail_json(msg='Specify desired retention along with '
+                                      'retention unit.')
+        if expiration_timestamp is not None:
+            self.validate_expiration_timestamp(expiration_timestamp)
+            expiration_timestamp = self.convert_utc_to_epoch(
+                expiration_timestamp)
+        if params['max_workers'] is not None and params['max_workers'] < 1:
+            self.module.fail_json(msg="max_workers must be greater than 0.")
+
+        bulk_details = self.create_bulk_snapshots(
+            params['snapshots'], desired_retention,
+            params['retention_unit'], expiration_timestamp,
+            params['max_workers'])
+        result['changed'] = bool(bulk_details['created'])
+        result['bulk_snapshot_details'] = bulk_details
+        if bulk_details['failed']:
+            error_message = "Failed to create {0} of {1} snapshots.".format(
+                len(bulk_details['failed']), len(params['snapshots']))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message, **result)
+
 
 def get_snapshot_parameters():
     return dict(
-        snapshot_name=dict(required=True, type='str'),
+        snapshot_name=dict(type='str'),
         path=dict(type='str', no_log=True),
         access_zone=dict(type='str', default='System'),
         new_snapshot_name=dict(type='str'),
@@ -772,7 +1042,13 @@ def get_snapshot_parameters():
                             choices=['hours', 'days']),
         alias=dict(type='str'),
         state=dict(required=True, type='str',
-                   choices=['present', 'absent'])
+                   choices=['present', 'absent']),
+        snapshots=dict(type='list', elements='dict', options=dict(
+            snapshot_name=dict(type='str', required=True),
+            path=dict(type='str', required=True),
+            access_zone=dict(type='str', default='System'),
+            alias=dict(type='str'))),
+        max_workers=dict(type='int', default=10)
     )
 
 
@@ -0,0 +1,459 @@
+#!/usr/bin/python
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Ansible module for pruning snapshots on PowerScale based on retention rules"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: snapshot_retention
+version_added: '3.10.0'
+short_description: Prune snapshots on PowerScale based on retention rules
+description:
+- You can perform the following operations.
+- Compute the set of snapshots which are not retained by the retention rules.
+- Delete the snapshots which are not retained by the retention rules.
+
+extends_documentation_fragment:
+  - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
+
+author:
+- Ansible Team (@dell) <ansible.team@dell.com>
+
+options:
+  path:
+    description:
+    - Only snapshots of this filesystem path are considered.
+    - At least one of I(path), I(schedule) or I(name_pattern) must be
+      specified.
+    - It is the absolute path for System access zone and it is relative if
+      using non-System access zone.
+    type: str
+  access_zone:
+    description:
+    - The access zone whose base path is prefixed to I(path).
+    type: str
+    default: 'System'
+  schedule:
+    description:
+    - Only snapshots created by this snapshot schedule are considered.
+    - The filter is applied by the PowerScale cluster.
+    type: str
+  name_pattern:
+    description:
+    - Only snapshots whose name matches this regular expression are
+      considered.
+    type: str
+  keep_last:
+    description:
+    - The number of newest snapshots to retain for each path.
+    type: int
+  keep_daily_days:
+    description:
+    - Retain the newest snapshot of each day for this number of days for
+      each path.
+    type: int
+  max_age:
+    description:
+    - Snapshots which are not retained by I(keep_last) or I(keep_daily_days)
+      are deleted only when they are older than this age.
+    - If not specified, all the snapshots not retained by I(keep_last) or
+      I(keep_daily_days) are deleted.
+    type: int
+  max_age_unit:
+    description:
+    - The unit of I(max_age).
+    type: str
+    choices: ['hours', 'days', 'weeks']
+    default: 'days'
+  max_workers:
+    description:
+    - The maximum number of snapshot delete requests sent concurrently.
+    type: int
+    default: 10
+  include_synciq_snapshots:
+    description:
+    - Whether the snapshots of SyncIQ policies are considered.
+    - SyncIQ names its snapshots C(SIQ-<policy id>-latest) and alike and
+      relies on them for incremental replication, so they are skipped by
+      default.
+    type: bool
+    default: false
+attributes:
+    check_mode:
+        description: Runs task to validate without performing action on the target machine.
+        support: full
+    diff_mode:
+        description: Runs the task to report the changes made or to be made.
+        support: none
+notes:
+- At least one of I(keep_last), I(keep_daily_days) or I(max_age) must be
+  specified.
+- At least one of I(path), I(schedule) or I(name_pattern) must be specified,
+  so that a task never applies to every snapshot of the cluster.
+- The snapshots are streamed newest first and the delete set is computed in
+  a single pass.
+- Snapshot aliases and snapshots with locks are never deleted. Snapshots of
+  SyncIQ policies are deleted only with I(include_synciq_snapshots).
+- In check mode, I(deleted_snapshots) lists exactly the snapshots which would
+  be deleted.
+'''
+
+EXAMPLES = r'''
+- name: Keep the last 24 snapshots and one snapshot per day for a week
+  dellemc.powerscale.snapshot_retention:
+    onefs_host: "{{ onefs_host }}"
+    verify_ssl: "{{ verify_ssl }}"
+    api_user: "{{ api_user }}"
+    api_password: "{{ api_password }}"
+    path: "/project1"
+    access_zone: "{{ access_zone }}"
+    keep_last: 24
+    keep_daily_days: 7
+
+- name: Delete snapshots of a schedule older than 30 days
+  dellemc.powerscale.snapshot_retention:
+    onefs_host: "{{ onefs_host }}"
+    verify_ssl: "{{ verify_ssl }}"
+    api_user: "{{ api_user }}"
+    api_password: "{{ api_password }}"
+    schedule: "hourly_schedule"
+    name_pattern: "^hourly_"
+    max_age: 30
+    max_age_unit: "days"
+    max_workers: 20
+'''
+
+RETURN = r'''
+changed:
+    description: Whether or not the resource has changed.
+    returned: always
+    type: bool
+    sample: true
+
+deleted_snapshots:
+    description: The snapshots deleted, or to be deleted in check mode.
+    type: list
+    returned: always
+    elements: dict
+    contains:
+        id:
+            description: The snapshot ID.
+            type: int
+            sample: 936
+        name:
+            description: The name of the snapshot.
+            type: str
+            sample: "hourly_2026-01-01_00-00"
+        path:
+            description: The directory path whose snapshot has been taken.
+            type: str
+            sample: "/ifs/project1"
+        created:
+            description: The creation timestamp.
+            type: int
+            sample: 1767225600
+    sample: [
+        {
+            "id": 936,
+            "name": "hourly_2026-01-01_00-00",
+            "path": "/ifs/project1",
+            "created": 1767225600
+        }
+    ]
+
+retained_snapshots_count:
+    description: The number of considered snapshots which are retained.
+    type: int
+    returned: always
+    sample: 31
+
+failed_snapshots:
+    description: The snapshots which could not be deleted along with the error.
+    type: list
+    returned: When deletion of any snapshot fails.
+    elements: dict
+    sample: [
+        {
+            "id": 937,
+            "name": "hourly_2026-01-01_01-00",
+            "error": "Snapshot is in use"
+        }
+    ]
+'''
+
+import re
+import time
+from datetime import datetime, timezone
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.powerscale_base \
+    import PowerScaleBase
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.snapshot \
+    import Snapshot
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zones_summary \
+    import ZonesSummary
+
+LOG = utils.get_logger('snapshot_retention')
+
+DAY_IN_SECONDS = 24 * 60 * 60
+SYNCIQ_SNAPSHOT_PATTERN = re.compile(r'^SIQ-')
+
+
+class SnapshotRetention(PowerScaleBase):
+    '''Class with snapshot retention operations'''
+
+    def __init__(self):
+        """
+        Initializes the class instance.
+        """
+        ansible_module_params = {
+            'argument_spec': self.get_snapshot_retention_parameters(),
+            'supports_check_mode': True,
+            'required_one_of': [['keep_last', 'keep_daily_days', 'max_age'],
+                                ['path', 'schedule', 'name_pattern']]
+        }
+        super().__init__(AnsibleModule, ansible_module_params)
+
+        self.result.update({
+            "deleted_snapshots": [],
+            "retained_snapshots_count": 0
+        })
+
+    def get_snapshot_retention_parameters(self):
+        """
+        Returns a dictionary with the parameters for snapshot retention.
+        """
+        return dict(
+            path=dict(type='str'),
+            access_zone=dict(type='str', default='System'),
+            schedule=dict(type='str'),
+            name_pattern=dict(type='str'),
+            keep_last=dict(type='int'),
+            keep_daily_days=dict(type='int'),
+            max_age=dict(type='int'),
+            max_age_unit=dict(type='str', default='days',
+                              choices=['hours', 'days', 'weeks']),
+            max_workers=dict(type='int', default=10),
+            include_synciq_snapshots=dict(type='bool', default=False),
+            **utils.get_zone_cache_parameters()
+        )
+
+    def validate_params(self, params):
+        """
+        Validates the retention rules.
+        :param params: The module parameters.
+        """
+        for key in ['keep_last', 'keep_daily_days', 'max_age']:
+            if params.get(key) is not None and params[key] < 0:
+                self.module.fail_json(
+                    msg="{0} must be a non-negative integer.".format(key))
+        if params.get('max_workers') is not None and \
+                params['max_workers'] < 1:
+            self.module.fail_json(msg="max_workers must be greater than 0.")
+        if params.get('name_pattern'):
+            try:
+                re.compile(params['name_pattern'])
+            except re.error as e:
+                self.module.fail_json(
+                    msg="Invalid name_pattern {0}: {1}".format(
+                        params['name_pattern'], str(e)))
+
+    def get_effective_path(self, params):
+        """
+        Returns the effective path of the snapshots to be considered.
+        :param params: The module parameters.
+        :return: The effective path or None.
+        """
+        path = params.get('path')
+        if not path:
+            return None
+        path = path.rstrip("/")
+        access_zone = params.get('access_zone')
+        if access_zone and access_zone.lower() != 'system':
+            path = ZonesSummary(self.zones_summary_api, self.module,
+                                self.zone_topology) \
+                .get_zone_base_path(access_zone) + path
+        return path
+
+    def get_list_query_params(self, params):
+        """
+        Returns the server side filters for listing snapshots, newest first.
+        :param params: The module parameters.
+        """
+        query_params = dict(sort='created', dir='DESC', state='active',
+                            type='real')
+        if params.get('schedule'):
+            query_params['schedule'] = params['schedule']
+        return query_params
+
+    def is_candidate(self, snapshot, effective_path, name_regex,
+                     include_synciq=False):
+        """
+        Returns whether the snapshot is subject to the retention rules.
+        """
+        if effective_path is not None and \
+                snapshot.get('path', '').rstrip("/") != effective_path:
+            return False
+        if name_regex is not None and \
+                not name_regex.search(snapshot.get('name') or ''):
+            return False
+        if snapshot.get('has_locks'):
+            LOG.info("Skipping snapshot %s as it has locks",
+                     snapshot.get('name'))
+            return False
+        if not include_synciq and \
+                SYNCIQ_SNAPSHOT_PATTERN.match(snapshot.get('name') or ''):
+            LOG.info("Skipping snapshot %s of a SyncIQ policy",
+                     snapshot.get('name'))
+            return False
+        return True
+
+    def plan_deletion(self, snapshots, params, now=None):
+        """
+        Computes the snapshots to be deleted in one pass over a newest
+        first stream of snapshots.
+        :param snapshots: Iterable of snapshot dicts, newest first.
+        :param params: The module parameters.
+        :param now: The current epoch time.
+        :return: Tuple of the delete set and the retained count.
+        """
+        now = time.time() if now is None else now
+        effective_path = self.get_effective_path(params)
+        name_regex = re.compile(params['name_pattern']) \
+            if params.get('name_pattern') else None
+        keep_last = params.get('keep_last')
+        keep_daily_days = params.get('keep_daily_days')
+        max_age = None
+        if params.get('max_age') is not None:
+            max_age = utils.get_time_in_seconds(params['max_age'],
+                                                params['max_age_unit'])
+
+        delete_set = []
+        retained_count = 0
+        path_state = {}
+        for snapshot in snapshots:
+            if not self.is_candidate(snapshot, effective_path, name_regex,
+                                     params.get('include_synciq_snapshots')):
+                continue
+            state = path_state.setdefault(
+                snapshot.get('path'), dict(count=0, days=set()))
+            state['count'] += 1
+            age = now - (snapshot.get('created') or now)
+            day = datetime.fromtimestamp(snapshot.get('created') or now,
+                                         timezone.utc).date()
+
+            if keep_last is not None and state['count'] <= keep_last:
+                # The day is covered by this snapshot for keep_daily_days
+                state['days'].add(day)
+                retained_count += 1
+                continue
+            if keep_daily_days is not None and \
+                    age < keep_daily_days * DAY_IN_SECONDS:
+                if day not in state['days']:
+                    state['days'].add(day)
+                    retained_count += 1
+                    continue
+            if max_age is not None and age <= max_age:
+                retained_count += 1
+                continue
+            delete_set.append(dict(id=snapshot.get('id'),
+                                   name=snapshot.get('name'),
+                                   path=snapshot.get('path'),
+                                   created=snapshot.get('created')))
+        return delete_set, retained_count
+
+    def get_snapshot_stream(self, params):
+        """
+        Returns a generator of snapshots with the server side filters.
+        :param params: The module parameters.
+        """
+        return Snapshot(self.snapshot_api, self.module).iter_snapshots(
+            **self.get_list_query_params(params))
+
+    def delete_snapshot(self, snapshot):
+        """
+        Deletes a snapshot by ID.
+        :param snapshot: The snapshot dict from the delete set.
+        """
+        self.snapshot_api.delete_snapshot_snapshot(str(snapshot['id']))
+        return True
+
+    def delete_snapshots(self, delete_set, max_workers):
+        """
+        Deletes the snapshots through a bounded pool of workers.
+        :param delete_set: The list of snapshots to be deleted.
+        :param max_workers: The maximum number of concurrent deletes.
+        :return: The list of failed deletions.
+        """
+        LOG.info("Deleting %s snapshots with %s workers",
+                 len(delete_set), max_workers)
+        outcome = utils.run_concurrently(self.delete_snapshot, delete_set,
+                                         max_workers)
+        return [dict(id=item['item']['id'], name=item['item']['name'],
+                     error=item['error'])
+                for item in outcome if item['error']]
+
+
+class SnapshotRetentionHandler:
+    def handle(self, retention_obj, module_params):
+        """
+        Computes the delete set and deletes the snapshots.
+        :param retention_obj: The SnapshotRetention object.
+        :param module_params: The module parameters.
+        """
+        retention_obj.validate_params(module_params)
+        try:
+            delete_set, retained_count = retention_obj.plan_deletion(
+                retention_obj.get_snapshot_stream(module_params),
+                module_params)
+        except Exception as e:
+            error_msg = utils.determine_error(error_obj=e)
+            error_message = 'Failed to list snapshots for retention ' \
+                            'with error: {0}'.format(str(error_msg))
+            LOG.error(error_message)
+            retention_obj.module.fail_json(msg=error_message)
+
+        retention_obj.result['retained_snapshots_count'] = retained_count
+        retention_obj.result['deleted_snapshots'] = delete_set
+        retention_obj.result['changed'] = bool(delete_set)
+        LOG.info("%s snapshots to be deleted, %s snapshots retained",
+                 len(delete_set), retained_count)
+
+        if delete_set and not retention_obj.module.check_mode:
+            failed = retention_obj.delete_snapshots(
+                delete_set, module_params['max_workers'])
+            if failed:
+                failed_ids = set(item['id'] for item in failed)
+                retention_obj.result['deleted_snapshots'] = [
+                    snap for snap in delete_set
+                    if snap['id'] not in failed_ids]
+                retention_obj.result['changed'] = \
+                    bool(retention_obj.result['deleted_snapshots'])
+                retention_obj.result['failed_snapshots'] = failed
+                error_message = 'Failed to delete {0} of {1} ' \
+                                'snapshots.'.format(len(failed),
+                                                    len(delete_set))
+                LOG.error(error_message)
+                retention_obj.module.fail_json(msg=error_message,
+                                               **retention_obj.result)
+        retention_obj.module.exit_json(**retention_obj.result)
+
+
+def main():
+    """Create PowerScale SnapshotRetention object and perform action on it
+        based on user input from playbook"""
+    obj = SnapshotRetention()
+    SnapshotRetentionHandler().handle(obj, obj.module.params)
+
+
+if __name__ == '__main__':
+    main()
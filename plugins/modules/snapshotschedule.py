@@ -24,6 +24,7 @@ description:
 
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 
 author:
 - Akash Shendge (@shenda1) <ansible.team@dell.com>
@@ -92,6 +93,28 @@ options:
     type: str
     required: true
     choices: [absent, present]
+  snapshot_list_mode:
+    description:
+    - Defines how the snapshots created by the snapshot schedule are
+      returned in I(snapshot_schedule_details).
+    - C(full) - The snapshot records are returned in I(snapshot_list),
+      following pagination up to I(snapshot_list_limit) records.
+    - C(summary) - Only the count, the oldest and newest snapshots and the
+      total size are returned in I(snapshot_summary).
+    - C(none) - The snapshots are not returned.
+    type: str
+    choices: [full, summary, none]
+    default: full
+    version_added: '3.10.0'
+  snapshot_list_limit:
+    description:
+    - The maximum number of snapshot records returned when
+      I(snapshot_list_mode) is C(full).
+    - If more snapshots exist, the resume token of the next page is returned
+      in I(snapshot_list) when the records end on a page boundary.
+    type: int
+    default: 1000
+    version_added: '3.10.0'
 notes:
 - The I(check_mode) is not supported.
 '''
@@ -172,6 +195,16 @@ EXAMPLES = r'''
     retention_unit: "{{retention_unit_days}}"
     state: "{{state_present}}"
 
+- name: Get details of snapshot schedule with a summary of its snapshots
+  dellemc.powerscale.snapshotschedule:
+    onefs_host: "{{onefs_host}}"
+    verify_ssl: "{{verify_ssl}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    name: "{{new_name}}"
+    snapshot_list_mode: "summary"
+    state: "{{state_present}}"
+
 - name: Delete snapshot schedule
   dellemc.powerscale.snapshotschedule:
     onefs_host: "{{onefs_host}}"
@@ -221,6 +254,7 @@ snapshot_schedule_details:
                      type: str
         snapshot_list:
             description: List of snapshots taken by this schedule
+            returned: When I(snapshot_list_mode) is C(full)
             type: complex
             contains:
                 snapshots:
@@ -248,6 +282,30 @@ snapshot_schedule_details:
                 total:
                     description: Total number of items available
                     type: int
+                resume:
+                    description: Resume token of the next page when the list
+                                 is truncated at I(snapshot_list_limit) on a
+                                 page boundary, else null
+                    type: str
+        snapshot_summary:
+            description: Summary of the snapshots taken by this schedule
+            returned: When I(snapshot_list_mode) is C(summary)
+            type: complex
+            contains:
+                count:
+                    description: Number of snapshots
+                    type: int
+                oldest:
+                    description: ID, name and creation time of the oldest
+                                 snapshot
+                    type: dict
+                newest:
+                    description: ID, name and creation time of the newest
+                                 snapshot
+                    type: dict
+                total_size:
+                    description: Total size in bytes of the snapshots
+                    type: int
     sample: {
         "schedules": [
             {
@@ -274,6 +332,10 @@ import re
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zone_topology \
+    import ZoneTopology
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.snapshot \
+    import Snapshot
 
 LOG = utils.get_logger('snapshotschedule')
 
@@ -286,6 +348,7 @@ class SnapshotSchedule(object):
         """ Define all parameters required by this module"""
         self.module_params = utils.get_powerscale_management_host_parameters()
         self.module_params.update(get_snapshotschedule_parameters())
+        self.module_params.update(utils.get_zone_cache_parameters())
 
         # initialize the Ansible module
         self.module = AnsibleModule(
@@ -293,26 +356,29 @@ class SnapshotSchedule(object):
             supports_check_mode=False
         )
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         self.api_instance = utils.isi_sdk.SnapshotApi(self.api_client)
-        self.zone_summary_api = utils.isi_sdk.ZonesSummaryApi(self.api_client)
+        self.zones_api = utils.isi_sdk.ZonesApi(self.api_client)
+        self.zone_topology = None
         LOG.info('Got python SDK instance for provisioning on PowerScale')
 
-    def get_details(self, name):
+    def get_details(self, name, include_snapshots=True):
         """Get snapshot schedule details"""
         try:
             api_response = self.api_instance.get_snapshot_schedule(name).\
                 to_dict()
-            snapshot_list = self.api_instance.list_snapshot_snapshots(
-                schedule=name).to_dict()
-            api_response['snapshot_list'] = snapshot_list
+            if include_snapshots:
+                self.add_schedule_snapshots(name, api_response)
             return api_response
         except utils.ApiException as e:
             if str(e.status) == "404":
@@ -333,12 +399,24 @@ class SnapshotSchedule(object):
             LOG.error(error_message)
             self.module.fail_json(msg=error_message)
 
+    def add_schedule_snapshots(self, name, api_response):
+        """Add the snapshots of the schedule as per snapshot_list_mode"""
+        list_mode = self.module.params.get('snapshot_list_mode') or 'full'
+        snapshot = Snapshot(self.api_instance, self.module)
+        if list_mode == 'summary':
+            api_response['snapshot_summary'] = \
+                snapshot.get_snapshots_summary(schedule=name)
+        elif list_mode == 'full':
+            limit = self.module.params.get('snapshot_list_limit') or 1000
+            api_response['snapshot_list'] = snapshot.get_snapshots_page(
+                limit, schedule=name)
+
     def get_zone_base_path(self, access_zone):
         """Returns the base path of the Access Zone."""
         try:
-            zone_path = (self.zone_summary_api.
-                         get_zones_summary_zone(access_zone)).to_dict()
-            return zone_path['summary']['path']
+            if self.zone_topology is None:
+                self.zone_topology = ZoneTopology(self.zones_api, self.module)
+            return self.zone_topology.get_zone_base_path(access_zone)
         except Exception as e:
             error_msg = self.determine_error(error_obj=e)
             error_message = 'Unable to fetch base path of Access Zone {0} ' \
@@ -455,7 +533,8 @@ class SnapshotSchedule(object):
     def validate_new_name(self, new_name):
         """validate if the snapshot schedule with new_name already exists"""
 
-        snapshot_schedules = self.get_details(new_name)
+        snapshot_schedules = self.get_details(new_name,
+                                              include_snapshots=False)
 
         if snapshot_schedules is not None:
             error_message = 'Snapshot schedule with name {0} already exists'.\
@@ -600,7 +679,13 @@ class SnapshotSchedule(object):
         if desired_retention:
             self.validate_desired_retention(desired_retention)
 
-        snapshot_schedule_details = self.get_details(name)
+        snapshot_list_limit = self.module.params.get('snapshot_list_limit')
+        if snapshot_list_limit is not None and snapshot_list_limit <= 0:
+            self.module.fail_json(msg="Please provide a positive integer "
+                                      "as the snapshot_list_limit.")
+
+        snapshot_schedule_details = self.get_details(
+            name, include_snapshots=False)
 
         is_schedule_modified = False
         snapshot_schedule_modification_details = dict()
@@ -643,7 +728,10 @@ def get_snapshotschedule_parameters():
         retention_unit=dict(type='str', choices=['hours', 'days'],
                             default='hours'),
         alias=dict(required=False, type='str'),
-        state=dict(required=True, type='str', choices=['present', 'absent'])
+        state=dict(required=True, type='str', choices=['present', 'absent']),
+        snapshot_list_mode=dict(type='str', default='full',
+                                choices=['full', 'summary', 'none']),
+        snapshot_list_limit=dict(type='int', default=1000)
     )
 
 
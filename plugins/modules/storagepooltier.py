@@ -150,17 +150,19 @@ class StoragePoolTier(object):
                                     mutually_exclusive=mutually_exclusive,
                                     supports_check_mode=True)
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.storagepool_api = utils.isi_sdk.StoragepoolApi(self.api_client)
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
-        check_mode_msg = f'Check mode flag is {self.module.check_mode}'
-        LOG.info(check_mode_msg)
+        LOG.info('Check mode flag is %s', self.module.check_mode)
 
     def get_tier_details(self, tier_name=None, tier_id=None):
         """
@@ -215,8 +217,7 @@ class StoragePoolTier(object):
                 "name": tier_name,
                 "children": nodepools
             }
-            create_msg = f'Creating storage pool tier {tier_name}'
-            LOG.info(create_msg)
+            LOG.info('Creating storage pool tier %s', tier_name)
             if not self.module.check_mode:
                 tier_object = utils.isi_sdk.StoragepoolTierCreateParams(**tier_data)
                 create_tier_response = self.storagepool_api.create_storagepool_tier(tier_object)
@@ -281,13 +281,16 @@ class Subnet(object):
         self.module = AnsibleModule(argument_spec=self.module_params,
                                     supports_check_mode=False)
 
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.groupnet_api = utils.isi_sdk.NetworkGroupnetsApi(self.api_client)
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
 
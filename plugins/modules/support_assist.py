@@ -437,8 +437,7 @@ class SupportAssist(PowerScaleBase):
         try:
             support_assist_obj = self.support_assist_api.get_supportassist_settings().to_dict()
             if support_assist_obj:
-                msg = f"support assist settings details are: {support_assist_obj}"
-                LOG.info(msg)
+                LOG.info("support assist settings details are: %s", support_assist_obj)
                 return support_assist_obj
 
         except Exception as e:
@@ -476,8 +475,7 @@ class SupportAssist(PowerScaleBase):
         try:
             terms_obj = self.support_assist_api.get_supportassist_terms().to_dict()
             if terms_obj:
-                msg = f"support assist terms details are: {terms_obj}"
-                LOG.info(msg)
+                LOG.info("support assist terms details are: %s", terms_obj)
                 return terms_obj
 
         except Exception as e:
@@ -0,0 +1,432 @@
+#!/usr/bin/python
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Ansible module for summarizing SyncIQ replication on PowerScale"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: synciq_analytics
+version_added: '3.10.0'
+short_description: Summarize SyncIQ replication health on PowerScale
+description:
+- Summarize the SyncIQ reports of a time window per policy.
+- Compute the data and files transferred, the duration, the effective
+  throughput and the error count of each policy.
+- Compute the current replication lag of each policy and compare it against
+  the RPO alert of the policy.
+
+extends_documentation_fragment:
+  - dellemc.powerscale.powerscale
+
+author:
+- Ansible Team (@dell) <ansible.team@dell.com>
+
+options:
+  policy_names:
+    description:
+    - Names of the SyncIQ policies to be summarized.
+    - If not specified, all the SyncIQ policies are summarized.
+    type: list
+    elements: str
+  window:
+    description:
+    - Only the reports of the jobs started within this time window are
+      summarized.
+    type: int
+    default: 24
+  window_unit:
+    description:
+    - The unit of I(window).
+    type: str
+    choices: ['hours', 'days', 'weeks']
+    default: 'hours'
+  include_sub_reports:
+    description:
+    - Whether to fetch the sub-reports of the reports to count the errors of
+      the retried job phases.
+    type: bool
+    default: false
+  max_workers:
+    description:
+    - The maximum number of sub-report requests sent concurrently.
+    type: int
+    default: 10
+attributes:
+    check_mode:
+        description: Runs task to validate without performing action on the target machine.
+        support: full
+    diff_mode:
+        description: Runs the task to report the changes made or to be made.
+        support: none
+notes:
+- The reports are streamed once for all the policies.
+- The lag of a policy is the time since the start of its latest successful
+  job. If no successful job is found in the window, the last success time
+  of the policy is used.
+- A policy with an RPO alert of 0 never exceeds its RPO.
+'''
+
+EXAMPLES = r'''
+- name: Summarize the replication of all the policies for the last day
+  dellemc.powerscale.synciq_analytics:
+    onefs_host: "{{ onefs_host }}"
+    verify_ssl: "{{ verify_ssl }}"
+    api_user: "{{ api_user }}"
+    api_password: "{{ api_password }}"
+
+- name: Summarize two policies for the last week including sub-reports
+  dellemc.powerscale.synciq_analytics:
+    onefs_host: "{{ onefs_host }}"
+    verify_ssl: "{{ verify_ssl }}"
+    api_user: "{{ api_user }}"
+    api_password: "{{ api_password }}"
+    policy_names:
+      - "policy_1"
+      - "policy_2"
+    window: 1
+    window_unit: "weeks"
+    include_sub_reports: true
+    max_workers: 20
+'''
+
+RETURN = r'''
+changed:
+    description: Whether or not the resource has changed.
+    returned: always
+    type: bool
+    sample: false
+
+synciq_analytics:
+    description: The replication summary of each policy.
+    type: list
+    returned: always
+    elements: dict
+    contains:
+        policy_name:
+            description: The name of the SyncIQ policy.
+            type: str
+        policy_id:
+            description: The ID of the SyncIQ policy.
+            type: str
+        enabled:
+            description: Whether the SyncIQ policy is enabled.
+            type: bool
+        report_count:
+            description: The number of reports in the window.
+            type: int
+        successful_jobs:
+            description: The number of finished jobs in the window.
+            type: int
+        failed_jobs:
+            description: The number of failed jobs in the window.
+            type: int
+        bytes_transferred:
+            description: The number of bytes transferred in the window.
+            type: int
+        files_transferred:
+            description: The number of files transferred in the window.
+            type: int
+        duration:
+            description: The total duration of the jobs in seconds.
+            type: int
+        throughput:
+            description: The effective throughput in bytes per second.
+            type: float
+        error_count:
+            description: The number of errors reported by the jobs, and by
+                         their sub-reports if I(include_sub_reports=true).
+            type: int
+        last_success:
+            description: The start time of the latest successful job in
+                         epoch seconds.
+            type: int
+        lag:
+            description: The number of seconds since I(last_success).
+            type: int
+        rpo_alert:
+            description: The RPO alert of the policy in seconds.
+            type: int
+        rpo_exceeded:
+            description: Whether the lag exceeds the RPO alert.
+            type: bool
+    sample: [
+        {
+            "policy_name": "policy_1",
+            "policy_id": "2ed973731814666a9d258db3a8875b5d",
+            "enabled": true,
+            "report_count": 24,
+            "successful_jobs": 23,
+            "failed_jobs": 1,
+            "bytes_transferred": 2147483648,
+            "files_transferred": 1200,
+            "duration": 1024,
+            "throughput": 2097152.0,
+            "error_count": 1,
+            "last_success": 1767225600,
+            "lag": 1800,
+            "rpo_alert": 3600,
+            "rpo_exceeded": false
+        }
+    ]
+
+failed_sub_reports:
+    description: The reports whose sub-reports could not be fetched along
+                 with the error.
+    type: list
+    returned: When fetching the sub-reports of any report fails.
+    elements: dict
+    sample: [
+        {
+            "id": "3-policy_1",
+            "policy_name": "policy_1",
+            "error": "Report not found"
+        }
+    ]
+'''
+
+import math
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.powerscale_base \
+    import PowerScaleBase
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.synciq \
+    import SyncIQ
+
+LOG = utils.get_logger('synciq_analytics')
+
+DAY_IN_SECONDS = 24 * 60 * 60
+
+
+class SyncIQAnalytics(PowerScaleBase):
+    '''Class with SyncIQ analytics operations'''
+
+    def __init__(self):
+        """
+        Initializes the class instance.
+        """
+        ansible_module_params = {
+            'argument_spec': self.get_synciq_analytics_parameters(),
+            'supports_check_mode': True
+        }
+        super().__init__(AnsibleModule, ansible_module_params)
+
+        self.result.update({
+            "synciq_analytics": []
+        })
+
+    def get_synciq_analytics_parameters(self):
+        """
+        Returns a dictionary with the parameters for SyncIQ analytics.
+        """
+        return dict(
+            policy_names=dict(type='list', elements='str'),
+            window=dict(type='int', default=24),
+            window_unit=dict(type='str', default='hours',
+                             choices=['hours', 'days', 'weeks']),
+            include_sub_reports=dict(type='bool', default=False),
+            max_workers=dict(type='int', default=10)
+        )
+
+    def validate_params(self, params):
+        """
+        Validates the window and the number of workers.
+        :param params: The module parameters.
+        """
+        if params['window'] < 1:
+            self.module.fail_json(msg="window must be greater than 0.")
+        if params['max_workers'] < 1:
+            self.module.fail_json(msg="max_workers must be greater than 0.")
+
+    def get_policies(self, policy_names):
+        """
+        Returns the policies to be summarized keyed by name.
+        :param policy_names: The policy names, all policies if None.
+        """
+        wanted = set(policy_names) if policy_names is not None else None
+        policies = {}
+        for policy in SyncIQ(self.synciq_api, self.module).iter_policies():
+            policy = policy.to_dict()
+            if wanted is None or policy['name'] in wanted:
+                policies[policy['name']] = policy
+        if wanted is not None:
+            missing = sorted(wanted - set(policies))
+            if missing:
+                self.module.fail_json(
+                    msg="SyncIQ policies {0} are not found.".format(
+                        ", ".join(missing)))
+        return policies
+
+    def get_report_stream(self, policies, window_start, now):
+        """
+        Returns a generator of the reports started within the window.
+        :param policies: The policies to be summarized keyed by name.
+        :param window_start: The start of the window in epoch seconds.
+        :param now: The current epoch time.
+        """
+        query = dict(newer_than=int(math.ceil((now - window_start) / DAY_IN_SECONDS)),
+                     sort='start_time', dir='DESC')
+        if len(policies) == 1:
+            query['policy_name'] = next(iter(policies))
+        for report in SyncIQ(self.synciq_api, self.module).iter_reports(**query):
+            report = report.to_dict()
+            if report.get('policy_name') not in policies:
+                continue
+            if (report.get('start_time') or 0) < window_start:
+                continue
+            yield report
+
+    def new_summary(self, policy):
+        """
+        Returns an empty summary of a policy.
+        :param policy: The policy details.
+        """
+        return dict(policy_name=policy['name'],
+                    policy_id=policy.get('id'),
+                    enabled=policy.get('enabled'),
+                    report_count=0,
+                    successful_jobs=0,
+                    failed_jobs=0,
+                    bytes_transferred=0,
+                    files_transferred=0,
+                    duration=0,
+                    throughput=0.0,
+                    error_count=0,
+                    last_success=None,
+                    lag=None,
+                    rpo_alert=policy.get('rpo_alert') or 0,
+                    rpo_exceeded=False)
+
+    def summarize(self, policies, reports, now):
+        """
+        Aggregates the reports per policy in one pass.
+        :param policies: The policies to be summarized keyed by name.
+        :param reports: Iterable of report dicts.
+        :param now: The current epoch time.
+        :return: Tuple of the summaries keyed by policy name and the reports
+                 which have sub-reports.
+        """
+        summaries = dict((name, self.new_summary(policy))
+                         for name, policy in policies.items())
+        with_sub_reports = []
+        for report in reports:
+            summary = summaries[report['policy_name']]
+            summary['report_count'] += 1
+            summary['bytes_transferred'] += report.get('bytes_transferred') or 0
+            summary['files_transferred'] += report.get('files_transferred') or 0
+            summary['duration'] += report.get('duration') or 0
+            summary['error_count'] += len(report.get('errors') or [])
+            if report.get('state') == 'finished':
+                summary['successful_jobs'] += 1
+                start_time = report.get('start_time')
+                if start_time and (summary['last_success'] is None or
+                                   start_time > summary['last_success']):
+                    summary['last_success'] = start_time
+            elif report.get('state') == 'failed':
+                summary['failed_jobs'] += 1
+            if report.get('subreport_count'):
+                with_sub_reports.append(report)
+
+        for name, summary in summaries.items():
+            if summary['duration']:
+                summary['throughput'] = round(
+                    float(summary['bytes_transferred']) / summary['duration'], 2)
+            if summary['last_success'] is None:
+                summary['last_success'] = policies[name].get('last_success') or None
+            if summary['last_success'] is not None:
+                summary['lag'] = max(0, int(now - summary['last_success']))
+            summary['rpo_exceeded'] = bool(
+                summary['rpo_alert'] and summary['lag'] is not None and
+                summary['lag'] > summary['rpo_alert'])
+        return summaries, with_sub_reports
+
+    def get_sub_report_error_count(self, report):
+        """
+        Returns the number of errors of the sub-reports of a report.
+        :param report: The report dict.
+        """
+        sub_reports = self.synciq_reports_api.get_report_subreports(
+            report['id']).to_dict()
+        return sum(len(sub_report.get('errors') or [])
+                   for sub_report in sub_reports.get('subreports') or [])
+
+    def add_sub_report_errors(self, summaries, reports, max_workers):
+        """
+        Adds the errors of the sub-reports through a bounded pool of workers.
+        :param summaries: The summaries keyed by policy name.
+        :param reports: The reports which have sub-reports.
+        :param max_workers: The maximum number of concurrent requests.
+        :return: The list of failed sub-report fetches.
+        """
+        LOG.info("Fetching sub-reports of %s reports with %s workers",
+                 len(reports), max_workers)
+        outcome = utils.run_concurrently(self.get_sub_report_error_count,
+                                         reports, max_workers)
+        failed = []
+        for item in outcome:
+            report = item['item']
+            if item['error']:
+                failed.append(dict(id=report['id'],
+                                   policy_name=report['policy_name'],
+                                   error=item['error']))
+                continue
+            summaries[report['policy_name']]['error_count'] += item['result']
+        return failed
+
+
+class SyncIQAnalyticsHandler:
+    def handle(self, analytics_obj, module_params):
+        """
+        Summarizes the SyncIQ reports per policy.
+        :param analytics_obj: The SyncIQAnalytics object.
+        :param module_params: The module parameters.
+        """
+        analytics_obj.validate_params(module_params)
+        now = time.time()
+        window_start = now - utils.get_time_in_seconds(
+            module_params['window'], module_params['window_unit'])
+        try:
+            policies = analytics_obj.get_policies(
+                module_params['policy_names'])
+            summaries, with_sub_reports = analytics_obj.summarize(
+                policies,
+                analytics_obj.get_report_stream(policies, window_start, now),
+                now)
+        except Exception as e:
+            error_msg = utils.determine_error(error_obj=e)
+            error_message = 'Failed to summarize SyncIQ reports ' \
+                            'with error: {0}'.format(str(error_msg))
+            LOG.error(error_message)
+            analytics_obj.module.fail_json(msg=error_message)
+
+        if module_params['include_sub_reports'] and with_sub_reports:
+            failed = analytics_obj.add_sub_report_errors(
+                summaries, with_sub_reports, module_params['max_workers'])
+            if failed:
+                analytics_obj.result['failed_sub_reports'] = failed
+                analytics_obj.module.warn(
+                    'Failed to get the sub-reports of {0} of {1} '
+                    'reports.'.format(len(failed), len(with_sub_reports)))
+
+        analytics_obj.result['synciq_analytics'] = [
+            summaries[name] for name in sorted(summaries)]
+        analytics_obj.module.exit_json(**analytics_obj.result)
+
+
+def main():
+    """Create PowerScale SyncIQAnalytics object and perform action on it
+        based on user input from playbook"""
+    obj = SyncIQAnalytics()
+    SyncIQAnalyticsHandler().handle(obj, obj.module.params)
+
+
+if __name__ == '__main__':
+    main()
@@ -255,6 +255,8 @@ modified_job:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.synciq \
+    import SyncIQ
 
 LOG = utils.get_logger('synciqjob')
 
@@ -275,14 +277,18 @@ class SyncIQJob(object):
 
         # result is a dictionary that contains changed status
         self.result = {"changed": False}
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.sync_api_instance = utils.isi_sdk.SyncApi(self.api_client)
+        self.synciq = SyncIQ(self.sync_api_instance, self.module)
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
 
     def get_job_details(self, job_id):
@@ -293,10 +299,8 @@ class SyncIQJob(object):
         else returns None.
         """
         try:
-            api_response = \
-                self.sync_api_instance.list_sync_jobs().jobs
-            jobs = [job.to_dict() for job in api_response if job.id == job_id]
-            return jobs
+            jobs = self.synciq.get_sync_jobs_by_id(job_id)
+            return [job.to_dict() for job in jobs]
         except utils.ApiException as e:
             if str(e.status) == '404':
                 error_message = "SyncIQ job %s details are not " \
@@ -544,6 +544,8 @@ target_synciq_policy_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.synciq \
+    import SyncIQ
 import copy
 
 LOG = utils.get_logger('synciqpolicy')
@@ -574,16 +576,20 @@ class SynciqPolicy(object):
             supports_check_mode=True,
             mutually_exclusive=mutually_exclusive
         )
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
 
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         self.api_instance = utils.isi_sdk.SyncApi(self.api_client)
+        self.synciq = SyncIQ(self.api_instance, self.module)
         LOG.info('Got python SDK instance for provisioning on PowerScale')
 
     def get_synciq_policy_details(self, policy_name, policy_id, job_params=None):
@@ -724,8 +730,7 @@ class SynciqPolicy(object):
         """
         try:
             jobs_list = []
-            api_response = self.api_instance.list_sync_jobs().jobs
-            jobs = [job for job in api_response if job.id == policy_id]
+            jobs = self.synciq.get_sync_jobs_by_id(policy_id)
             for job in jobs:
                 jobs_list.append({"id": job.id,
                                   "state": job.state,
@@ -27,6 +27,7 @@ options:
   name:
     description:
     - The name of the SyncIQ report.
+    - If the policy has more than one report, the latest one is used.
     type: str
   sub_report_id:
     description:
@@ -37,6 +38,15 @@ options:
     - This flag is used to fetch the list of sub reports.
     type: bool
     default: false
+  policy_names:
+    description:
+    - Names of the SyncIQ policies whose latest report is fetched.
+    - The latest reports of all the policies are resolved in a single pass
+      over the reports.
+    - Mutually exclusive with I(id), I(name) and I(sub_report_id).
+    type: list
+    elements: str
+    version_added: '3.10.0'
   state:
     description:
     - The state option is used to mention the existence of reports.
@@ -96,6 +106,17 @@ EXAMPLES = r'''
     id: "1-Test_syncIQ_policy"
     sub_report_id: "1"
     state: "present"
+
+- name: Get the latest SyncIQ report of multiple policies
+  dellemc.powerscale.synciqreports:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    policy_names:
+      - "Test_syncIQ_policy"
+      - "Test_syncIQ_policy_2"
+    state: "present"
 '''
 
 RETURN = r'''
@@ -103,6 +124,21 @@ changed:
     description: Whether or not the resource has changed.
     returned: always
     type: bool
+synciq_latest_reports:
+    description: Latest SyncIQ report details of each policy, keyed by the
+                 policy name. The value is null for a policy without a report.
+    returned: When I(policy_names) is given
+    type: dict
+    sample: {
+        "Test_syncIQ_policy": {
+            "id": "3-Test_syncIQ_policy",
+            "policy_name": "Test_syncIQ_policy",
+            "start_time": 1687488892,
+            "end_time": 1687488893,
+            "state": "finished"
+        },
+        "Test_syncIQ_policy_2": null
+    }
 synciq_report:
     description: Details of the SyncIQ report.
     returned: When SyncIQ report exists
@@ -428,6 +464,8 @@ synciq_report:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.synciq \
+    import SyncIQ
 
 
 LOG = utils.get_logger('synciqreports')
@@ -442,10 +480,11 @@ class SyncIQReports(object):
         self.module_params = utils.get_powerscale_management_host_parameters()
         self.module_params.update(get_synciq_reports_parameters())
 
-        mutually_exclusive = [['id', 'name']]
+        mutually_exclusive = [['id', 'name', 'policy_names'],
+                              ['policy_names', 'sub_report_id']]
 
         required_one_of = [
-            ['id', 'name']
+            ['id', 'name', 'policy_names']
         ]
 
         # initialize the ansible module
@@ -456,17 +495,21 @@ class SyncIQReports(object):
         # result is a dictionary that contains changed status and
         # SyncIQ report details
         self.result = {"changed": False}
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info('Got python SDK instance for provisioning on PowerScale ')
         self.synciq_api = self.isi_sdk.SyncApi(self.api_client)
         self.synciq_reports_api = self.isi_sdk.SyncReportsApi(self.api_client)
+        self.synciq = SyncIQ(self.synciq_api, self.module)
 
     def get_synciq_report(self, id):
         """
@@ -523,18 +566,13 @@ class SyncIQReports(object):
         """
         Get report id for SyncIQ when report name is mentioned.
         :param name: Specifies name of SyncIQ report.
-        :return: if exists returns id of the SyncIQ report
+        :return: if exists returns id of the latest SyncIQ report
         else returns None.
         """
         try:
-            id_report = None
-            all_reports = (self.synciq_api.get_sync_reports()).to_dict()
-            for items in range(len(all_reports['reports'])):
-                if all_reports['reports'][items]['policy_name'] == name:
-                    id_report = all_reports['reports'][items]['id']
-                    break
-            if id_report:
-                return id_report
+            report = self.synciq.get_latest_report(name, target=False)
+            if report:
+                return report.id
             else:
                 error_message = ("Failed to get the id of the target report for specified name %s "
                                  % (name))
@@ -546,6 +584,22 @@ class SyncIQReports(object):
             LOG.error(error_message)
             self.module.fail_json(msg=error_message)
 
+    def get_latest_reports(self, policy_names):
+        """
+        Get the latest SyncIQ report of each policy.
+        :param policy_names: Specifies names of the SyncIQ policies.
+        :return: Dictionary of policy name to the latest SyncIQ report
+        details, None for the policies without a report.
+        """
+        try:
+            index = self.synciq.get_latest_reports_index(policy_names, target=False)
+            return dict((name, index.get(name)) for name in policy_names)
+        except Exception as e:
+            error_message = ("Getting latest SyncIQ reports failed with "
+                             "error: %s" % (str(e)))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
     def _resolve_report_id(self):
         """Resolve report id from id or name parameter."""
         report_id = self.module.params['id']
@@ -568,6 +622,11 @@ class SyncIQReports(object):
         if state != 'present':
             self.module.fail_json(msg='Please provide a valid value for state')
 
+        policy_names = self.module.params['policy_names']
+        if policy_names is not None:
+            self.result["synciq_latest_reports"] = self.get_latest_reports(policy_names)
+            self.module.exit_json(**self.result)
+
         report_id = self._resolve_report_id()
 
         if sub_report_id:
@@ -588,7 +647,8 @@ def get_synciq_reports_parameters():
         name=dict(required=False, type='str'),
         state=dict(required=True, type='str', choices=['present', 'absent']),
         sub_report_id=dict(required=False, type='str'),
-        include_sub_reports=dict(required=False, type='bool', default=False))
+        include_sub_reports=dict(required=False, type='bool', default=False),
+        policy_names=dict(required=False, type='list', elements='str'))
 
 
 def main():
@@ -23,6 +23,7 @@ options:
   name:
     description:
     - The name of the SyncIQ target report.
+    - If the policy has more than one target report, the latest one is used.
     type: str
   id:
     description:
@@ -37,6 +38,15 @@ options:
     - This flag is used to fetch the list of target sub reports.
     type: bool
     default: false
+  policy_names:
+    description:
+    - Names of the SyncIQ policies whose latest target report is fetched.
+    - The latest target reports of all the policies are resolved in a single pass
+      over the target reports.
+    - Mutually exclusive with I(id), I(name) and I(sub_report_id).
+    type: list
+    elements: str
+    version_added: '3.10.0'
   state:
     description:
     - The state option is used to mention the existence of target reports.
@@ -95,6 +105,17 @@ EXAMPLES = r'''
     id: "2-sample_policy"
     sub_report_id: "1"
     state: "present"
+
+- name: Get the latest SyncIQ target report of multiple policies
+  dellemc.powerscale.synciqtargetreports:
+    onefs_host: "{{onefs_host}}"
+    api_user: "{{api_user}}"
+    api_password: "{{api_password}}"
+    verify_ssl: "{{verify_ssl}}"
+    policy_names:
+      - "sample_policy"
+      - "sample_policy_2"
+    state: "present"
 '''
 
 RETURN = r'''
@@ -102,6 +123,21 @@ changed:
     description: Whether or not the resource has changed.
     returned: always
     type: bool
+synciq_latest_target_reports:
+    description: Latest SyncIQ target report details of each policy, keyed by the
+                 policy name. The value is null for a policy without a target report.
+    returned: When I(policy_names) is given
+    type: dict
+    sample: {
+        "sample_policy": {
+            "id": "3-sample_policy",
+            "policy_name": "sample_policy",
+            "start_time": 1687488892,
+            "end_time": 1687488893,
+            "state": "finished"
+        },
+        "sample_policy_2": null
+    }
 synciq_target_report:
     description: Details of the SyncIQ target report.
     returned: When SyncIQ target report exists
@@ -427,6 +463,8 @@ synciq_target_report:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.synciq \
+    import SyncIQ
 
 
 LOG = utils.get_logger('synciqtargetreports')
@@ -441,10 +479,11 @@ class SyncIQTargetReports(object):
         self.module_params = utils.get_powerscale_management_host_parameters()
         self.module_params.update(get_synciq_target_reports_parameters())
 
-        mutually_exclusive = [['id', 'name']]
+        mutually_exclusive = [['id', 'name', 'policy_names'],
+                              ['policy_names', 'sub_report_id']]
 
         required_one_of = [
-            ['id', 'name']
+            ['id', 'name', 'policy_names']
         ]
 
         # initialize the ansible module
@@ -455,17 +494,21 @@ class SyncIQTargetReports(object):
         # result is a dictionary that contains changed status and
         # SyncIQ report details
         self.result = {"changed": False}
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.isi_sdk = utils.get_powerscale_sdk()
         LOG.info('Got python SDK instance for provisioning on PowerScale ')
         self.synciq_api = self.isi_sdk.SyncApi(self.api_client)
         self.synciq_target_reports_api = self.isi_sdk.SyncTargetApi(self.api_client)
+        self.synciq = SyncIQ(self.synciq_api, self.module)
 
     def get_synciq_target_report(self, id):
         """
@@ -522,18 +565,13 @@ class SyncIQTargetReports(object):
         """
         Get report id for SyncIQ target report when report name is mentioned.
         :param name: Specifies name of SyncIQ target report.
-        :return: if exists returns id of the SyncIQ target report
+        :return: if exists returns id of the latest SyncIQ target report
         else returns None.
         """
         try:
-            id_report = None
-            all_reports = (self.synciq_api.get_target_reports()).to_dict()
-            for items in range(len(all_reports['reports'])):
-                if all_reports['reports'][items]['policy_name'] == name:
-                    id_report = all_reports['reports'][items]['id']
-                    break
-            if id_report:
-                return id_report
+            report = self.synciq.get_latest_report(name, target=True)
+            if report:
+                return report.id
             else:
                 error_message = ("Failed to get the id of the target report for specified name %s "
                                  % (name))
@@ -545,6 +583,22 @@ class SyncIQTargetReports(object):
             LOG.error(error_message)
             self.module.fail_json(msg=error_message)
 
+    def get_latest_reports(self, policy_names):
+        """
+        Get the latest SyncIQ target report of each policy.
+        :param policy_names: Specifies names of the SyncIQ policies.
+        :return: Dictionary of policy name to the latest SyncIQ target report
+        details, None for the policies without a target report.
+        """
+        try:
+            index = self.synciq.get_latest_reports_index(policy_names, target=True)
+            return dict((name, index.get(name)) for name in policy_names)
+        except Exception as e:
+            error_message = ("Getting latest SyncIQ target reports failed with "
+                             "error: %s" % (str(e)))
+            LOG.error(error_message)
+            self.module.fail_json(msg=error_message)
+
     def _resolve_target_report_id(self):
         """Resolve target report id from id or name parameter."""
         report_id = self.module.params['id']
@@ -567,6 +621,11 @@ class SyncIQTargetReports(object):
         if state != 'present':
             self.module.fail_json(msg='Please provide a valid value for state')
 
+        policy_names = self.module.params['policy_names']
+        if policy_names is not None:
+            self.result["synciq_latest_target_reports"] = self.get_latest_reports(policy_names)
+            self.module.exit_json(**self.result)
+
         report_id = self._resolve_target_report_id()
 
         if sub_report_id:
@@ -587,7 +646,8 @@ def get_synciq_target_reports_parameters():
         name=dict(required=False, type='str'),
         state=dict(required=True, type='str', choices=['present', 'absent']),
         sub_report_id=dict(required=False, type='str'),
-        include_sub_reports=dict(required=False, type='bool', default=False))
+        include_sub_reports=dict(required=False, type='bool', default=False),
+        policy_names=dict(required=False, type='list', elements='str'))
 
 
 def main():
@@ -18,6 +18,7 @@ description:
 version_added: "1.2.0"
 extends_documentation_fragment:
   - dellemc.powerscale.powerscale
+  - dellemc.powerscale.powerscale.zone_cache
 author:
 - P Srinivas Rao (@srinivas-rao5) <ansible.team@dell.com>
 - Trisha Datta (@trisha-dell) <ansible.team@dell.com>
@@ -333,6 +334,8 @@ user_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.zone_topology \
+    import ZoneTopology
 import re
 
 LOG = utils.get_logger('user')
@@ -346,6 +349,7 @@ class User(object):
 
         self.module_params = utils.get_powerscale_management_host_parameters()
         self.module_params.update(get_user_parameters())
+        self.module_params.update(utils.get_zone_cache_parameters())
 
         required_one_of = [
             ['user_name', 'user_id']
@@ -359,13 +363,16 @@ class User(object):
         # result is a dictionary that contains changed status and
         # user details
         self.result = {"changed": False}
-        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params)
+        PREREQS_VALIDATE = utils.validate_module_pre_reqs(self.module.params,
+                                                          self.module._socket_path)
         if PREREQS_VALIDATE \
                 and not PREREQS_VALIDATE["all_packages_found"]:
             self.module.fail_json(
                 msg=PREREQS_VALIDATE["error_message"])
 
-        self.api_client = utils.get_powerscale_connection(self.module.params)
+        self.api_client = utils.get_powerscale_connection(
+            self.module.params, self.module._socket_path)
+        utils.report_api_perf(self.module)
         self.api_instance = utils.isi_sdk.AuthApi(self.api_client)
         cluster_api = utils.isi_sdk.ClusterApi(self.api_client)
         major = str(cluster_api.get_cluster_config().to_dict()['onefs_version']['release'].split('.')[0])
@@ -373,16 +380,18 @@ class User(object):
         self.array_version = major + "." + minor
         self.role_api_instance = utils.isi_sdk.AuthRolesApi(
             self.api_client)
-        self.zone_summary_api = utils.isi_sdk.ZonesSummaryApi(self.api_client)
+        self.zones_api = utils.isi_sdk.ZonesApi(self.api_client)
+        self.zone_topology = None
 
         LOG.info('Got the isi_sdk instance for authorization on to PowerScale')
 
     def get_zone_base_path(self, access_zone):
         """Returns the base path of the Access Zone."""
         try:
-            zone_path = (self.zone_summary_api.
-                         get_zones_summary_zone(access_zone)).to_dict()
-            zone_base_path = zone_path['summary']['path']
+            if self.zone_topology is None:
+                self.zone_topology = ZoneTopology(self.zones_api, self.module)
+            zone_base_path = \
+                self.zone_topology.get_zone_base_path(access_zone)
             LOG.info("Successfully got zone_base_path for %s is %s",
                      access_zone, zone_base_path)
             return zone_base_path
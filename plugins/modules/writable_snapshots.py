@@ -54,6 +54,13 @@ options:
         - This option is required I(state) is C(present).
         required: false
         type: str
+  max_workers:
+    description:
+    - The maximum number of writable snapshots created or deleted
+      concurrently.
+    type: int
+    default: 10
+    version_added: '3.10.0'
 attributes:
     check_mode:
         description: Runs task to validate without performing action on the target machine.
@@ -63,6 +70,10 @@ attributes:
         support: full
 notes:
 - The I(writable_snapshots) parameter will follow the order of deleting operations before creating operations.
+- The existing writable snapshots are fetched with a single listing and each
+  distinct source snapshot is validated once.
+- The failure of an individual writable snapshot does not stop the other
+  operations, all the failures are reported in I(failed_writable_snapshots).
 '''
 
 EXAMPLES = r'''
@@ -181,6 +192,21 @@ writable_snapshots_details:
             "state": "active"
             }
         ]
+
+failed_writable_snapshots:
+    description: The writable snapshots which are invalid or could not be
+                 created or deleted, along with the error if any.
+    type: list
+    elements: dict
+    returned: When any writable snapshot operation fails.
+    sample: [
+        {
+            "dst_path": "/ifs/test_two",
+            "src_snap": 2,
+            "state": "present",
+            "error": "Path already exists"
+        }
+    ]
 '''
 
 from ansible.module_utils.basic import AnsibleModule
@@ -209,6 +235,7 @@ class WritableSnapshot(PowerScaleBase):
         self.result.update({
             "writable_snapshots_details": {}
         })
+        self._writable_snapshot_index = None
 
         if self.module._diff:
             self.result.update({"diff": {"before": {"writable_snapshots": []}, "after": {"writable_snapshots": []}}})
@@ -229,7 +256,8 @@ class WritableSnapshot(PowerScaleBase):
               "state": {"type": 'str', "required": False, "choices": ['present', 'absent'], "default": 'present'},
               },
              "required_if": [("state", "present", ("src_snap",))]
-             }
+             },
+            "max_workers": {"type": 'int', "default": 10}
         }
 
     def segregate_snapshots(self, module_params):
@@ -249,9 +277,13 @@ class WritableSnapshot(PowerScaleBase):
         """
         writable_snapshot = module_params.get('writable_snapshots')
         snapshots_to_create, snapshots_to_delete, invalid_snapshots = [], [], []
+        valid_src_snaps = self.validate_src_snaps(
+            [snapshot_dict.get('src_snap') for snapshot_dict in writable_snapshot
+             if snapshot_dict.get('state') == 'present'])
         for snapshot_dict in writable_snapshot:
             if snapshot_dict.get('state') == 'present':
-                if not self.validate_src_snap(snapshot_dict.get('src_snap')) or not snapshot_dict.get('dst_path').startswith('/ifs/'):
+                if str(snapshot_dict.get('src_snap')) not in valid_src_snaps or \
+                        not snapshot_dict.get('dst_path').startswith('/ifs/'):
                     invalid_snapshots.append(snapshot_dict)
                 else:
                     snapshots_to_create.append(snapshot_dict)
@@ -292,6 +324,50 @@ class WritableSnapshot(PowerScaleBase):
         except Exception:
             return False
 
+    def validate_src_snaps(self, src_snaps):
+        """
+        Validates each distinct source snapshot once, concurrently.
+
+        Args:
+            src_snaps (list): The source snapshot names or IDs.
+
+        Returns:
+            set: The valid source snapshots, as strings.
+        """
+        unique_src_snaps = list(dict.fromkeys(
+            str(src_snap) for src_snap in src_snaps if src_snap is not None))
+        outcome = utils.run_concurrently(self.validate_src_snap, unique_src_snaps,
+                                         self.module.params.get('max_workers'))
+        return set(item['item'] for item in outcome if item['result'])
+
+    def get_writable_snapshot_index(self):
+        """
+        Retrieves all the writable snapshots with a single paginated listing.
+
+        Returns:
+            dict: The writable snapshots indexed by destination path.
+        """
+        if self._writable_snapshot_index is None:
+            try:
+                index = {}
+                snapshot_list = self.snapshot_api.list_snapshot_writable().to_dict()
+                while True:
+                    for snapshot in snapshot_list.get("writable") or []:
+                        index[snapshot["dst_path"].rstrip("/")] = snapshot
+                    resume = snapshot_list.get("resume")
+                    if not resume:
+                        break
+                    snapshot_list = self.snapshot_api.list_snapshot_writable(
+                        resume=resume).to_dict()
+                self._writable_snapshot_index = index
+            except Exception as e:
+                error_msg = utils.determine_error(error_obj=e)
+                error_message = 'Failed to get writable snapshots ' \
+                                'due to error {0}'.format(str(error_msg))
+                LOG.error(error_message)
+                self.module.fail_json(msg=error_message)
+        return self._writable_snapshot_index
+
     def get_writable_snapshot(self, dst_path):
         """
         Retrieves the writable snapshot for the given destination path.
@@ -304,14 +380,10 @@ class WritableSnapshot(PowerScaleBase):
             whether the writable snapshot exists or not. The second value is the writable
             snapshot data if it exists, otherwise an empty list.
         """
-        try:
-            snapshot_out = self.snapshot_api.get_snapshot_writable_wspath(
-                snapshot_writable_wspath=dst_path
-            ).to_dict().get("writable")
-            writable_snapshot_exists = True if snapshot_out else False
-            return writable_snapshot_exists, snapshot_out[0]
-        except Exception:
-            return False, []
+        snapshot_out = self.get_writable_snapshot_index().get(dst_path.rstrip("/"))
+        if snapshot_out:
+            return True, snapshot_out
+        return False, []
 
     def compare_src_snap(self, existing_snapshot, src_snap):
         """
@@ -380,30 +452,51 @@ class WritableSnapshot(PowerScaleBase):
             tuple: A tuple containing a boolean indicating if any snapshots were created and a list of dictionaries
                    containing the details of all created snapshots.
         """
-        create_result, existing_snapshot_list = [], []
+        create_result, existing_snapshot_list, failed = [], [], []
         changed_flag = False
-        for create_snapshot_dict in snapshots_to_create:
-            dst_path = create_snapshot_dict.get("dst_path")
-            src_snap = create_snapshot_dict.get("src_snap")
-            try:
-                snapshot_exists, existing_snapshot = self.get_writable_snapshot(dst_path)
-                if not snapshot_exists:
-                    output = self.handle_new_snapshot(dst_path, src_snap)
-                    create_result.append(output)
-                    changed_flag = True
-                else:
-                    changed, result = self.handle_existing_snapshot(dst_path, src_snap, existing_snapshot)
-                    create_result.append(result)
-                    if changed:
-                        changed_flag = True
-                    else:
-                        existing_snapshot_list.append(existing_snapshot)
-            except Exception as e:
-                self.log_snapshot_creation_error(dst_path, e)
+        self.get_writable_snapshot_index()
+        outcome = utils.run_concurrently(self.create_or_replace_snapshot, snapshots_to_create,
+                                         self.module.params.get('max_workers'))
+        for item in outcome:
+            dst_path = item['item'].get("dst_path")
+            src_snap = item['item'].get("src_snap")
+            if item['error']:
+                failed.append(dict(item['item'], error=item['error']))
+                continue
+            changed, output, existing_snapshot = item['result']
+            create_result.append(output)
+            if changed:
+                changed_flag = True
+                if existing_snapshot:
+                    self.update_diff_before(dst_path, self.compare_src_snap(existing_snapshot, src_snap)[1])
+                self.update_diff_after(dst_path, src_snap)
+            else:
+                existing_snapshot_list.append(existing_snapshot)
 
         result = create_result + existing_snapshot_list
+        if failed:
+            self.log_snapshot_creation_error(failed, changed_flag, result)
         return changed_flag, result
 
+    def create_or_replace_snapshot(self, create_snapshot_dict):
+        """
+        Creates the writable snapshot, or re-creates it if the source snapshot differs.
+
+        Args:
+            create_snapshot_dict (dict): The details of the writable snapshot to create.
+
+        Returns:
+            tuple: A tuple containing a boolean indicating if the snapshot was created,
+                   the details of the created snapshot and the existing snapshot if any.
+        """
+        dst_path = create_snapshot_dict.get("dst_path")
+        src_snap = create_snapshot_dict.get("src_snap")
+        snapshot_exists, existing_snapshot = self.get_writable_snapshot(dst_path)
+        if not snapshot_exists:
+            return True, self.handle_new_snapshot(dst_path, src_snap), None
+        changed, output = self.handle_existing_snapshot(dst_path, src_snap, existing_snapshot)
+        return changed, output, existing_snapshot
+
     def handle_new_snapshot(self, dst_path, src_snap):
         """
         Handle creation of a new snapshot.
@@ -419,7 +512,6 @@ class WritableSnapshot(PowerScaleBase):
             dst_path=dst_path,
             src_snap=src_snap
         )
-        self.update_diff_after(dst_path, src_snap)
         if not self.module.check_mode:
             output = self.snapshot_api.create_snapshot_writable_item(writable_snapshot_create_item)
             return output.to_dict()
@@ -442,28 +534,32 @@ class WritableSnapshot(PowerScaleBase):
         src_snap_changed, existing_snapshot_src_snap = self.compare_src_snap(existing_snapshot, src_snap)
         output = {}
         if src_snap_changed:
-            self.update_diff_before(dst_path, existing_snapshot_src_snap)
             if not self.module.check_mode:
                 self.snapshot_api.delete_snapshot_writable_wspath(snapshot_writable_wspath=dst_path)
             output = self.handle_new_snapshot(dst_path, src_snap)
             return True, output
         return False, output
 
-    def log_snapshot_creation_error(self, dst_path, error_obj):
+    def log_snapshot_creation_error(self, failed, changed, details):
         """
-        Log an error encountered during snapshot creation.
+        Log the errors encountered during snapshot creation and fail the module.
 
         Args:
-            dst_path (str): The destination path of the snapshot.
-            error_obj (Exception): The error encountered.
+            failed (list): The writable snapshots which failed, with the error.
+            changed (bool): Whether any other writable snapshot was created.
+            details (list): The details of the writable snapshots created.
 
         Returns:
             None
         """
-        error_msg = utils.determine_error(error_obj=error_obj)
-        error_message = 'Failed to create writable snapshot: {0} with error: {1}'.format(dst_path, str(error_msg))
+        error_message = '; '.join(
+            'Failed to create writable snapshot: {0} with error: {1}'.format(item.get('dst_path'), item['error'])
+            for item in failed)
         LOG.error(error_message)
-        self.module.fail_json(msg=error_message)
+        self.result['changed'] = self.result['changed'] or changed
+        self.result['writable_snapshots_details'] = [item for item in details if item]
+        self.result['failed_writable_snapshots'] = failed
+        self.module.fail_json(msg=error_message, **self.result)
 
     def delete_writable_snapshot(self, snapshots_to_delete):
         """
@@ -480,29 +576,50 @@ class WritableSnapshot(PowerScaleBase):
 
         """
         changed_flag = False
-        existing_snpashot_list = []
+        failed = []
+        to_delete = []
         for delete_snapshot_dict in snapshots_to_delete:
-            dst_path = delete_snapshot_dict.get('dst_path')
-            try:
-                snapshot_exits, existing_snapshot = self.get_writable_snapshot(dst_path)
-                if snapshot_exits:
-                    if not self.module.check_mode:
-                        self.snapshot_api.delete_snapshot_writable_wspath(snapshot_writable_wspath=dst_path)
-                    if self.module._diff:
-                        before_dict = [{"dst_path": delete_snapshot_dict.get("dst_path")}]
-                        self.result["diff"]["before"]["writable_snapshots"].extend(before_dict)
-                    changed_flag = True
-                if existing_snapshot:
-                    existing_snpashot_list.append(existing_snapshot)
-            except Exception as e:
-                error_msg = utils.determine_error(error_obj=e)
-                error_message = 'Failed to delete ' \
-                                'snapshot: {0} with ' \
-                                'error: {1}'.format(dst_path, str(error_msg))
-                LOG.error(error_message)
-                self.module.fail_json(msg=error_message)
+            snapshot_exits, existing_snapshot = self.get_writable_snapshot(delete_snapshot_dict.get('dst_path'))
+            if snapshot_exits:
+                to_delete.append(delete_snapshot_dict)
+        outcome = utils.run_concurrently(self.delete_snapshot_by_path, to_delete,
+                                         self.module.params.get('max_workers'))
+        for item in outcome:
+            dst_path = item['item'].get('dst_path')
+            if item['error']:
+                failed.append(dict(item['item'], error=item['error']))
+                continue
+            if self.module._diff:
+                before_dict = [{"dst_path": dst_path}]
+                self.result["diff"]["before"]["writable_snapshots"].extend(before_dict)
+            changed_flag = True
+        if failed:
+            error_message = '; '.join(
+                'Failed to delete snapshot: {0} with error: {1}'.format(item.get('dst_path'), item['error'])
+                for item in failed)
+            LOG.error(error_message)
+            self.result['changed'] = self.result['changed'] or changed_flag
+            self.result['failed_writable_snapshots'] = failed
+            self.module.fail_json(msg=error_message, **self.result)
         return changed_flag
 
+    def delete_snapshot_by_path(self, delete_snapshot_dict):
+        """
+        Deletes the writable snapshot and drops it from the index.
+
+        Args:
+            delete_snapshot_dict (dict): The details of the writable snapshot to delete.
+
+        Returns:
+            bool: True once the writable snapshot is deleted.
+        """
+        dst_path = delete_snapshot_dict.get('dst_path')
+        if not self.module.check_mode:
+            self.snapshot_api.delete_snapshot_writable_wspath(snapshot_writable_wspath=dst_path)
+        if self._writable_snapshot_index is not None:
+            self._writable_snapshot_index.pop(dst_path.rstrip("/"), None)
+        return True
+
 
 class WritableSnapshotHandler:
     def handle(self, writable_snapshot_obj, module_params):
@@ -0,0 +1,175 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Measurement of the performance scenarios of PowerScale modules"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import copy
+import gc
+import json
+import os
+import time
+import tracemalloc
+import warnings
+
+import pytest
+from mock.mock import MagicMock, patch
+
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.initial_mock \
+    import utils
+from ansible_collections.dellemc.powerscale.tests.perf.fake_sdk import FakeSdk
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+
+BASELINES_FILE = os.environ.get(
+    'POWERSCALE_PERF_BASELINES',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 'baselines.json'))
+
+# Allowed absolute increase of the wall time and of the peak memory, so that
+# fast scenarios do not fail on noise. They depend on the machine, so they
+# only fail the scenario with POWERSCALE_PERF_TIMING=1.
+WALL_TIME_SLACK = 0.05
+MEMORY_SLACK = 1024 * 1024
+
+MEASUREMENTS = {}
+
+
+def get_latency():
+    return float(os.environ.get('POWERSCALE_PERF_LATENCY_MS', '1')) / 1000
+
+
+def load_baselines():
+    if not os.path.exists(BASELINES_FILE):
+        return {}
+    with open(BASELINES_FILE) as baselines_file:
+        return json.load(baselines_file)
+
+
+def write_json(path, data):
+    with open(path, 'w') as json_file:
+        json.dump(data, json_file, indent=2, sort_keys=True)
+        json_file.write('\n')
+
+
+class Benchmark:
+
+    '''Measures a scenario and compares it with its baseline'''
+
+    def __init__(self, baselines):
+        self.baselines = baselines
+        self.rounds = int(os.environ.get('POWERSCALE_PERF_ROUNDS', '3'))
+        self.threshold = float(os.environ.get('POWERSCALE_PERF_THRESHOLD',
+                                              '1.5'))
+        self.update = os.environ.get('POWERSCALE_PERF_UPDATE') == '1'
+        self.timing = os.environ.get('POWERSCALE_PERF_TIMING') == '1'
+
+    def __call__(self, name, cluster, scenario):
+        """
+        Run a scenario, record its measurement and check it
+        :param name: The name of the scenario in the baselines
+        :param cluster: The fake cluster or the fake PAPI server of the
+                        scenario
+        :param scenario: Function running the scenario
+        :return: The result of the last run of the scenario
+        """
+        wall_times = []
+        calls = handshakes = None
+        for _round in range(self.rounds):
+            cluster.reset_stats()
+            gc.collect()
+            start = time.perf_counter()
+            result = scenario()
+            wall_times.append(time.perf_counter() - start)
+            calls = dict(cluster.calls)
+            handshakes = getattr(cluster, 'handshakes', None)
+
+        # Memory is traced in a separate run as tracing slows it down
+        gc.collect()
+        tracemalloc.start()
+        try:
+            scenario()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        measurement = dict(wall_time_s=round(min(wall_times), 4),
+                           api_calls=sum(calls.values()), calls=calls,
+                           peak_memory_bytes=peak_memory)
+        if handshakes is not None:
+            measurement['tls_handshakes'] = handshakes
+        MEASUREMENTS[name] = measurement
+        self.check(name, measurement)
+        return result
+
+    def check(self, name, measurement):
+        """
+        Compare a measurement with its baseline. More API calls or TLS
+        handshakes fail the scenario. A longer wall time or a higher peak
+        memory only warns unless timing is enabled.
+        :param name: The name of the scenario
+        :param measurement: The measurement
+        """
+        baseline = self.baselines.get(name)
+        if self.update:
+            return
+        if baseline is None:
+            warnings.warn('No baseline for the %s scenario, run with '
+                          'POWERSCALE_PERF_UPDATE=1 to store it' % name)
+            return
+        errors = []
+        if measurement['api_calls'] > baseline['api_calls']:
+            errors.append('%d API calls instead of %d: %s'
+                          % (measurement['api_calls'], baseline['api_calls'],
+                             measurement['calls']))
+        if measurement.get('tls_handshakes', 0) > \
+                baseline.get('tls_handshakes', 0):
+            errors.append('%d TLS handshakes instead of %d'
+                          % (measurement['tls_handshakes'],
+                             baseline.get('tls_handshakes', 0)))
+        for key, slack in (('wall_time_s', WALL_TIME_SLACK),
+                           ('peak_memory_bytes', MEMORY_SLACK)):
+            limit = baseline[key] * self.threshold + slack
+            if measurement[key] <= limit:
+                continue
+            error = '%s of %s exceeds %s (baseline %s)' \
+                % (key, measurement[key], round(limit, 4), baseline[key])
+            if self.timing:
+                errors.append(error)
+            else:
+                warnings.warn('%s of the %s scenario, set '
+                              'POWERSCALE_PERF_TIMING=1 to fail on it'
+                              % (error, name))
+        assert not errors, '%s regressed: %s' % (name, '; '.join(errors))
+
+
+def run_module(cluster, module_class, params, handler=None):
+    """
+    Run a module against a fake cluster
+    :param cluster: The fake cluster
+    :param module_class: The class of the module, such as SmartQuota
+    :param params: The module parameters
+    :param handler: The handler class of the module, else its
+                    perform_module_operation method is called
+    :return: The arguments of exit_json
+    """
+    with patch.object(utils, 'isi_sdk', FakeSdk(cluster)), \
+            patch.object(utils, 'ApiException', MockApiException):
+        module_obj = module_class()
+        module_obj.module = MagicMock()
+        module_obj.module.params = copy.deepcopy(params)
+        module_obj.module.check_mode = False
+        module_obj.module.fail_json = MagicMock(side_effect=SystemExit)
+        try:
+            if handler is not None:
+                handler().handle(module_obj, module_obj.module.params)
+            else:
+                module_obj.perform_module_operation()
+        except SystemExit:
+            pytest.fail('The module failed with %s'
+                        % module_obj.module.fail_json.call_args[1]['msg'])
+    return module_obj.module.exit_json.call_args[1]
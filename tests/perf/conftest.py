@@ -0,0 +1,89 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Fixtures of the performance tests of PowerScale modules
+
+The scenarios run the modules against a fake cluster with large fixtures,
+or send their requests over HTTPS to a fake Platform API served in the test
+process. They record the wall time, the API calls, the TLS handshakes and
+the peak memory of each scenario and compare them with the baselines of
+baselines.json. The API calls and the TLS handshakes do not depend on the
+machine and must not exceed their baseline. The wall time and the peak
+memory depend on the machine, exceeding their baseline only warns unless
+requested, against baselines stored on the same machine.
+
+Environment variables:
+- POWERSCALE_PERF_LATENCY_MS: latency of each fake API call and of each
+  request of the fake Platform API, default 1.
+- POWERSCALE_PERF_ROUNDS: runs of each scenario, the fastest is kept,
+  default 3.
+- POWERSCALE_PERF_TIMING: set to 1 to fail the scenarios whose wall time
+  or peak memory exceeds their baseline instead of warning.
+- POWERSCALE_PERF_THRESHOLD: allowed ratio of the wall time and the peak
+  memory to their baseline, default 1.5.
+- POWERSCALE_PERF_BASELINES: path of the baselines file.
+- POWERSCALE_PERF_UPDATE: set to 1 to store the measurements as the
+  baselines instead of comparing them.
+- POWERSCALE_PERF_RESULTS: path of a JSON file receiving the measurements.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+
+import pytest
+
+from ansible_collections.dellemc.powerscale.tests.perf.benchmark import \
+    BASELINES_FILE, MEASUREMENTS, Benchmark, get_latency, load_baselines, \
+    write_json
+from ansible_collections.dellemc.powerscale.tests.perf.papi_server import \
+    FakePapiServer, make_certificate
+
+
+@pytest.fixture(scope='session')
+def baselines():
+    return load_baselines()
+
+
+@pytest.fixture
+def perf_benchmark(baselines):
+    return Benchmark(baselines)
+
+
+@pytest.fixture
+def latency():
+    return get_latency()
+
+
+@pytest.fixture(scope='session')
+def papi_certificate(tmp_path_factory):
+    pytest.importorskip('cryptography')
+    return make_certificate(str(tmp_path_factory.mktemp('papi')))
+
+
+@pytest.fixture
+def papi_server(papi_certificate, latency):
+    with FakePapiServer(papi_certificate, latency) as server:
+        yield server
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not MEASUREMENTS:
+        return
+    terminalreporter.section('PowerScale performance scenarios')
+    for name, measurement in sorted(MEASUREMENTS.items()):
+        terminalreporter.write_line(
+            '%-40s %9.4f s %7d calls %5s handshakes %12d bytes'
+            % (name, measurement['wall_time_s'], measurement['api_calls'],
+               measurement.get('tls_handshakes', '-'),
+               measurement['peak_memory_bytes']))
+    if os.environ.get('POWERSCALE_PERF_RESULTS'):
+        write_json(os.environ['POWERSCALE_PERF_RESULTS'], MEASUREMENTS)
+    if os.environ.get('POWERSCALE_PERF_UPDATE') == '1':
+        baselines = load_baselines()
+        baselines.update(MEASUREMENTS)
+        write_json(BASELINES_FILE, baselines)
+        terminalreporter.write_line('Updated %s' % BASELINES_FILE)
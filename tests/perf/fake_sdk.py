@@ -0,0 +1,325 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Fake PowerScale SDK serving large fixtures with simulated latency"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import collections
+import itertools
+import threading
+import time
+
+from ansible_collections.dellemc.powerscale.tests.perf import generators
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+
+# Maximum number of records of a page, as returned by PAPI
+PAGE_SIZE = 1000
+
+
+def to_dict(value):
+    """Copy a value as the to_dict method of an SDK model does"""
+    if isinstance(value, dict):
+        return dict((key, to_dict(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return [to_dict(item) for item in value]
+    if isinstance(value, FakeModel):
+        return value.to_dict()
+    return value
+
+
+def get_index(records, key):
+    """
+    Get an index of records
+    :param records: The indexed records
+    :param key: Function returning the keys of a record
+    """
+    index = collections.defaultdict(list)
+    for record in records:
+        for value in key(record):
+            index[value].append(record)
+    return index
+
+
+class FakeModel:
+
+    '''SDK model with the attributes of a dictionary'''
+
+    def __init__(self, data=None, **kwargs):
+        self._data = dict(data or {}, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith('__') or name not in self._data:
+            raise AttributeError(name)
+        value = self._data[name]
+        if isinstance(value, dict):
+            return FakeModel(value)
+        if isinstance(value, list):
+            return [FakeModel(item) if isinstance(item, dict) else item
+                    for item in value]
+        return value
+
+    def to_dict(self):
+        return to_dict(self._data)
+
+
+class FakeCluster:
+
+    '''Objects of a simulated cluster, with the latency and the count of the
+    API calls'''
+
+    def __init__(self, latency=0.001, page_size=PAGE_SIZE, zones=None,
+                 nodes=None, quotas=None, snapshots=None, nfs_exports=None):
+        """
+        Initialize the cluster
+        :param latency: The simulated latency of each call, in seconds
+        :param page_size: The maximum number of records of a page
+        """
+        self.latency = latency
+        self.page_size = page_size
+        self.zones = zones or generators.make_zones()
+        self.nodes = nodes or []
+        self.quotas = quotas or []
+        self.snapshots = snapshots or []
+        self.nfs_exports = nfs_exports or []
+        self.calls = collections.Counter()
+        self.lock = threading.Lock()
+        self.cursors = {}
+        self.tokens = itertools.count(1)
+        self.next_id = itertools.count(10 ** 7)
+        # The indexes of the server side filters, built before the
+        # measurements
+        self.quotas_by_path = get_index(self.quotas,
+                                        lambda quota: [quota['path']])
+        self.snapshots_by_name = get_index(
+            self.snapshots, lambda snap: [snap['name'], str(snap['id'])])
+        self.snapshots_by_schedule = get_index(
+            self.snapshots, lambda snap: [snap['schedule']])
+        self.snapshot_aliases = [snap for snap in self.snapshots
+                                 if snap['target_name']]
+        self.nfs_exports_by_path = get_index(self.nfs_exports,
+                                             lambda export: export['paths'])
+        self.nfs_exports_by_id = get_index(
+            self.nfs_exports, lambda export: [str(export['id'])])
+
+    @property
+    def call_count(self):
+        return sum(self.calls.values())
+
+    def reset_stats(self):
+        with self.lock:
+            self.calls.clear()
+
+    def call(self, name):
+        """
+        Count a call and wait for its simulated latency
+        :param name: The API method
+        """
+        with self.lock:
+            self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def page(self, name, records, key, resume=None, limit=None):
+        """
+        Get a page of records with the resume token of the next page
+        :param name: The API method
+        :param records: The records matching the query of the first page
+        :param key: The key of the records in the response
+        :param resume: The resume token of a previous page
+        :param limit: The maximum number of records of the page
+        """
+        self.call(name)
+        with self.lock:
+            if resume:
+                if resume not in self.cursors:
+                    raise MockApiException(400, 'Invalid resume token')
+                records, offset, size = self.cursors.pop(resume)
+            else:
+                offset = 0
+                size = min(limit or self.page_size, self.page_size)
+            page = records[offset:offset + size]
+            token = None
+            if offset + size < len(records):
+                token = 'resume-%d' % next(self.tokens)
+                self.cursors[token] = (records, offset + size, size)
+        return FakeModel({key: page, 'resume': token,
+                          'total': len(records)})
+
+    def not_found(self, name):
+        raise MockApiException(404, '%s not found' % name)
+
+
+class FakeApi:
+
+    '''API of the fake SDK'''
+
+    def __init__(self, cluster):
+        self.cluster = cluster
+
+
+class FakeZonesApi(FakeApi):
+
+    def list_zones(self, **kwargs):
+        self.cluster.call('list_zones')
+        return FakeModel(zones=self.cluster.zones,
+                         total=len(self.cluster.zones))
+
+    def get_zone(self, zone_id, **kwargs):
+        self.cluster.call('get_zone')
+        for zone in self.cluster.zones:
+            if str(zone_id) in (str(zone['id']), zone['name']):
+                return FakeModel(zones=[zone])
+        self.cluster.not_found(zone_id)
+
+
+class FakeZonesSummaryApi(FakeApi):
+
+    def get_zones_summary_zone(self, zone, **kwargs):
+        self.cluster.call('get_zones_summary_zone')
+        for item in self.cluster.zones:
+            if str(zone) in (str(item['id']), item['name']):
+                return FakeModel(summary=dict(path=item['path']))
+        self.cluster.not_found(zone)
+
+
+class FakeClusterApi(FakeApi):
+
+    def get_cluster_nodes(self, **kwargs):
+        self.cluster.call('get_cluster_nodes')
+        return FakeModel(nodes=self.cluster.nodes,
+                         total=len(self.cluster.nodes))
+
+
+class FakeQuotaApi(FakeApi):
+
+    def list_quota_quotas(self, resume=None, limit=None, path=None,
+                          type=None, **kwargs):
+        quotas = self.cluster.quotas
+        if path is not None:
+            quotas = self.cluster.quotas_by_path.get(path, [])
+        if type is not None:
+            quotas = [quota for quota in quotas if quota['type'] == type]
+        return self.cluster.page('list_quota_quotas', quotas, 'quotas',
+                                 resume, limit)
+
+    def create_quota_quota(self, quota_quota, **kwargs):
+        self.cluster.call('create_quota_quota')
+        return FakeModel(id='quota%d' % next(self.cluster.next_id))
+
+    def update_quota_quota(self, quota_quota, quota_quota_id, **kwargs):
+        self.cluster.call('update_quota_quota')
+
+
+class FakeSnapshotApi(FakeApi):
+
+    def list_snapshot_snapshots(self, resume=None, limit=None, type=None,
+                                schedule=None, **kwargs):
+        snapshots = self.cluster.snapshots
+        if schedule is not None:
+            snapshots = self.cluster.snapshots_by_schedule.get(schedule, [])
+        if type == 'alias':
+            snapshots = self.cluster.snapshot_aliases if schedule is None \
+                else [snap for snap in snapshots if snap['target_name']]
+        return self.cluster.page('list_snapshot_snapshots', snapshots,
+                                 'snapshots', resume, limit)
+
+    def get_snapshot_snapshot(self, snapshot_snapshot_id, **kwargs):
+        self.cluster.call('get_snapshot_snapshot')
+        matched = self.cluster.snapshots_by_name.get(
+            str(snapshot_snapshot_id))
+        if not matched:
+            self.cluster.not_found(snapshot_snapshot_id)
+        return FakeModel(snapshots=matched[:1])
+
+    def create_snapshot_snapshot(self, snapshot_snapshot, **kwargs):
+        self.cluster.call('create_snapshot_snapshot')
+        params = to_dict(snapshot_snapshot)
+        return FakeModel(generators.make_snapshot(
+            next(self.cluster.next_id), params.get('path'),
+            params.get('name')))
+
+
+class FakeProtocolsApi(FakeApi):
+
+    def list_nfs_exports(self, resume=None, limit=None, path=None,
+                         zone=None, **kwargs):
+        exports = self.cluster.nfs_exports
+        if path is not None:
+            exports = self.cluster.nfs_exports_by_path.get(path, [])
+        if zone is not None and zone.lower() != 'system':
+            exports = [export for export in exports
+                       if export['zone'] == zone]
+        return self.cluster.page('list_nfs_exports', exports, 'exports',
+                                 resume, limit)
+
+    def get_nfs_export(self, nfs_export_id, **kwargs):
+        self.cluster.call('get_nfs_export')
+        matched = self.cluster.nfs_exports_by_id.get(str(nfs_export_id))
+        if not matched:
+            self.cluster.not_found(nfs_export_id)
+        return FakeModel(exports=matched[:1])
+
+    def list_smb_shares(self, **kwargs):
+        return self.cluster.page('list_smb_shares', [], 'shares')
+
+
+class FakeNamespaceApi(FakeApi):
+
+    def get_directory_metadata(self, directory_metadata_path, **kwargs):
+        self.cluster.call('get_directory_metadata')
+        return FakeModel(generators.make_directory_metadata(
+            directory_metadata_path))
+
+    def get_acl(self, namespace_path, **kwargs):
+        self.cluster.call('get_acl')
+        return FakeModel(generators.make_acl())
+
+
+class FakeAuthApi(FakeApi):
+
+    def get_auth_user(self, auth_user_id, **kwargs):
+        self.cluster.call('get_auth_user')
+        name = auth_user_id.split(':', 1)[-1]
+        return FakeModel(users=[dict(
+            name=name, uid=dict(id='UID:2000'),
+            sid=dict(id='SID:S-1-5-21-%s' % name),
+            on_disk_user_identity=dict(id='UID:2000'))])
+
+    def get_auth_group(self, auth_group_id, **kwargs):
+        self.cluster.call('get_auth_group')
+        name = auth_group_id.split(':', 1)[-1]
+        return FakeModel(groups=[dict(
+            name=name, gid=dict(id='GID:2000'),
+            sid=dict(id='SID:S-1-5-21-%s' % name),
+            on_disk_group_identity=dict(id='GID:2000'))])
+
+
+class FakeSdk:
+
+    '''PowerScale SDK whose APIs serve the objects of a fake cluster. The
+    APIs which are not simulated have no methods, the classes of the SDK
+    models build fake models of their parameters.'''
+
+    APIS = dict(ZonesApi=FakeZonesApi, ZonesSummaryApi=FakeZonesSummaryApi,
+                ClusterApi=FakeClusterApi, QuotaApi=FakeQuotaApi,
+                SnapshotApi=FakeSnapshotApi, ProtocolsApi=FakeProtocolsApi,
+                NamespaceApi=FakeNamespaceApi, AuthApi=FakeAuthApi)
+
+    major = 9
+    minor = 7
+
+    def __init__(self, cluster):
+        self.cluster = cluster
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        if name.endswith('Api'):
+            api_class = self.APIS.get(name, FakeApi)
+            return lambda api_client=None: api_class(self.cluster)
+        return FakeModel
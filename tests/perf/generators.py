@@ -0,0 +1,182 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Generators of large PowerScale fixtures for the performance tests"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+CREATED = 1700000000
+SYSTEM_ZONE_ID = 1
+GB = 1024 * 1024 * 1024
+
+
+def project_path(index):
+    return '/ifs/data/project_%05d' % index
+
+
+def home_path(index):
+    return '/ifs/home/user_%06d' % index
+
+
+def export_path(index):
+    return '/ifs/exports/share_%05d' % index
+
+
+def make_zones(count=1):
+    """Access zones, the first one being the System zone"""
+    zones = [{"id": SYSTEM_ZONE_ID, "zone_id": SYSTEM_ZONE_ID,
+              "name": "System", "path": "/ifs",
+              "auth_providers": ["lsa-local-provider:System"],
+              "groupnet": "groupnet0"}]
+    for index in range(1, count):
+        zones.append({"id": index + 1, "zone_id": index + 1,
+                      "name": "zone_%03d" % index,
+                      "path": "/ifs/zones/zone_%03d" % index,
+                      "auth_providers": ["lsa-local-provider:zone_%03d"
+                                         % index],
+                      "groupnet": "groupnet0"})
+    return zones
+
+
+def make_nodes(count):
+    """Nodes of a cluster with their hardware and drive summary"""
+    return [{"id": index + 1, "lnn": index + 1,
+             "hardware": {"class": "storage", "model": "F600",
+                          "serial_number": "SN%08d" % index},
+             "status": {"capacity": [{"bytes_total": 64 * 1024 * GB,
+                                      "bytes_used": index * GB,
+                                      "type": "hdd"}],
+                        "nvram": {"present": True}},
+             "drives": [{"bay": bay + 1, "lnum": bay,
+                         "devname": "da%d" % (bay + 1),
+                         "ui_state": "HEALTHY"} for bay in range(10)],
+             "state": {"readonly": {"enabled": False},
+                       "smartfail": {"smartfailed": False}}}
+            for index in range(count)]
+
+
+def make_quota(index, path=None):
+    """A directory quota with thresholds and usage"""
+    return {"id": "quota%06dAQAAAAAAAAAAAAAAAAAAAAAAAAAA" % index,
+            "path": path or home_path(index), "type": "directory",
+            "container": False, "enforced": True, "include_snapshots": False,
+            "persona": None, "linked": None, "notifications": "default",
+            "ready": True,
+            "thresholds": {"advisory": None, "advisory_exceeded": False,
+                           "hard": 10 * GB, "hard_exceeded": False,
+                           "soft": 8 * GB, "soft_exceeded": False,
+                           "soft_grace": 604800},
+            "thresholds_on": "fs_logical_size",
+            "usage": {"applogical": index * 1024, "fslogical": index * 1024,
+                      "inodes": index % 1000, "physical": index * 2048}}
+
+
+def make_quotas(count):
+    return [make_quota(index) for index in range(count)]
+
+
+def make_snapshot(index, path, name=None):
+    """A snapshot of a path"""
+    return {"id": index + 1, "name": name or "snap_%06d" % index,
+            "path": path, "created": CREATED + index,
+            "expires": CREATED + index + 604800, "size": 4096 * (index % 64),
+            "state": "active", "alias": None, "target_id": None,
+            "target_name": None, "schedule": "daily_%02d" % (index % 10),
+            "has_locks": False, "pct_filesystem": 0.0, "pct_reserve": 0.0,
+            "shadow_bytes": 0}
+
+
+def make_snapshots(count, paths=5000):
+    """Snapshots spread evenly over project paths"""
+    return [make_snapshot(index, project_path(index % paths))
+            for index in range(count)]
+
+
+def make_nfs_export(index, path=None, zone='System'):
+    """An NFS export of a single path"""
+    return {"id": index + 1, "paths": [path or export_path(index)],
+            "zone": zone, "clients": ["10.%d.%d.%d" % (index // 65536 % 256,
+                                                       index // 256 % 256,
+                                                       index % 256)],
+            "root_clients": [], "read_only_clients": [],
+            "read_write_clients": [], "description": "export %d" % index,
+            "read_only": False, "all_dirs": False,
+            "security_flavors": ["unix"], "map_root": {
+                "enabled": True, "primary_group": {"id": None},
+                "secondary_groups": [], "user": {"id": "USER:nobody"}},
+            "map_non_root": {"enabled": False, "primary_group": {"id": None},
+                             "secondary_groups": [],
+                             "user": {"id": "USER:nobody"}},
+            "block_size": 8192, "encoding": "DEFAULT",
+            "snapshot": "-", "symlinks": True}
+
+
+def make_nfs_exports(count):
+    return [make_nfs_export(index) for index in range(count)]
+
+
+def make_directory_metadata(path):
+    """The metadata of a directory of the namespace API"""
+    return {"attrs": [
+        {"name": "name", "namespace": None, "value": path.rsplit('/', 1)[-1]},
+        {"name": "owner", "namespace": None, "value": "root"},
+        {"name": "group", "namespace": None, "value": "wheel"},
+        {"name": "mode", "namespace": None, "value": "0755"},
+        {"name": "size", "namespace": None, "value": 0},
+        {"name": "uid", "namespace": None, "value": 0},
+        {"name": "gid", "namespace": None, "value": 0}]}
+
+
+def make_acl():
+    """The POSIX ACL of a directory of the namespace API"""
+    return {"authoritative": "mode", "mode": "0755",
+            "owner": {"id": "UID:0", "name": "root", "type": "user"},
+            "group": {"id": "GID:0", "name": "wheel", "type": "group"},
+            "acl": []}
+
+
+def make_network_pools(count, groupnet='groupnet0', subnet='subnet0'):
+    """IP address pools of a subnet"""
+    return [{"id": "%s.%s.pool_%03d" % (groupnet, subnet, index),
+             "name": "pool_%03d" % index, "groupnet": groupnet,
+             "subnet": subnet, "access_zone": "System",
+             "alloc_method": "static", "description": "pool %d" % index,
+             "ifaces": [{"iface": "ext-1", "lnn": lnn + 1}
+                        for lnn in range(4)],
+             "ranges": [{"low": "10.1.%d.10" % index,
+                         "high": "10.1.%d.250" % index}],
+             "sc_dns_zone": "pool%d.example.com" % index,
+             "sc_connect_policy": "round_robin"}
+            for index in range(count)]
+
+
+def make_ads_providers(count):
+    """Active Directory providers joined by the cluster"""
+    return [{"id": "ADS%02d.EXAMPLE.COM" % index,
+             "name": "ADS%02d.EXAMPLE.COM" % index,
+             "groupnet": "groupnet0", "status": "online",
+             "machine_account": "CLUSTER$", "site": "Default-First-Site",
+             "dns_domain": "ads%02d.example.com" % index,
+             "controller_time": CREATED}
+            for index in range(count)]
+
+
+def make_ipmi_config(node_count):
+    """The IPMI resources and collections of the platform API"""
+    resources = {
+        "ipmi/config/settings": {"settings": {
+            "enabled": True, "allocation_type": "static"}},
+        "ipmi/config/network": {"network": {
+            "gateway": "10.2.0.1", "prefixlen": 24,
+            "ranges": [{"low": "10.2.0.10", "high": "10.2.0.250"}]}},
+        "ipmi/config/user": {"user": {"username": "ipmiadmin"}}}
+    features = [{"id": feature, "enabled": True, "feature_description":
+                 "Remote %s" % feature}
+                for feature in ("power-control", "sol")]
+    nodes = [{"id": index + 1, "lnn": index + 1,
+              "ipmi_address": "10.2.0.%d" % (index + 10),
+              "status": "configured"} for index in range(node_count)]
+    return resources, features, nodes
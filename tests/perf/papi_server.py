@@ -0,0 +1,437 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Fake OneFS Platform API served over HTTPS by an in-process server"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+import collections
+import datetime
+import ipaddress
+import itertools
+import json
+import os
+import re
+import ssl
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from ansible_collections.dellemc.powerscale.tests.perf.fake_sdk import \
+    PAGE_SIZE
+
+SESSION_PATH = '/session/1/session'
+PAPI_PATH = re.compile(r'^/(platform|namespace)/\d+/(.+?)/?$')
+
+ERROR_CODES = {400: 'AEC_BAD_REQUEST', 401: 'AEC_UNAUTHORIZED',
+               403: 'AEC_FORBIDDEN', 404: 'AEC_NOT_FOUND',
+               409: 'AEC_CONFLICT'}
+
+
+def make_certificate(directory, host='127.0.0.1'):
+    """
+    Create a self signed certificate of the server
+    :param directory: The directory of the certificate and key files
+    :param host: The IP address of the server
+    :return: The paths of the certificate and of the key
+    """
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME,
+                                         'fake-onefs')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = x509.CertificateBuilder().subject_name(name) \
+        .issuer_name(name).public_key(key.public_key()) \
+        .serial_number(x509.random_serial_number()) \
+        .not_valid_before(now - datetime.timedelta(days=1)) \
+        .not_valid_after(now + datetime.timedelta(days=30)) \
+        .add_extension(x509.SubjectAlternativeName(
+            [x509.IPAddress(ipaddress.ip_address(host))]), critical=False) \
+        .sign(key, hashes.SHA256())
+    cert_path = os.path.join(directory, 'papi.crt')
+    key_path = os.path.join(directory, 'papi.key')
+    with open(cert_path, 'wb') as cert_file:
+        cert_file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, 'wb') as key_file:
+        key_file.write(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption()))
+    return cert_path, key_path
+
+
+class PapiError(Exception):
+
+    '''Error response of the Platform API'''
+
+    def __init__(self, status, message):
+        super(PapiError, self).__init__(message)
+        self.status = status
+        self.message = message
+
+    def to_dict(self):
+        return dict(errors=[dict(
+            code=ERROR_CODES.get(self.status, 'AEC_EXCEPTION'),
+            message=self.message)])
+
+
+class PapiRequestHandler(BaseHTTPRequestHandler):
+
+    '''Handles the requests of a keep-alive connection to the fake PAPI'''
+
+    protocol_version = 'HTTP/1.1'
+    # Idle keep-alive connections are closed after this number of seconds
+    timeout = 30
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, body=None, headers=None):
+        data = json.dumps(body).encode() if body is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or []):
+            self.send_header(name, value)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def handle_papi(self):
+        papi = self.server.papi
+        parts = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        papi.count(self.command, parts.path)
+        if papi.latency:
+            time.sleep(papi.latency)
+        try:
+            papi.raise_injected_error(self.command, parts.path)
+            if parts.path == SESSION_PATH:
+                return self.handle_session(body)
+            match = PAPI_PATH.match(parts.path)
+            if not match:
+                raise PapiError(404, 'Path %s not found' % parts.path)
+            papi.authenticate(self.headers)
+            status, response = papi.handle(
+                self.command, unquote(match.group(2)),
+                parse_qs(parts.query), json.loads(body) if body else None)
+            self.reply(status, response)
+        except PapiError as e:
+            self.reply(e.status, e.to_dict())
+
+    def handle_session(self, body):
+        papi = self.server.papi
+        if self.command == 'POST':
+            credentials = json.loads(body or b'{}')
+            session_id, csrf_token = papi.create_session(
+                credentials.get('username'), credentials.get('password'))
+            response = dict(services=credentials.get('services', []),
+                            timeout_absolute=14400, timeout_inactive=900,
+                            username=credentials.get('username'))
+            # The NetworkPoolAPI helper reads the cookie and the CSRF token
+            # of the session at the header positions of OneFS
+            return self.reply(201, response, [
+                ('Cache-Control', 'no-cache, no-store'),
+                ('Strict-Transport-Security', 'max-age=31536000'),
+                ('Set-Cookie', 'isisessid=%s; path=/; HttpOnly; Secure'
+                 % session_id),
+                ('Set-Cookie', 'isicsrf=%s; path=/; Secure' % csrf_token),
+                ('X-CSRF-Token', csrf_token)])
+        session_id = papi.get_session_id(self.headers)
+        if self.command == 'DELETE':
+            papi.delete_session(session_id)
+            return self.reply(204)
+        if self.command == 'GET':
+            papi.get_csrf_token(session_id)
+            return self.reply(200, dict(services=['platform', 'namespace']))
+        raise PapiError(400, 'Method %s not supported' % self.command)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = handle_papi
+
+
+class PapiHTTPServer(ThreadingHTTPServer):
+
+    '''Threaded HTTPS server counting the TLS handshakes of its
+    connections'''
+
+    daemon_threads = True
+
+    def __init__(self, papi, context):
+        ThreadingHTTPServer.__init__(self, ('127.0.0.1', 0),
+                                     PapiRequestHandler)
+        self.papi = papi
+        self.context = context
+
+    def finish_request(self, request, client_address):
+        # The handshake runs in the thread of the connection
+        try:
+            tls_request = self.context.wrap_socket(request, server_side=True)
+        except (ssl.SSLError, OSError):
+            return
+        self.papi.count_handshake()
+        try:
+            self.RequestHandlerClass(tls_request, client_address, self)
+        finally:
+            tls_request.close()
+
+
+class FakePapiServer:
+
+    '''Stand-in of the Platform API of a cluster. It serves the sessions
+    with their CSRF tokens, the resources and the paginated collections
+    added by the tests, with a latency and injected errors, and counts the
+    requests and the TLS handshakes.'''
+
+    def __init__(self, certificate, latency=0, page_size=PAGE_SIZE,
+                 username='admin', password='Secret123'):
+        """
+        Initialize the server
+        :param certificate: The paths of the certificate and of the key
+        :param latency: The latency of each request, in seconds
+        :param page_size: The maximum number of records of a page
+        :param username: The user allowed to log in
+        :param password: The password of the user
+        """
+        self.certificate = certificate
+        self.latency = latency
+        self.page_size = page_size
+        self.credentials = (username, password)
+        self.resources = {}
+        self.collections = {}
+        self.sessions = {}
+        self.errors = []
+        self.calls = collections.Counter()
+        self.handshakes = 0
+        self.sessions_created = 0
+        self.lock = threading.Lock()
+        self.cursors = {}
+        self.tokens = itertools.count(1)
+        self.next_id = itertools.count(10 ** 6)
+        self.server = None
+        self.thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+    @property
+    def url(self):
+        return 'https://127.0.0.1:%d' % self.port
+
+    @property
+    def call_count(self):
+        return sum(self.calls.values())
+
+    def start(self):
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(*self.certificate)
+        self.server = PapiHTTPServer(self, context)
+        self.thread = threading.Thread(target=self.server.serve_forever,
+                                       daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reset_stats(self):
+        with self.lock:
+            self.calls.clear()
+            self.handshakes = 0
+            self.sessions_created = 0
+
+    def count(self, method, path):
+        with self.lock:
+            self.calls['%s %s' % (method, path)] += 1
+
+    def count_handshake(self):
+        with self.lock:
+            self.handshakes += 1
+
+    def add_resource(self, path, body):
+        """
+        Serve a resource, such as the IPMI settings
+        :param path: The path of the resource after the API version, such as
+                     ipmi/config/settings
+        :param body: The response of the resource. The PUT requests update
+                     its nested dictionary.
+        """
+        self.resources[path] = body
+
+    def add_collection(self, path, key, records):
+        """
+        Serve a collection with resume pagination and its records by id or
+        name
+        :param path: The path of the collection after the API version, such
+                     as quota/quotas
+        :param key: The key of the records in the responses
+        :param records: The records of the collection
+        """
+        self.collections[path] = (key, records)
+
+    def inject_error(self, pattern, status=500, message=None, method=None,
+                     count=None):
+        """
+        Fail the requests of matching paths
+        :param pattern: Regular expression searched in the request path
+        :param status: The HTTP status of the errors
+        :param message: The message of the errors
+        :param method: The failed HTTP method, else all of them
+        :param count: The number of failed requests, else all of them
+        """
+        self.errors.append(dict(pattern=re.compile(pattern), status=status,
+                                message=message or 'Injected error',
+                                method=method, count=count))
+
+    def raise_injected_error(self, method, path):
+        with self.lock:
+            for error in self.errors:
+                if error['method'] not in (None, method) or \
+                        not error['pattern'].search(path) or \
+                        error['count'] == 0:
+                    continue
+                if error['count'] is not None:
+                    error['count'] -= 1
+                raise PapiError(error['status'], error['message'])
+
+    def create_session(self, username, password):
+        if (username, password) != self.credentials:
+            raise PapiError(401, 'Username or password is incorrect.')
+        session_id, csrf_token = uuid.uuid4().hex, uuid.uuid4().hex
+        with self.lock:
+            self.sessions[session_id] = csrf_token
+            self.sessions_created += 1
+        return session_id, csrf_token
+
+    def delete_session(self, session_id):
+        with self.lock:
+            if self.sessions.pop(session_id, None) is None:
+                raise PapiError(401, 'Session not found')
+
+    def get_csrf_token(self, session_id):
+        csrf_token = self.sessions.get(session_id)
+        if csrf_token is None:
+            raise PapiError(401, 'Authorization required')
+        return csrf_token
+
+    @staticmethod
+    def get_session_id(headers):
+        for cookie in (headers.get('Cookie') or '').split(';'):
+            name, _sep, value = cookie.strip().partition('=')
+            if name == 'isisessid':
+                return value
+        return None
+
+    def authenticate(self, headers):
+        """
+        Check the basic authentication or the session cookie of a request.
+        The requests of a session need its CSRF token and a referer.
+        :param headers: The request headers
+        """
+        authorization = headers.get('Authorization') or ''
+        if authorization.startswith('Basic '):
+            credentials = base64.b64decode(authorization[6:]).decode()
+            if tuple(credentials.split(':', 1)) != self.credentials:
+                raise PapiError(401, 'Username or password is incorrect.')
+            return
+        csrf_token = self.get_csrf_token(self.get_session_id(headers))
+        if headers.get('X-CSRF-Token') != csrf_token or \
+                not headers.get('Referer'):
+            raise PapiError(403, 'CSRF token validation failed')
+
+    def find_collection(self, path):
+        """
+        Get the collection of a path and the record id of the path
+        """
+        if path in self.collections:
+            return path, None
+        parent, _sep, record_id = path.rpartition('/')
+        if parent in self.collections:
+            return parent, record_id
+        raise PapiError(404, 'Path %s not found' % path)
+
+    def handle(self, method, path, query, body):
+        """
+        Handle a request of a resource or of a collection
+        :param method: The HTTP method
+        :param path: The path after the API version
+        :param query: The query parameters
+        :param body: The JSON body of the request
+        :return: The status and the response
+        """
+        if path in self.resources:
+            resource = self.resources[path]
+            if method == 'GET':
+                return 200, resource
+            if method == 'PUT':
+                for value in resource.values():
+                    if isinstance(value, dict):
+                        value.update(body or {})
+                return 204, None
+            raise PapiError(400, 'Method %s not supported' % method)
+        collection, record_id = self.find_collection(path)
+        key, records = self.collections[collection]
+        if record_id is None:
+            if method == 'GET':
+                return 200, self.get_page(key, records, query)
+            if method == 'POST':
+                record = dict(body or {}, id=next(self.next_id))
+                records.append(record)
+                return 201, dict(id=record['id'])
+            raise PapiError(400, 'Method %s not supported' % method)
+        record = self.find_record(records, record_id)
+        if method == 'GET':
+            return 200, {key: [record]}
+        if method == 'PUT':
+            record.update(body or {})
+            return 204, None
+        if method == 'DELETE':
+            records.remove(record)
+            return 204, None
+        raise PapiError(400, 'Method %s not supported' % method)
+
+    @staticmethod
+    def find_record(records, record_id):
+        for record in records:
+            if record_id in (str(record.get('id')), record.get('name')):
+                return record
+        raise PapiError(404, 'Record %s not found' % record_id)
+
+    def get_page(self, key, records, query):
+        """
+        Get a page of a collection with the resume token of the next page
+        """
+        with self.lock:
+            if 'resume' in query:
+                cursor = self.cursors.pop(query['resume'][0], None)
+                if cursor is None:
+                    raise PapiError(400, 'Invalid resume token')
+                records, offset, size = cursor
+            else:
+                offset = 0
+                size = min(int(query.get('limit', [self.page_size])[0]),
+                           self.page_size)
+            token = None
+            if offset + size < len(records):
+                token = 'resume-%d' % next(self.tokens)
+                self.cursors[token] = (records, offset + size, size)
+        return {key: records[offset:offset + size], 'resume': token,
+                'total': len(records)}
@@ -0,0 +1,253 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""End to end scenarios of the HTTP clients of PowerScale against a fake
+Platform API"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import http.client
+import json
+import ssl
+
+import pytest
+from mock.mock import MagicMock
+
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.powerscale.tests.perf import generators
+from ansible_collections.dellemc.powerscale.tests.perf.benchmark import \
+    MEASUREMENTS, Benchmark, utils
+from ansible_collections.dellemc.powerscale.plugins.httpapi.powerscale \
+    import HttpApi
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.ipmi \
+    import IpmiApi
+
+USER = 'admin'
+PASSWORD = 'Secret123'
+POOL_COUNT = 20
+ADS_PROVIDER_COUNT = 5
+IPMI_NODE_COUNT = 40
+QUOTA_COUNT = 10000
+POOLS_PATH = 'network/groupnets/groupnet0/subnets/subnet0/pools'
+
+
+def get_ipmi_api(server):
+    module = MagicMock()
+    module.params = dict(onefs_host='127.0.0.1', port_no=server.port,
+                         api_user=USER, api_password=PASSWORD,
+                         verify_ssl=False)
+    module.fail_json = MagicMock(side_effect=SystemExit)
+    return IpmiApi(module)
+
+
+def add_ipmi_config(server):
+    resources, features, nodes = generators.make_ipmi_config(IPMI_NODE_COUNT)
+    for path, body in resources.items():
+        server.add_resource(path, body)
+    server.add_collection('ipmi/config/features', 'features', features)
+    server.add_collection('ipmi/nodes', 'nodes', nodes)
+
+
+def get_httpapi(server):
+    options = dict(host='127.0.0.1', port=server.port, use_ssl=True,
+                   validate_certs=False, persistent_command_timeout=5)
+    connection = MagicMock()
+    connection.get_option.side_effect = lambda name: options.get(name)
+    httpapi = HttpApi(connection)
+    httpapi.login(USER, PASSWORD)
+    return httpapi
+
+
+def test_network_pool_details(perf_benchmark, papi_server):
+    pools = generators.make_network_pools(POOL_COUNT)
+    papi_server.add_collection(POOLS_PATH, 'pools', pools)
+
+    def scenario():
+        return [utils.get_network_pool_details(
+            USER, PASSWORD, '127.0.0.1', papi_server.port, 'groupnet0',
+            'subnet0', pool['name']) for pool in pools]
+
+    result = perf_benchmark('networkpool_details_open_url_20', papi_server,
+                            scenario)
+    assert [details['pools'][0]['id'] for details in result] == \
+        [pool['id'] for pool in pools]
+    # Each request logs in and out on connections of its own
+    assert MEASUREMENTS['networkpool_details_open_url_20'][
+        'tls_handshakes'] == 3 * POOL_COUNT
+    assert not papi_server.sessions
+
+
+def test_ads_provider_details(perf_benchmark, papi_server):
+    providers = generators.make_ads_providers(ADS_PROVIDER_COUNT)
+    papi_server.add_collection('auth/providers/ads', 'ads', providers)
+
+    def scenario():
+        return [utils.get_ads_provider_details(
+            USER, PASSWORD, '127.0.0.1', papi_server.port, provider['name'])
+            for provider in providers]
+
+    result = perf_benchmark('ads_provider_details_open_url_5', papi_server,
+                            scenario)
+    assert result[-1]['ads'][0]['status'] == 'online'
+    assert not papi_server.sessions
+
+
+def test_ipmi_config(perf_benchmark, papi_server):
+    add_ipmi_config(papi_server)
+    ipmi_api = get_ipmi_api(papi_server)
+    result = perf_benchmark('ipmi_all_config_open_url', papi_server,
+                            ipmi_api.get_all_ipmi_config)
+    assert result['network']['ip_ranges'][0]['low'] == '10.2.0.10'
+    assert len(result['nodes']) == IPMI_NODE_COUNT
+    assert not papi_server.sessions
+
+
+def test_httpapi_quota_pages(perf_benchmark, papi_server):
+    papi_server.add_collection('quota/quotas', 'quotas',
+                               generators.make_quotas(QUOTA_COUNT))
+    httpapi = get_httpapi(papi_server)
+
+    def scenario():
+        quotas = []
+        query = [['limit', '1000']]
+        while True:
+            response = httpapi.send_request('GET', '/platform/1/quota/quotas',
+                                            query)
+            page = json.loads(response['data'])
+            quotas.extend(page['quotas'])
+            if not page['resume']:
+                return quotas
+            query = [['resume', page['resume']]]
+
+    try:
+        result = perf_benchmark('httpapi_quota_pages_10k', papi_server,
+                                scenario)
+    finally:
+        httpapi.logout()
+    assert len(result) == QUOTA_COUNT
+    # The pages are read on the keep-alive connection of the session
+    assert MEASUREMENTS['httpapi_quota_pages_10k']['tls_handshakes'] == 0
+    assert papi_server.sessions_created == 0
+
+
+def test_sdk_quota_pages(perf_benchmark, papi_server):
+    isi_sdk = pytest.importorskip('isilon_sdk.v9_10_0')
+    papi_server.add_collection('quota/quotas', 'quotas',
+                               generators.make_quotas(QUOTA_COUNT))
+    configuration = isi_sdk.Configuration()
+    configuration.host = papi_server.url
+    configuration.username = USER
+    configuration.password = PASSWORD
+    configuration.verify_ssl = False
+    quota_api = isi_sdk.QuotaApi(isi_sdk.ApiClient(configuration))
+
+    def scenario():
+        page = quota_api.list_quota_quotas(limit=1000)
+        quotas = list(page.quotas)
+        while page.resume:
+            page = quota_api.list_quota_quotas(resume=page.resume)
+            quotas.extend(page.quotas)
+        return quotas
+
+    result = perf_benchmark('sdk_quota_pages_10k', papi_server, scenario)
+    assert len(result) == QUOTA_COUNT
+    assert MEASUREMENTS['sdk_quota_pages_10k']['tls_handshakes'] <= 1
+
+
+def test_session_csrf(papi_server):
+    papi_server.add_collection('quota/quotas', 'quotas',
+                               generators.make_quotas(1))
+    httpapi = get_httpapi(papi_server)
+    context = ssl._create_unverified_context()
+    connection = http.client.HTTPSConnection('127.0.0.1', papi_server.port,
+                                             context=context)
+    headers = httpapi.get_session_headers()
+    for name, status in ((None, 200), ('X-CSRF-Token', 403),
+                         ('Cookie', 401)):
+        request_headers = dict((key, value) for key, value in headers.items()
+                               if key != name)
+        connection.request('GET', '/platform/1/quota/quotas',
+                           headers=request_headers)
+        response = connection.getresponse()
+        response.read()
+        assert response.status == status
+    connection.close()
+    httpapi.logout()
+    assert not papi_server.sessions
+
+
+def test_resume_pagination(papi_server):
+    papi_server.add_collection('ipmi/nodes', 'nodes',
+                               generators.make_ipmi_config(5)[2])
+    papi_server.page_size = 2
+    httpapi = get_httpapi(papi_server)
+    response = httpapi.send_request('GET', '/platform/10/ipmi/nodes')
+    page = json.loads(response['data'])
+    assert (len(page['nodes']), page['total']) == (2, 5)
+    response = httpapi.send_request('GET', '/platform/10/ipmi/nodes',
+                                    [['resume', page['resume']]])
+    assert json.loads(response['data'])['nodes'][0]['lnn'] == 3
+    # A resume token is valid for a single page
+    response = httpapi.send_request('GET', '/platform/10/ipmi/nodes',
+                                    [['resume', page['resume']]])
+    assert response['status'] == 400
+    httpapi.logout()
+
+
+def test_injected_errors(papi_server):
+    add_ipmi_config(papi_server)
+    papi_server.add_collection(POOLS_PATH, 'pools',
+                               generators.make_network_pools(1))
+    papi_server.inject_error('ipmi/config/user', 404, 'IPMI is not configured')
+    papi_server.inject_error('ipmi/config/settings', 500, method='GET',
+                             count=1)
+    papi_server.inject_error('/pools/', 503, count=1)
+    ipmi_api = get_ipmi_api(papi_server)
+
+    assert ipmi_api.get_ipmi_user() == {}
+    with pytest.raises(SystemExit):
+        ipmi_api.get_ipmi_settings()
+    assert 'HTTP 500' in ipmi_api.module.fail_json.call_args[1]['msg']
+    assert ipmi_api.get_ipmi_settings()['enabled'] is True
+    ipmi_api.update_ipmi_settings(dict(enabled=False))
+    assert ipmi_api.get_ipmi_settings()['enabled'] is False
+
+    with pytest.raises(HTTPError) as error:
+        utils.get_network_pool_details(USER, PASSWORD, '127.0.0.1',
+                                       papi_server.port, 'groupnet0',
+                                       'subnet0', 'pool_000')
+    assert error.value.code == 503
+    assert utils.get_network_pool_details(
+        USER, PASSWORD, '127.0.0.1', papi_server.port, 'groupnet0',
+        'subnet0', 'pool_000')['pools'][0]['name'] == 'pool_000'
+
+
+def test_benchmark_gates(monkeypatch):
+    for name in ('POWERSCALE_PERF_TIMING', 'POWERSCALE_PERF_UPDATE',
+                 'POWERSCALE_PERF_THRESHOLD'):
+        monkeypatch.delenv(name, raising=False)
+    baseline = dict(api_calls=15, tls_handshakes=15, wall_time_s=0.44,
+                    peak_memory_bytes=126258)
+    slower = dict(baseline, calls={}, wall_time_s=0.75,
+                  peak_memory_bytes=4 * 1024 * 1024)
+    benchmark = Benchmark(dict(scenario=baseline))
+    # The wall time and the peak memory depend on the machine, they only
+    # fail the scenario on request
+    with pytest.warns(UserWarning) as warned:
+        benchmark.check('scenario', slower)
+        with pytest.raises(AssertionError, match='16 TLS handshakes instead '
+                                                 'of 15'):
+            benchmark.check('scenario', dict(slower, tls_handshakes=16))
+        with pytest.raises(AssertionError,
+                           match='16 API calls instead of 15'):
+            benchmark.check('scenario', dict(slower, api_calls=16))
+    assert len(warned) == 6
+
+    monkeypatch.setenv('POWERSCALE_PERF_TIMING', '1')
+    with pytest.raises(AssertionError) as error:
+        Benchmark(dict(scenario=baseline)).check('scenario', slower)
+    assert 'wall_time_s of 0.75 exceeds' in str(error.value)
+    assert 'peak_memory_bytes of 4194304 exceeds' in str(error.value)
@@ -0,0 +1,192 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Performance scenarios of PowerScale modules on large clusters"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.dellemc.powerscale.tests.perf import generators
+from ansible_collections.dellemc.powerscale.tests.perf.benchmark import \
+    Benchmark, run_module
+from ansible_collections.dellemc.powerscale.tests.perf.fake_sdk import \
+    FakeCluster
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_info_api \
+    import MockGatherfactsApi
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_nfs_export_api \
+    import NFS_COMMON_ARGS
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_smartquota_api \
+    import MockSmartQuotaApi
+from ansible_collections.dellemc.powerscale.plugins.modules.filesystem \
+    import FileSystem, FilesystemHandler
+from ansible_collections.dellemc.powerscale.plugins.modules.info import Info
+from ansible_collections.dellemc.powerscale.plugins.modules.nfs \
+    import NfsExport, NFSHandler
+from ansible_collections.dellemc.powerscale.plugins.modules.smartquota \
+    import SmartQuota
+from ansible_collections.dellemc.powerscale.plugins.modules.snapshot \
+    import Snapshot
+
+QUOTA_COUNT = 100000
+SNAPSHOT_COUNT = 250000
+NFS_EXPORT_COUNT = 50000
+NODE_COUNT = 40
+
+CONNECTION_ARGS = {
+    'onefs_host': '10.0.0.1',
+    'port_no': '8080',
+    'verify_ssl': False,
+    'api_user': 'admin',
+    'api_password': 'Secret123',
+    'zone_cache_file': None,
+    'zone_cache_ttl': 300,
+}
+
+
+def get_args(args, **params):
+    return dict(CONNECTION_ARGS, **dict(args, **params))
+
+
+@pytest.fixture(scope='module')
+def quotas():
+    return generators.make_quotas(QUOTA_COUNT)
+
+
+@pytest.fixture(scope='module')
+def snapshots():
+    return generators.make_snapshots(SNAPSHOT_COUNT)
+
+
+@pytest.fixture(scope='module')
+def nfs_exports():
+    return generators.make_nfs_exports(NFS_EXPORT_COUNT)
+
+
+def test_info_smartquota(perf_benchmark, latency, quotas):
+    cluster = FakeCluster(latency, quotas=quotas)
+    args = get_args(MockGatherfactsApi.GATHERFACTS_COMMON_ARGS,
+                    gather_subset=['smartquota'])
+    result = perf_benchmark('info_smartquota_100k', cluster,
+                            lambda: run_module(cluster, Info, args))
+    assert len(result['smart_quota']) == QUOTA_COUNT
+
+
+def test_info_nfs_exports(perf_benchmark, latency, nfs_exports):
+    cluster = FakeCluster(latency, nfs_exports=nfs_exports)
+    args = get_args(MockGatherfactsApi.GATHERFACTS_COMMON_ARGS,
+                    gather_subset=['nfs_exports'])
+    result = perf_benchmark('info_nfs_exports_50k', cluster,
+                            lambda: run_module(cluster, Info, args))
+    assert result['NfsExports']
+
+
+def test_info_nodes(perf_benchmark, latency):
+    cluster = FakeCluster(latency,
+                          nodes=generators.make_nodes(NODE_COUNT))
+    args = get_args(MockGatherfactsApi.GATHERFACTS_COMMON_ARGS,
+                    gather_subset=['nodes'])
+    result = perf_benchmark('info_nodes_40', cluster,
+                            lambda: run_module(cluster, Info, args))
+    assert len(result['Nodes']['nodes']) == NODE_COUNT
+
+
+def test_filesystem_snapshots(perf_benchmark, latency, quotas, snapshots):
+    cluster = FakeCluster(latency, quotas=quotas, snapshots=snapshots)
+    path = generators.project_path(7)
+    args = get_args(dict(path=path, access_zone='System', owner=None,
+                         group=None, access_control=None,
+                         access_control_rights=None,
+                         access_control_rights_state=None, recursive=True,
+                         recursive_force_delete=False, quota=None,
+                         list_snapshots=True, state='present'))
+    result = perf_benchmark(
+        'filesystem_snapshots_250k', cluster,
+        lambda: run_module(cluster, FileSystem, args, FilesystemHandler))
+    assert result['changed'] is False
+    assert all(snap['path'] == path
+               for snap in result['filesystem_snapshots'])
+
+
+def test_nfs_existing_export(perf_benchmark, latency, nfs_exports):
+    cluster = FakeCluster(latency, nfs_exports=nfs_exports)
+    export = nfs_exports[NFS_EXPORT_COUNT // 2]
+    args = get_args(NFS_COMMON_ARGS, path=export['paths'][0],
+                    access_zone='System', state='present')
+    result = perf_benchmark(
+        'nfs_existing_export_50k', cluster,
+        lambda: run_module(cluster, NfsExport, args, NFSHandler))
+    assert result['changed'] is False
+    assert result['NFS_export_details']['id'] == export['id']
+
+
+def test_smartquota_existing_quota(perf_benchmark, latency, quotas):
+    cluster = FakeCluster(latency, quotas=quotas)
+    quota = quotas[QUOTA_COUNT // 2]
+    args = get_args(MockSmartQuotaApi.SMART_QUOTA_COMMON_ARGS,
+                    path=quota['path'], access_zone='System',
+                    quota_type='directory', state='present')
+    result = perf_benchmark(
+        'smartquota_existing_quota_100k', cluster,
+        lambda: run_module(cluster, SmartQuota, args))
+    assert result['changed'] is False
+    assert result['quota_details']['id'] == quota['id']
+
+
+def test_snapshot_existing_snapshot(perf_benchmark, latency, snapshots):
+    cluster = FakeCluster(latency, snapshots=snapshots)
+    snapshot = snapshots[SNAPSHOT_COUNT // 2]
+    args = get_args(dict(snapshot_name=snapshot['name'],
+                         path=snapshot['path'], access_zone='System',
+                         new_snapshot_name=None, expiration_timestamp=None,
+                         desired_retention=None, retention_unit=None,
+                         alias=None, state='present', snapshots=None,
+                         max_workers=10))
+    result = perf_benchmark(
+        'snapshot_existing_snapshot_250k', cluster,
+        lambda: run_module(cluster, Snapshot, args))
+    assert result['changed'] is False
+    assert result['snapshot_details']['snapshots'][0]['id'] == \
+        snapshot['id']
+
+
+def test_snapshot_bulk_create(perf_benchmark, latency, snapshots):
+    cluster = FakeCluster(latency, snapshots=snapshots)
+    requested = [dict(snapshot_name='bulk_%04d' % index,
+                      path=generators.project_path(index),
+                      access_zone='System', alias=None)
+                 for index in range(250)]
+    requested.extend(dict(snapshot_name=snap['name'], path=snap['path'],
+                          access_zone='System', alias=None)
+                     for snap in snapshots[:250])
+    args = get_args(dict(snapshot_name=None, path=None, access_zone='System',
+                         new_snapshot_name=None, expiration_timestamp=None,
+                         desired_retention='2', retention_unit='days',
+                         alias=None, state='present', snapshots=requested,
+                         max_workers=10))
+    result = perf_benchmark(
+        'snapshot_bulk_create_250k', cluster,
+        lambda: run_module(cluster, Snapshot, args))
+    details = result['bulk_snapshot_details']
+    assert (len(details['created']), len(details['existing'])) == (250, 250)
+
+
+def test_benchmark_warns_on_wall_time(monkeypatch):
+    for name in ('POWERSCALE_PERF_TIMING', 'POWERSCALE_PERF_UPDATE',
+                 'POWERSCALE_PERF_THRESHOLD'):
+        monkeypatch.delenv(name, raising=False)
+    baseline = dict(api_calls=100, wall_time_s=1.0,
+                    peak_memory_bytes=92967028)
+    slower = dict(baseline, calls={}, wall_time_s=2.5)
+    benchmark = Benchmark(dict(info_smartquota_100k=baseline))
+    with pytest.warns(UserWarning, match='wall_time_s of 2.5 exceeds 1.55 '
+                                         r'\(baseline 1.0\) of the '
+                                         'info_smartquota_100k scenario'):
+        benchmark.check('info_smartquota_100k', slower)
+        with pytest.raises(AssertionError,
+                           match='101 API calls instead of 100'):
+            benchmark.check('info_smartquota_100k',
+                            dict(slower, api_calls=101))
@@ -0,0 +1,64 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the batch action plugin"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock.mock import MagicMock
+
+from ansible.errors import AnsibleActionFail
+from ansible_collections.dellemc.powerscale.plugins.action.batch \
+    import ActionModule
+
+
+def get_action(tmp_path, operations):
+    task = MagicMock()
+    task.args = dict(onefs_host='10.0.0.1', operations=operations)
+    task.async_val = 0
+    shared_loader_obj = MagicMock()
+
+    def find_plugin_with_context(name, collection_list=None):
+        path = tmp_path / (name.split('.')[-1] + '.py')
+        path.write_text(u'# %s\n' % name)
+        return MagicMock(resolved=True, plugin_resolved_path=str(path))
+    shared_loader_obj.module_loader.find_plugin_with_context.side_effect = \
+        find_plugin_with_context
+    action = ActionModule(task, MagicMock(), MagicMock(), MagicMock(),
+                          MagicMock(), shared_loader_obj)
+    action._shared_loader_obj = shared_loader_obj
+    action._execute_module = MagicMock(return_value=dict(changed=True))
+    return action
+
+
+def test_batch_action(tmp_path):
+    action = get_action(tmp_path, [
+        dict(module='filesystem', params=dict(path='/ifs/a')),
+        dict(module='dellemc.powerscale.nfs', params=dict(path='/ifs/a')),
+        dict(module='filesystem', params=dict(path='/ifs/b'))])
+    result = action.run(task_vars={})
+    assert result['changed'] is True
+    kwargs = action._execute_module.call_args[1]
+    assert kwargs['module_name'] == 'dellemc.powerscale.batch'
+    assert kwargs['module_args']['module_sources'] == dict(
+        filesystem=u'# dellemc.powerscale.filesystem\n',
+        nfs=u'# dellemc.powerscale.nfs\n')
+    assert kwargs['module_args']['onefs_host'] == '10.0.0.1'
+    assert 'module_sources' not in action._task.args
+
+
+@pytest.mark.parametrize('operations, error', [
+    ('filesystem', 'operations must be a list of operations'),
+    (['filesystem'], 'Operation 1 must be a dictionary'),
+    ([dict(module='info')], 'Module info of operation 1 cannot run in a '
+                            'batch')])
+def test_batch_action_invalid_operations(tmp_path, operations, error):
+    action = get_action(tmp_path, operations)
+    with pytest.raises(AnsibleActionFail) as exc:
+        action.run(task_vars={})
+    assert error in str(exc.value)
+    action._execute_module.assert_not_called()
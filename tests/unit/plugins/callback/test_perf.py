@@ -0,0 +1,83 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerScale perf callback plugin"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+
+from mock.mock import MagicMock
+
+from ansible_collections.dellemc.powerscale.plugins.callback import perf
+
+
+def get_perf(*calls):
+    return dict(version=1, calls=[
+        dict(cluster=cluster, method='GET', endpoint=endpoint,
+             count=len(latencies), errors=errors,
+             latency_ms=sum(latencies), latencies_ms=latencies,
+             payload_bytes=100 * len(latencies), retries=0)
+        for cluster, endpoint, latencies, errors in calls])
+
+
+def get_result(action, result):
+    return MagicMock(_task=MagicMock(resolved_action=action), _result=result)
+
+
+def get_callback(tmp_path):
+    options = dict(output_file=str(tmp_path / 'perf' / 'report.json'),
+                   top=10)
+    callback = perf.CallbackModule(display=MagicMock(verbosity=0))
+    callback.get_option = MagicMock(side_effect=options.get)
+    return callback
+
+
+def test_perf_callback(tmp_path):
+    callback = get_callback(tmp_path)
+    play = MagicMock()
+    play.get_name.return_value = 'Provision'
+    callback.v2_playbook_on_play_start(play)
+    callback.v2_runner_on_ok(get_result(
+        'dellemc.powerscale.filesystem', dict(perf=get_perf(
+            ('10.0.0.1', '/platform/3/zones', [10.0, 20.0], 0),
+            ('10.0.0.1', '/namespace/{NamespacePath}', [5.0], 1)))))
+    callback.v2_runner_on_failed(get_result(
+        'dellemc.powerscale.nfs', dict(results=[
+            dict(perf=get_perf(('10.0.0.2', '/platform/3/zones',
+                                [float(latency) for latency in
+                                 range(1, 101)], 0))),
+            dict(skipped=True)])))
+    callback.v2_runner_on_ok(get_result('ansible.builtin.debug', dict()))
+    callback.v2_playbook_on_stats(MagicMock())
+
+    with open(str(tmp_path / 'perf' / 'report.json')) as report_file:
+        reports = json.load(report_file)['plays']
+    assert len(reports) == 1 and reports[0]['play'] == 'Provision'
+    assert reports[0]['tasks'] == 2
+    endpoints = reports[0]['endpoints']
+    assert [row['name'] for row in endpoints] == [
+        'GET /platform/3/zones', 'GET /namespace/{NamespacePath}']
+    assert (endpoints[0]['requests'], endpoints[0]['p50_ms'],
+            endpoints[0]['p90_ms'], endpoints[0]['p99_ms'],
+            endpoints[0]['max_ms'], endpoints[0]['payload_bytes']) == \
+        (102, 49.0, 90.0, 99.0, 100.0, 10200)
+    assert [(row['name'], row['requests'], row['errors'])
+            for row in reports[0]['modules']] == [
+        ('dellemc.powerscale.nfs', 100, 0),
+        ('dellemc.powerscale.filesystem', 3, 1)]
+    assert [row['name'] for row in reports[0]['clusters']] == [
+        '10.0.0.2', '10.0.0.1']
+    callback._display.banner.assert_called_once_with(
+        'POWERSCALE API PERF: Provision')
+
+
+def test_perf_callback_without_requests(tmp_path):
+    callback = get_callback(tmp_path)
+    callback.v2_runner_on_ok(get_result('ansible.builtin.debug', dict()))
+    callback.v2_playbook_on_stats(MagicMock())
+    assert not (tmp_path / 'perf').exists()
+    callback._display.banner.assert_not_called()
@@ -0,0 +1,174 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerScale httpapi plugin"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from mock.mock import MagicMock, patch
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.powerscale.plugins.httpapi.powerscale \
+    import HttpApi
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import persistent_connection
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+
+
+class MockPapiHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, body=None, headers=None):
+        data = json.dumps(body).encode() if body is not None else b''
+        self.send_response(status)
+        for name, value in (headers or []):
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def handle_request(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        server.requests.append(dict(method=self.command, path=self.path,
+                                    port=self.client_address[1],
+                                    cookie=self.headers.get('Cookie'),
+                                    csrf=self.headers.get('X-CSRF-Token'),
+                                    body=body.decode()))
+        if self.path.startswith('/session/1/session'):
+            if self.command == 'POST':
+                credentials = json.loads(body)
+                if credentials['password'] != 'password':
+                    return self.reply(401, dict(message='Unauthorized'))
+                server.sessions += 1
+                return self.reply(201, dict(services=['platform']), [
+                    ('Set-Cookie', 'isisessid=session%d; path=/; HttpOnly'
+                     % server.sessions),
+                    ('Set-Cookie', 'isicsrf=csrf%d; path=/' % server.sessions)])
+            return self.reply(204)
+        if self.headers.get('Cookie') != 'isisessid=session%d' \
+                % server.sessions:
+            return self.reply(401, dict(message='Session expired'))
+        if self.path == '/platform/1/cluster/config':
+            return self.reply(200, dict(onefs_version=dict(release='9.10.0.0')))
+        if self.path.startswith('/platform/3/zones'):
+            return self.reply(200, dict(zones=[dict(name='System')]))
+        return self.reply(404, dict(errors=[dict(message='Not found')]))
+
+    do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+
+@pytest.fixture
+def papi_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockPapiHandler)
+    server.requests = []
+    server.sessions = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get_httpapi(server, password='password'):
+    options = dict(host='127.0.0.1', port=server.server_address[1],
+                   use_ssl=False, validate_certs=False,
+                   persistent_command_timeout=5)
+    connection = MagicMock()
+    connection.get_option.side_effect = lambda name: options.get(name)
+    httpapi = HttpApi(connection)
+    httpapi.login('admin', password)
+    return httpapi
+
+
+def test_session_login_and_keep_alive(papi_server):
+    httpapi = get_httpapi(papi_server)
+    for resume in ('1', '2'):
+        response = httpapi.send_request('GET', '/platform/3/zones',
+                                        [['resume', resume]])
+        assert response['status'] == 200
+        assert json.loads(response['data'])['zones'][0]['name'] == 'System'
+    assert httpapi.get_onefs_version()['release'] == '9.10.0.0'
+    assert httpapi.get_onefs_version()['release'] == '9.10.0.0'
+
+    requests = papi_server.requests
+    assert [request['method'] for request in requests] == \
+        ['POST', 'GET', 'GET', 'GET']
+    assert requests[1]['path'] == '/platform/3/zones?resume=1'
+    assert all(request['cookie'] == 'isisessid=session1' and
+               request['csrf'] == 'csrf1' for request in requests[1:])
+    # All the requests are sent on the same keep-alive connection
+    assert len(set(request['port'] for request in requests)) == 1
+
+    httpapi.logout()
+    assert papi_server.requests[-1]['method'] == 'DELETE'
+    assert httpapi.session_id is None and not httpapi.idle_connections
+
+
+def test_session_expired(papi_server):
+    httpapi = get_httpapi(papi_server)
+    papi_server.sessions += 1
+    response = httpapi.send_request('PUT', '/platform/3/zones/System',
+                                    body=dict(path='/ifs'))
+    assert response['status'] == 200
+    assert httpapi.session_id == 'session3'
+    assert [request['method'] for request in papi_server.requests] == \
+        ['POST', 'PUT', 'POST', 'PUT']
+    assert json.loads(papi_server.requests[-1]['body']) == dict(path='/ifs')
+
+
+def test_login_failure(papi_server):
+    with pytest.raises(ConnectionError) as error:
+        get_httpapi(papi_server, password='wrong')
+    assert 'Login to the PowerScale cluster failed with status 401' in \
+        str(error.value)
+
+
+def test_stale_keep_alive_connection(papi_server):
+    httpapi = get_httpapi(papi_server)
+    httpapi.idle_connections[0].sock.close()
+    response = httpapi.send_request('GET', '/platform/3/zones')
+    assert response['status'] == 200
+
+
+def test_persistent_rest_client():
+    with patch.object(persistent_connection, 'Connection') as connection:
+        send_request = connection.return_value.send_request
+        send_request.side_effect = [
+            dict(status=200, reason='OK', data='{"zones": []}',
+                 headers={'Content-Length': '13'}),
+            dict(status=404, reason='Not Found', data='{}', headers={})]
+        rest_client = persistent_connection.PersistentRestClient(
+            '/tmp/socket', MockApiException)
+        response = rest_client.GET(
+            'https://10.0.0.1:8080/platform/3/zones',
+            query_params=[('resume', 'abc')],
+            headers={'Authorization': 'Basic abc', 'Accept': 'application/json'})
+        assert response.data == '{"zones": []}'
+        assert response.getheader('content-length') == '13'
+        send_request.assert_called_with(
+            'GET', '/platform/3/zones', [['resume', 'abc']], None,
+            {'Accept': 'application/json'})
+
+        def get_exception(http_resp):
+            return MockApiException(http_resp.status, http_resp.data)
+        rest_client.api_exception = get_exception
+        with pytest.raises(MockApiException) as error:
+            rest_client.DELETE('https://10.0.0.1:8080/platform/3/zones/test',
+                               body=None)
+        assert error.value.status == 404
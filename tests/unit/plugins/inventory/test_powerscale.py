@@ -0,0 +1,152 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerScale inventory plugin"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock.mock import MagicMock, patch
+
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible_collections.dellemc.powerscale.plugins.inventory import powerscale
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response \
+    import MockSDKResponse
+
+try:
+    from ansible.template import trust_as_template
+except ImportError:
+    def trust_as_template(value):
+        return value
+
+TOPOLOGY = dict(
+    nodes=[dict(id=1, lnn=1, status='OK'), dict(id=2, lnn=2, status='OK'),
+           dict(id=3, lnn=3, status='DOWN')],
+    access_zones=[dict(name='System', id='System', path='/ifs'),
+                  dict(name='sample-zone', id='sample-zone',
+                       path='/ifs/sample')],
+    groupnets=[dict(id='groupnet0', name='groupnet0')],
+    subnets=[dict(id='groupnet0.subnet0', name='subnet0',
+                  groupnet='groupnet0')],
+    network_pools=[dict(id='groupnet0.subnet0.pool0', name='pool0',
+                        groupnet='groupnet0', subnet='subnet0',
+                        access_zone='sample-zone',
+                        sc_dns_zone='data.example.com'),
+                   dict(id='groupnet0.subnet0.pool1', name='pool1',
+                        groupnet='groupnet0', subnet='subnet0',
+                        access_zone='System', sc_dns_zone='')],
+    node_pools=[dict(id=1, name='h500', lnns=[1, 2]),
+                dict(id=2, name='a200', lnns=[3])],
+)
+
+
+def get_sdk(topology, failed_query=None):
+    isi_sdk = MagicMock()
+    for query, (api_name, method, key) in \
+            powerscale.TOPOLOGY_QUERIES.items():
+        api_method = getattr(getattr(isi_sdk, api_name).return_value, method)
+        if query == failed_query:
+            api_method.side_effect = Exception('SDK Error message')
+        else:
+            api_method.return_value = MockSDKResponse(
+                {key: topology[query]})
+    return isi_sdk
+
+
+@pytest.fixture
+def inventory_plugin():
+    plugin = powerscale.InventoryModule()
+    options = dict(clusters=[dict(name='cluster1', onefs_host='10.0.0.1',
+                                  api_user='admin', api_password='password')],
+                   max_workers=4, cache=True, strict=False, compose={},
+                   groups={}, keyed_groups=[
+                       dict(key=trust_as_template('powerscale_node.status'),
+                            prefix='node')])
+    plugin.get_option = MagicMock(side_effect=options.get)
+    plugin._read_config_data = MagicMock()
+    plugin._cache = {}
+    plugin.display = MagicMock()
+    return plugin
+
+
+def parse(plugin, cache=False):
+    inventory = InventoryData()
+    plugin.parse(inventory, DataLoader(), 'cluster.powerscale.yml',
+                 cache=cache)
+    return inventory
+
+
+def get_hosts(inventory, group):
+    return sorted(host.name for host in
+                  inventory.groups[group].get_hosts())
+
+
+def test_verify_file(inventory_plugin, tmp_path):
+    for name, valid in (('cluster.powerscale.yml', True),
+                        ('powerscale.yaml', True), ('hosts.yml', False)):
+        path = tmp_path / name
+        path.write_text(u'plugin: dellemc.powerscale.powerscale\n')
+        assert inventory_plugin.verify_file(str(path)) is valid
+
+
+def test_populate_inventory(inventory_plugin):
+    with patch.object(powerscale, 'get_controller_connection',
+                      return_value=(get_sdk(TOPOLOGY), MagicMock())):
+        inventory = parse(inventory_plugin)
+
+    assert get_hosts(inventory, 'cluster1_nodes') == \
+        ['cluster1-node-1', 'cluster1-node-2', 'cluster1-node-3']
+    assert get_hosts(inventory, 'cluster1_nodepool_h500') == \
+        ['cluster1-node-1', 'cluster1-node-2']
+    assert get_hosts(inventory, 'node_DOWN') == ['cluster1-node-3']
+    assert get_hosts(inventory, 'cluster1_access_zones') == \
+        ['cluster1-zone-System', 'cluster1-zone-sample-zone']
+    assert get_hosts(inventory, 'cluster1_zone_sample_zone') == \
+        ['cluster1-zone-sample-zone', 'data.example.com']
+    assert get_hosts(inventory, 'cluster1_subnet_groupnet0_subnet0') == \
+        ['cluster1-pool-groupnet0.subnet0.pool1', 'data.example.com']
+    assert 'cluster1_subnet_groupnet0_subnet0' in \
+        inventory.groups['cluster1_groupnet_groupnet0'].child_groups[0].name
+    assert set(group.name for group in
+               inventory.groups['cluster1'].child_groups) >= \
+        set(['cluster1_nodes', 'cluster1_access_zones',
+             'cluster1_network_pools', 'cluster1_groupnet_groupnet0'])
+
+    host_vars = inventory.get_host('data.example.com').vars
+    assert host_vars['powerscale_cluster'] == 'cluster1'
+    assert host_vars['powerscale_onefs_host'] == '10.0.0.1'
+    assert host_vars['powerscale_network_pool']['name'] == 'pool0'
+    assert inventory.get_host('cluster1-node-2').vars['powerscale_lnn'] == 2
+
+
+def test_inventory_cache(inventory_plugin):
+    with patch.object(powerscale, 'get_controller_connection',
+                      return_value=(get_sdk(TOPOLOGY), MagicMock())) \
+            as connection:
+        parse(inventory_plugin, cache=False)
+        inventory = parse(inventory_plugin, cache=True)
+    assert connection.call_count == 1
+    assert len(get_hosts(inventory, 'cluster1_nodes')) == 3
+
+
+def test_inventory_request_failure(inventory_plugin):
+    with patch.object(powerscale, 'get_controller_connection',
+                      return_value=(get_sdk(TOPOLOGY, 'node_pools'),
+                                    MagicMock())):
+        inventory = parse(inventory_plugin, cache=False)
+    assert len(get_hosts(inventory, 'cluster1_nodes')) == 3
+    assert 'cluster1_nodepool_h500' not in inventory.groups
+    assert 'Getting node pools of PowerScale cluster cluster1 failed' in \
+        inventory_plugin.display.warning.call_args[0][0]
+    assert inventory_plugin._cache == {}
+
+    with patch.object(powerscale, 'get_controller_connection',
+                      side_effect=ValueError('isilon-sdk is not installed')):
+        inventory = parse(inventory_plugin, cache=False)
+    assert get_hosts(inventory, 'cluster1_nodes') == []
+    assert 'Skipping PowerScale cluster cluster1: isilon-sdk is not ' \
+        'installed' == inventory_plugin.display.warning.call_args[0][0]
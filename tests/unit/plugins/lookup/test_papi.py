@@ -0,0 +1,163 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerScale papi lookup plugin"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import threading
+import time
+
+import pytest
+from mock.mock import MagicMock, patch
+
+from ansible.errors import AnsibleLookupError
+from ansible_collections.dellemc.powerscale.plugins.lookup import papi
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.query_cache \
+    import QueryCache
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response \
+    import MockSDKResponse
+
+CLUSTER = dict(onefs_host='10.0.0.1', port_no='8080', verify_ssl=False,
+               api_user='admin', api_password='password')
+
+
+@pytest.fixture
+def isi_sdk():
+    isi_sdk = MagicMock()
+    isi_sdk.ZonesSummaryApi.return_value.get_zones_summary_zone\
+        .return_value = MockSDKResponse(dict(summary=dict(path='/ifs/sample')))
+    isi_sdk.ProtocolsApi.return_value.list_nfs_exports.return_value = \
+        MockSDKResponse(dict(exports=[dict(id=12, paths=['/ifs/data'])],
+                             total=1))
+    isi_sdk.ProtocolsApi.return_value.get_smb_share.side_effect = \
+        MockApiException(404)
+    isi_sdk.QuotaApi.return_value.list_quota_quotas.return_value = \
+        MockSDKResponse(dict(quotas=[dict(usage=dict(logical=2048))]))
+    with patch.object(papi, 'CACHE', QueryCache()), \
+            patch.object(papi, 'CONNECTIONS', {}), \
+            patch.object(utils, 'ApiException', MockApiException), \
+            patch.object(papi, 'get_controller_connection',
+                         return_value=(isi_sdk, MagicMock())):
+        yield isi_sdk
+
+
+def lookup(terms, cache_dir=None, **kwargs):
+    options = dict(CLUSTER, access_zone='System', cache_ttl=60,
+                   cache_size=256, cache_dir=cache_dir)
+    options.update(kwargs)
+    plugin = papi.LookupModule()
+    plugin.set_options = MagicMock()
+    plugin.get_option = MagicMock(side_effect=options.get)
+    return plugin.run(terms)
+
+
+def test_papi_queries(isi_sdk, tmp_path):
+    cache_dir = str(tmp_path)
+    assert lookup(['zone_base_path'], cache_dir,
+                  access_zone='sample') == ['/ifs/sample']
+    assert lookup(['nfs_export_id', 'quota_usage', 'smb_share_path'],
+                  cache_dir, path='/ifs/data/', share_name='data') == \
+        [12, dict(logical=2048), None]
+    isi_sdk.ProtocolsApi.return_value.list_nfs_exports.assert_called_with(
+        path='/ifs/data', zone='System')
+    isi_sdk.QuotaApi.return_value.list_quota_quotas.assert_called_with(
+        path='/ifs/data/', type='directory')
+
+    # The results are kept for the time to live
+    assert lookup(['nfs_export_id'], cache_dir, path='/ifs/data/') == [12]
+    assert lookup(['zone_base_path'], cache_dir,
+                  access_zone='sample') == ['/ifs/sample']
+    assert isi_sdk.ProtocolsApi.return_value.list_nfs_exports.call_count == 1
+    assert papi.get_controller_connection.call_count == 1
+    assert papi.CACHE.hits == 2
+
+
+def test_papi_query_errors(isi_sdk):
+    with pytest.raises(AnsibleLookupError) as error:
+        lookup(['zone_details'])
+    assert 'Unknown PowerScale query zone_details' in str(error.value)
+
+    with pytest.raises(AnsibleLookupError) as error:
+        lookup(['quota_usage'])
+    assert 'path is required for the quota_usage query' in str(error.value)
+
+    isi_sdk.ProtocolsApi.return_value.get_smb_share.side_effect = \
+        MockApiException(500)
+    with pytest.raises(AnsibleLookupError) as error:
+        lookup(['smb_share_path'], share_name='data')
+    assert 'PowerScale query smb_share_path failed with error: Fetching ' \
+        'SMB share data failed with error: SDK Error message' == \
+        str(error.value)
+
+
+def test_papi_quota_usage_error_not_cached(isi_sdk, tmp_path):
+    cache_dir = str(tmp_path)
+    list_quota_quotas = isi_sdk.QuotaApi.return_value.list_quota_quotas
+    list_quota_quotas.side_effect = [
+        MockApiException(500), MockSDKResponse(dict(quotas=[]))]
+    with pytest.raises(AnsibleLookupError) as error:
+        lookup(['quota_usage'], cache_dir, path='/ifs/data')
+    assert 'PowerScale query quota_usage failed with error: Fetching ' \
+        'directory quota of path /ifs/data failed with error: SDK Error ' \
+        'message' == str(error.value)
+
+    # The failure is neither cached in memory nor shared through the
+    # cache directory, the next lookup queries the cluster again
+    assert lookup(['quota_usage'], cache_dir, path='/ifs/data') == [None]
+    assert list_quota_quotas.call_count == 2
+
+
+def test_query_cache_ttl_and_lru():
+    cache = QueryCache(max_size=2)
+    fetch = MagicMock(side_effect=lambda: fetch.call_count)
+    assert cache.get(['a'], fetch, ttl=60) == 1
+    assert cache.get(['a'], fetch, ttl=60) == 1
+    assert cache.get(['b'], fetch, ttl=60) == 2
+    assert cache.get(['c'], fetch, ttl=60) == 3
+    # The least recently used result is evicted
+    assert cache.get(['a'], fetch, ttl=60) == 4
+    assert cache.get(['c'], fetch, ttl=60) == 3
+    assert cache.get(['d'], fetch, ttl=0) == 5
+    assert cache.get(['d'], fetch, ttl=0) == 6
+    assert (cache.hits, cache.misses) == (2, 6)
+
+
+@pytest.mark.parametrize('shared', [False, True])
+def test_query_cache_concurrent_queries(tmp_path, shared):
+    # Separate caches sharing a directory stand in for the forks of a run
+    caches = [QueryCache() for _index in range(4)] if shared \
+        else [QueryCache()] * 4
+    cache_dir = str(tmp_path) if shared else None
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return dict(path='/ifs/sample')
+
+    results = []
+    threads = [threading.Thread(target=lambda cache=cache: results.append(
+        cache.get(['cluster', 'zone_base_path'], fetch, 60, cache_dir)))
+        for cache in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [dict(path='/ifs/sample')] * 4
+    assert len(calls) == 1
+
+
+def test_query_cache_failed_fetch():
+    cache = QueryCache()
+    fetch = MagicMock(side_effect=[ValueError('Session expired'), 'value'])
+    with pytest.raises(ValueError):
+        cache.get(['a'], fetch)
+    assert cache.get(['a'], fetch) == 'value'
@@ -8,6 +8,14 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import copy
+import threading
+import time
+
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response import (
+    MockSDKResponse,
+)
+
 MODULE_UTILS_PATH = (
     "ansible_collections.dellemc.powerscale.plugins.modules.accesszone.utils"
 )
@@ -192,6 +200,35 @@ SMB_SHARE_SETTINGS = {
 }
 
 
+class ConcurrentGetter:
+    """Callable returning the settings of a zone after a delay and tracking
+    the number of calls in flight"""
+
+    def __init__(self, responses, latency=0.0, missing_exception=None):
+        self.responses = responses
+        self.latency = latency
+        self.missing_exception = missing_exception
+        self.calls = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, zone_id=None, zone=None):
+        name = zone_id or zone
+        with self.lock:
+            self.calls.append(name)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            if name not in self.responses:
+                raise self.missing_exception
+            return MockSDKResponse(copy.deepcopy(self.responses[name]))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
 class ProviderSummary:
     def __init__(self, id, name, type):
         self.id = id
@@ -205,6 +242,7 @@ def get_error_message(response_type, az_name=None):
         "create_zone_without_path_exception": "Provide a valid path to create an access zone",
         "delete_zone_exception": "Failed to delete access zone",
         "get_zone_exception": f"Get details of access zone {az_name} failed with error:",
+        "az_names_state_exception": "az_names can only be used to get the details of access zones with state present",
         "provider_type_no_exist_exception": "Provider: System of type: file does not exist",
         "add_provider_exception": f"Add auth providers to access zone {az_name} failed with error:",
         "remove_provider_exception": f"Remove auth providers to access zone {az_name} failed with error:",
@@ -8,6 +8,9 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response \
+    import MockSDKResponse
+
 
 class MockGatherfactsApi:
     MODULE_PATH = 'ansible_collections.dellemc.powerscale.plugins.modules.info.Info.'
@@ -90,7 +93,8 @@ class MockGatherfactsApi:
         'alert_rules': [],
         'alert_channels': [],
         'alert_categories': [],
-        'event_groups': []
+        'event_groups': [],
+        'event_group_occurrences': []
     }
     API = "api"
     MODULE = "module"
@@ -1447,6 +1451,41 @@ class MockGatherfactsApi:
         else:
             return "Fetching alert rules failed with erro"
 
+    @staticmethod
+    def make_event_group_occurrences(count, begin=1700000000):
+        return [{"id": "3.%d" % (index + 1),
+                 "time_noticed": begin + index // 2,
+                 "last_event": begin + index // 2 + 30,
+                 "severity": "critical" if index % 5 == 0 else "warning",
+                 "resolved": False,
+                 "causes": [["ONGOING"]]}
+                for index in range(count)]
+
+    @staticmethod
+    def get_event_group_occurrence_pages(occurrences, page_size):
+        """Callable listing occurrences at or after begin in pages"""
+        calls = []
+
+        def get_event_eventgroup_occurrences(**query):
+            calls.append(query)
+            if 'resume' in query:
+                offset = int(query['resume'])
+                matched = pages['matched']
+            else:
+                matched = [occurrence for occurrence in occurrences
+                           if occurrence['time_noticed'] >= query.get('begin', 0)]
+                pages['matched'] = matched
+                offset = 0
+            page = matched[offset:offset + page_size]
+            resume = str(offset + page_size) \
+                if offset + page_size < len(matched) else None
+            return MockSDKResponse({"eventgroups": page, "resume": resume,
+                                    "total": len(matched)})
+
+        pages = {}
+        get_event_eventgroup_occurrences.calls = calls
+        return get_event_eventgroup_occurrences
+
     @staticmethod
     def get_event_groups(response_type):
         if response_type == "api" or response_type == "module":
@@ -9,6 +9,9 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response \
+    import MockSDKResponse
+
 
 MODULE_UTILS_PATH = ('ansible_collections.dellemc.powerscale.'
                      'plugins.modules.job.utils')
@@ -29,6 +32,10 @@ COMMON_ARGS = {
     "wait": False,
     "wait_timeout": 300,
     "wait_interval": 10,
+    "wait_max_interval": 60,
+    "wait_max_errors": 3,
+    "jobs": None,
+    "max_running_per_type": None,
     "state": "present"
 }
 
@@ -143,6 +150,16 @@ JOB_MODIFIED_POLICY = {
     }]
 }
 
+JOB_PHASE_2 = {
+    "jobs": [dict(JOB_CREATED["jobs"][0], progress="Processed 120 LINs; 60% complete",
+                  current_phase=2, total_phases=2)]
+}
+
+JOB_SUCCEEDED_PHASES = {
+    "jobs": [dict(JOB_CREATED["jobs"][0], state="succeeded", progress=None,
+                  current_phase=2, total_phases=2, end_time=1700010600)]
+}
+
 JOBS_LIST_EMPTY = {"jobs": [], "resume": None}
 JOBS_LIST_WITH_RUNNING = {"jobs": [JOB_RUNNING["jobs"][0]], "resume": None}
 
@@ -185,3 +202,46 @@ def wrong_state_error_msg():
 
 def wait_timeout_msg():
     return 'timed out'
+
+
+class FakeJobEngine(object):
+    """Job Engine which completes every job after a number of listings"""
+
+    def __init__(self, jobs=None, ticks_to_complete=2, page_size=2):
+        self.jobs = [dict(job) for job in jobs or []]
+        self.ticks_to_complete = ticks_to_complete
+        self.page_size = page_size
+        self.ages = {}
+        self.next_id = 100
+        self.max_active = {}
+
+    def create_job_job(self, body):
+        job_id = self.next_id
+        self.next_id += 1
+        self.jobs.append({"id": job_id, "type": body.type, "state": "running",
+                          "paths": body.paths})
+        self.ages[job_id] = 0
+        self.track_active()
+        return MockSDKResponse({"id": job_id})
+
+    def track_active(self):
+        counts = {}
+        for job in self.jobs:
+            if job["state"] == "running":
+                counts[job["type"]] = counts.get(job["type"], 0) + 1
+        for job_type, count in counts.items():
+            self.max_active[job_type] = max(self.max_active.get(job_type, 0), count)
+
+    def list_job_jobs(self, resume=None):
+        start = int(resume or 0)
+        if start == 0:
+            for job in self.jobs:
+                if job["id"] in self.ages and job["state"] == "running":
+                    self.ages[job["id"]] += 1
+                    if self.ages[job["id"]] > self.ticks_to_complete:
+                        job["state"] = "succeeded"
+        page = self.jobs[start:start + self.page_size]
+        next_start = start + self.page_size
+        return MockSDKResponse({
+            "jobs": [dict(job) for job in page],
+            "resume": str(next_start) if next_start < len(self.jobs) else None})
@@ -8,6 +8,12 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import threading
+import time
+
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response \
+    import MockSDKResponse
+
 
 MODULE_UTILS_PATH = ('ansible_collections.dellemc.powerscale.'
                      'plugins.modules.job_event_info.utils')
@@ -17,6 +23,7 @@ COMMON_ARGS = {
     "api_user": "admin",
     "api_password": "test_password",
     "verify_ssl": False,
+    "port_no": "8080",
     "state": None,
     "begin_time": None,
     "end_time": None,
@@ -25,47 +32,52 @@ COMMON_ARGS = {
     "job_type": None,
     "event_key": None,
     "ended_jobs_only": None,
-    "limit": None
+    "limit": None,
+    "parallel_windows": 1,
+    "max_workers": 10,
+    "max_items": None,
+    "output_file": None,
+    "cursor_file": None
 }
 
 EVENT_1 = {
-    "id": "event_456",
+    "id": 456,
     "job_id": 42,
     "job_type": "SmartPools",
-    "state": "running",
-    "event_key": "job_started",
-    "timestamp": 1700000000,
-    "message": "Job started successfully"
+    "key": "job_state",
+    "value": "running",
+    "phase": 1,
+    "time": 1700000000
 }
 
 EVENT_2 = {
-    "id": "event_457",
+    "id": 457,
     "job_id": 42,
     "job_type": "SmartPools",
-    "state": "succeeded",
-    "event_key": "job_complete",
-    "timestamp": 1700001000,
-    "message": "Job completed successfully"
+    "key": "job_state",
+    "value": "succeeded",
+    "phase": 2,
+    "time": 1700001000
 }
 
 EVENT_3 = {
-    "id": "event_458",
+    "id": 458,
     "job_id": 43,
     "job_type": "TreeDelete",
-    "state": "running",
-    "event_key": "phase_start",
-    "timestamp": 1700002000,
-    "message": "Phase started"
+    "key": "job_state",
+    "value": "running",
+    "phase": 1,
+    "time": 1700002000
 }
 
 EVENT_4 = {
-    "id": "event_459",
+    "id": 459,
     "job_id": 43,
     "job_type": "TreeDelete",
-    "state": "failed",
-    "event_key": "job_failed",
-    "timestamp": 1700003000,
-    "message": "Job failed due to permission error"
+    "key": "job_state",
+    "value": "failed",
+    "phase": 1,
+    "time": 1700003000
 }
 
 EVENTS_ALL = {"events": [EVENT_1, EVENT_2, EVENT_3, EVENT_4], "resume": None}
@@ -78,6 +90,63 @@ EVENTS_PAGE1 = {"events": [EVENT_1, EVENT_2], "resume": "token_abc"}
 EVENTS_PAGE2 = {"events": [EVENT_3, EVENT_4], "resume": None}
 EVENTS_TIME_RANGE = {"events": [EVENT_1, EVENT_2], "resume": None}
 
+WINDOW_BEGIN = 1700000000
+
+
+def make_events(count, begin=WINDOW_BEGIN, step=60):
+    """Events one step apart starting at begin"""
+    return [{"id": index + 1,
+             "job_id": index // 10 + 1,
+             "job_type": "SmartPools",
+             "key": "phase_progress",
+             "value": "running",
+             "phase": 1,
+             "time": begin + index * step}
+            for index in range(count)]
+
+
+class WindowedPager(object):
+    """
+    Callable standing in for get_job_events and get_job_reports. Filters
+    the records by the begin and exclusive end query arguments and returns
+    them in time order in pages of at most page_size records.
+    """
+
+    def __init__(self, records, records_key, page_size=100, latency=0):
+        self.records = sorted(records, key=lambda record: record['time'])
+        self.records_key = records_key
+        self.page_size = page_size
+        self.latency = latency
+        self.calls = []
+        self.cursors = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, **query):
+        with self.lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self.calls.append(query)
+            if query.get('resume'):
+                matched, offset = self.cursors.pop(query['resume'])
+            else:
+                matched = [record for record in self.records
+                           if query.get('begin', 0) <= record['time'] <
+                           query.get('end', float('inf'))]
+                offset = 0
+            size = min(query.get('limit') or self.page_size, self.page_size)
+            page = matched[offset:offset + size]
+            resume = None
+            if offset + size < len(matched):
+                resume = 'resume-%d' % len(self.calls)
+                self.cursors[resume] = (matched, offset + size)
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            self.in_flight -= 1
+        return MockSDKResponse({self.records_key: page, "resume": resume})
+
 
 def get_events_failed_msg():
     return 'Failed to get job events'
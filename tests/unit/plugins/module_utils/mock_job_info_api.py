@@ -8,6 +8,12 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import threading
+import time
+
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response \
+    import MockSDKResponse
+
 
 MODULE_UTILS_PATH = ('ansible_collections.dellemc.powerscale.'
                      'plugins.modules.job_info.utils')
@@ -117,6 +123,65 @@ JOB_SUMMARY = {
     "total_jobs": 156
 }
 
+JOB_STATES = ['running', 'paused_user', 'paused_system', 'paused_policy',
+              'paused_priority']
+JOB_TYPES = ['SmartPools', 'TreeDelete', 'FSAnalyze', 'MultiScan']
+
+
+def make_jobs(count):
+    """Jobs spread evenly over the active states and job types"""
+    return [{"id": index + 1,
+             "type": JOB_TYPES[index % len(JOB_TYPES)],
+             "state": JOB_STATES[index % len(JOB_STATES)],
+             "priority": index % 10 + 1,
+             "start_time": 1700000000 + index}
+            for index in range(count)]
+
+
+class PagedJobLister(object):
+    """
+    Callable standing in for list_job_jobs. Filters by state, sorts, and
+    returns pages of at most page_size jobs with resume tokens.
+    """
+
+    def __init__(self, jobs, page_size=1000, latency=0):
+        self.jobs = jobs
+        self.page_size = page_size
+        self.latency = latency
+        self.calls = []
+        self.cursors = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, **query):
+        with self.lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self.calls.append(query)
+            if query.get('resume'):
+                matched, offset, size = self.cursors.pop(query['resume'])
+            else:
+                matched = [job for job in self.jobs
+                           if not query.get('state') or
+                           job['state'] == query['state']]
+                if query.get('sort'):
+                    matched.sort(key=lambda job: job[query['sort']],
+                                 reverse=query.get('dir') == 'DESC')
+                offset = 0
+                size = min(query.get('limit') or self.page_size,
+                           self.page_size)
+            page = matched[offset:offset + size]
+            resume = None
+            if offset + size < len(matched):
+                resume = 'resume-%d' % len(self.calls)
+                self.cursors[resume] = (matched, offset + size, size)
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            self.in_flight -= 1
+        return MockSDKResponse({"jobs": page, "resume": resume})
+
 
 def get_job_by_id_failed_msg():
     return 'Failed to get job details'
@@ -17,6 +17,7 @@ COMMON_ARGS = {
     "api_user": "admin",
     "api_password": "test_password",
     "verify_ssl": False,
+    "port_no": "8080",
     "job_type": None,
     "job_id": None,
     "event_key": None,
@@ -24,37 +25,46 @@ COMMON_ARGS = {
     "end": None,
     "last_phase_only": None,
     "verbose": None,
-    "limit": None
+    "limit": None,
+    "parallel_windows": 1,
+    "max_workers": 10,
+    "max_items": None,
+    "output_file": None,
+    "cursor_file": None,
+    "aggregate": False
 }
 
 REPORT_1 = {
-    "id": "report_123",
+    "id": 123,
     "job_id": 42,
     "job_type": "SmartPools",
-    "event_key": "phase_complete",
-    "phase": "analyze",
-    "timestamp": 1700000000,
-    "statistics": {"files_processed": 10000, "errors": 0, "warnings": 5}
+    "key": "phase_complete",
+    "value": "LINs processed: 10000",
+    "status": "running",
+    "phase": 1,
+    "time": 1700000000
 }
 
 REPORT_2 = {
-    "id": "report_124",
+    "id": 124,
     "job_id": 42,
     "job_type": "SmartPools",
-    "event_key": "job_complete",
-    "phase": "finalize",
-    "timestamp": 1700001000,
-    "statistics": {"files_processed": 10000, "errors": 0, "warnings": 0}
+    "key": "job_complete",
+    "value": "LINs processed: 10000",
+    "status": "succeeded",
+    "phase": 2,
+    "time": 1700001000
 }
 
 REPORT_3 = {
-    "id": "report_125",
+    "id": 125,
     "job_id": 43,
     "job_type": "TreeDelete",
-    "event_key": "phase_complete",
-    "phase": "delete",
-    "timestamp": 1700002000,
-    "statistics": {"files_processed": 500, "errors": 1, "warnings": 0}
+    "key": "phase_complete",
+    "value": "LINs processed: 500",
+    "status": "failed",
+    "phase": 1,
+    "time": 1700002000
 }
 
 REPORTS_ALL = {"reports": [REPORT_1, REPORT_2, REPORT_3], "resume": None}
@@ -69,5 +79,46 @@ REPORTS_PAGE1 = {"reports": [REPORT_1, REPORT_2], "resume": "token_xyz"}
 REPORTS_PAGE2 = {"reports": [REPORT_3], "resume": None}
 
 
+def make_reports(count, begin=1700000000, step=60):
+    """Phase reports one step apart starting at begin"""
+    return [{"id": index + 1,
+             "job_id": index // 4 + 1,
+             "job_type": "SmartPools",
+             "key": "phase_complete",
+             "value": "LINs processed: 100",
+             "status": "running",
+             "phase": index % 4 + 1,
+             "time": begin + index * step}
+            for index in range(count)]
+
+
+def make_phase_reports(job_count, begin=1700000000):
+    """Verbose reports of two phases of jobs of two job types with known
+    runtimes and failures. Each phase reports its start, then the LINs and
+    bytes processed at its end."""
+    reports = []
+    for job in range(job_count):
+        job_start = begin + job * 1000
+        status = "failed" if job % 50 == 1 else "running"
+        for phase in (1, 2):
+            start = job_start + (phase - 1) * 100
+            runtime = job % 50 + phase
+            for key, value, offset in (
+                    ("Phase started", "Phase %d" % phase, 0),
+                    ("LINs processed", str(runtime * 10), runtime),
+                    ("Bytes processed", str(runtime * 4096), runtime)):
+                reports.append({
+                    "id": len(reports) + 1,
+                    "job_id": job + 1,
+                    "job_type": "SmartPools" if job % 2 == 0 else
+                                "TreeDelete",
+                    "key": key,
+                    "value": value,
+                    "status": status,
+                    "phase": phase,
+                    "time": start + offset})
+    return reports
+
+
 def get_reports_failed_msg():
     return 'Failed to get job reports'
@@ -72,6 +72,17 @@ MODIFY_SNAPSHOT_PARAMS = {"expires": 60}
 
 RENAME_SNAPSHOT_PARAMS = {"name": "renamed_snapshot_name_1"}
 
+BULK_SNAPSHOTS = [
+    {"snapshot_name": "bulk_snap_1", "path": "/project1",
+     "access_zone": "sample_zone", "alias": None},
+    {"snapshot_name": "bulk_snap_2", "path": "/project2",
+     "access_zone": "sample_zone", "alias": None},
+    {"snapshot_name": "bulk_snap_3", "path": "/ifs/project3",
+     "access_zone": "System", "alias": None}
+]
+
+ZONE_SUMMARY = {"summary": {"path": "/ifs/sample_zone"}}
+
 
 def create_snapshot_failed_msg():
     return 'Failed to create snapshot'
@@ -129,5 +140,17 @@ def modify_non_existing_path_failed_msg():
     return 'specified in the playbook does not match the path of the snapshot'
 
 
+def bulk_snapshot_failed_msg():
+    return 'Failed to create 1 of 3 snapshots.'
+
+
+def bulk_snapshot_duplicate_failed_msg():
+    return 'Duplicate snapshot names'
+
+
+def bulk_snapshot_absent_failed_msg():
+    return 'snapshots is only supported with state present.'
+
+
 def get_snapshot_failed_msg():
     return 'Failed to get details of Snapshot'
@@ -0,0 +1,70 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Mock Api response for Unit tests of snapshot retention module on PowerScale"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+# 2026-01-10T12:00:00Z
+NOW = 1768046400
+
+
+class MockSnapshotRetentionApi:
+    RETENTION_COMMON_ARGS = {"onefs_host": "XX.XX.XX.XX",
+                             "port_no": "8080",
+                             "verify_ssl": "false",
+                             "path": None,
+                             "access_zone": "System",
+                             "schedule": None,
+                             "name_pattern": None,
+                             "keep_last": None,
+                             "keep_daily_days": None,
+                             "max_age": None,
+                             "max_age_unit": "days",
+                             "max_workers": 4,
+                             "include_synciq_snapshots": False
+                             }
+
+    @staticmethod
+    def get_snapshot(snap_id, age, path="/ifs/project1", name=None,
+                     has_locks=False):
+        return {"id": snap_id,
+                "name": name or "hourly_{0}".format(snap_id),
+                "path": path,
+                "created": NOW - age,
+                "has_locks": has_locks}
+
+    @staticmethod
+    def get_snapshot_pages():
+        """Two pages of snapshots of two paths, newest first."""
+        get_snapshot = MockSnapshotRetentionApi.get_snapshot
+        page_1 = {"snapshots": [get_snapshot(10, 1 * HOUR),
+                                get_snapshot(20, 1 * HOUR, path="/ifs/project2"),
+                                get_snapshot(9, 2 * HOUR),
+                                get_snapshot(8, 1 * DAY + HOUR),
+                                get_snapshot(7, 1 * DAY + 2 * HOUR)],
+                  "resume": "page_2"}
+        page_2 = {"snapshots": [get_snapshot(6, 2 * DAY + HOUR, has_locks=True),
+                                get_snapshot(5, 3 * DAY + HOUR),
+                                get_snapshot(4, 40 * DAY, name="manual_4"),
+                                get_snapshot(30, 40 * DAY,
+                                             name="SIQ-5b6f3c1d-latest"),
+                                get_snapshot(21, 40 * DAY, path="/ifs/project2")],
+                  "resume": None}
+        return [page_1, page_2]
+
+    @staticmethod
+    def get_retention_error_response(response_type):
+        if response_type == 'list_exception':
+            return "Failed to list snapshots for retention with error: SDK Error message"
+        elif response_type == 'delete_exception':
+            return "Failed to delete 1 of 2 snapshots."
+        elif response_type == 'invalid_pattern':
+            return "Invalid name_pattern"
+        elif response_type == 'invalid_keep_last':
+            return "keep_last must be a non-negative integer."
@@ -0,0 +1,88 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Mock Api response for Unit tests of SyncIQ analytics module on PowerScale"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from types import SimpleNamespace
+
+HOUR = 60 * 60
+# 2026-01-10T12:00:00Z
+NOW = 1768046400
+
+
+def sdk_object(details):
+    """Returns an SDK-like object exposing the details and to_dict"""
+    return SimpleNamespace(to_dict=lambda: details, **details)
+
+
+class MockSyncIQAnalyticsApi:
+    ANALYTICS_COMMON_ARGS = {"onefs_host": "XX.XX.XX.XX",
+                             "port_no": "8080",
+                             "verify_ssl": "false",
+                             "policy_names": None,
+                             "window": 24,
+                             "window_unit": "hours",
+                             "include_sub_reports": False,
+                             "max_workers": 4
+                             }
+
+    POLICIES = [
+        {"id": "id_1", "name": "policy_1", "enabled": True,
+         "rpo_alert": 4 * HOUR, "last_success": NOW - 30 * HOUR},
+        {"id": "id_2", "name": "policy_2", "enabled": True,
+         "rpo_alert": HOUR, "last_success": NOW - 5 * HOUR},
+        {"id": "id_3", "name": "policy_3", "enabled": False,
+         "rpo_alert": 0, "last_success": None},
+    ]
+
+    @staticmethod
+    def get_report(report_id, policy_name, age, state="finished",
+                   bytes_transferred=1000, files_transferred=10, duration=10,
+                   errors=None, subreport_count=0):
+        return {"id": report_id,
+                "policy_name": policy_name,
+                "start_time": NOW - age,
+                "end_time": NOW - age + duration,
+                "state": state,
+                "bytes_transferred": bytes_transferred,
+                "files_transferred": files_transferred,
+                "duration": duration,
+                "errors": errors or [],
+                "subreport_count": subreport_count}
+
+    @staticmethod
+    def get_reports():
+        get_report = MockSyncIQAnalyticsApi.get_report
+        return [
+            get_report("4-policy_1", "policy_1", 1 * HOUR),
+            get_report("3-policy_1", "policy_1", 2 * HOUR, state="failed",
+                       bytes_transferred=500, duration=40,
+                       errors=["Connection reset"], subreport_count=2),
+            get_report("9-policy_2", "policy_2", 3 * HOUR, state="failed",
+                       bytes_transferred=0, files_transferred=0, duration=5,
+                       errors=["Target unreachable"]),
+            get_report("9-other", "other_policy", 3 * HOUR),
+            get_report("2-policy_1", "policy_1", 30 * HOUR),
+        ]
+
+    @staticmethod
+    def get_policy_pages():
+        policies = [sdk_object(policy) for policy in MockSyncIQAnalyticsApi.POLICIES]
+        return [SimpleNamespace(policies=policies[:2], resume="policies_2"),
+                SimpleNamespace(policies=policies[2:], resume=None)]
+
+    @staticmethod
+    def get_report_pages():
+        reports = [sdk_object(report) for report in MockSyncIQAnalyticsApi.get_reports()]
+        return [SimpleNamespace(reports=reports[:3], resume="reports_2"),
+                SimpleNamespace(reports=reports[3:], resume=None)]
+
+    @staticmethod
+    def get_sub_reports():
+        return {"subreports": [{"id": 1, "errors": ["Worker failed"]},
+                               {"id": 2, "errors": ["Worker failed", "Retry"]}]}
@@ -8,6 +8,10 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import copy
+import json
+from types import SimpleNamespace
+
 MODULE_UTILS_PATH = 'ansible_collections.dellemc.powerscale.plugins.modules.synciqjob.utils'
 
 SYNCIQ_JOB = {
@@ -147,3 +151,29 @@ def get_synciq_job_failed_msg():
 
 def delete_synciq_job_failed_msg():
     return 'Please specify a valid state.'
+
+
+def make_sync_job(job):
+    """Build an SDK-like SyncIQ job object from its dict"""
+    return SimpleNamespace(id=job["id"], state=job["state"], action=job["action"],
+                           to_dict=lambda: job)
+
+
+def get_sync_job_pages(job_count, page_size=1000):
+    """Build list_sync_jobs pages holding job_count running jobs"""
+    jobs = []
+    for index in range(job_count):
+        job = copy.deepcopy(SYNCIQ_JOB["job_details"][0])
+        job.update(id="policy_%d" % index, policy_name="policy_%d" % index)
+        jobs.append(make_sync_job(job))
+    pages = []
+    for start in range(0, job_count, page_size):
+        resume = "token_%d" % start if start + page_size < job_count else None
+        pages.append(SimpleNamespace(jobs=jobs[start:start + page_size],
+                                     resume=resume, total=job_count))
+    return pages or [SimpleNamespace(jobs=[], resume=None, total=0)]
+
+
+def response_size(jobs):
+    """Serialized size of the job payload in bytes"""
+    return len(json.dumps(jobs, sort_keys=True))
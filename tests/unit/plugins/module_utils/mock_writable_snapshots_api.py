@@ -19,6 +19,14 @@ class MockWritableSanpshotsApi:
     WS_CREATE_ARGS_STR = {"writable_snapshots": [{"src_snap": "snap-2", "dst_path": DSTPATH, "state": "present"}]}
     WS_DELETE_ARGS = {"writable_snapshots": [{"src_snap": 2, "dst_path": DSTPATH, "state": "absent"}]}
     WS_INVALID_DSTPATH_ARGS = {"writable_snapshots": [{"src_snap": "invalid", "dst_path": DSTPATH, "state": "present"}]}
+    WS_EXISTING = {"dst_path": "/ifs/ansible8", "src_id": 2, "src_snap": "snap-2", "id": 20}
+    WS_EXISTING_PAGE_2 = {"dst_path": "/ifs/ansible9", "src_id": 3, "src_snap": "snap-3", "id": 21}
+    WS_BULK_ARGS = {"max_workers": 4,
+                    "writable_snapshots": [{"src_snap": 2, "dst_path": "/ifs/bulk_1", "state": "present"},
+                                           {"src_snap": 2, "dst_path": "/ifs/bulk_2", "state": "present"},
+                                           {"src_snap": 2, "dst_path": "/ifs/bulk_3", "state": "present"},
+                                           {"src_snap": 2, "dst_path": "/ifs/bulk_4", "state": "present"},
+                                           {"dst_path": DSTPATH, "state": "absent"}]}
 
     @staticmethod
     def get_writeable_snpshots_error_response(response_type):
@@ -27,5 +35,9 @@ class MockWritableSanpshotsApi:
             return f"Failed to delete snapshot: {dst_path} with error"
         elif response_type == 'create_exception':
             return f"Failed to create writable snapshot: {dst_path} with error: SDK Error message"
+        elif response_type == 'list_exception':
+            return "Failed to get writable snapshots due to error"
+        elif response_type == 'bulk_exception':
+            return "Failed to create writable snapshot: /ifs/bulk_2 with error: SDK Error message"
         elif response_type == 'invalid_dstpath':
             return "Few writable snapshots are not able to be created because the destination path or source path is invalid."
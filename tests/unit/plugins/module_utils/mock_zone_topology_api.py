@@ -0,0 +1,41 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Mock API responses for the access zone topology of PowerScale modules"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response import (
+    MockSDKResponse,
+)
+
+ZONE_PATHS = {
+    "System": "/ifs",
+    "sample_zone": "/ifs/sample_zone",
+    "sample_zone1": "/ifs/sample_zone1",
+    "sample-zone": "/ifs/sample_zone",
+    "nonsystem": "/ifs/nonsystem",
+    "non-System": "/ifs/non-System",
+    "test-zone": "/ifs/test_user_1",
+}
+
+
+def get_zones(zone_paths=None, auth_providers=None):
+    """Get the access zones listed by the zones API"""
+    zone_paths = ZONE_PATHS if zone_paths is None else zone_paths
+    auth_providers = auth_providers or {}
+    return [dict(name=name, id=name, zone_id=zone_id, path=path,
+                 auth_providers=auth_providers.get(
+                     name, ["lsa-file-provider:System"]),
+                 groupnet="groupnet0")
+            for zone_id, (name, path) in enumerate(zone_paths.items(), 1)]
+
+
+def get_zones_response(zone_paths=None, auth_providers=None):
+    """Get the response of the zones API listing the access zones"""
+    return MockSDKResponse({"zones": get_zones(zone_paths, auth_providers),
+                            "total": len(ZONE_PATHS if zone_paths is None
+                                         else zone_paths)})
@@ -0,0 +1,99 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the timings of the PAPI requests of PowerScale modules"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock.mock import MagicMock
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import api_perf
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+
+
+@pytest.fixture(autouse=True)
+def reset_api_perf():
+    api_perf.API_PERF.reset()
+    yield
+    api_perf.API_PERF.reset()
+
+
+def test_api_perf_record():
+    perf = api_perf.ApiPerf()
+    assert perf.get_perf() is None
+    perf.record('10.0.0.1', 'GET', '/platform/3/zones', 200, 12.5, 100, 1)
+    perf.record('10.0.0.1', 'GET', '/platform/3/zones', 404, 7.5)
+    perf.record('10.0.0.2', 'POST', '/platform/1/quota/quotas', None, 30.0)
+    result = perf.get_perf()
+    assert (result['requests'], result['errors'], result['latency_ms'],
+            result['payload_bytes'], result['retries']) == (3, 2, 50.0, 100, 1)
+    assert result['calls'][0] == dict(
+        cluster='10.0.0.1', method='GET', endpoint='/platform/3/zones',
+        count=2, errors=1, latency_ms=20.0, latencies_ms=[12.5, 7.5],
+        payload_bytes=100, retries=1)
+
+
+def test_latency_samples():
+    samples = []
+    for count in range(1, 101):
+        api_perf.add_latency_sample(samples, count, float(count), 10)
+    assert len(samples) == 10
+    assert all(1 <= latency <= 100 for latency in samples)
+
+
+def test_api_perf_of_requests():
+    retries = MagicMock(history=(MagicMock(),))
+    response = MagicMock(status=200, data=b'{"exports": []}',
+                         urllib3_response=MagicMock(retries=retries))
+    api_client = MagicMock()
+    api_client.request.side_effect = [response, MockApiException(404)]
+
+    def call_api(resource_path, method, path_params=None):
+        path = resource_path
+        for key, value in (path_params or {}).items():
+            path = path.replace('{%s}' % key, str(value))
+        return api_client.request(method, 'https://10.0.0.1:8080' + path)
+    api_client.call_api.side_effect = call_api
+
+    utils.log_api_requests(api_client)
+    assert api_client.call_api('/platform/2/protocols/nfs/exports/'
+                               '{NfsExportId}', 'GET',
+                               dict(NfsExportId=12)) is response
+    with pytest.raises(MockApiException):
+        api_client.request('GET', 'https://10.0.0.1:8080/platform/3/zones/'
+                           'missing?scope=user')
+
+    result = dict(changed=False)
+    utils.add_api_perf(result)
+    calls = [(call['cluster'], call['endpoint'], call['count'],
+              call['errors'], call['payload_bytes'], call['retries'])
+             for call in result['perf']['calls']]
+    assert calls == [
+        ('10.0.0.1', '/platform/2/protocols/nfs/exports/{NfsExportId}', 1, 0,
+         15, 1),
+        ('10.0.0.1', '/platform/3/zones/missing', 1, 1, 0, 0)]
+
+
+def test_report_api_perf():
+    api_perf.API_PERF.record('10.0.0.1', 'GET', '/platform/3/zones', 200,
+                             5.0)
+    module = utils.AnsibleModule.__new__(utils.AnsibleModule)
+    module.exit_json = exit_json = MagicMock()
+    module.fail_json = fail_json = MagicMock()
+    utils.report_api_perf(module)
+    module.exit_json(changed=True)
+    assert exit_json.call_args[1]['perf']['requests'] == 1
+    module.fail_json('Failed', perf=None)
+    assert fail_json.call_args == (('Failed',), dict(perf=None))
+
+    mock_module = MagicMock()
+    utils.report_api_perf(mock_module)
+    assert isinstance(mock_module.exit_json, MagicMock)
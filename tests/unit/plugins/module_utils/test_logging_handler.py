@@ -0,0 +1,151 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the logging of PowerScale modules"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import logging
+import os
+
+import pytest
+from mock.mock import MagicMock
+
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import logging_handler
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+
+
+def get_test_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    return logger
+
+
+def test_queue_handler_per_log_file(tmp_path):
+    log_file = str(tmp_path / 'ansible_powerscale.log')
+    formatter = logging.Formatter(utils.LOG_FORMAT)
+    handler = logging_handler.get_queue_handler(log_file, formatter,
+                                                1024, 5)
+    assert handler is logging_handler.get_queue_handler(
+        log_file, formatter, 1024, 5)
+    assert not os.path.exists(log_file)
+
+    logger = get_test_logger('test_queue_handler', handler)
+    logger.setLevel(logging.INFO)
+    logger.debug("Dropped %s", "debug")
+    logger.info("Details are: %s", {'id': 'test'})
+    handler.stop()
+    with open(log_file) as log:
+        content = log.read()
+    assert "INFO : Details are: {'id': 'test'}" in content
+    assert "Dropped" not in content
+
+
+def test_set_log_level_off(tmp_path):
+    log_file = str(tmp_path / 'ansible_powerscale.log')
+    handler = logging_handler.get_queue_handler(
+        log_file, logging.Formatter(utils.LOG_FORMAT), 1024, 5)
+    logger = get_test_logger('test_set_log_level', handler)
+    utils._LOGGERS['test_set_log_level'] = logger
+    try:
+        utils.set_log_level('OFF')
+        logger.critical("Dropped")
+        assert handler.listener is None
+        assert not os.path.exists(log_file)
+
+        utils.set_log_level('debug')
+        logger.debug("Written")
+        handler.stop()
+        with open(log_file) as log:
+            assert "DEBUG : Written" in log.read()
+    finally:
+        utils._LOGGERS.pop('test_set_log_level')
+        utils._LOG_SETTINGS['level'] = None
+
+
+def test_get_log_level():
+    assert utils.get_log_level('Warning') == logging.WARNING
+    assert utils.get_log_level('off') == utils.LOG_LEVEL_OFF
+    assert utils.get_log_level('verbose') is None
+    assert utils.get_log_level(None) is None
+
+
+def test_rotation_filename(tmp_path):
+    handler = logging_handler.CustomRotatingFileHandler(
+        str(tmp_path / 'powerscale.v2.log'), delay=True)
+    rotated = os.path.basename(
+        handler.rotation_filename(handler.baseFilename + '.1'))
+    assert rotated.startswith('powerscale.v2_')
+    assert rotated.endswith('.log.1')
+
+    handler = logging_handler.CustomRotatingFileHandler(
+        str(tmp_path / 'powerscale'), delay=True)
+    rotated = os.path.basename(
+        handler.rotation_filename(handler.baseFilename + '.2'))
+    assert rotated.startswith('powerscale_') and rotated.endswith('.2')
+
+
+def test_segmented_file_handler(tmp_path):
+    handler = logging_handler.SegmentedFileHandler(
+        str(tmp_path / 'powerscale.jsonl'), 100, 2)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    for index in range(20):
+        handler.handle(logging.makeLogRecord(dict(msg='%030d' % index)))
+    handler.close()
+    segments = sorted(os.listdir(str(tmp_path)),
+                      key=lambda name: int(name.split('.')[1]))
+    assert segments == ['powerscale.5.jsonl', 'powerscale.6.jsonl',
+                        'powerscale.7.jsonl']
+    with open(str(tmp_path / 'powerscale.7.jsonl')) as segment:
+        assert segment.read().split() == ['%030d' % 18, '%030d' % 19]
+
+
+def test_json_log_api_requests(tmp_path, monkeypatch):
+    monkeypatch.setenv(logging_handler.CORRELATION_ID_ENV, 'task-1')
+    monkeypatch.setitem(logging_handler._LOG_CONTEXT, 'pid', None)
+    log_file = str(tmp_path / 'ansible_powerscale.log')
+    handler = logging_handler.get_queue_handler(
+        log_file, logging.Formatter(utils.LOG_FORMAT), 1024 * 1024, 5)
+    logger = get_test_logger('api_requests', handler)
+    logger.setLevel(logging.INFO)
+    monkeypatch.setattr(utils, 'get_logger', lambda name: logger)
+    logging_handler.set_log_context(cluster='10.0.0.1')
+
+    response = MagicMock(status=200, data=b'{"zones": []}')
+    api_client = MagicMock()
+    api_client.request.side_effect = [response, MockApiException(404)]
+    try:
+        utils.set_log_format('json')
+        utils.log_api_requests(api_client)
+        assert api_client.request('GET', 'https://10.0.0.1:8080/platform/'
+                                  '3/zones?resume=1') is response
+        with pytest.raises(MockApiException):
+            api_client.request('GET', 'https://10.0.0.1:8080/platform/'
+                               '3/zones/missing')
+        handler.stop()
+    finally:
+        utils.set_log_format('text')
+        utils._LOG_SETTINGS['format'] = None
+        logging_handler.set_log_context()
+
+    with open(str(tmp_path / 'ansible_powerscale.1.jsonl')) as segment:
+        records = [json.loads(line) for line in segment]
+    assert [(record['endpoint'], record['http_status'],
+             record.get('payload_bytes')) for record in records] == [
+        ('/platform/3/zones', 200, 13), ('/platform/3/zones/missing', 404,
+                                         None)]
+    for record in records:
+        assert record['correlation_id'] == 'task-1'
+        assert record['cluster'] == '10.0.0.1'
+        assert record['module'] == 'api_requests'
+        assert record['latency_ms'] >= 0
+    assert not os.path.exists(log_file)
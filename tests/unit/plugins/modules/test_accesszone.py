@@ -38,6 +38,11 @@ class TestAccessZone(PowerScaleUnitBase):
         "create_path": None,
         "provider_state": None,
         "auth_providers": [{"provider_name": None, "provider_type": None}],
+        "az_names": None,
+        "smb": None,
+        "nfs": None,
+        "include_protocol_settings": True,
+        "max_workers": 10,
     }
 
     @pytest.fixture
@@ -673,3 +678,122 @@ class TestAccessZone(PowerScaleUnitBase):
         )
         powerscale_module_mock.perform_module_operation()
         assert powerscale_module_mock.module.exit_json.call_args[1]["changed"] is True
+
+    def mock_zone_settings(self, powerscale_module_mock, names, latency=0.0):
+        zones = dict((name, MockAccessZoneApi.ACCESS_ZONE_DETAILS_2)
+                     for name in names)
+        getters = dict(
+            get_zone=MockAccessZoneApi.ConcurrentGetter(
+                zones, latency, MockApiException(404)),
+            get_nfs_settings_export=MockAccessZoneApi.ConcurrentGetter(
+                dict.fromkeys(names, MockAccessZoneApi.NFS_EXPORT_SETTINGS),
+                latency, MockApiException(404)),
+            get_nfs_settings_zone=MockAccessZoneApi.ConcurrentGetter(
+                dict.fromkeys(names, MockAccessZoneApi.NFS_ZONE_SETTINGS),
+                latency, MockApiException(404)),
+            get_smb_settings_share=MockAccessZoneApi.ConcurrentGetter(
+                dict.fromkeys(names, MockAccessZoneApi.SMB_SHARE_SETTINGS),
+                latency, MockApiException(404)))
+        powerscale_module_mock.api_instance.get_zone = getters['get_zone']
+        for method in ('get_nfs_settings_export', 'get_nfs_settings_zone',
+                       'get_smb_settings_share'):
+            setattr(powerscale_module_mock.api_protocol, method,
+                    getters[method])
+        return getters
+
+    def test_get_access_zone_details_concurrently(self, powerscale_module_mock):
+        self.set_module_params(
+            self.get_access_zone_args,
+            {"az_name": "testaz", "state": "present"},
+        )
+        getters = self.mock_zone_settings(powerscale_module_mock, ["testaz"],
+                                          latency=0.05)
+        powerscale_module_mock.perform_module_operation()
+        details = powerscale_module_mock.module.exit_json.call_args[1][
+            "access_zone_details"]
+        assert details["smb_settings"]["file_create_mode_octal"] == "100"
+        assert details["nfs_settings"]["zone_settings"]["nfsv4_domain"] == \
+            "localhost"
+        assert details["nfs_settings"]["export_settings"][
+            "commit_asynchronous"] is False
+        assert sum(getter.peak_in_flight for getter in getters.values()) > 1
+
+    def test_get_access_zone_details_without_protocol_settings(
+            self, powerscale_module_mock):
+        self.set_module_params(
+            self.get_access_zone_args,
+            {"az_name": "testaz", "state": "present",
+             "include_protocol_settings": False},
+        )
+        getters = self.mock_zone_settings(powerscale_module_mock, ["testaz"])
+        powerscale_module_mock.perform_module_operation()
+        details = powerscale_module_mock.module.exit_json.call_args[1][
+            "access_zone_details"]
+        assert "smb_settings" not in details
+        assert "nfs_settings" not in details
+        assert getters["get_smb_settings_share"].calls == []
+        assert getters["get_nfs_settings_zone"].calls == []
+
+    def test_get_access_zone_details_only_requested_protocol(
+            self, powerscale_module_mock):
+        self.set_module_params(
+            self.get_access_zone_args,
+            {"az_name": "testaz", "state": "present",
+             "include_protocol_settings": False,
+             "smb": {"oplocks": True}},
+        )
+        getters = self.mock_zone_settings(powerscale_module_mock, ["testaz"])
+        powerscale_module_mock.perform_module_operation()
+        assert powerscale_module_mock.module.exit_json.call_args[1][
+            "changed"] is False
+        assert getters["get_smb_settings_share"].calls == ["testaz"]
+        assert getters["get_nfs_settings_export"].calls == []
+
+    def test_get_multiple_access_zone_details(self, powerscale_module_mock):
+        names = ["zone%d" % index for index in range(20)]
+        self.set_module_params(
+            self.get_access_zone_args,
+            {"az_names": names + ["missing", "zone0"], "state": "present",
+             "max_workers": 8, "auth_providers": None},
+        )
+        getters = self.mock_zone_settings(powerscale_module_mock, names,
+                                          latency=0.02)
+        powerscale_module_mock.perform_module_operation()
+        result = powerscale_module_mock.module.exit_json.call_args[1]
+        assert result["changed"] is False
+        details = result["access_zones_details"]
+        assert list(details) == names + ["missing"]
+        assert details["missing"] is None
+        assert details["zone7"]["smb_settings"]["file_create_mask_octal"] == \
+            "700"
+        assert len(getters["get_zone"].calls) == 21
+        assert 1 < sum(getter.peak_in_flight
+                       for getter in getters.values()) <= 4 * 8
+
+    def test_get_multiple_access_zone_details_exception(
+            self, powerscale_module_mock):
+        self.set_module_params(
+            self.get_access_zone_args,
+            {"az_names": ["zone0", "zone1"], "state": "present",
+             "auth_providers": None},
+        )
+        getters = self.mock_zone_settings(powerscale_module_mock, ["zone0"])
+        getters["get_zone"].missing_exception = MockApiException(500)
+        self.capture_fail_json_method(
+            MockAccessZoneApi.get_error_message("get_zone_exception",
+                                                az_name="zone1"),
+            powerscale_module_mock,
+            "perform_module_operation",
+        )
+
+    def test_get_multiple_access_zone_details_state_exception(
+            self, powerscale_module_mock):
+        self.set_module_params(
+            self.get_access_zone_args,
+            {"az_names": ["zone0"], "state": "absent"},
+        )
+        self.capture_fail_json_method(
+            MockAccessZoneApi.get_error_message("az_names_state_exception"),
+            powerscale_module_mock,
+            "perform_module_operation",
+        )
@@ -21,6 +21,8 @@ from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
     import mock_ads_api as MockAdsApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base \
     import PowerScaleUnitBase
 
@@ -33,6 +35,11 @@ class TestAds(PowerScaleUnitBase):
     def module_object(self):
         return Ads
 
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api_instance.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
     def test_create_ads(self, powerscale_module_mock):
         self.set_module_params(
             self.ads_args,
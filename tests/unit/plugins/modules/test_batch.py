@@ -0,0 +1,219 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for Batch module on PowerScale"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import importlib.util
+import os
+import sys
+
+import pytest
+from mock.mock import MagicMock, patch
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.initial_mock \
+    import utils
+from ansible.module_utils import basic
+from ansible_collections.dellemc.powerscale.plugins.modules.batch import Batch, BatchHandler
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.utils \
+    import get_powerscale_sdk
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library \
+    import zone_topology
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base \
+    import PowerScaleUnitBase
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response \
+    import MockSDKResponse
+
+
+def get_ansible_module_class():
+    # initial_mock replaces the AnsibleModule class of the basic module
+    spec = importlib.util.find_spec('ansible.module_utils.basic')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.AnsibleModule
+
+
+def read_module_source(name):
+    # The source the action plugin sends for a module of the collection
+    modules_dir = os.path.dirname(sys.modules[Batch.__module__].__file__)
+    with open(os.path.join(modules_dir, name + '.py')) as module_file:
+        return module_file.read()
+
+
+OPERATION_MODULE_SOURCE = '''
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell \\
+    import utils
+
+
+def main():
+    argument_spec = utils.get_powerscale_management_host_parameters()
+    argument_spec.update(path=dict(type='str', required=True),
+                         fail=dict(type='bool', default=False))
+    module = AnsibleModule(argument_spec=argument_spec,
+                           supports_check_mode=True)
+    prereqs = utils.validate_module_pre_reqs(module.params)
+    api_client = utils.get_powerscale_connection(module.params)
+    auth_api = utils.isi_sdk.AuthApi(api_client)
+    owner = auth_api.get_auth_user(auth_user_id='USER:admin', zone='System')
+    if module.params['fail']:
+        module.fail_json(msg='Failed for %s with password %s'
+                         % (module.params['path'],
+                            module.params['api_password']))
+    module.exit_json(changed=not module.check_mode, prereqs=prereqs,
+                     path=module.params['path'], owner=owner,
+                     diff=dict(before={}, after=dict(path=module.params['path'])))
+'''
+
+
+class TestBatch(PowerScaleUnitBase):
+    batch_args = {
+        'onefs_host': '10.0.0.1',
+        'verify_ssl': False,
+        'port_no': '8080',
+        'api_user': 'admin',
+        'api_password': 'Secret123',
+        'log_level': None,
+        'log_format': None,
+        'max_workers': 1,
+        'stop_on_error': True,
+        'module_sources': {'filesystem': OPERATION_MODULE_SOURCE,
+                           'nfs': OPERATION_MODULE_SOURCE}
+    }
+
+    @pytest.fixture
+    def module_object(self):
+        return Batch
+
+    @pytest.fixture(autouse=True)
+    def batch_module_mock(self, powerscale_module_mock):
+        module = MagicMock(spec=['params', 'check_mode', '_diff', 'fail_json',
+                                 'exit_json'])
+        module.fail_json.side_effect = SystemExit
+        module.check_mode = False
+        module._diff = True
+        self.powerscale_module_mock.module = module
+        self.powerscale_module_mock.api_client = MagicMock()
+        self.powerscale_module_mock.isi_sdk = MagicMock()
+        self.auth_api = self.powerscale_module_mock.isi_sdk.AuthApi.return_value
+        self.auth_api.get_auth_user.return_value = dict(users=[dict(uid=10)])
+        with patch.object(basic, 'AnsibleModule', get_ansible_module_class()):
+            yield
+
+    def get_operations(self, *operations):
+        return [dict(dict(name=None, params={}), **operation)
+                for operation in operations]
+
+    def run_batch(self, *operations, **params):
+        self.set_module_params(self.batch_args, dict(
+            params, operations=self.get_operations(*operations)))
+        BatchHandler().handle(self.powerscale_module_mock,
+                              self.powerscale_module_mock.module.params)
+
+    def test_batch_operations(self):
+        self.run_batch(
+            dict(module='filesystem', name='project1',
+                 params=dict(path='/ifs/project1')),
+            dict(module='dellemc.powerscale.nfs',
+                 params=dict(path='/ifs/project1')))
+        result = self.powerscale_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is True
+        assert [(entry['name'], entry['module'], entry['changed'])
+                for entry in result['results']] == \
+            [('project1', 'filesystem', True), ('nfs_2', 'nfs', True)]
+        assert result['results'][1]['result']['path'] == '/ifs/project1'
+        assert result['results'][1]['result']['owner'] == \
+            dict(users=[dict(uid=10)])
+        assert result['results'][1]['result']['prereqs'] is None
+        assert result['diff'][0] == dict(before={},
+                                         after=dict(path='/ifs/project1'),
+                                         before_header='project1',
+                                         after_header='project1')
+        # The operations share the auth API and its identity lookups
+        self.auth_api.get_auth_user.assert_called_once_with(
+            auth_user_id='USER:admin', zone='System')
+        assert 'module_sources' not in \
+            self.powerscale_module_mock.module.params
+        # The connection of the batch is restored
+        assert utils.isi_sdk is not self.powerscale_module_mock.isi_sdk
+        assert zone_topology._SHARED_ZONES is None
+
+    def test_batch_collection_modules(self):
+        isi_sdk = self.powerscale_module_mock.isi_sdk
+        api_client = self.powerscale_module_mock.api_client
+        snapshot_api = isi_sdk.SnapshotApi.return_value
+        snapshot_api.get_snapshot_snapshot.return_value = MockSDKResponse(
+            dict(snapshots=[dict(id=5, name='snap1', path='/ifs/project1')]))
+        protocols_api = isi_sdk.ProtocolsApi.return_value
+        nfs_export = dict(id=12, paths=['/ifs/project1'], zone='System')
+        protocols_api.list_nfs_exports.return_value = MagicMock(
+            total=1, exports=[MockSDKResponse(nfs_export)])
+        # The conftest replaces the SDK the modules get, they must get the
+        # SDK of the batch session
+        with patch.object(utils, 'get_powerscale_sdk', get_powerscale_sdk):
+            self.run_batch(
+                dict(module='snapshot',
+                     params=dict(snapshot_name='snap1', state='absent')),
+                dict(module='nfs',
+                     params=dict(path='/ifs/project1', state='absent')),
+                module_sources=dict(snapshot=read_module_source('snapshot'),
+                                    nfs=read_module_source('nfs')))
+        result = self.powerscale_module_mock.module.exit_json.call_args[1]
+        assert [(entry['module'], entry['changed'], entry['failed'])
+                for entry in result['results']] == \
+            [('snapshot', True, False), ('nfs', True, False)]
+        assert result['results'][0]['result']['snapshot_details'] == {}
+        assert result['results'][1]['result']['NFS_export_details'] == {}
+        assert result['diff'] == [dict(before=nfs_export, after={},
+                                       before_header='nfs_2',
+                                       after_header='nfs_2')]
+        # The modules connect through the API client and SDK of the batch
+        isi_sdk.SnapshotApi.assert_called_with(api_client)
+        isi_sdk.ProtocolsApi.assert_called_with(api_client)
+        snapshot_api.delete_snapshot_snapshot.assert_called_once_with('snap1')
+        protocols_api.list_nfs_exports.assert_called_once_with(
+            path='/ifs/project1', zone='System')
+        protocols_api.delete_nfs_export.assert_called_once_with(
+            12, zone='System')
+        assert utils.isi_sdk is not isi_sdk
+
+    def test_batch_check_mode(self):
+        self.powerscale_module_mock.module.check_mode = True
+        self.run_batch(dict(module='filesystem',
+                            params=dict(path='/ifs/project1')))
+        result = self.powerscale_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is False
+
+    def test_batch_operation_failure(self):
+        with pytest.raises(SystemExit):
+            self.run_batch(
+                dict(module='filesystem', params=dict(path='/ifs/a')),
+                dict(module='filesystem', params=dict(path='/ifs/b',
+                                                      fail=True)),
+                dict(module='nfs', params=dict(path='/ifs/c')))
+        result = self.powerscale_module_mock.module.fail_json.call_args[1]
+        assert result['msg'] == '1 of 3 operations failed: filesystem_2'
+        assert result['results'][1]['failed'] is True
+        assert result['results'][1]['msg'] == \
+            'Failed for /ifs/b with password ********'
+        assert result['results'][2]['skipped'] is True
+
+    def test_batch_invalid_operations(self):
+        self.set_module_params(self.batch_args, dict(
+            operations=self.get_operations(dict(module='info'))))
+        self.capture_fail_json_call(
+            'Module info of operation 1 cannot run in a batch', BatchHandler)
+        self.set_module_params(self.batch_args, dict(
+            operations=self.get_operations(dict(
+                module='nfs', params=dict(path='/ifs', api_user='root')))))
+        self.capture_fail_json_call(
+            'Operation 1 sets api_user, the options connecting to the '
+            'cluster are set on the batch', BatchHandler)
+        self.set_module_params(self.batch_args, dict(
+            operations=self.get_operations(dict(module='smb')),
+            module_sources={}))
+        self.capture_fail_json_call(
+            'The source of module smb is missing', BatchHandler)
@@ -28,6 +28,8 @@ from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock
     import MockFileSystemApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
 
 
 class TestFileSystem(PowerScaleUnitBase):
@@ -50,13 +52,18 @@ class TestFileSystem(PowerScaleUnitBase):
     def module_object(self):
         return FileSystem
 
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
     @pytest.fixture(autouse=True)
     def inject_attributes(self, powerscale_module_mock):
         powerscale_module_mock.namespace_api = MagicMock()
         powerscale_module_mock.quota_api = MagicMock()
         powerscale_module_mock.protocol_api = MagicMock()
         powerscale_module_mock.auth_api = MagicMock()
-        powerscale_module_mock.zone_summary_api = MagicMock()
+        powerscale_module_mock.zones_api = MagicMock()
 
     def test_get_file_system_404(self, powerscale_module_mock):
         self.set_module_params(self.get_filesystem_args,
@@ -655,16 +662,14 @@ class TestFileSystem(PowerScaleUnitBase):
         powerscale_module_mock.module.check_mode = False
         powerscale_module_mock.namespace_api.get_directory_metadata.to_dict = MagicMock(
             return_value=MockFileSystemApi.FILESYSTEM_DETAILS)
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone.to_dict = MagicMock(
-            return_value=MockFileSystemApi.ZONE_PATH)
         FilesystemHandler().handle(
             powerscale_module_mock, powerscale_module_mock.module.params)
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone.assert_called()
+        powerscale_module_mock.zones_api.list_zones.assert_called_once_with()
 
     def test_get_zone_path_exception(self, powerscale_module_mock):
         self.get_filesystem_args.update({"path": self.path1, "access_zone": "sample_zone1", "state": "present"})
         powerscale_module_mock.module.params = self.get_filesystem_args
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone = MagicMock(side_effect=MockApiException)
+        powerscale_module_mock.zones_api.list_zones = MagicMock(side_effect=MockApiException)
         self.capture_fail_json_call(
             MockFileSystemApi.get_error_responses(
                 'get_zone_path_exception'), FilesystemHandler)
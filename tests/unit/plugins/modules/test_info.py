@@ -154,6 +154,31 @@ class TestInfo(PowerScaleUnitBase):
         assert MockGatherfactsApi.get_gather_facts_module_response(
             gather_subset) == powerscale_module_mock.module.exit_json.call_args[1][return_key]
 
+    @pytest.mark.parametrize("input_params", [
+        {"gather_subset": "synciq_reports", "return_key": "SynciqReports", "items": "reports"},
+        {"gather_subset": "synciq_policies", "return_key": "SynciqPolicies", "items": "policies"},
+    ]
+    )
+    def test_get_facts_synciq_api_pagination(self, powerscale_module_mock, input_params):
+        """Test that the SyncIQ report and policy lists follow the resume token"""
+        gather_subset = input_params.get('gather_subset')
+        items = input_params.get('items')
+        api_response = MockGatherfactsApi.get_gather_facts_api_response(
+            gather_subset)
+        pages = [{items: api_response[items][:1], "resume": "token", "total": 2},
+                 {items: api_response[items][1:], "resume": None, "total": 2}]
+        self.get_module_args.update({
+            'gather_subset': [gather_subset]
+        })
+        powerscale_module_mock.module.params = self.get_module_args
+        with patch.object(powerscale_module_mock.synciq_api,
+                          MockGatherfactsApi.get_gather_facts_error_method(gather_subset)) as mock_method:
+            mock_method.side_effect = [MockSDKResponse(page) for page in pages]
+            powerscale_module_mock.perform_module_operation()
+            mock_method.assert_called_with(resume="token")
+        assert MockGatherfactsApi.get_gather_facts_module_response(
+            gather_subset) == powerscale_module_mock.module.exit_json.call_args[1][input_params.get('return_key')]
+
     @pytest.mark.parametrize("gather_subset", [
         "synciq_reports",
         "synciq_target_reports",
@@ -776,6 +801,66 @@ class TestInfo(PowerScaleUnitBase):
             self.capture_fail_json_call(MockGatherfactsApi.get_gather_facts_error_response(
                 gather_subset), invoke_perform_module=True)
 
+    def test_get_facts_event_group_occurrences_cursor(self, powerscale_module_mock, tmp_path):
+        """Test that a cursor returns only the event group occurrences noticed since the previous call"""
+        cursor_file = str(tmp_path / 'cursor.json')
+        occurrences = MockGatherfactsApi.make_event_group_occurrences(10)
+        self.get_module_args.update({
+            'port_no': '8080',
+            'gather_subset': ['event_group_occurrences'],
+            'query_parameters': {'event_group_occurrences': [
+                {'cursor_file': cursor_file}, {'resolved': False},
+                {'limit': 3}, {'max_items': 5}]}
+        })
+        powerscale_module_mock.module.params = self.get_module_args
+        powerscale_module_mock.module.check_mode = False
+        list_occurrences = MockGatherfactsApi.get_event_group_occurrence_pages(occurrences, 3)
+        powerscale_module_mock.event_api.get_event_eventgroup_occurrences = list_occurrences
+        powerscale_module_mock.perform_module_operation()
+        result = powerscale_module_mock.module.exit_json.call_args[1]['event_group_occurrences']
+        assert result == occurrences[:5]
+        assert list_occurrences.calls[0] == {'sort': 'time_noticed', 'dir': 'ASC',
+                                             'resolved': False, 'limit': 3}
+        assert list_occurrences.calls[1] == {'resume': '3'}
+
+        list_occurrences = MockGatherfactsApi.get_event_group_occurrence_pages(occurrences, 3)
+        powerscale_module_mock.event_api.get_event_eventgroup_occurrences = list_occurrences
+        powerscale_module_mock.perform_module_operation()
+        result = powerscale_module_mock.module.exit_json.call_args[1]['event_group_occurrences']
+        assert result == occurrences[5:]
+        assert list_occurrences.calls[0]['begin'] == occurrences[4]['time_noticed']
+
+        powerscale_module_mock.perform_module_operation()
+        assert powerscale_module_mock.module.exit_json.call_args[1]['event_group_occurrences'] == []
+
+    def test_get_facts_event_group_occurrences_check_mode(self, powerscale_module_mock, tmp_path):
+        """Test that the cursor file is not written in check mode"""
+        cursor_file = tmp_path / 'cursor.json'
+        occurrences = MockGatherfactsApi.make_event_group_occurrences(4)
+        self.get_module_args.update({
+            'port_no': '8080',
+            'gather_subset': ['event_group_occurrences'],
+            'query_parameters': {'event_group_occurrences': [{'cursor_file': str(cursor_file)}]}
+        })
+        powerscale_module_mock.module.params = self.get_module_args
+        powerscale_module_mock.module.check_mode = True
+        powerscale_module_mock.event_api.get_event_eventgroup_occurrences = \
+            MockGatherfactsApi.get_event_group_occurrence_pages(occurrences, 100)
+        powerscale_module_mock.perform_module_operation()
+        assert powerscale_module_mock.module.exit_json.call_args[1]['event_group_occurrences'] == occurrences
+        assert not cursor_file.exists()
+
+    def test_get_facts_event_group_occurrences_exception(self, powerscale_module_mock):
+        """Test the get_facts that uses the event group occurrences api endpoint to get the exception"""
+        self.get_module_args.update({
+            'gather_subset': ['event_group_occurrences']
+        })
+        powerscale_module_mock.module.params = self.get_module_args
+        powerscale_module_mock.event_api.get_event_eventgroup_occurrences = \
+            MagicMock(side_effect=MockApiException)
+        self.capture_fail_json_call('Fetching event group occurrences failed with error',
+                                    invoke_perform_module=True)
+
     @pytest.mark.parametrize("input_params", [
         {"gather_subset": "smartquota", "return_key": "smart_quota"},
         {"gather_subset": "smartquota", "return_key": "smart_quota", "filters":
@@ -10,6 +10,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import pytest
+from types import SimpleNamespace
 from mock.mock import MagicMock
 # pylint: disable=unused-import
 from ansible_collections.dellemc.powerscale\
@@ -18,6 +19,8 @@ from ansible_collections.dellemc.powerscale\
     import utils
 
 from ansible_collections.dellemc.powerscale.plugins.modules.job import Job
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.job \
+    import JobWaiter
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.\
     module_utils import mock_job_api as MockJobApi
 from ansible_collections.dellemc.powerscale\
@@ -34,6 +37,37 @@ from ansible_collections.dellemc.powerscale\
     import PowerScaleUnitBase
 
 
+JOB_WAITER_PATH = ('ansible_collections.dellemc.powerscale.plugins.'
+                   'module_utils.storage.dell.shared_library.job')
+
+
+class FakeClock(object):
+    """Wall clock which advances on sleep and on every request."""
+
+    def __init__(self, request_latency=0):
+        self.now = 1000.0
+        self.request_latency = request_latency
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def requests(self, responses):
+        responses = list(responses)
+
+        def respond(*args, **kwargs):
+            self.now += self.request_latency
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        return respond
+
+
 class TestJob(PowerScaleUnitBase):
     get_module_args = MockJobApi.COMMON_ARGS
 
@@ -820,3 +854,223 @@ class TestJob(PowerScaleUnitBase):
             mod.main()
         except (SystemExit, TypeError):
             pass
+
+    # -------------------------------------------------------------------------
+    # Adaptive waiter
+    # -------------------------------------------------------------------------
+    @pytest.fixture
+    def fake_clock(self, mocker):
+        clock = FakeClock()
+        mocker.patch(JOB_WAITER_PATH + '.time.monotonic', side_effect=clock.monotonic)
+        mocker.patch(JOB_WAITER_PATH + '.time.sleep', side_effect=clock.sleep)
+        mocker.patch(JOB_WAITER_PATH + '.random.uniform', side_effect=lambda low, high: high)
+        return clock
+
+    def mock_start_and_polls(self, powerscale_module_mock, clock, polls, **params):
+        self.set_module_params(self.get_module_args, dict({
+            "job_type": "TreeDelete",
+            "paths": ["/ifs/data/archive"],
+            "wait": True,
+            "wait_timeout": 600,
+            "wait_interval": 1,
+            "wait_max_interval": 4,
+            "state": "present"
+        }, **params))
+        powerscale_module_mock.job_api.list_job_jobs = MagicMock(
+            return_value=MockSDKResponse(MockJobApi.JOBS_LIST_EMPTY))
+        powerscale_module_mock.job_api.create_job_job = MagicMock(
+            return_value=MockSDKResponse(MockJobApi.CREATE_JOB_RESPONSE))
+        responses = [MockSDKResponse(MockJobApi.JOB_CREATED)]
+        for poll in polls:
+            responses.append(poll if isinstance(poll, Exception) else MockSDKResponse(poll))
+        powerscale_module_mock.job_api.get_job_job = MagicMock(
+            side_effect=clock.requests(responses))
+
+    def test_wait_backoff_is_bounded(self, powerscale_module_mock, fake_clock):
+        self.mock_start_and_polls(
+            powerscale_module_mock, fake_clock,
+            [MockJobApi.JOB_CREATED] * 5 + [MockJobApi.JOB_SUCCEEDED_PHASES])
+        powerscale_module_mock.perform_module_operation()
+        assert fake_clock.sleeps == [1, 2, 4, 4, 4]
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_details']['state'] == 'succeeded'
+
+    def test_wait_progress_samples(self, powerscale_module_mock, fake_clock):
+        self.mock_start_and_polls(
+            powerscale_module_mock, fake_clock,
+            [MockJobApi.JOB_CREATED, MockJobApi.JOB_PHASE_2, MockJobApi.JOB_PHASE_2,
+             MockJobApi.JOB_SUCCEEDED_PHASES])
+        powerscale_module_mock.perform_module_operation()
+        progress = powerscale_module_mock.module.exit_json.call_args[1]['job_progress']
+        assert [(sample['state'], sample['phase'], sample['percent']) for sample in progress] == \
+            [('running', None, 0.0), ('running', 2, 60.0), ('succeeded', 2, 50.0)]
+        assert [sample['elapsed'] for sample in progress] == [0, 1, 7]
+
+    def test_wait_tolerates_transient_errors(self, powerscale_module_mock, fake_clock):
+        self.mock_start_and_polls(
+            powerscale_module_mock, fake_clock,
+            [MockApiException(503), MockApiException(503),
+             MockJobApi.JOB_CREATED, MockApiException(503),
+             MockJobApi.JOB_SUCCEEDED_PHASES],
+            wait_max_errors=2)
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_details']['state'] == 'succeeded'
+        powerscale_module_mock.module.fail_json.assert_not_called()
+
+    def test_wait_fails_after_max_errors(self, powerscale_module_mock, fake_clock):
+        self.mock_start_and_polls(
+            powerscale_module_mock, fake_clock,
+            [MockApiException(503)] * 3, wait_max_errors=2)
+        self.capture_fail_json_call(
+            MockJobApi.get_job_failed_msg(), invoke_perform_module=True)
+
+    def test_wait_deadline_counts_request_latency(self, powerscale_module_mock, fake_clock):
+        fake_clock.request_latency = 30
+        self.mock_start_and_polls(
+            powerscale_module_mock, fake_clock,
+            [MockJobApi.JOB_CREATED] * 10, wait_timeout=100)
+        self.capture_fail_json_call(
+            MockJobApi.wait_timeout_msg(), invoke_perform_module=True)
+        # One lookup after start and four polls of 30 seconds each, with the
+        # sleeps in between, exhaust the 100 seconds
+        assert powerscale_module_mock.job_api.get_job_job.call_count == 5
+        assert fake_clock.sleeps == [1, 2, 4]
+
+    def test_waiter_watches_jobs_concurrently(self, fake_clock):
+        job_api = MagicMock()
+        states = {1: ['running', 'succeeded'], 2: ['running', 'running', 'failed']}
+
+        def get_job(job_id):
+            state = states[job_id].pop(0)
+            return MockSDKResponse({"jobs": [{"id": job_id, "state": state}]})
+        job_api.get_job_job = MagicMock(side_effect=get_job)
+        status = JobWaiter(job_api, MagicMock(), initial_interval=1,
+                           max_interval=8).wait([1, 2], timeout=60)
+        assert status[1]['job']['state'] == 'succeeded'
+        assert status[2]['job']['state'] == 'failed'
+        assert not status[1]['timed_out'] and not status[2]['timed_out']
+        assert job_api.get_job_job.call_count == 5
+        assert fake_clock.sleeps == [1, 2]
+
+    @pytest.mark.parametrize("job, percent", [
+        ({"progress": 25}, 25.0),
+        ({"progress": "Phase 1: 12.5% done"}, 12.5),
+        ({"progress": "Processed 10 LINs", "current_phase": 3, "total_phases": 4}, 50.0),
+        ({"progress": None}, None),
+    ])
+    def test_waiter_progress_percent(self, job, percent):
+        assert JobWaiter.get_progress_sample(job, 0)['percent'] == percent
+
+    # -------------------------------------------------------------------------
+    # Batch mode
+    # -------------------------------------------------------------------------
+    def mock_job_engine(self, powerscale_module_mock, engine, **params):
+        self.set_module_params(self.get_module_args, dict({
+            "jobs": [
+                {"job_type": "TreeDelete", "paths": ["/ifs/a"], "allow_dup": True},
+                {"job_type": "TreeDelete", "paths": ["/ifs/b"], "allow_dup": True},
+                {"job_type": "TreeDelete", "paths": ["/ifs/c"], "allow_dup": True},
+                {"job_type": "FSAnalyze", "paths": ["/ifs"], "allow_dup": False},
+                {"job_type": "SmartPools", "paths": ["/ifs"], "allow_dup": False},
+            ],
+            "wait_interval": 1,
+            "wait_max_interval": 4,
+            "wait_timeout": 600,
+        }, **params))
+        powerscale_module_mock.isi_sdk.JobJobCreateParams = MagicMock(
+            side_effect=lambda **kwargs: SimpleNamespace(**kwargs))
+        powerscale_module_mock.job_api.create_job_job = MagicMock(
+            side_effect=engine.create_job_job)
+        powerscale_module_mock.job_api.list_job_jobs = MagicMock(
+            side_effect=engine.list_job_jobs)
+        powerscale_module_mock.job_api.get_job_job = MagicMock()
+
+    def test_batch_start_and_wait(self, powerscale_module_mock, fake_clock):
+        engine = MockJobApi.FakeJobEngine(jobs=MockJobApi.JOBS_LIST_WITH_RUNNING["jobs"])
+        self.mock_job_engine(powerscale_module_mock, engine, wait=True,
+                             max_running_per_type=2)
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['changed'] is True
+        outcomes = [(entry['job_type'], entry['outcome']) for entry in exit_args['batch_jobs']]
+        assert outcomes == [("TreeDelete", "started"), ("TreeDelete", "started"),
+                            ("TreeDelete", "started"), ("FSAnalyze", "started"),
+                            ("SmartPools", "noop")]
+        assert exit_args['batch_jobs'][4]['job_id'] == 42
+        assert all(entry['job_details']['state'] == 'succeeded'
+                   for entry in exit_args['batch_jobs'][:4])
+        assert engine.max_active["TreeDelete"] == 2
+        assert powerscale_module_mock.job_api.create_job_job.call_count == 4
+        # The job states come from listings, never from per-job lookups
+        powerscale_module_mock.job_api.get_job_job.assert_not_called()
+
+    def test_batch_duplicates_within_batch(self, powerscale_module_mock, fake_clock):
+        engine = MockJobApi.FakeJobEngine()
+        self.mock_job_engine(powerscale_module_mock, engine, wait=True, jobs=[
+            {"job_type": "FSAnalyze", "paths": ["/ifs"], "allow_dup": False},
+            {"job_type": "FSAnalyze", "paths": ["/ifs/data"], "allow_dup": False},
+        ])
+        powerscale_module_mock.perform_module_operation()
+        entries = powerscale_module_mock.module.exit_json.call_args[1]['batch_jobs']
+        assert [entry['outcome'] for entry in entries] == ["started", "noop"]
+        # The duplicate points to the job started for the first spec
+        assert entries[0]['job_id'] is not None
+        assert entries[1]['job_id'] == entries[0]['job_id']
+        assert entries[1]['job_details']['id'] == entries[0]['job_id']
+        assert entries[1]['job_details']['state'] == 'succeeded'
+        assert powerscale_module_mock.job_api.create_job_job.call_count == 1
+        # The wait polls use listings only
+        powerscale_module_mock.job_api.get_job_job.assert_not_called()
+
+    def test_batch_without_wait_respects_cap(self, powerscale_module_mock, fake_clock):
+        engine = MockJobApi.FakeJobEngine(ticks_to_complete=1)
+        self.mock_job_engine(powerscale_module_mock, engine, max_running_per_type=1)
+        powerscale_module_mock.perform_module_operation()
+        entries = powerscale_module_mock.module.exit_json.call_args[1]['batch_jobs']
+        assert [entry['outcome'] for entry in entries] == ["started"] * 5
+        assert engine.max_active["TreeDelete"] == 1
+        assert 'job_progress' not in entries[0]
+
+    def test_batch_deferred_on_timeout(self, powerscale_module_mock, fake_clock):
+        engine = MockJobApi.FakeJobEngine(ticks_to_complete=100)
+        self.mock_job_engine(powerscale_module_mock, engine, max_running_per_type=1,
+                             wait_timeout=10)
+        self.capture_fail_json_call("2 of 5 batch jobs failed",
+                                    invoke_perform_module=True)
+        entries = powerscale_module_mock.module.fail_json.call_args[1]['batch_jobs']
+        assert [entry['outcome'] for entry in entries] == \
+            ["started", "deferred", "deferred", "started", "started"]
+
+    def test_batch_start_failure(self, powerscale_module_mock, fake_clock):
+        engine = MockJobApi.FakeJobEngine()
+        self.mock_job_engine(powerscale_module_mock, engine)
+        create = engine.create_job_job
+
+        def create_job_job(body):
+            if body.type == "FSAnalyze":
+                raise MockApiException(400, "Invalid job type")
+            return create(body)
+        powerscale_module_mock.job_api.create_job_job = MagicMock(side_effect=create_job_job)
+        self.capture_fail_json_call("FSAnalyze job : Invalid job type",
+                                    invoke_perform_module=True)
+
+    def test_batch_check_mode(self, powerscale_module_mock, fake_clock):
+        engine = MockJobApi.FakeJobEngine(jobs=MockJobApi.JOBS_LIST_WITH_RUNNING["jobs"])
+        self.mock_job_engine(powerscale_module_mock, engine)
+        powerscale_module_mock.module.check_mode = True
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert [entry['outcome'] for entry in exit_args['batch_jobs']] == \
+            ["started"] * 4 + ["noop"]
+        powerscale_module_mock.job_api.create_job_job.assert_not_called()
+
+    @pytest.mark.parametrize("params, msg", [
+        ({"jobs": [{"job_type": "TreeDelete", "paths": []}]}, "at least one path"),
+        ({"jobs": [{"job_type": "TreeDelete", "paths": ["/ifs"], "priority": 11}]},
+         "Invalid priority 11"),
+        ({"jobs": [], "max_running_per_type": 0}, "max_running_per_type must be"),
+    ])
+    def test_batch_invalid_params(self, powerscale_module_mock, params, msg):
+        self.set_module_params(self.get_module_args, params)
+        self.capture_fail_json_call(msg, invoke_perform_module=True)
@@ -9,8 +9,10 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import json
+
 import pytest
-from mock.mock import MagicMock
+from mock.mock import MagicMock, patch
 # pylint: disable=unused-import
 from ansible_collections.dellemc.powerscale\
     .tests.unit.plugins.module_utils\
@@ -19,6 +21,8 @@ from ansible_collections.dellemc.powerscale\
 
 from ansible_collections.dellemc.powerscale.plugins.modules.job_event_info \
     import JobEventInfo
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.job \
+    import JobHistory
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.\
     module_utils import mock_job_event_info_api as MockJobEventInfoApi
 from ansible_collections.dellemc.powerscale\
@@ -34,6 +38,9 @@ from ansible_collections.dellemc.powerscale\
     .shared_library.powerscale_unit_base \
     import PowerScaleUnitBase
 
+TIME_PATH = ('ansible_collections.dellemc.powerscale.plugins.modules.'
+             'job_event_info.time.time')
+
 
 class TestJobEventInfo(PowerScaleUnitBase):
     get_module_args = MockJobEventInfoApi.COMMON_ARGS
@@ -70,7 +77,7 @@ class TestJobEventInfo(PowerScaleUnitBase):
         events = ea['job_events']
         assert len(events) == 2
         for event in events:
-            assert event['state'] == 'running'
+            assert event['value'] == 'running'
 
     def test_list_events_begin_time_epoch(self, powerscale_module_mock):
         """U-JE-003: Filter events by begin_time as epoch timestamp."""
@@ -383,3 +390,232 @@ class TestJobEventInfo(PowerScaleUnitBase):
             mod.main()
         except (SystemExit, TypeError):
             pass
+
+    def test_split_window(self, powerscale_module_mock):
+        """U-JE-W01: Sub-windows are contiguous and do not overlap."""
+        assert JobHistory.split_window(0, 100, 4) == \
+            [(0, 25), (25, 50), (50, 75), (75, 100)]
+        assert JobHistory.split_window(10, 13, 5) == \
+            [(10, 11), (11, 12), (12, 13)]
+
+    def test_list_events_window_boundaries(self, powerscale_module_mock):
+        """U-JE-W08: Events on a sub-window boundary are returned once and
+        events at the window end are left out."""
+        events = MockJobEventInfoApi.make_events(201, step=1)
+        pager = MockJobEventInfoApi.WindowedPager(events, 'events')
+        self.set_module_params(self.get_module_args, {
+            "begin_time": str(events[0]['time']),
+            "end_time": str(events[200]['time']),
+            "parallel_windows": 4})
+        powerscale_module_mock.job_api.get_job_events = pager
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_events'] == events[:200]
+        assert [(call['begin'], call['end']) for call in pager.calls] == \
+            [(events[index]['time'], events[index + 50]['time'])
+             for index in (0, 50, 100, 150)]
+
+    def test_list_events_parallel_windows(self, powerscale_module_mock):
+        """U-JE-W02: Sub-windows are fetched concurrently and merged in
+        time order."""
+        events = MockJobEventInfoApi.make_events(1000)
+        pager = MockJobEventInfoApi.WindowedPager(events, 'events',
+                                                  page_size=50, latency=0.01)
+        self.set_module_params(self.get_module_args, {
+            "begin_time": str(MockJobEventInfoApi.WINDOW_BEGIN),
+            "end_time": str(events[-1]['time'] + 1),
+            "parallel_windows": 10, "state": "running"})
+        powerscale_module_mock.job_api.get_job_events = pager
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_events'] == events
+        assert exit_args['total_events'] == 1000
+        assert len(pager.calls) == 20
+        assert pager.peak_in_flight > 1
+        first_pages = [call for call in pager.calls if 'resume' not in call]
+        assert len(first_pages) == 10
+        assert all(call['state'] == 'running' for call in pager.calls)
+
+    def test_list_events_max_items_stops_early(self, powerscale_module_mock):
+        """U-JE-W03: max_items stops the later sub-windows."""
+        events = MockJobEventInfoApi.make_events(1000)
+        pager = MockJobEventInfoApi.WindowedPager(events, 'events',
+                                                  page_size=50)
+        self.set_module_params(self.get_module_args, {
+            "begin_time": str(MockJobEventInfoApi.WINDOW_BEGIN),
+            "end_time": str(events[-1]['time'] + 1),
+            "parallel_windows": 10, "max_workers": 1, "max_items": 150})
+        powerscale_module_mock.job_api.get_job_events = pager
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_events'] == events[:150]
+        assert len(pager.calls) == 3
+
+    def test_list_events_max_items_follows_resume(self,
+                                                  powerscale_module_mock):
+        """U-JE-W04: With max_items, limit is the page size."""
+        events = MockJobEventInfoApi.make_events(30)
+        pager = MockJobEventInfoApi.WindowedPager(events, 'events')
+        self.set_module_params(self.get_module_args, {
+            "limit": 10, "max_items": 25})
+        powerscale_module_mock.job_api.get_job_events = pager
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_events'] == events[:25]
+        assert len(pager.calls) == 3
+
+    def test_list_events_output_file(self, powerscale_module_mock, tmp_path):
+        """U-JE-W05: Events are streamed to a JSON lines file."""
+        events = MockJobEventInfoApi.make_events(120)
+        output_file = str(tmp_path / 'events.jsonl')
+        self.set_module_params(self.get_module_args, {
+            "duration": {"value": 2, "unit": "hours"},
+            "parallel_windows": 4, "output_file": output_file})
+        powerscale_module_mock.job_api.get_job_events = \
+            MockJobEventInfoApi.WindowedPager(events, 'events')
+        with patch(TIME_PATH, return_value=events[-1]['time'] + 1):
+            powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_events'] == []
+        assert exit_args['total_events'] == 120
+        assert exit_args['output_file'] == output_file
+        with open(output_file) as output:
+            written = [json.loads(line) for line in output]
+        assert written == events
+
+    def test_list_events_parallel_requires_begin(self,
+                                                 powerscale_module_mock):
+        """U-JE-W06: parallel_windows without a time window fails."""
+        self.set_module_params(self.get_module_args,
+                               {"parallel_windows": 4})
+        self.capture_fail_json_call(
+            'parallel_windows requires begin_time or duration',
+            invoke_perform_module=True)
+
+    def test_list_events_parallel_window_exception(self,
+                                                   powerscale_module_mock):
+        """U-JE-W07: A failing sub-window fails the module."""
+        self.set_module_params(self.get_module_args, {
+            "begin_time": "1700000000", "end_time": "1700003599",
+            "parallel_windows": 2})
+        powerscale_module_mock.job_api.get_job_events = MagicMock(
+            side_effect=MockApiException)
+        self.capture_fail_json_call(
+            MockJobEventInfoApi.get_events_failed_msg(),
+            invoke_perform_module=True)
+
+    @pytest.mark.parametrize("params", [
+        {"parallel_windows": 0}, {"max_workers": 0}, {"max_items": -1}])
+    def test_list_events_invalid_fetch_params(self, powerscale_module_mock,
+                                              params):
+        """U-JE-W08: Invalid fetch parameters fail the module."""
+        self.set_module_params(self.get_module_args, params)
+        self.capture_fail_json_call(list(params)[0],
+                                    invoke_perform_module=True)
+
+    def test_list_events_cursor(self, powerscale_module_mock, tmp_path):
+        """U-JE-K01: A cursor returns only events newer than the last run."""
+        cursor_file = str(tmp_path / 'cursor.json')
+        events = MockJobEventInfoApi.make_events(10)
+        same_second = dict(events[4], id=100)
+        pager = MockJobEventInfoApi.WindowedPager(events[:5], 'events')
+        self.set_module_params(self.get_module_args, {
+            "begin_time": "1690000000", "cursor_file": cursor_file})
+        powerscale_module_mock.module.check_mode = False
+        powerscale_module_mock.job_api.get_job_events = pager
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_events'] == events[:5]
+        assert exit_args['cursor'] == {"time": events[4]['time'],
+                                       "ids": [events[4]['id']]}
+
+        pager = MockJobEventInfoApi.WindowedPager(
+            events + [same_second], 'events')
+        powerscale_module_mock.job_api.get_job_events = pager
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert [event['id'] for event in exit_args['job_events']] == \
+            [100] + [event['id'] for event in events[5:]]
+        assert pager.calls[0]['begin'] == events[4]['time']
+        with open(cursor_file) as state_file:
+            state = json.load(state_file)
+        assert state['test.example.com:8080']['events'] == \
+            {"time": events[9]['time'], "ids": [events[9]['id']]}
+
+    def test_list_events_cursor_max_items(self, powerscale_module_mock,
+                                          tmp_path):
+        """U-JE-K02: Events already read do not count towards max_items."""
+        cursor_file = tmp_path / 'cursor.json'
+        events = [dict(event, time=1700000000)
+                  for event in MockJobEventInfoApi.make_events(6)]
+        cursor_file.write_text(json.dumps({"test.example.com:8080": {
+            "events": {"time": 1700000000,
+                       "ids": [event['id'] for event in events[:3]]},
+            "reports": {"time": 1, "ids": [1]}}}))
+        self.set_module_params(self.get_module_args, {
+            "begin_time": "1690000000", "max_items": 2,
+            "cursor_file": str(cursor_file)})
+        powerscale_module_mock.module.check_mode = False
+        powerscale_module_mock.job_api.get_job_events = \
+            MockJobEventInfoApi.WindowedPager(events, 'events')
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_events'] == events[3:5]
+        state = json.loads(cursor_file.read_text())
+        assert state['test.example.com:8080']['events']['ids'] == \
+            [event['id'] for event in events[:5]]
+        assert state['test.example.com:8080']['reports'] == \
+            {"time": 1, "ids": [1]}
+
+    def test_list_events_cursor_check_mode(self, powerscale_module_mock,
+                                           tmp_path):
+        """U-JE-K03: The cursor file is not written in check mode."""
+        cursor_file = tmp_path / 'cursor.json'
+        self.set_module_params(self.get_module_args, {
+            "cursor_file": str(cursor_file)})
+        powerscale_module_mock.module.check_mode = True
+        powerscale_module_mock.job_api.get_job_events = MagicMock(
+            return_value=MockSDKResponse(MockJobEventInfoApi.EVENTS_ALL))
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['cursor']['ids'] == [459]
+        assert not cursor_file.exists()
+
+    def test_list_events_cursor_invalid_file(self, powerscale_module_mock,
+                                             tmp_path):
+        """U-JE-K04: An unreadable cursor file fails the module."""
+        cursor_file = tmp_path / 'cursor.json'
+        cursor_file.write_text('not json')
+        self.set_module_params(self.get_module_args, {
+            "cursor_file": str(cursor_file)})
+        self.capture_fail_json_call('Failed to read the cursor file',
+                                    invoke_perform_module=True)
+
+    def test_list_events_cursor_same_time(self, powerscale_module_mock,
+                                          tmp_path):
+        """U-JE-K05: The cursor keeps only the IDs of the events at its
+        time."""
+        cursor_file = tmp_path / 'cursor.json'
+        events = MockJobEventInfoApi.make_events(6)
+        last_time = events[5]['time']
+        events[3:] = [dict(event, time=last_time) for event in events[3:]]
+        self.set_module_params(self.get_module_args, {
+            "begin_time": "1690000000", "cursor_file": str(cursor_file)})
+        powerscale_module_mock.module.check_mode = False
+        powerscale_module_mock.job_api.get_job_events = \
+            MockJobEventInfoApi.WindowedPager(events, 'events')
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['cursor'] == {
+            "time": last_time, "ids": [event['id'] for event in events[3:]]}
+
+        late_event = dict(events[0], id=100, time=last_time)
+        powerscale_module_mock.job_api.get_job_events = \
+            MockJobEventInfoApi.WindowedPager(events + [late_event], 'events')
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_events'] == [late_event]
+        state = json.loads(cursor_file.read_text())
+        assert state['test.example.com:8080']['events'] == {
+            "time": last_time,
+            "ids": [event['id'] for event in events[3:]] + [100]}
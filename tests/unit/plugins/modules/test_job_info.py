@@ -9,6 +9,8 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import time
+
 import pytest
 from mock.mock import MagicMock
 # pylint: disable=unused-import
@@ -371,3 +373,91 @@ class TestJobInfo(PowerScaleUnitBase):
             mod.main()
         except (SystemExit, TypeError):
             pass
+
+    # U-JI-P01: Resume tokens are followed for a single state
+    def test_list_jobs_follows_resume(self, powerscale_module_mock):
+        jobs = MockJobInfoApi.make_jobs(25)
+        lister = MockJobInfoApi.PagedJobLister(jobs, page_size=10)
+        self.set_module_params(self.get_module_args, {})
+        powerscale_module_mock.job_api = MagicMock()
+        powerscale_module_mock.job_api.list_job_jobs = lister
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_details'] == jobs
+        assert exit_args['total_jobs'] == 25
+        assert lister.calls[1:] == [{'resume': 'resume-1'},
+                                    {'resume': 'resume-2'}]
+
+    # U-JI-P02: Limit stops the stream once enough jobs match the type
+    def test_list_jobs_limit_with_type_filter(self, powerscale_module_mock):
+        lister = MockJobInfoApi.PagedJobLister(
+            MockJobInfoApi.make_jobs(100), page_size=10)
+        self.set_module_params(self.get_module_args, {
+            "job_type": ["TreeDelete"], "limit": 5})
+        powerscale_module_mock.job_api = MagicMock()
+        powerscale_module_mock.job_api.list_job_jobs = lister
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert [job['id'] for job in exit_args['job_details']] == \
+            [2, 6, 10, 14, 18]
+        assert len(lister.calls) == 4
+
+    # U-JI-P03: Multiple states are merged in sort order without duplicates
+    def test_list_jobs_multi_state_sorted_merge(self, powerscale_module_mock):
+        jobs = MockJobInfoApi.make_jobs(30)
+        duplicate = dict(jobs[0], state='paused_user')
+        lister = MockJobInfoApi.PagedJobLister(jobs + [duplicate],
+                                               page_size=4)
+        self.set_module_params(self.get_module_args, {
+            "state": ["running", "paused_user"], "sort": "id",
+            "dir": "DESC", "limit": 8})
+        powerscale_module_mock.job_api = MagicMock()
+        powerscale_module_mock.job_api.list_job_jobs = lister
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert [job['id'] for job in exit_args['job_details']] == \
+            [27, 26, 22, 21, 17, 16, 12, 11]
+
+    # U-JI-P04: A failing state fails the module with the state named
+    def test_list_jobs_multi_state_exception(self, powerscale_module_mock):
+        lister = MockJobInfoApi.PagedJobLister(MockJobInfoApi.make_jobs(10))
+
+        def list_job_jobs(**query):
+            if query.get('state') == 'paused_user':
+                raise MockApiException(500, "SDK Error message")
+            return lister(**query)
+
+        self.set_module_params(self.get_module_args, {
+            "state": ["running", "paused_user"]})
+        powerscale_module_mock.job_api = MagicMock()
+        powerscale_module_mock.job_api.list_job_jobs = list_job_jobs
+        self.capture_fail_json_call(
+            MockJobInfoApi.list_jobs_failed_msg(), invoke_perform_module=True)
+        fail_msg = powerscale_module_mock.module.fail_json.call_args[1]['msg']
+        assert 'paused_user' in fail_msg
+
+    # U-JI-P05: Benchmark listing every active state on a 10k job cluster
+    @pytest.mark.parametrize("job_count", [1000, 10000])
+    def test_list_jobs_benchmark(self, powerscale_module_mock, job_count):
+        latency = 0.02
+        page_size = 500
+        jobs = MockJobInfoApi.make_jobs(job_count)
+        lister = MockJobInfoApi.PagedJobLister(jobs, page_size=page_size,
+                                               latency=latency)
+        self.set_module_params(self.get_module_args, {
+            "state": MockJobInfoApi.JOB_STATES, "job_type": ["SmartPools"]})
+        powerscale_module_mock.job_api = MagicMock()
+        powerscale_module_mock.job_api.list_job_jobs = lister
+        start = time.perf_counter()
+        powerscale_module_mock.perform_module_operation()
+        elapsed = time.perf_counter() - start
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        expected = [job['id'] for job in jobs if job['type'] == 'SmartPools']
+        listed = [job['id'] for job in exit_args['job_details']]
+        assert sorted(listed) == expected
+        assert len(set(listed)) == len(listed)
+        per_state = -(-job_count // len(MockJobInfoApi.JOB_STATES))
+        pages = len(MockJobInfoApi.JOB_STATES) * -(-per_state // page_size)
+        assert len(lister.calls) == pages
+        assert lister.peak_in_flight > 1
+        assert elapsed < pages * latency
@@ -9,6 +9,9 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import json
+import random
+
 import pytest
 from mock.mock import MagicMock
 # pylint: disable=unused-import
@@ -19,8 +22,13 @@ from ansible_collections.dellemc.powerscale\
 
 from ansible_collections.dellemc.powerscale.plugins.modules.job_report_info \
     import JobReportInfo
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.job_statistics \
+    import StreamingQuantile, get_report_measure, get_report_value, \
+    is_failed_report
 from ansible_collections.dellemc.powerscale.tests.unit.plugins. \
     module_utils import mock_job_report_info_api as MockJobReportInfoApi
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.\
+    module_utils import mock_job_event_info_api as MockJobEventInfoApi
 from ansible_collections.dellemc.powerscale\
     .tests.unit.plugins.module_utils\
     .mock_sdk_response \
@@ -240,3 +248,173 @@ class TestJobReportInfo(PowerScaleUnitBase):
             mod.main()
         except (SystemExit, TypeError):
             pass
+
+    # U-JR-W01: Sub-windows are fetched concurrently and merged in order
+    def test_get_reports_parallel_windows(self, powerscale_module_mock):
+        reports = MockJobReportInfoApi.make_reports(400)
+        pager = MockJobEventInfoApi.WindowedPager(reports, 'reports',
+                                                  page_size=25, latency=0.01)
+        self.set_module_params(self.get_module_args, {
+            "begin": reports[0]['time'],
+            "end": reports[-1]['time'] + 1,
+            "verbose": True, "parallel_windows": 8})
+        powerscale_module_mock.job_api.get_job_reports = pager
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_reports'] == reports
+        assert len(pager.calls) == 16
+        assert pager.peak_in_flight > 1
+        assert all(call['verbose'] for call in pager.calls)
+
+    # U-JR-W02: max_items caps the merged reports written to a file
+    def test_get_reports_output_file_max_items(self, powerscale_module_mock,
+                                               tmp_path):
+        reports = MockJobReportInfoApi.make_reports(200)
+        output_file = str(tmp_path / 'reports.jsonl')
+        self.set_module_params(self.get_module_args, {
+            "begin": reports[0]['time'],
+            "end": reports[-1]['time'] + 1,
+            "parallel_windows": 4, "max_items": 60,
+            "output_file": output_file})
+        powerscale_module_mock.job_api.get_job_reports = \
+            MockJobEventInfoApi.WindowedPager(reports, 'reports',
+                                              page_size=20)
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_reports'] == []
+        assert exit_args['total_reports'] == 60
+        with open(output_file) as output:
+            assert [json.loads(line) for line in output] == reports[:60]
+
+    # U-JR-W03: Writing to an unwritable file fails the module
+    def test_get_reports_output_file_error(self, powerscale_module_mock,
+                                           tmp_path):
+        self.set_module_params(self.get_module_args, {
+            "output_file": str(tmp_path / 'missing' / 'reports.jsonl')})
+        powerscale_module_mock.job_api.get_job_reports = MagicMock(
+            return_value=MockSDKResponse(MockJobReportInfoApi.REPORTS_ALL))
+        self.capture_fail_json_call('Failed to write job reports',
+                                    invoke_perform_module=True)
+
+    # U-JR-W04: parallel_windows without begin fails
+    def test_get_reports_parallel_requires_begin(self,
+                                                 powerscale_module_mock):
+        self.set_module_params(self.get_module_args,
+                               {"parallel_windows": 2})
+        self.capture_fail_json_call('parallel_windows requires begin',
+                                    invoke_perform_module=True)
+
+    # U-JR-K01: A cursor returns only reports newer than the last run
+    def test_get_reports_cursor(self, powerscale_module_mock, tmp_path):
+        cursor_file = str(tmp_path / 'cursor.json')
+        reports = MockJobReportInfoApi.make_reports(8)
+        self.set_module_params(self.get_module_args, {
+            "cursor_file": cursor_file})
+        powerscale_module_mock.module.check_mode = False
+        powerscale_module_mock.job_api.get_job_reports = \
+            MockJobEventInfoApi.WindowedPager(reports[:3], 'reports')
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['total_reports'] == 3
+
+        pager = MockJobEventInfoApi.WindowedPager(reports, 'reports')
+        powerscale_module_mock.job_api.get_job_reports = pager
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_reports'] == reports[3:]
+        assert pager.calls[0]['begin'] == reports[2]['time']
+        assert exit_args['cursor'] == {"time": reports[7]['time'],
+                                       "ids": [reports[7]['id']]}
+
+    # U-JR-K02: A failure to write the cursor fails the module
+    def test_get_reports_cursor_write_error(self, powerscale_module_mock,
+                                            tmp_path):
+        self.set_module_params(self.get_module_args, {
+            "cursor_file": str(tmp_path / 'missing' / 'cursor.json')})
+        powerscale_module_mock.module.check_mode = False
+        powerscale_module_mock.job_api.get_job_reports = MagicMock(
+            return_value=MockSDKResponse(MockJobReportInfoApi.REPORTS_ALL))
+        self.capture_fail_json_call('Failed to update the cursor file',
+                                    invoke_perform_module=True)
+
+    # U-JR-A01: Reports are aggregated into per job type statistics
+    def test_get_reports_aggregate(self, powerscale_module_mock):
+        reports = MockJobReportInfoApi.make_phase_reports(1000)
+        pager = MockJobEventInfoApi.WindowedPager(reports, 'reports',
+                                                  page_size=100)
+        self.set_module_params(self.get_module_args, {
+            "aggregate": True, "verbose": True, "limit": 100})
+        powerscale_module_mock.job_api.get_job_reports = pager
+        powerscale_module_mock.perform_module_operation()
+        exit_args = powerscale_module_mock.module.exit_json.call_args[1]
+        assert exit_args['job_reports'] == []
+        assert exit_args['total_reports'] == 6000
+        assert len(pager.calls) == 60
+        summary = exit_args['job_report_summary']
+        assert sorted(summary) == ['SmartPools', 'TreeDelete']
+        tree_delete = summary['TreeDelete']
+        assert tree_delete['report_count'] == 3000
+        assert tree_delete['failed_reports'] == 120
+        assert tree_delete['failure_rate'] == 0.04
+        assert tree_delete['first_report_time'] == 1700001000
+        assert tree_delete['last_report_time'] == 1700999151
+        runtime = tree_delete['runtime']
+        assert runtime['count'] == 1000
+        assert (runtime['min'], runtime['max'], runtime['mean']) == \
+            (2.0, 51.0, 26.5)
+        assert abs(runtime['p50'] - 26.5) <= 3
+        assert abs(runtime['p90'] - 46) <= 3
+        assert tree_delete['lins_processed'] == 265000
+        assert tree_delete['bytes_processed'] == 265000 * 4096 // 10
+        assert tree_delete['lins_per_second']['count'] == 1000
+        assert tree_delete['lins_per_second']['p50'] == 10
+        assert tree_delete['bytes_per_second']['p50'] == 4096
+        assert sorted(tree_delete['values']) == ['Bytes processed',
+                                                 'LINs processed']
+        assert summary['SmartPools']['failed_reports'] == 0
+        assert sum(phase['report_count'] for phase in
+                   tree_delete['phases'].values()) == 3000
+
+    # U-JR-A02: Streaming quantiles track exact percentiles
+    @pytest.mark.parametrize("quantile", [0.5, 0.9, 0.99])
+    def test_streaming_quantile_accuracy(self, powerscale_module_mock,
+                                         quantile):
+        generator = random.Random(7)
+        values = [generator.lognormvariate(3, 1) for dummy in range(20000)]
+        estimator = StreamingQuantile(quantile)
+        for value in values:
+            estimator.add(value)
+        exact = sorted(values)[int(quantile * (len(values) - 1))]
+        assert abs(estimator.value() - exact) / exact < 0.05
+
+    # U-JR-A03: Quantiles of a few values are exact
+    def test_streaming_quantile_small(self, powerscale_module_mock):
+        estimator = StreamingQuantile(0.5)
+        assert estimator.value() is None
+        for value in (5, 1, 3):
+            estimator.add(value)
+        assert estimator.value() == 3
+
+    # U-JR-A04: Only the numeric values of SDK reports are summarized
+    @pytest.mark.parametrize("value, expected", [
+        ("120", 120.0), ("0.5", 0.5), ("LINs processed: 500", None),
+        ("nan", None), ("inf", None), ("", None), (None, None)])
+    def test_get_report_value(self, powerscale_module_mock, value,
+                              expected):
+        report = dict(MockJobReportInfoApi.REPORT_1, value=value)
+        assert get_report_value(report) == expected
+
+    # U-JR-A05: The status of a report tells whether its job failed
+    def test_is_failed_report(self, powerscale_module_mock):
+        assert [is_failed_report(report) for report in (
+            MockJobReportInfoApi.REPORT_1, MockJobReportInfoApi.REPORT_2,
+            MockJobReportInfoApi.REPORT_3,
+            dict(MockJobReportInfoApi.REPORT_1, status=None))] == \
+            [False, False, True, False]
+
+    # U-JR-A06: Report keys naming LINs or bytes are measured
+    @pytest.mark.parametrize("key, measure", [
+        ("LINs processed", "lins"), ("Bytes freed", "bytes"),
+        ("lin_count", "lins"), ("Elapsed time", None), (None, None)])
+    def test_get_report_measure(self, powerscale_module_mock, key, measure):
+        assert get_report_measure({'key': key}) == measure
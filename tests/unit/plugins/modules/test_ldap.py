@@ -19,6 +19,8 @@ from ansible_collections.dellemc.powerscale.tests.unit.plugins.\
     module_utils import mock_ldap_api as MockLdapApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base import \
     PowerScaleUnitBase
 
@@ -41,6 +43,11 @@ class TestLdap(PowerScaleUnitBase):
     def module_object(self):
         return Ldap
 
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api_instance.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
     def test_create(self, powerscale_module_mock):
         self.set_module_params(self.get_ldap_args, {
             'ldap_name': 'ldap1',
@@ -234,3 +241,25 @@ class TestLdap(PowerScaleUnitBase):
             return_value=MockLdapApi.LDAP)
         main()
         powerscale_module_mock.get_ldap_details(ldap_name)
+
+    def test_update_ldap_linked_access_zones(self, powerscale_module_mock):
+        powerscale_module_mock.module.params = self.get_ldap_args
+        powerscale_module_mock.zones_api_instance.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response(
+                auth_providers={
+                    "System": ["lsa-ldap-provider:ldap1"],
+                    "sample_zone": ["lsa-file-provider:System",
+                                    "lsa-ldap-provider:ldap1"]}))
+        provider = MagicMock(id="lsa-ldap-provider:ldap1", type="ldap")
+        provider.name = "ldap1"
+        powerscale_module_mock.auth_api_instance.get_providers_summary = \
+            MagicMock(return_value=MagicMock(provider_instances=[provider]))
+        ldap_details = {}
+        powerscale_module_mock.update_ldap_access_zone_info("LDAP1",
+                                                            ldap_details)
+        powerscale_module_mock.update_ldap_access_zone_info("ldap1",
+                                                            ldap_details)
+        assert ldap_details["linked_access_zones"] == ["System",
+                                                       "sample_zone"]
+        powerscale_module_mock.zones_api_instance.list_zones. \
+            assert_called_once_with()
@@ -26,6 +26,8 @@ from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock
     import MockSDKResponse
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base \
     import PowerScaleUnitBase
 
@@ -43,6 +45,11 @@ class TestNfsExport(PowerScaleUnitBase):
         """
         return NfsExport
 
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
     def test_get_nfs_response(self, powerscale_module_mock):
         self.set_module_params(
             self.get_nfs_args,
@@ -75,8 +82,6 @@ class TestNfsExport(PowerScaleUnitBase):
             {"path": "/sample_file_path1",
              "access_zone": "sample_zone",
              "state": MockNFSApi.STATE_P})
-        powerscale_module_mock.zones_summary_api.get_zones_summary_zone.to_dict = MagicMock(
-            return_value=MockSDKResponse(MockNFSApi.ZONE))
         powerscale_module_mock.protocol_api.list_nfs_exports = MagicMock(
             return_value=NFSTestExport(1, MockNFSApi.NFS_1['exports'])
         )
@@ -92,7 +97,7 @@ class TestNfsExport(PowerScaleUnitBase):
              "state": MockNFSApi.STATE_P})
         powerscale_module_mock.protocol_api.list_nfs_exports = MagicMock(
             return_value=NFSTestExport(1, MockNFSApi.NFS_1['exports']))
-        powerscale_module_mock.zones_summary_api.get_zones_summary_zone = MagicMock(
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
             side_effect=MockApiException(404))
         self.capture_fail_json_call(MockNFSApi.get_nfs_non_zone_failed_msg(), NFSHandler)
 
@@ -427,12 +432,16 @@ class TestNfsExport(PowerScaleUnitBase):
             {"path": "sample-path",
              "access_zone": MockNFSApi.SAMPLE_ZONE,
              "state": MockNFSApi.STATE_P})
-        powerscale_module_mock.zones_summary_api.get_zones_summary_zone = MagicMock(
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
             side_effect=MockApiException)
         self.capture_fail_json_call(MockNFSApi.get_failed_msgs("az_path_err"), NFSHandler)
-        powerscale_module_mock.zones_summary_api.get_zones_summary_zone = MagicMock()
 
     def test_multiple_nfs_exception(self, powerscale_module_mock):
+        self.set_module_params(
+            self.get_nfs_args,
+            {"path": MockNFSApi.PATH_1,
+             "access_zone": MockNFSApi.SAMPLE_ZONE,
+             "state": MockNFSApi.STATE_P})
         powerscale_module_mock.protocol_api.list_nfs_exports.return_value.total = 2
         self.capture_fail_json_call("Multiple NFS Exports found", NFSHandler)
 
@@ -8,6 +8,9 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import json
+import time
+
 import pytest
 from mock.mock import patch, MagicMock
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.initial_mock \
@@ -21,6 +24,8 @@ from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock
     import MockSDKResponse
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base import \
     PowerScaleUnitBase
 
@@ -42,6 +47,11 @@ class TestNfsAlias(PowerScaleUnitBase):
     def module_object(self, mocker):
         return NfsAlias
 
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
     def test_get_nfs_alias_by_name_response(self, powerscale_module_mock):
         self.get_nfs_alias_args.update({"nfs_alias_name": self.nfs_alias_name_1,
                                         "state": "present"})
@@ -161,3 +171,62 @@ class TestNfsAlias(PowerScaleUnitBase):
         powerscale_module_mock.perform_module_operation()
         powerscale_module_mock.protocol_api.delete_nfs_alias.assert_called()
         assert powerscale_module_mock.module.exit_json.call_args[1]['changed'] is True
+
+    def test_zone_base_path_single_zone_request(self, powerscale_module_mock):
+        powerscale_module_mock.module.params = dict(self.get_nfs_alias_args)
+        assert powerscale_module_mock.get_zone_base_path("sample_zone") == \
+            "/ifs/sample_zone"
+        assert powerscale_module_mock.get_zone_base_path("NON-SYSTEM") == \
+            "/ifs/non-System"
+        assert powerscale_module_mock.get_zone_base_path("test-zone") == \
+            "/ifs/test_user_1"
+        powerscale_module_mock.zones_api.list_zones.assert_called_once_with()
+
+    def test_zone_base_path_not_found_exception(self, powerscale_module_mock):
+        powerscale_module_mock.module.params = dict(self.get_nfs_alias_args)
+        with pytest.raises(SystemExit):
+            powerscale_module_mock.get_zone_base_path("missing_zone")
+        assert powerscale_module_mock.module.fail_json.call_args[1]['msg'] == \
+            "Unable to fetch base path of Access Zone missing_zone failed " \
+            "with error: Access zone missing_zone does not exist"
+
+    def test_zone_base_path_cache_file(self, powerscale_module_mock, tmp_path):
+        cache_file = str(tmp_path / "zones.json")
+        powerscale_module_mock.module.params = dict(
+            self.get_nfs_alias_args, onefs_host="10.1.1.1", port_no="8080",
+            zone_cache_file=cache_file, zone_cache_ttl=300)
+        assert powerscale_module_mock.get_zone_base_path("sample_zone") == \
+            "/ifs/sample_zone"
+        with open(cache_file) as cache:
+            assert [zone["name"] for zone in
+                    json.load(cache)["10.1.1.1:8080"]["zones"]] == \
+                list(MockZoneTopologyApi.ZONE_PATHS)
+
+        # A later task reads the topology from the cache file
+        powerscale_module_mock.zone_topology = None
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            side_effect=MockApiException)
+        assert powerscale_module_mock.get_zone_base_path("nonsystem") == \
+            "/ifs/nonsystem"
+
+        # A zone missing from the cache file is fetched again
+        powerscale_module_mock.zone_topology = None
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response(
+                dict(MockZoneTopologyApi.ZONE_PATHS, new_zone="/ifs/new")))
+        assert powerscale_module_mock.get_zone_base_path("new_zone") == \
+            "/ifs/new"
+        powerscale_module_mock.zones_api.list_zones.assert_called_once_with()
+
+    def test_zone_base_path_cache_file_expired(self, powerscale_module_mock,
+                                               tmp_path):
+        cache_file = tmp_path / "zones.json"
+        cache_file.write_text(json.dumps({"10.1.1.1:8080": {
+            "time": time.time() - 600,
+            "zones": MockZoneTopologyApi.get_zones({"sample_zone": "/old"})}}))
+        powerscale_module_mock.module.params = dict(
+            self.get_nfs_alias_args, onefs_host="10.1.1.1", port_no="8080",
+            zone_cache_file=str(cache_file), zone_cache_ttl=300)
+        assert powerscale_module_mock.get_zone_base_path("sample_zone") == \
+            "/ifs/sample_zone"
+        powerscale_module_mock.zones_api.list_zones.assert_called_once_with()
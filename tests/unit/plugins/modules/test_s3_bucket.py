@@ -8,6 +8,7 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import copy
 import pytest
 from mock.mock import MagicMock
 # pylint: disable=unused-import
@@ -26,6 +27,8 @@ from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock
     import MockS3BucketeApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
 
 
 class TestS3Bucket(PowerScaleUnitBase):
@@ -35,6 +38,18 @@ class TestS3Bucket(PowerScaleUnitBase):
     def module_object(self):
         return S3Bucket
 
+    @pytest.fixture(autouse=True)
+    def s3bucket_common_args(self):
+        # The access zones are validated against the zone topology, so the
+        # tests must not see the parameters updated by the previous ones
+        self.s3bucket_args = copy.deepcopy(
+            MockS3BucketeApi.S3_BUCKET_COMMON_ARGS)
+
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
     def test_get_s3_bucket_details(self, powerscale_module_mock):
         self.s3bucket_args.update({
             "s3_bucket_name": MockS3BucketeApi.BUCKET_NAME,
@@ -80,8 +95,6 @@ class TestS3Bucket(PowerScaleUnitBase):
         powerscale_module_mock.module.params = self.s3bucket_args
         powerscale_module_mock.protocol_api.get_s3_bucket = MagicMock(
             return_value={})
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone.to_dict = MagicMock(
-            return_value=MockS3BucketeApi.ZONE_PATH)
         powerscale_module_mock.isi_sdk.S3BucketCreateParams = MagicMock(
             return_value=MockS3BucketeApi.CREATE_S3_OBJECT_PARAMS)
         S3BucketHandler().handle(powerscale_module_mock,
@@ -242,8 +255,6 @@ class TestS3Bucket(PowerScaleUnitBase):
         powerscale_module_mock.module.params = self.s3bucket_args
         powerscale_module_mock.protocol_api.get_s3_bucket = MagicMock(
             return_value={})
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone.to_dict = MagicMock(
-            return_value=MockS3BucketeApi.ZONE_PATH)
         powerscale_module_mock.isi_sdk.S3BucketCreateParams = MagicMock(
             side_effect=MockApiException)
         self.capture_fail_json_call(
@@ -291,7 +302,7 @@ class TestS3Bucket(PowerScaleUnitBase):
         powerscale_module_mock.module.params = self.s3bucket_args
         powerscale_module_mock.protocol_api.get_s3_bucket = MagicMock(
             return_value={})
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone = MagicMock(
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
             side_effect=MockApiException)
         self.capture_fail_json_call(
             MockS3BucketeApi.get_s3_bucket_exception_response(
@@ -334,7 +345,7 @@ class TestS3Bucket(PowerScaleUnitBase):
         powerscale_module_mock.module.params = self.s3bucket_args
         powerscale_module_mock.protocol_api.get_s3_bucket = MagicMock(
             return_value={})
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone = MagicMock(
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
             side_effect=MockApiException)
         self.capture_fail_json_call(
             MockS3BucketeApi.get_error_responses(
@@ -20,6 +20,8 @@ from ansible_collections.dellemc.powerscale.tests.unit.plugins. \
     module_utils.mock_smartquota_api import MockSmartQuotaApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base import \
     PowerScaleUnitBase
 
@@ -32,6 +34,11 @@ class TestSmartQuota(PowerScaleUnitBase):
         utils.convert_size_with_unit = MagicMock()
         return SmartQuota
 
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
     @pytest.mark.parametrize("params", [{"path": MockSmartQuotaApi.PATH1,
                                          "access_zone": "System",
                                          "quota_type": "user",
@@ -18,6 +18,8 @@ from ansible_collections.dellemc.powerscale.plugins.modules.smb import SMB, SMBH
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_smb_api import MockSMBApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base \
     import PowerScaleUnitBase
 
@@ -35,6 +37,11 @@ class TestSMB(PowerScaleUnitBase):
         """
         return SMB
 
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
     def test_get_smb_by_name_response(self, powerscale_module_mock):
         self.set_module_params(self.smb_args,
                                {"share_name": MockSMBApi.SMB_NAME, "state": MockSMBApi.STATE_P})
@@ -8,7 +8,9 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import copy
 import pytest
+from types import SimpleNamespace
 from mock.mock import patch, MagicMock
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.initial_mock \
     import utils
@@ -21,6 +23,8 @@ from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock
     import MockSDKResponse
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base \
     import PowerScaleUnitBase
 
@@ -35,7 +39,9 @@ class TestSnapshot(PowerScaleUnitBase):
         "desired_retention": None,
         "retention_unit": None,
         "alias": None,
-        "state": None
+        "state": None,
+        "snapshots": None,
+        "max_workers": 10
     }
 
     snapshot_name_1 = "ansible_test_snapshot"
@@ -44,6 +50,17 @@ class TestSnapshot(PowerScaleUnitBase):
     def module_object(self, mocker):
         return Snapshot
 
+    @pytest.fixture(autouse=True)
+    def snapshot_args(self):
+        # The access zones are validated against the zone topology, so the
+        # tests must not see the parameters updated by the previous ones
+        self.get_snapshot_args = copy.deepcopy(TestSnapshot.get_snapshot_args)
+
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
     def test_get_snapshot_by_name_response(self, powerscale_module_mock):
         self.get_snapshot_args.update({"snapshot_name": self.snapshot_name_1,
                                        "state": "present"})
@@ -210,7 +227,7 @@ class TestSnapshot(PowerScaleUnitBase):
         powerscale_module_mock.module.params = self.get_snapshot_args
         powerscale_module_mock.snapshot_api.get_snapshot_snapshot = MagicMock(
             return_value=None)
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone = MagicMock(
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
             side_effect=utils.ApiException)
         self.capture_fail_json_call(
             MockSnapshotApi.invalid_access_zone_failed_msg(),
@@ -430,7 +447,6 @@ class TestSnapshot(PowerScaleUnitBase):
 
     def test_compute_expiration_hours(self, powerscale_module_mock):
         """Test _compute_expiration with hours unit."""
-        from datetime import datetime, timedelta
         import time
 
         snap_creation_timestamp = time.time()
@@ -444,7 +460,6 @@ class TestSnapshot(PowerScaleUnitBase):
 
     def test_compute_expiration_days(self, powerscale_module_mock):
         """Test _compute_expiration with days unit."""
-        from datetime import datetime, timedelta
         import time
 
         snap_creation_timestamp = time.time()
@@ -495,7 +510,6 @@ class TestSnapshot(PowerScaleUnitBase):
     def test_check_timestamp_modified_diff(self, powerscale_module_mock):
         """Test _check_timestamp_modified when timestamps differ by more than 2 minutes."""
         import time
-        from datetime import datetime, timedelta
 
         snap_data = {'expires': time.time()}
         expiration_timestamp = time.time() + 300  # 5 minutes difference
@@ -547,3 +561,93 @@ class TestSnapshot(PowerScaleUnitBase):
             snap_data, expiration_timestamp, desired_retention, mod_details)
         assert result is True
         assert mod_details['is_timestamp_modified'] is True
+
+    def create_bulk_snapshot_mock(self, create_params):
+        created = {"bulk_snap_1": 1628155527, "bulk_snap_2": 1628155529,
+                   "bulk_snap_3": 1628155528}
+        return MockSDKResponse({"name": create_params.name,
+                                "created": created[create_params.name]})
+
+    def bulk_snapshot_lookup_mock(self, snapshot_name):
+        if snapshot_name == "bulk_snap_2":
+            return MockSDKResponse(MockSnapshotApi.SNAPSHOT)
+        raise MockApiException(404)
+
+    def test_create_bulk_snapshots(self, powerscale_module_mock):
+        self.set_module_params(self.get_snapshot_args,
+                               {"snapshots": MockSnapshotApi.BULK_SNAPSHOTS,
+                                "snapshot_name": None,
+                                "desired_retention": "2",
+                                "retention_unit": "days",
+                                "state": "present"})
+        powerscale_module_mock.isi_sdk.SnapshotSnapshotCreateParams = MagicMock(
+            side_effect=lambda **kwargs: SimpleNamespace(**kwargs))
+        powerscale_module_mock.snapshot_api.get_snapshot_snapshot = MagicMock(
+            side_effect=self.bulk_snapshot_lookup_mock)
+        powerscale_module_mock.snapshot_api.create_snapshot_snapshot = MagicMock(
+            side_effect=self.create_bulk_snapshot_mock)
+        powerscale_module_mock.perform_module_operation()
+        powerscale_module_mock.zones_api.list_zones.assert_called_once_with()
+        assert powerscale_module_mock.snapshot_api.create_snapshot_snapshot.call_count == 2
+        created_paths = sorted(call.kwargs['path'] for call in
+                               powerscale_module_mock.isi_sdk.SnapshotSnapshotCreateParams.call_args_list)
+        assert created_paths == ["/ifs/project3", "/ifs/sample_zone/project1"]
+        result = powerscale_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is True
+        bulk_details = result['bulk_snapshot_details']
+        assert bulk_details['created'] == ["bulk_snap_1", "bulk_snap_3"]
+        assert bulk_details['existing'] == ["bulk_snap_2"]
+        assert bulk_details['creation_spread_seconds'] == 1
+
+    def test_create_bulk_snapshots_idempotent(self, powerscale_module_mock):
+        self.set_module_params(self.get_snapshot_args,
+                               {"snapshots": MockSnapshotApi.BULK_SNAPSHOTS,
+                                "snapshot_name": None,
+                                "desired_retention": "2",
+                                "state": "present"})
+        powerscale_module_mock.snapshot_api.get_snapshot_snapshot = MagicMock(
+            return_value=MockSDKResponse(MockSnapshotApi.SNAPSHOT))
+        powerscale_module_mock.perform_module_operation()
+        powerscale_module_mock.snapshot_api.create_snapshot_snapshot.assert_not_called()
+        assert powerscale_module_mock.module.exit_json.call_args[1]['changed'] is False
+
+    @patch.object(utils, 'determine_error', utils.determine_error)
+    def test_create_bulk_snapshots_partial_failure(self, powerscale_module_mock):
+        self.set_module_params(self.get_snapshot_args,
+                               {"snapshots": MockSnapshotApi.BULK_SNAPSHOTS,
+                                "snapshot_name": None,
+                                "desired_retention": "2",
+                                "state": "present"})
+        powerscale_module_mock.isi_sdk.SnapshotSnapshotCreateParams = MagicMock(
+            side_effect=lambda **kwargs: SimpleNamespace(**kwargs))
+        powerscale_module_mock.snapshot_api.get_snapshot_snapshot = MagicMock(
+            side_effect=MockApiException(404))
+
+        def create_snapshot(create_params):
+            if create_params.name == "bulk_snap_3":
+                raise MockApiException(500)
+            return self.create_bulk_snapshot_mock(create_params)
+        powerscale_module_mock.snapshot_api.create_snapshot_snapshot = MagicMock(
+            side_effect=create_snapshot)
+        self.capture_fail_json_call(
+            MockSnapshotApi.bulk_snapshot_failed_msg(), invoke_perform_module=True)
+        failed = powerscale_module_mock.module.fail_json.call_args.kwargs[
+            'bulk_snapshot_details']['failed']
+        assert failed == [{"snapshot_name": "bulk_snap_3", "error": "SDK Error message"}]
+
+    def test_create_bulk_snapshots_duplicate_names(self, powerscale_module_mock):
+        self.set_module_params(self.get_snapshot_args,
+                               {"snapshots": MockSnapshotApi.BULK_SNAPSHOTS * 2,
+                                "snapshot_name": None,
+                                "desired_retention": "2",
+                                "state": "present"})
+        self.capture_fail_json_call(
+            MockSnapshotApi.bulk_snapshot_duplicate_failed_msg(), invoke_perform_module=True)
+
+    def test_bulk_snapshots_absent_exception(self, powerscale_module_mock):
+        self.set_module_params(self.get_snapshot_args,
+                               {"snapshots": MockSnapshotApi.BULK_SNAPSHOTS,
+                                "snapshot_name": None,
+                                "state": "absent"})
+        self.capture_fail_json_call(
+            MockSnapshotApi.bulk_snapshot_absent_failed_msg(), invoke_perform_module=True)
@@ -0,0 +1,179 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for Snapshot Retention module on PowerScale"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock.mock import MagicMock
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.initial_mock \
+    import utils
+from ansible_collections.dellemc.powerscale.plugins.modules.snapshot_retention \
+    import SnapshotRetention, SnapshotRetentionHandler
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base \
+    import PowerScaleUnitBase
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_snapshot_retention_api \
+    import MockSnapshotRetentionApi, NOW
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response \
+    import MockSDKResponse
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
+
+
+class TestSnapshotRetention(PowerScaleUnitBase):
+    retention_args = MockSnapshotRetentionApi.RETENTION_COMMON_ARGS
+
+    @pytest.fixture
+    def module_object(self):
+        return SnapshotRetention
+
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
+    def mock_snapshot_list(self):
+        pages = [MockSDKResponse(page) for page in
+                 MockSnapshotRetentionApi.get_snapshot_pages()]
+        self.powerscale_module_mock.snapshot_api.list_snapshot_snapshots = \
+            MagicMock(side_effect=pages)
+
+    def plan(self):
+        params = self.powerscale_module_mock.module.params
+        snapshots = self.powerscale_module_mock.get_snapshot_stream(params)
+        delete_set, retained = self.powerscale_module_mock.plan_deletion(
+            snapshots, params, now=NOW)
+        return sorted(snap['id'] for snap in delete_set), retained
+
+    def test_plan_keep_last(self):
+        self.set_module_params(self.retention_args, {"keep_last": 2})
+        self.mock_snapshot_list()
+        assert self.plan() == ([4, 5, 7, 8], 4)
+        list_calls = self.powerscale_module_mock.snapshot_api.list_snapshot_snapshots.call_args_list
+        assert list_calls[0].kwargs == {"sort": "created", "dir": "DESC",
+                                        "state": "active", "type": "real"}
+        assert list_calls[1].kwargs == {"resume": "page_2"}
+
+    def test_plan_keep_daily(self):
+        self.set_module_params(self.retention_args, {"keep_daily_days": 7,
+                                                     "path": "/ifs/project1/"})
+        self.mock_snapshot_list()
+        assert self.plan() == ([4, 7, 9], 3)
+
+    def test_plan_keep_last_and_keep_daily(self):
+        # The day of the snapshot kept by keep_last needs no other snapshot
+        self.set_module_params(self.retention_args, {"keep_last": 1,
+                                                     "keep_daily_days": 7,
+                                                     "path": "/ifs/project1/"})
+        self.mock_snapshot_list()
+        assert self.plan() == ([4, 7, 9], 3)
+
+    def test_plan_keep_last_and_max_age(self):
+        self.set_module_params(self.retention_args, {"keep_last": 1,
+                                                     "max_age": 2,
+                                                     "max_age_unit": "days"})
+        self.mock_snapshot_list()
+        assert self.plan() == ([4, 5, 21], 5)
+
+    def test_plan_skips_synciq_snapshots(self):
+        self.set_module_params(self.retention_args, {"keep_last": 0,
+                                                     "path": "/ifs/project1"})
+        self.mock_snapshot_list()
+        assert self.plan() == ([4, 5, 7, 8, 9, 10], 0)
+
+    def test_plan_include_synciq_snapshots(self):
+        self.set_module_params(self.retention_args, {
+            "keep_last": 0, "path": "/ifs/project1",
+            "include_synciq_snapshots": True})
+        self.mock_snapshot_list()
+        assert self.plan() == ([4, 5, 7, 8, 9, 10, 30], 0)
+
+    def test_retention_requires_filter(self, mocker):
+        ansible_module = mocker.patch(
+            'ansible_collections.dellemc.powerscale.plugins.modules.'
+            'snapshot_retention.AnsibleModule')
+        SnapshotRetention()
+        assert ['path', 'schedule', 'name_pattern'] in \
+            ansible_module.call_args.kwargs['required_one_of']
+
+    def test_plan_name_pattern_and_schedule(self):
+        self.set_module_params(self.retention_args, {"max_age": 30,
+                                                     "name_pattern": "^manual_",
+                                                     "schedule": "hourly"})
+        self.mock_snapshot_list()
+        assert self.plan() == ([4], 0)
+        list_calls = self.powerscale_module_mock.snapshot_api.list_snapshot_snapshots.call_args_list
+        assert list_calls[0].kwargs['schedule'] == "hourly"
+
+    def test_plan_access_zone_path(self):
+        self.set_module_params(self.retention_args, {"keep_last": 0,
+                                                     "path": "/project2",
+                                                     "access_zone": "sample_zone"})
+        self.powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response(
+                {"sample_zone": "/ifs"}))
+        self.mock_snapshot_list()
+        assert self.plan() == ([20, 21], 0)
+
+    def test_retention_check_mode(self):
+        self.set_module_params(self.retention_args, {"keep_last": 2})
+        self.powerscale_module_mock.module.check_mode = True
+        self.mock_snapshot_list()
+        SnapshotRetentionHandler().handle(self.powerscale_module_mock,
+                                          self.powerscale_module_mock.module.params)
+        self.powerscale_module_mock.snapshot_api.delete_snapshot_snapshot.assert_not_called()
+        result = self.powerscale_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is True
+        assert len(result['deleted_snapshots']) == 4
+
+    def test_retention_delete(self):
+        self.set_module_params(self.retention_args, {"keep_last": 3})
+        self.mock_snapshot_list()
+        SnapshotRetentionHandler().handle(self.powerscale_module_mock,
+                                          self.powerscale_module_mock.module.params)
+        deleted = sorted(call.args[0] for call in
+                         self.powerscale_module_mock.snapshot_api.delete_snapshot_snapshot.call_args_list)
+        assert deleted == ["4", "5", "7"]
+        assert self.powerscale_module_mock.module.exit_json.call_args[1]['changed'] is True
+
+    def test_retention_nothing_to_delete(self):
+        self.set_module_params(self.retention_args, {"keep_last": 10})
+        self.mock_snapshot_list()
+        SnapshotRetentionHandler().handle(self.powerscale_module_mock,
+                                          self.powerscale_module_mock.module.params)
+        self.powerscale_module_mock.snapshot_api.delete_snapshot_snapshot.assert_not_called()
+        assert self.powerscale_module_mock.module.exit_json.call_args[1]['changed'] is False
+
+    def test_retention_delete_exception(self):
+        self.set_module_params(self.retention_args, {"keep_last": 0,
+                                                     "path": "/ifs/project2"})
+        self.mock_snapshot_list()
+        self.powerscale_module_mock.snapshot_api.delete_snapshot_snapshot = MagicMock(
+            side_effect=[MockApiException(), True])
+        self.capture_fail_json_call(
+            MockSnapshotRetentionApi.get_retention_error_response('delete_exception'),
+            SnapshotRetentionHandler)
+
+    def test_retention_list_exception(self):
+        self.set_module_params(self.retention_args, {"keep_last": 1})
+        self.powerscale_module_mock.snapshot_api.list_snapshot_snapshots = MagicMock(
+            side_effect=MockApiException())
+        self.capture_fail_json_call(
+            MockSnapshotRetentionApi.get_retention_error_response('list_exception'),
+            SnapshotRetentionHandler)
+
+    @pytest.mark.parametrize("params, error_type", [
+        ({"keep_last": -1}, "invalid_keep_last"),
+        ({"max_age": 1, "name_pattern": "["}, "invalid_pattern")
+    ])
+    def test_retention_invalid_params(self, params, error_type):
+        self.set_module_params(self.retention_args, params)
+        self.capture_fail_json_call(
+            MockSnapshotRetentionApi.get_retention_error_response(error_type),
+            SnapshotRetentionHandler)
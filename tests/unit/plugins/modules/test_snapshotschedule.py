@@ -71,3 +71,89 @@ class TestSnapshotSchedule:
 
         module_mock.module.fail_json.assert_called_once_with(
             msg="The snapshot desired retention must be at least 2 hours")
+
+    def schedule_snapshot_pages(self):
+        page_1 = {"snapshots": [{"id": 1, "name": "s_1", "created": 300, "size": 10},
+                                {"id": 2, "name": "s_2", "created": 100, "size": 20}],
+                  "total": 3, "resume": "page_2"}
+        page_2 = {"snapshots": [{"id": 3, "name": "s_3", "created": 200, "size": 30}],
+                  "total": 3, "resume": None}
+        return [MagicMock(to_dict=MagicMock(return_value=page))
+                for page in [page_1, page_2]]
+
+    def test_get_details_snapshot_summary(self, module_mock):
+        """Test get_details returns only a summary of the snapshots."""
+        module_mock.module.params = {"snapshot_list_mode": "summary"}
+        module_mock.api_instance = MagicMock()
+        module_mock.api_instance.get_snapshot_schedule.return_value.to_dict.return_value = \
+            {"schedules": [{"name": "sched"}]}
+        module_mock.api_instance.list_snapshot_snapshots = MagicMock(
+            side_effect=self.schedule_snapshot_pages())
+        module_mock.add_schedule_snapshots = \
+            lambda name, details: SnapshotSchedule.add_schedule_snapshots(module_mock, name, details)
+
+        result = SnapshotSchedule.get_details(module_mock, "sched")
+
+        assert "snapshot_list" not in result
+        assert result["snapshot_summary"] == {
+            "count": 3, "total_size": 60,
+            "oldest": {"id": 2, "name": "s_2", "created": 100},
+            "newest": {"id": 1, "name": "s_1", "created": 300}}
+        calls = module_mock.api_instance.list_snapshot_snapshots.call_args_list
+        assert calls[0].kwargs == {"schedule": "sched"}
+        assert calls[1].kwargs == {"resume": "page_2"}
+
+    def test_get_details_snapshot_list_paginated(self, module_mock):
+        """Test get_details follows resume up to snapshot_list_limit."""
+        module_mock.module.params = {"snapshot_list_mode": "full",
+                                     "snapshot_list_limit": 2}
+        module_mock.api_instance = MagicMock()
+        module_mock.api_instance.get_snapshot_schedule.return_value.to_dict.return_value = \
+            {"schedules": [{"name": "sched"}]}
+        module_mock.api_instance.list_snapshot_snapshots = MagicMock(
+            side_effect=self.schedule_snapshot_pages())
+        module_mock.add_schedule_snapshots = \
+            lambda name, details: SnapshotSchedule.add_schedule_snapshots(module_mock, name, details)
+
+        result = SnapshotSchedule.get_details(module_mock, "sched")
+
+        assert [snap["id"] for snap in result["snapshot_list"]["snapshots"]] == [1, 2]
+        assert result["snapshot_list"]["resume"] == "page_2"
+        assert result["snapshot_list"]["total"] == 3
+        module_mock.api_instance.list_snapshot_snapshots.assert_called_once_with(
+            limit=2, schedule="sched")
+
+    def test_get_details_snapshot_list_cut_page(self, module_mock):
+        """Test get_details drops the resume token of a cut page."""
+        module_mock.module.params = {"snapshot_list_mode": "full",
+                                     "snapshot_list_limit": 2}
+        module_mock.api_instance = MagicMock()
+        module_mock.api_instance.get_snapshot_schedule.return_value.to_dict.return_value = \
+            {"schedules": [{"name": "sched"}]}
+        page_1, page_2 = self.schedule_snapshot_pages()
+        page_1.to_dict.return_value = {"snapshots": [{"id": 1, "name": "s_1"}],
+                                       "total": 4, "resume": "page_2"}
+        page_2.to_dict.return_value = {"snapshots": [{"id": 2, "name": "s_2"},
+                                                     {"id": 3, "name": "s_3"}],
+                                       "total": 4, "resume": "page_3"}
+        module_mock.api_instance.list_snapshot_snapshots = MagicMock(
+            side_effect=[page_1, page_2])
+        module_mock.add_schedule_snapshots = \
+            lambda name, details: SnapshotSchedule.add_schedule_snapshots(module_mock, name, details)
+
+        result = SnapshotSchedule.get_details(module_mock, "sched")
+
+        assert [snap["id"] for snap in result["snapshot_list"]["snapshots"]] == [1, 2]
+        assert result["snapshot_list"]["resume"] is None
+
+    def test_get_details_without_snapshots(self, module_mock):
+        """Test get_details skips the snapshot listing when not required."""
+        module_mock.api_instance = MagicMock()
+        module_mock.api_instance.get_snapshot_schedule.return_value.to_dict.return_value = \
+            {"schedules": [{"name": "sched"}]}
+
+        result = SnapshotSchedule.get_details(module_mock, "sched",
+                                              include_snapshots=False)
+
+        assert result == {"schedules": [{"name": "sched"}]}
+        module_mock.api_instance.list_snapshot_snapshots.assert_not_called()
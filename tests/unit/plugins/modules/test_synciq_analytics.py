@@ -0,0 +1,156 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for SyncIQ Analytics module on PowerScale"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock.mock import MagicMock, patch
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.initial_mock \
+    import utils
+from ansible_collections.dellemc.powerscale.plugins.modules.synciq_analytics \
+    import SyncIQAnalytics, SyncIQAnalyticsHandler
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base \
+    import PowerScaleUnitBase
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_synciq_analytics_api \
+    import MockSyncIQAnalyticsApi, NOW, HOUR
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response \
+    import MockSDKResponse
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+
+
+class TestSyncIQAnalytics(PowerScaleUnitBase):
+    analytics_args = MockSyncIQAnalyticsApi.ANALYTICS_COMMON_ARGS
+
+    @pytest.fixture
+    def module_object(self):
+        return SyncIQAnalytics
+
+    @pytest.fixture(autouse=True)
+    def mock_time(self, mocker):
+        mocker.patch("ansible_collections.dellemc.powerscale.plugins.modules."
+                     "synciq_analytics.time.time", return_value=NOW)
+
+    @pytest.fixture(autouse=True)
+    def mock_sync_lists(self, powerscale_module_mock):
+        synciq_api = powerscale_module_mock.synciq_api
+        synciq_api.list_sync_policies = MagicMock(
+            side_effect=MockSyncIQAnalyticsApi.get_policy_pages())
+        synciq_api.get_sync_reports = MagicMock(
+            side_effect=MockSyncIQAnalyticsApi.get_report_pages())
+
+    def run_module(self, params):
+        self.set_module_params(self.analytics_args, params)
+        SyncIQAnalyticsHandler().handle(self.powerscale_module_mock,
+                                        self.powerscale_module_mock.module.params)
+        return self.powerscale_module_mock.module.exit_json.call_args[1]
+
+    def get_summary(self, result, policy_name):
+        return [summary for summary in result['synciq_analytics']
+                if summary['policy_name'] == policy_name][0]
+
+    def test_summarize_all_policies(self):
+        result = self.run_module({})
+        assert [summary['policy_name'] for summary in result['synciq_analytics']] == \
+            ["policy_1", "policy_2", "policy_3"]
+        assert result['changed'] is False
+
+        policy_1 = self.get_summary(result, "policy_1")
+        assert policy_1['report_count'] == 2
+        assert policy_1['successful_jobs'] == 1
+        assert policy_1['failed_jobs'] == 1
+        assert policy_1['bytes_transferred'] == 1500
+        assert policy_1['files_transferred'] == 20
+        assert policy_1['duration'] == 50
+        assert policy_1['throughput'] == 30.0
+        assert policy_1['error_count'] == 1
+        assert policy_1['last_success'] == NOW - HOUR
+        assert policy_1['lag'] == HOUR
+        assert policy_1['rpo_exceeded'] is False
+
+        synciq_api = self.powerscale_module_mock.synciq_api
+        assert synciq_api.get_sync_reports.call_args_list[0].kwargs == \
+            {"newer_than": 1, "sort": "start_time", "dir": "DESC"}
+        assert synciq_api.get_sync_reports.call_args_list[1].kwargs == \
+            {"resume": "reports_2"}
+        synciq_api.list_sync_policies.assert_called_with(resume="policies_2")
+
+    def test_lag_falls_back_to_policy_last_success(self):
+        result = self.run_module({})
+        policy_2 = self.get_summary(result, "policy_2")
+        assert policy_2['successful_jobs'] == 0
+        assert policy_2['last_success'] == NOW - 5 * HOUR
+        assert policy_2['lag'] == 5 * HOUR
+        assert policy_2['rpo_exceeded'] is True
+
+        policy_3 = self.get_summary(result, "policy_3")
+        assert policy_3['report_count'] == 0
+        assert policy_3['lag'] is None
+        assert policy_3['rpo_exceeded'] is False
+
+    def test_window_days(self):
+        result = self.run_module({"window": 2, "window_unit": "days"})
+        policy_1 = self.get_summary(result, "policy_1")
+        assert policy_1['report_count'] == 3
+        assert policy_1['successful_jobs'] == 2
+        assert self.powerscale_module_mock.synciq_api.get_sync_reports. \
+            call_args_list[0].kwargs['newer_than'] == 2
+
+    def test_single_policy_filtered_by_server(self):
+        result = self.run_module({"policy_names": ["policy_2"]})
+        assert [summary['policy_name'] for summary in result['synciq_analytics']] == \
+            ["policy_2"]
+        assert self.powerscale_module_mock.synciq_api.get_sync_reports. \
+            call_args_list[0].kwargs['policy_name'] == "policy_2"
+
+    def test_unknown_policy(self):
+        self.set_module_params(self.analytics_args,
+                               {"policy_names": ["policy_1", "missing"]})
+        self.capture_fail_json_call("SyncIQ policies missing are not found.",
+                                    SyncIQAnalyticsHandler)
+
+    def test_include_sub_reports(self):
+        self.powerscale_module_mock.synciq_reports_api.get_report_subreports = \
+            MagicMock(return_value=MockSDKResponse(
+                MockSyncIQAnalyticsApi.get_sub_reports()))
+        result = self.run_module({"include_sub_reports": True})
+        assert self.get_summary(result, "policy_1")['error_count'] == 4
+        self.powerscale_module_mock.synciq_reports_api.get_report_subreports. \
+            assert_called_once_with("3-policy_1")
+        assert 'failed_sub_reports' not in result
+
+    @patch.object(utils, 'determine_error', utils.determine_error)
+    def test_include_sub_reports_failure(self):
+        self.powerscale_module_mock.synciq_reports_api.get_report_subreports = \
+            MagicMock(side_effect=MockApiException)
+        result = self.run_module({"include_sub_reports": True})
+        assert result['failed_sub_reports'] == [
+            {"id": "3-policy_1", "policy_name": "policy_1",
+             "error": "SDK Error message"}]
+        assert self.get_summary(result, "policy_1")['error_count'] == 1
+        self.powerscale_module_mock.module.warn.assert_called()
+
+    def test_list_reports_exception(self):
+        self.set_module_params(self.analytics_args, {})
+        self.powerscale_module_mock.synciq_api.get_sync_reports = MagicMock(
+            side_effect=MockApiException)
+        self.capture_fail_json_call("Failed to summarize SyncIQ reports",
+                                    SyncIQAnalyticsHandler)
+
+    @pytest.mark.parametrize("params", [{"window": 0}, {"max_workers": 0}])
+    def test_invalid_params(self, params):
+        self.set_module_params(self.analytics_args, params)
+        self.capture_fail_json_call("must be greater than 0.",
+                                    SyncIQAnalyticsHandler)
+
+    def test_main(self):
+        from ansible_collections.dellemc.powerscale.plugins.modules import synciq_analytics
+        with patch.object(utils, 'get_powerscale_connection', MagicMock()), \
+                patch.object(synciq_analytics, 'SyncIQAnalyticsHandler') as handler:
+            synciq_analytics.main()
+        handler.return_value.handle.assert_called()
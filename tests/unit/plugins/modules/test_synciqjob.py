@@ -10,6 +10,7 @@ __metaclass__ = type
 
 import pytest
 from mock.mock import MagicMock
+from types import SimpleNamespace
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.initial_mock \
     import utils
 
@@ -70,8 +71,10 @@ class TestSyncIQJob(PowerScaleUnitBase):
             "job_id": "test",
             "state": "present"})
         powerscale_module_mock.module.params = self.get_synciq_job_args
+        powerscale_module_mock.sync_api_instance.get_sync_job = MagicMock(
+            side_effect=MockApiException)
         powerscale_module_mock.sync_api_instance.list_sync_jobs = MagicMock(
-            side_effect=utils.ApiException)
+            side_effect=MockApiException)
         self.capture_fail_json_call(
             MockSyncIQJobApi.get_synciq_job_failed_msg(), invoke_perform_module=True)
 
@@ -104,7 +107,7 @@ class TestSyncIQJob(PowerScaleUnitBase):
         self.get_synciq_job_args.update({"job_id": "non_existing_job",
                                          "state": "present"})
         powerscale_module_mock.module.params = self.get_synciq_job_args
-        powerscale_module_mock.sync_api_instance.list_sync_jobs = MagicMock(
+        powerscale_module_mock.sync_api_instance.get_sync_job = MagicMock(
             side_effect=MockApiException(404))
         self.capture_fail_json_call(
             MockSyncIQJobApi.create_synciq_job_failed_msg(), invoke_perform_module=True)
@@ -137,3 +140,45 @@ class TestSyncIQJob(PowerScaleUnitBase):
             side_effect=utils.ApiException)
         self.capture_fail_json_call(
             MockSyncIQJobApi.modify_synciq_job_failed_msg(), invoke_perform_module=True)
+
+    def test_get_job_details_by_id(self, powerscale_module_mock):
+        job = MockSyncIQJobApi.SYNCIQ_JOB["job_details"][0]
+        powerscale_module_mock.sync_api_instance.get_sync_job = MagicMock(
+            return_value=SimpleNamespace(jobs=[MockSyncIQJobApi.make_sync_job(job)]))
+        powerscale_module_mock.sync_api_instance.list_sync_jobs = MagicMock()
+        assert powerscale_module_mock.get_job_details("test") == [job]
+        powerscale_module_mock.sync_api_instance.get_sync_job.assert_called_once_with("test")
+        powerscale_module_mock.sync_api_instance.list_sync_jobs.assert_not_called()
+
+    def test_get_job_details_fallback_to_list(self, powerscale_module_mock):
+        pages = MockSyncIQJobApi.get_sync_job_pages(job_count=5, page_size=2)
+        powerscale_module_mock.sync_api_instance.get_sync_job = MagicMock(
+            side_effect=MockApiException(405))
+        powerscale_module_mock.sync_api_instance.list_sync_jobs = MagicMock(
+            side_effect=pages)
+        jobs = powerscale_module_mock.get_job_details("policy_4")
+        assert [job["id"] for job in jobs] == ["policy_4"]
+        assert powerscale_module_mock.sync_api_instance.list_sync_jobs.call_count == 3
+
+    @pytest.mark.parametrize("job_count", [1, 10, 100, 1000])
+    def test_get_job_details_response_size(self, powerscale_module_mock, job_count):
+        """Per-job lookup transfers one job regardless of how many jobs are running,
+        while listing all jobs grows linearly with the job count."""
+        pages = MockSyncIQJobApi.get_sync_job_pages(job_count=job_count)
+        jobs_by_id = dict((job.id, job) for page in pages for job in page.jobs)
+        powerscale_module_mock.sync_api_instance.get_sync_job = MagicMock(
+            side_effect=lambda job_id: SimpleNamespace(jobs=[jobs_by_id[job_id]]))
+        powerscale_module_mock.sync_api_instance.list_sync_jobs = MagicMock(
+            side_effect=pages)
+
+        target = "policy_%d" % (job_count - 1)
+        lookup = powerscale_module_mock.get_job_details(target)
+        listed = [job.to_dict() for job in powerscale_module_mock.synciq.iter_sync_jobs()]
+
+        lookup_size = MockSyncIQJobApi.response_size(lookup)
+        listing_size = MockSyncIQJobApi.response_size(listed)
+        assert len(lookup) == 1 and len(listed) == job_count
+        assert lookup_size < 2 * MockSyncIQJobApi.response_size(
+            [jobs_by_id["policy_0"].to_dict()])
+        assert listing_size >= job_count * lookup_size * 0.9
+        assert powerscale_module_mock.sync_api_instance.get_sync_job.call_count == 1
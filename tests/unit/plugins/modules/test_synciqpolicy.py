@@ -347,6 +347,21 @@ class TestSynciqPolicy(PowerScaleUnitBase):
                 SynciqPolicyHandler
             )
 
+    def test_get_policy_jobs_by_id(self):
+        job = MagicMock(id="Policy1", state="running", action="run")
+        self.powerscale_module_mock.api_instance.get_sync_job = MagicMock(
+            return_value=MagicMock(jobs=[job]))
+        self.powerscale_module_mock.api_instance.list_sync_jobs.reset_mock()
+        jobs = self.powerscale_module_mock.get_policy_jobs("Policy1")
+        assert jobs == [{"id": "Policy1", "state": "running", "action": "run"}]
+        self.powerscale_module_mock.api_instance.get_sync_job.assert_called_once_with("Policy1")
+        self.powerscale_module_mock.api_instance.list_sync_jobs.assert_not_called()
+
+    def test_get_policy_jobs_not_found(self):
+        self.powerscale_module_mock.api_instance.get_sync_job = MagicMock(
+            side_effect=MockApiException(404))
+        assert self.powerscale_module_mock.get_policy_jobs("Policy1") == []
+
     def test_get_target_policy(self):
         job_params = MockSynciqApi.MockSynciqpolicyApi.JOB_ARGS1["job_params"]
         policy_id = MockSynciqApi.MockSynciqpolicyApi.POLICY_ID
@@ -10,9 +10,25 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import pytest
+from types import SimpleNamespace
 from mock.mock import MagicMock
 from ansible_collections.dellemc.powerscale.plugins.modules.synciqreports \
     import SyncIQReports
+from ansible_collections.dellemc.powerscale.plugins.module_utils.storage.dell.shared_library.synciq \
+    import SyncIQ
+
+
+def _report(report_id, policy_name, start_time):
+    details = {"id": report_id, "policy_name": policy_name, "start_time": start_time}
+    return SimpleNamespace(to_dict=lambda: details, **details)
+
+
+def _pages(*pages):
+    responses = []
+    for index, reports in enumerate(pages):
+        resume = "token_%d" % index if index < len(pages) - 1 else None
+        responses.append(SimpleNamespace(reports=list(reports), resume=resume))
+    return responses
 
 
 class TestSyncIQReports:
@@ -54,3 +70,62 @@ class TestSyncIQReports:
 
         module_mock.module.fail_json.assert_called_once_with(
             msg='Please provide a valid report id or valid report name')
+
+    @pytest.fixture
+    def synciq_api(self, module_mock):
+        """Attach the shared SyncIQ helper backed by a mock SyncApi."""
+        api = MagicMock()
+        module_mock.synciq = SyncIQ(api, module_mock.module)
+        return api
+
+    def test_get_report_id_newest_first(self, module_mock, synciq_api):
+        """Test the name lookup asks for the newest report of the policy."""
+        synciq_api.get_sync_reports = MagicMock(side_effect=_pages(
+            [_report("9-policy", "policy", 900), _report("8-policy", "policy", 800)]))
+
+        result = SyncIQReports.get_report_id(module_mock, "policy")
+
+        assert result == "9-policy"
+        synciq_api.get_sync_reports.assert_called_once_with(
+            policy_name="policy", sort="start_time", dir="DESC", limit=10)
+
+    def test_get_report_id_ignores_other_policies(self, module_mock, synciq_api):
+        """Test the name lookup skips reports the server did not filter."""
+        synciq_api.get_sync_reports = MagicMock(side_effect=_pages(
+            [_report("5-other", "other", 500)], [_report("4-policy", "policy", 400)]))
+
+        assert SyncIQReports.get_report_id(module_mock, "policy") == "4-policy"
+        synciq_api.get_sync_reports.assert_called_with(resume="token_0")
+
+    def test_get_latest_reports(self, module_mock, synciq_api):
+        """Test the latest report of many policies is resolved in one pass."""
+        synciq_api.get_sync_reports = MagicMock(side_effect=_pages(
+            [_report("3-a", "a", 300), _report("2-c", "c", 200)],
+            [_report("1-a", "a", 100), _report("1-b", "b", 50)]))
+
+        result = SyncIQReports.get_latest_reports(module_mock, ["a", "b", "d"])
+
+        assert result["a"]["id"] == "3-a"
+        assert result["b"]["id"] == "1-b"
+        assert result["d"] is None
+        assert "c" not in result
+        synciq_api.get_sync_reports.assert_any_call(
+            reports_per_policy=1, sort="start_time", dir="DESC")
+
+    def test_get_latest_reports_stops_when_resolved(self, module_mock, synciq_api):
+        """Test the pass stops once every requested policy is resolved."""
+        synciq_api.get_sync_reports = MagicMock(side_effect=_pages(
+            [_report("3-a", "a", 300)], [_report("1-b", "b", 100)]))
+
+        result = SyncIQReports.get_latest_reports(module_mock, ["a"])
+
+        assert result == {"a": {"id": "3-a", "policy_name": "a", "start_time": 300}}
+        assert synciq_api.get_sync_reports.call_count == 1
+
+    def test_get_latest_reports_exception(self, module_mock, synciq_api):
+        """Test the failure while indexing the latest reports."""
+        synciq_api.get_sync_reports = MagicMock(side_effect=Exception("SDK Error message"))
+
+        SyncIQReports.get_latest_reports(module_mock, ["a"])
+
+        assert "SDK Error message" in module_mock.module.fail_json.call_args[1]["msg"]
@@ -11,7 +11,6 @@ __metaclass__ = type
 import pytest
 from mock.mock import patch, MagicMock
 
-from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response import MockSDKResponse
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.initial_mock \
     import utils
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.powerscale_unit_base \
@@ -21,6 +20,8 @@ from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock
     import MockUserApi
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
     import MockApiException
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils \
+    import mock_zone_topology_api as MockZoneTopologyApi
 from ansible.module_utils.compat.version import LooseVersion
 
 utils.pkg_resources = MagicMock()
@@ -46,6 +47,11 @@ class TestUser(PowerScaleUnitBase):
         mock_cluster_instance.get_cluster_config.return_value = mock_response
         return User
 
+    @pytest.fixture(autouse=True)
+    def zones_mock(self, powerscale_module_mock):
+        powerscale_module_mock.zones_api.list_zones = MagicMock(
+            return_value=MockZoneTopologyApi.get_zones_response())
+
     def test_get_user_details(self, powerscale_module_mock):
         self.set_module_params(self.user_args, {
             'user_id': 7000,
@@ -277,7 +283,7 @@ class TestUser(PowerScaleUnitBase):
             "create_user_with_existing_id"), powerscale_module_mock, invoke_perform_module=True)
 
     def test_set_validate_params(self, powerscale_module_mock):
-        # Test with get_zones_summary_zone error
+        # Test with list_zones error
         self.set_module_params(self.user_args, {
             'access_zone': "test-zone",
             'provider_type': "local",
@@ -289,8 +295,8 @@ class TestUser(PowerScaleUnitBase):
             'primary_group': 'Isilon Users',
             'role_name': 'AuditAdmin',
             'state': 'present'})
-        with patch.object(powerscale_module_mock.zone_summary_api,
-                          'get_zones_summary_zone',
+        with patch.object(powerscale_module_mock.zones_api,
+                          'list_zones',
                           side_effect=MockApiException):
             self.capture_fail_json_call(MockUserApi.get_error_responses(
                 "error_fetch_base_path"), invoke_perform_module=True)
@@ -307,8 +313,6 @@ class TestUser(PowerScaleUnitBase):
             'primary_group': 'Isilon Users',
             'role_name': 'AuditAdmin',
             'state': 'present'})
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone = MagicMock(
-            return_value=MockSDKResponse(MockUserApi.ZONE_SUMMARY))
         self.capture_fail_json_call(MockUserApi.get_error_responses(
             "param_error_user_id_and_name"), invoke_perform_module=True)
 
@@ -326,8 +330,6 @@ class TestUser(PowerScaleUnitBase):
             'primary_group': 'Isilon Users',
             'role_name': 'AuditAdmin',
             'state': 'present'})
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone = MagicMock(
-            return_value=MockSDKResponse(MockUserApi.ZONE_SUMMARY))
         self.capture_fail_json_call(MockUserApi.get_error_responses(
             "param_error_email_format"), invoke_perform_module=True)
 
@@ -345,8 +347,6 @@ class TestUser(PowerScaleUnitBase):
             'primary_group': 'Isilon Users',
             'role_name': 'AuditAdmin',
             'state': 'present'})
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone = MagicMock(
-            return_value=MockSDKResponse(MockUserApi.ZONE_SUMMARY))
         self.capture_fail_json_call(MockUserApi.get_error_responses(
             "param_error_role_name_and_state"), invoke_perform_module=True)
 
@@ -365,8 +365,6 @@ class TestUser(PowerScaleUnitBase):
             'role_name': 'AuditAdmin',
             'role_state': 'present-for-user',
             'state': 'present'})
-        powerscale_module_mock.zone_summary_api.get_zones_summary_zone = MagicMock(
-            return_value=MockSDKResponse(MockUserApi.ZONE_SUMMARY))
         self.capture_fail_json_call(MockUserApi.get_error_responses(
             "param_error_role_and_zone"), invoke_perform_module=True)
 
@@ -9,7 +9,8 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import pytest
-from mock.mock import MagicMock
+from types import SimpleNamespace
+from mock.mock import MagicMock, patch
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shared_library.initial_mock \
     import utils
 from ansible_collections.dellemc.powerscale.plugins.modules.writable_snapshots import WritableSnapshot, WritableSnapshotHandler
@@ -17,6 +18,10 @@ from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.shar
     import PowerScaleUnitBase
 from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_writable_snapshots_api \
     import MockWritableSanpshotsApi
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_sdk_response \
+    import MockSDKResponse
+from ansible_collections.dellemc.powerscale.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
 
 
 class TestWritableSnapshot(PowerScaleUnitBase):
@@ -26,6 +31,18 @@ class TestWritableSnapshot(PowerScaleUnitBase):
     def module_object(self):
         return WritableSnapshot
 
+    @pytest.fixture(autouse=True)
+    def writable_snapshot_list_mock(self, powerscale_module_mock):
+        self.mock_writable_snapshot_list([])
+
+    def mock_writable_snapshot_list(self, *pages):
+        responses = []
+        for index, page in enumerate(pages):
+            resume = "page_{0}".format(index + 1) if index + 1 < len(pages) else None
+            responses.append(MockSDKResponse({"writable": page, "resume": resume}))
+        self.powerscale_module_mock.snapshot_api.list_snapshot_writable = MagicMock(
+            side_effect=responses)
+
     def test_create_writable_snapshot_check_mode(self):
         self.set_module_params(self.writable_snapshot_args,
                                MockWritableSanpshotsApi.WS_CREATE_ARGS
@@ -119,6 +136,7 @@ class TestWritableSnapshot(PowerScaleUnitBase):
                                MockWritableSanpshotsApi.WS_DELETE_ARGS
                                )
         self.powerscale_module_mock.check_mode = False
+        self.mock_writable_snapshot_list([MockWritableSanpshotsApi.WS_EXISTING])
         self.powerscale_module_mock.snapshot_api.delete_snapshot_writable_wspath = MagicMock(
             side_effect=Exception)
         self.capture_fail_json_call(MockWritableSanpshotsApi.get_writeable_snpshots_error_response("delete_exception"),
@@ -128,11 +146,10 @@ class TestWritableSnapshot(PowerScaleUnitBase):
         self.set_module_params(self.writable_snapshot_args,
                                MockWritableSanpshotsApi.WS_DELETE_ARGS
                                )
-        self.powerscale_module_mock.snapshot_api.get_snapshot_writable_wspath = MagicMock(
+        self.powerscale_module_mock.snapshot_api.list_snapshot_writable = MagicMock(
             side_effect=Exception)
-        WritableSnapshotHandler().handle(self.powerscale_module_mock,
-                                         self.powerscale_module_mock.module.params)
-        assert self.powerscale_module_mock.module.exit_json.call_args[1]['changed'] is False
+        self.capture_fail_json_call(MockWritableSanpshotsApi.get_writeable_snpshots_error_response("list_exception"),
+                                    WritableSnapshotHandler)
 
     def test_invalid_writable_snapshot(self):
         self.set_module_params(self.writable_snapshot_args,
@@ -143,3 +160,52 @@ class TestWritableSnapshot(PowerScaleUnitBase):
             return_value=(False))
         self.capture_fail_json_call(MockWritableSanpshotsApi.get_writeable_snpshots_error_response("invalid_dstpath"),
                                     WritableSnapshotHandler)
+
+    def test_writable_snapshot_index_paginated(self):
+        self.set_module_params(self.writable_snapshot_args, {"max_workers": 4})
+        self.mock_writable_snapshot_list([MockWritableSanpshotsApi.WS_EXISTING],
+                                         [MockWritableSanpshotsApi.WS_EXISTING_PAGE_2])
+        assert self.powerscale_module_mock.get_writable_snapshot("/ifs/ansible8/") == \
+            (True, MockWritableSanpshotsApi.WS_EXISTING)
+        assert self.powerscale_module_mock.get_writable_snapshot("/ifs/ansible9")[0] is True
+        assert self.powerscale_module_mock.get_writable_snapshot("/ifs/other") == (False, [])
+        assert self.powerscale_module_mock.snapshot_api.list_snapshot_writable.call_count == 2
+
+    def test_bulk_writable_snapshots(self):
+        self.set_module_params(self.writable_snapshot_args,
+                               MockWritableSanpshotsApi.WS_BULK_ARGS)
+        self.powerscale_module_mock.check_mode = False
+        self.powerscale_module_mock._diff = False
+        self.mock_writable_snapshot_list([MockWritableSanpshotsApi.WS_EXISTING])
+        self.powerscale_module_mock.snapshot_api.create_snapshot_writable_item = MagicMock(
+            side_effect=lambda item: MockSDKResponse({"dst_path": "created"}))
+        WritableSnapshotHandler().handle(self.powerscale_module_mock,
+                                         self.powerscale_module_mock.module.params)
+        assert self.powerscale_module_mock.module.exit_json.call_args[1]['changed'] is True
+        # each distinct source snapshot is validated once
+        assert self.powerscale_module_mock.snapshot_api.get_snapshot_snapshot.call_count == 1
+        assert self.powerscale_module_mock.snapshot_api.list_snapshot_writable.call_count == 1
+        assert self.powerscale_module_mock.snapshot_api.create_snapshot_writable_item.call_count == 4
+        self.powerscale_module_mock.snapshot_api.delete_snapshot_writable_wspath.assert_called_once_with(
+            snapshot_writable_wspath=MockWritableSanpshotsApi.DSTPATH)
+
+    @patch.object(utils, 'determine_error', utils.determine_error)
+    def test_bulk_writable_snapshots_partial_failure(self):
+        self.set_module_params(self.writable_snapshot_args,
+                               MockWritableSanpshotsApi.WS_BULK_ARGS)
+        self.powerscale_module_mock.check_mode = False
+
+        def create_writable_snapshot(item):
+            if item.dst_path == "/ifs/bulk_2":
+                raise MockApiException()
+            return MockSDKResponse({"dst_path": item.dst_path})
+        self.powerscale_module_mock.isi_sdk.SnapshotWritableItem = MagicMock(
+            side_effect=lambda **kwargs: SimpleNamespace(**kwargs))
+        self.powerscale_module_mock.snapshot_api.create_snapshot_writable_item = MagicMock(
+            side_effect=create_writable_snapshot)
+        self.capture_fail_json_call(MockWritableSanpshotsApi.get_writeable_snpshots_error_response("bulk_exception"),
+                                    WritableSnapshotHandler)
+        call_args = self.powerscale_module_mock.module.fail_json.call_args.kwargs
+        assert [item["dst_path"] for item in call_args["failed_writable_snapshots"]] == ["/ifs/bulk_2"]
+        assert call_args["changed"] is True
+        assert len(call_args["writable_snapshots_details"]) == 3